@@ -0,0 +1,44 @@
+#Benchmark of the scaling of the C action calculations with the number of
+#OpenMP threads
+#Run as python actionAngle-benchmark.py [npoints] [maxcores]
+import sys
+import time
+import multiprocessing
+import numpy as nu
+from galpy.potential import MWPotential
+from galpy.actionAngle import actionAngleStaeckel, actionAngleAdiabatic
+def benchmark(npoints,maxcores):
+    #Mix of near-circular, typical, and close-to-unbound disk orbits, which
+    #have very different costs
+    nu.random.seed(1)
+    R= 0.5+nu.random.uniform(size=npoints)*1.5
+    vR= nu.random.normal(size=npoints)*nu.random.choice([0.001,0.1,0.5],
+                                                        size=npoints)
+    vT= 1.+nu.random.normal(size=npoints)*0.1
+    z= nu.random.normal(size=npoints)*0.1
+    vz= nu.random.normal(size=npoints)*0.1
+    aAS= actionAngleStaeckel(pot=MWPotential,delta=0.45,c=True)
+    aAA= actionAngleAdiabatic(pot=MWPotential,gamma=1.,c=True)
+    numcores= [1]
+    while 2*numcores[-1] <= maxcores: numcores.append(2*numcores[-1])
+    if numcores[-1] != maxcores: numcores.append(maxcores)
+    print "Time in seconds for the actions of %i points" % npoints
+    print "%10s %12s %12s %12s" % ('numcores','Staeckel','Freqs','Adiabatic')
+    for nc in numcores:
+        times= []
+        for func in [aAS,aAS.actionsFreqs,aAA]:
+            start= time.time()
+            func(R,vR,vT,z,vz,numcores=nc)
+            times.append(time.time()-start)
+        print "%10i %12.4f %12.4f %12.4f" % tuple([nc]+times)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        npoints= int(sys.argv[1])
+    else:
+        npoints= 10**4
+    if len(sys.argv) > 2:
+        maxcores= int(sys.argv[2])
+    else:
+        maxcores= multiprocessing.cpu_count()
+    benchmark(npoints,maxcores)
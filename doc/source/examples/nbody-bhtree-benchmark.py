@@ -0,0 +1,57 @@
+#Benchmark of the Barnes-Hut tree code against direct summation
+#Run as python nbody-bhtree-benchmark.py [N1 N2 ...]
+import sys
+import time
+import numpy as nu
+from galpy.potential import MWPotential
+from galpy.snapshot_src.directnbody_c import direct_nbody_c, bhtree_nbody_c
+def plummer_sphere(N,a=0.01,mass=1e-4,seed=1):
+    """Positions and velocities of a Plummer sphere with scale a (isotropic
+    velocity dispersion at each radius) on a circular orbit at R=1"""
+    nu.random.seed(seed)
+    r= a/nu.sqrt(nu.random.uniform(size=N)**(-2./3.)-1.)
+    costheta= nu.random.uniform(-1.,1.,size=N)
+    phi= nu.random.uniform(0.,2.*nu.pi,size=N)
+    sintheta= nu.sqrt(1.-costheta**2.)
+    q= nu.array([r*sintheta*nu.cos(phi),r*sintheta*nu.sin(phi),
+                 r*costheta]).T
+    sig= nu.sqrt(mass/6./nu.sqrt(r**2.+a**2.))
+    p= nu.random.normal(size=(N,3))*nu.tile(sig,(3,1)).T
+    q[:,0]+= 1.
+    p[:,1]+= 1.
+    return (q,p,nu.ones(N)*mass/N)
+
+def benchmark(N,opening_angles=[0.3,0.5,0.7,0.9],ndirectmax=20000):
+    q,p,m= plummer_sphere(N)
+    soft= 0.001
+    t= nu.array([0.,1e-4]) #single step: velocity change is dt x self-force
+    if N <= ndirectmax:
+        start= time.time()
+        dout= direct_nbody_c(q,p,m,t,softening_length=soft)
+        tdirect= time.time()-start
+        ddp= dout[-1][1]-p
+        ddpnorm= nu.sqrt(nu.sum(ddp**2.,axis=1))
+    else:
+        tdirect= nu.nan
+    for th in opening_angles:
+        start= time.time()
+        bout= bhtree_nbody_c(q,p,m,t,softening_length=soft,opening_angle=th)
+        ttree= time.time()-start
+        if N <= ndirectmax:
+            err= nu.sqrt(nu.sum((bout[-1][1]-p-ddp)**2.,axis=1))/ddpnorm
+            print "N=%7i, theta=%.1f: direct %8.3f s, tree %8.3f s, relative force error median %.1e, 99%% %.1e" % (N,th,tdirect,ttree,nu.median(err),nu.percentile(err,99.))
+        else:
+            print "N=%7i, theta=%.1f: tree %8.3f s" % (N,th,ttree)
+    #Full run in the Milky Way potential with the tree code
+    start= time.time()
+    bhtree_nbody_c(q,p,m,nu.linspace(0.,0.1,11),pot=MWPotential,
+                   softening_length=soft,opening_angle=0.7)
+    print "N=%7i: 10 tree steps in MWPotential in %.3f s" % (N,time.time()-start)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        Ns= [int(n) for n in sys.argv[1:]]
+    else:
+        Ns= [1000,10000,100000]
+    for N in Ns:
+        benchmark(N)
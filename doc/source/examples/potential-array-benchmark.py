@@ -0,0 +1,53 @@
+#Benchmark of the evaluation of potentials and forces on large grids
+#Run as python potential-array-benchmark.py [npoints]
+import sys
+import time
+import numpy as nu
+from galpy.potential import evaluatePotentials, evaluateRforces, \
+    evaluatezforces, MiyamotoNagaiPotential, IsochronePotential, \
+    DoubleExponentialDiskPotential, LogarithmicHaloPotential, \
+    KeplerPotential, PowerSphericalPotential, \
+    PowerSphericalPotentialwCutoff, NFWPotential, JaffePotential, \
+    HernquistPotential, RazorThinExponentialDiskPotential, \
+    FlattenedPowerPotential, MWPotential
+from galpy.potential_src.Potential import _check_c
+def benchmark(npoints):
+    nside= int(nu.sqrt(npoints))
+    R, z= nu.meshgrid(nu.linspace(0.1,3.,nside),nu.linspace(-1.,1.,nside),
+                      indexing='ij')
+    pots= [('MWPotential',MWPotential),
+           ('MiyamotoNagai',MiyamotoNagaiPotential(normalize=1.)),
+           ('Isochrone',IsochronePotential(normalize=1.)),
+           ('DoubleExponentialDisk',DoubleExponentialDiskPotential(normalize=1.)),
+           ('LogarithmicHalo',LogarithmicHaloPotential(normalize=1.,q=0.9)),
+           ('Kepler',KeplerPotential(normalize=1.)),
+           ('PowerSpherical',PowerSphericalPotential(normalize=1.)),
+           ('PowerSphericalwCutoff',PowerSphericalPotentialwCutoff(normalize=1.)),
+           ('NFW',NFWPotential(normalize=1.)),
+           ('Jaffe',JaffePotential(normalize=1.)),
+           ('Hernquist',HernquistPotential(normalize=1.)),
+           ('RazorThinExponentialDisk',RazorThinExponentialDiskPotential(normalize=1.)),
+           ('FlattenedPower',FlattenedPowerPotential(normalize=1.,q=0.8))]
+    print "Per-point cost in microseconds for a grid of %i points" % R.size
+    print "(C: using the C implementations, with OpenMP over the points)"
+    print "%25s %12s %12s %12s %12s %12s %12s" \
+        % ('Potential','Phi','F_R','F_z','Phi (C)','F_R (C)','F_z (C)')
+    for name, pot in pots:
+        times= []
+        for use_c in [False,True]:
+            for func in [evaluatePotentials,evaluateRforces,evaluatezforces]:
+                if use_c and not _check_c(pot):
+                    times.append(nu.nan)
+                    continue
+                start= time.time()
+                func(R,z,pot,use_c=use_c)
+                times.append((time.time()-start)/R.size*10.**6.)
+        print "%25s %12.4f %12.4f %12.4f %12.4f %12.4f %12.4f" \
+            % tuple([name]+times)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        npoints= int(sys.argv[1])
+    else:
+        npoints= 10**6
+    benchmark(npoints)
@@ -38,6 +38,9 @@ class actionAngleAdiabatic():
            pot= potential or list of potentials (planarPotentials)
 
            gamma= (default=1.) replace Lz by Lz+gamma Jz in effective potential
+
+           numcores= (None) number of OpenMP threads to use in the C code
+                     (default: OMP_NUM_THREADS or all available cores)
         OUTPUT:
         HISTORY:
             2012-07-26 - Written - Bovy (IAS@MPIA)
@@ -55,6 +58,10 @@ class actionAngleAdiabatic():
             self._gamma= kwargs['gamma']
         else:
             self._gamma= 1.
+        if kwargs.has_key('numcores'):
+            self._numcores= kwargs['numcores']
+        else:
+            self._numcores= None
         return None
     
     def __call__(self,*args,**kwargs):
@@ -68,12 +75,17 @@ class actionAngleAdiabatic():
               a) R,vR,vT,z,vz
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
+            numcores= overrides the object's numcores= keyword
            scipy.integrate.quadrature keywords
         OUTPUT:
            (jr,lz,jz), where jr=[jr,jrerr], and jz=[jz,jzerr]
         HISTORY:
            2012-07-26 - Written - Bovy (IAS@MPIA)
         """
+        if kwargs.has_key('numcores'):
+            numcores= kwargs.pop('numcores')
+        else:
+            numcores= self._numcores
         if ((self._c and not (kwargs.has_key('c') and not kwargs['c']))\
                 or (ext_loaded and ((kwargs.has_key('c') and kwargs['c'])))) \
                 and _check_c(self._pot):
@@ -96,7 +108,7 @@ class actionAngleAdiabatic():
                 vz= nu.array([vz])
             Lz= R*vT
             jr, jz, err= actionAngleAdiabatic_c.actionAngleAdiabatic_c(\
-                self._pot,self._gamma,R,vR,vT,z,vz)
+                self._pot,self._gamma,R,vR,vT,z,vz,numcores=numcores)
             if err == 0:
                 return (jr,Lz,jz)
             else:
@@ -16,13 +16,17 @@ from scipy import interpolate
 from actionAngleAdiabatic import actionAngleAdiabatic
 from galpy.actionAngle_src.actionAngle import actionAngle, UnboundError
 import galpy.potential
-from galpy.util import multi
+from galpy.util import multi, cache_dir, load_npy_cache, \
+    save_npy_cache
 from matplotlib import pyplot
 _PRINTOUTSIDEGRID= False
+#Grids that are saved in the on-disk cache
+_CACHEDGRIDS= ['_Rs','_EzZmaxs','_jz','_jzEzzmax','_Lzs','_RL','_ERRL',
+               '_ERRa','_jr','_jrERRa']
 class actionAngleAdiabaticGrid():
     """Action-angle formalism for axisymmetric potentials using the adiabatic approximation, grid-based interpolation"""
     def __init__(self,pot=None,zmax=1.,gamma=1.,Rmax=5.,
-                 nR=16,nEz=16,nEr=31,nLz=31,numcores=1,
+                 nR=16,nEz=16,nEr=31,nLz=31,numcores=None,cachedir=None,
                  **kwargs):
         """
         NAME:
@@ -41,7 +45,9 @@ class actionAngleAdiabaticGrid():
 
            nEz=, nEr=, nLz, nR= grid size
 
-           numcores= number of cpus to use to parallellize
+           numcores= number of cpus to use to parallellize (with c=True, the number of OpenMP threads; default: OMP_NUM_THREADS or all available cores; otherwise the rows of the grids are distributed over numcores processes; default: 1)
+
+           cachedir= if set, save the grids in this directory, under a key that depends on the potential, gamma, and the grid settings; later instances with the same key load the (memory-mapped) grids instead of re-computing them
 
            c= if True, use C to calculate actions
 
@@ -49,6 +55,7 @@ class actionAngleAdiabaticGrid():
         OUTPUT:
         HISTORY:
             2012-07-27 - Written - Bovy (IAS@MPIA)
+            2026-10-18 - Added cachedir
         """
         if pot is None:
             raise IOError("Must specify pot= for actionAngleAxi")
@@ -66,6 +73,30 @@ class actionAngleAdiabaticGrid():
         #Set up the actionAngleAdiabatic object that we will use to interpolate
         self._aA= actionAngleAdiabatic(pot=self._pot,gamma=self._gamma,
                                        c=self._c)
+        self._Lzmin= 0.01
+        self._Ramax= 99.
+        self._nR= nR
+        self._nEz= nEz
+        self._nEr= nEr
+        self._nLz= nLz
+        #Build grids or load them from the cache
+        self._cachedir= cache_dir(cachedir,self._pot,
+                                  (self._gamma,self._zmax,self._Rmax,
+                                   nR,nEz,nEr,nLz,self._c,kwargs))
+        grids= load_npy_cache(self._cachedir,_CACHEDGRIDS)
+        if grids is None:
+            self._calc_grids(numcores,**kwargs)
+            save_npy_cache(self._cachedir,
+                           dict([(name,self.__dict__[name])
+                                 for name in _CACHEDGRIDS]))
+        else:
+            self.__dict__.update(grids)
+        self._setup_interpolation()
+        return None
+
+    def _calc_grids(self,numcores,**kwargs):
+        """Calculate the Jz grid in (R,Ez) and the JR grid in (Lz,ER)"""
+        nR, nEz, nEr, nLz= self._nR, self._nEz, self._nEr, self._nLz
         #Build grid for Ez, first calculate Ez(zmax;R) function
         self._Rs= numpy.linspace(self._Rmin,self._Rmax,nR)
         try:
@@ -74,123 +105,123 @@ class actionAngleAdiabaticGrid():
         except TypeError:
             self._EzZmaxs= numpy.array([galpy.potential.evaluatePotentials(r,self._zmax,self._pot)-
                                         galpy.potential.evaluatePotentials(r,0.,self._pot) for r in self._Rs])
-        self._EzZmaxsInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(self._EzZmaxs),k=3)
         y= numpy.linspace(0.,1.,nEz)
-        jz= numpy.zeros((nR,nEz))
-        jzEzzmax= numpy.zeros(nR)
-        thisRs= (numpy.tile(self._Rs,(nEz,1)).T).flatten()
-        thisEzZmaxs= (numpy.tile(self._EzZmaxs,(nEz,1)).T).flatten()
-        thisy= (numpy.tile(y,(nR,1))).flatten()
-        if self._c:
-            jz= self._aA(thisRs,
-                         numpy.zeros(len(thisRs)),
-                         numpy.ones(len(thisRs)),#these two r dummies
-                         numpy.zeros(len(thisRs)),
-                         numpy.sqrt(2.*thisy*thisEzZmaxs),
-                         **kwargs)[2]
-            jz= numpy.reshape(jz,(nR,nEz))
-            jzEzzmax[0:nR]= jz[:,nEz-1]
-        else:
-            if numcores > 1:
-                jz= multi.parallel_map((lambda x: self._aA.Jz(thisRs[x],0.,1.,#these two r dummies
-                                                              0.,math.sqrt(2.*thisy[x]*thisEzZmaxs[x]),
-                                                              **kwargs)[0]),
-                                       range(nR*nEz),numcores=numcores)
-                jz= numpy.reshape(jz,(nR,nEz))
-                jzEzzmax[0:nR]= jz[:,nEz-1]
-            else:
-                for ii in range(nR):
-                    for jj in range(nEz):
-                    #Calculate Jz
-                        jz[ii,jj]= self._aA.Jz(self._Rs[ii],0.,1.,#these two r dummies
-                                               0.,numpy.sqrt(2.*y[jj]*self._EzZmaxs[ii]),
-                                               **kwargs)[0]
-                        if jj == nEz-1: 
-                            jzEzzmax[ii]= jz[ii,jj]
-        for ii in range(nR): jz[ii,:]/= jzEzzmax[ii]
-        #First interpolate Ez=Ezmax
-        self._jzEzmaxInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(jzEzzmax+10.**-5.),k=3)
+        thisRs= numpy.tile(self._Rs,(nEz,1)).T
+        thisEzZmaxs= numpy.tile(self._EzZmaxs,(nEz,1)).T
+        thisy= numpy.tile(y,(nR,1))
+        jz= self._calc_actions_grid(self._calc_jz,
+                                    thisRs,
+                                    numpy.sqrt(2.*thisy*thisEzZmaxs),
+                                    numcores=numcores,**kwargs)
+        self._jzEzzmax= jz[:,nEz-1].copy()
+        for ii in range(nR): jz[ii,:]/= self._jzEzzmax[ii]
         self._jz= jz
-        self._jzInterp= interpolate.RectBivariateSpline(self._Rs,
-                                                        y,
-                                                        jz,
-                                                        kx=3,ky=3,s=0.)
         #JR grid
-        self._Lzmin= 0.01
         self._Lzs= numpy.linspace(self._Lzmin,
                                   self._Rmax\
                                       *galpy.potential.vcirc(self._pot,
                                                              self._Rmax),
                                   nLz)
-        self._Lzmax= self._Lzs[-1]
         #Calculate ER(vr=0,R=RL)
         self._RL= numpy.array([galpy.potential.rl(self._pot,l) for l in self._Lzs])
-        self._RLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                 self._RL,k=3)
         try:
-            self._ERRL= galpy.potential.evaluatePotentials(self._RL,numpy.zeros(nLz),self._pot) +self._Lzs**2./2./self._RL**2.
+            PhiRL= galpy.potential.evaluatePotentials(self._RL,numpy.zeros(nLz),self._pot)
         except TypeError:
-            self._ERRL= numpy.array([galpy.potential.evaluatePotentials(self._RL[ii],0.,self._pot) +self._Lzs[ii]**2./2./self._RL[ii]**2. for ii in range(nLz)])
-        self._ERRLmax= numpy.amax(self._ERRL)+1.
-        self._ERRLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                   numpy.log(-(self._ERRL-self._ERRLmax)),k=3)
-        self._Ramax= 99.
+            PhiRL= numpy.array([galpy.potential.evaluatePotentials(self._RL[ii],0.,self._pot) for ii in range(nLz)])
+        self._ERRL= PhiRL+self._Lzs**2./2./self._RL**2.
         try:
             self._ERRa= galpy.potential.evaluatePotentials(self._Ramax,0.,self._pot) +self._Lzs**2./2./self._Ramax**2.
         except TypeError:
             self._ERRa= numpy.array([galpy.potential.evaluatePotentials(self._Ramax,0.,self._pot) +self._Lzs[ii]**2./2./self._Ramax**2. for ii in range(nLz)])
-        self._ERRamax= numpy.amax(self._ERRa)+1.
-        self._ERRaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                   numpy.log(-(self._ERRa-self._ERRamax)),k=3)
         y= numpy.linspace(0.,1.,nEr)
         jr= numpy.zeros((nLz,nEr))
-        jrERRa= numpy.zeros(nLz)
-        thisRL= (numpy.tile(self._RL,(nEr-1,1)).T).flatten()
-        thisLzs= (numpy.tile(self._Lzs,(nEr-1,1)).T).flatten()
-        thisERRL= (numpy.tile(self._ERRL,(nEr-1,1)).T).flatten()
-        thisERRa= (numpy.tile(self._ERRa,(nEr-1,1)).T).flatten()
-        thisy= (numpy.tile(y[0:-1],(nLz,1))).flatten()
+        thisRL= numpy.tile(self._RL,(nEr-1,1)).T
+        thisLzs= numpy.tile(self._Lzs,(nEr-1,1)).T
+        thisERRL= numpy.tile(self._ERRL,(nEr-1,1)).T
+        thisERRa= numpy.tile(self._ERRa,(nEr-1,1)).T
+        thisPhiRL= numpy.tile(PhiRL,(nEr-1,1)).T
+        thisy= numpy.tile(y[0:-1],(nLz,1))
+        #Last one is zero by construction
+        jr[:,0:-1]= self._calc_actions_grid(self._calc_jr,
+                                            thisRL,
+                                            numpy.sqrt(2.*(thisERRa+thisy*(thisERRL-thisERRa)-thisPhiRL)-thisLzs**2./thisRL**2.),
+                                            thisLzs/thisRL,
+                                            numcores=numcores,**kwargs)
+        self._jrERRa= jr[:,0].copy()
+        for ii in range(nLz): jr[ii,:]/= self._jrERRa[ii]
+        self._jr= jr
+        return None
+
+    def _calc_actions_grid(self,func,*args,**kwargs):
+        """Calculate actions on a grid with func(*args), all at once when
+        using C, otherwise with the rows of the grid distributed over
+        numcores processes"""
+        numcores= kwargs.pop('numcores',None)
+        shape= args[0].shape
+        if self._c or numcores is None or numcores < 2:
+            out= func(*[arg.flatten() for arg in args],numcores=numcores,
+                       **kwargs)
+            return numpy.reshape(out,shape)
+        out= multi.parallel_map((lambda x: func(*[arg[x] for arg in args],
+                                                **kwargs)),
+                                range(shape[0]),
+                                numcores=numpy.amin([numcores,shape[0]]))
+        return numpy.array(out)
+
+    def _calc_jz(self,R,vz,numcores=None,**kwargs):
+        """Calculate Jz for arrays of (R,vz) at z=0"""
         if self._c:
-            mjr= self._aA(thisRL,
-                          numpy.sqrt(2.*(thisERRa+thisy*(thisERRL-thisERRa)-galpy.potential.evaluatePotentials(thisRL,numpy.zeros((nEr-1)*nLz),self._pot))-thisLzs**2./thisRL**2.),
-                          thisLzs/thisRL,
-                          numpy.zeros(len(thisRL)),
-                          numpy.zeros(len(thisRL)),
-                          **kwargs)[0]
-            jr[:,0:-1]= numpy.reshape(mjr,(nLz,nEr-1))
-            jrERRa[0:nLz]= jr[:,0]
+            return self._aA(R,
+                            numpy.zeros(len(R)),
+                            numpy.ones(len(R)),#these two r dummies
+                            numpy.zeros(len(R)),
+                            vz,
+                            numcores=numcores,
+                            **kwargs)[2]
         else:
-            if numcores > 1:
-                mjr= multi.parallel_map((lambda x: self._aA.JR(thisRL[x],
-                                                          numpy.sqrt(2.*(thisERRa[x]+thisy[x]*(thisERRL[x]-thisERRa[x])-galpy.potential.evaluatePotentials(thisRL[x],0.,self._pot))-thisLzs[x]**2./thisRL[x]**2.),
-                                                               thisLzs[x]/thisRL[x],
-                                                               0.,0.,
-                                                               **kwargs)[0]),
-                                        range((nEr-1)*nLz),
-                                        numcores=numcores)
-                jr[:,0:-1]= numpy.reshape(mjr,(nLz,nEr-1))
-                jrERRa[0:nLz]= jr[:,0]
-            else:
-                for ii in range(nLz):
-                    for jj in range(nEr-1): #Last one is zero by construction
-                        try:
-                            jr[ii,jj]= self._aA.JR(self._RL[ii],
-                                                   numpy.sqrt(2.*(self._ERRa[ii]+y[jj]*(self._ERRL[ii]-self._ERRa[ii])-galpy.potential.evaluatePotentials(self._RL[ii],0.,self._pot))-self._Lzs[ii]**2./self._RL[ii]**2.),
-                                                   self._Lzs[ii]/self._RL[ii],
-                                                   0.,0.,
-                                                   **kwargs)[0]
-                        except UnboundError:
-                            raise
-                        if jj == 0: 
-                            jrERRa[ii]= jr[ii,jj]
-        for ii in range(nLz): jr[ii,:]/= jrERRa[ii]
+            #Jz returns [9999.99,nan] for unbound orbits, a float otherwise
+            return numpy.array([numpy.atleast_1d(\
+                        self._aA.Jz(R[ii],0.,1.,#these two r dummies
+                                    0.,vz[ii],**kwargs))[0]
+                                for ii in range(len(R))])
+
+    def _calc_jr(self,R,vR,vT,numcores=None,**kwargs):
+        """Calculate JR for arrays of (R,vR,vT) at z=0"""
+        if self._c:
+            return self._aA(R,vR,vT,
+                            numpy.zeros(len(R)),
+                            numpy.zeros(len(R)),
+                            numcores=numcores,
+                            **kwargs)[0]
+        else:
+            return numpy.array([self._aA.JR(R[ii],vR[ii],vT[ii],0.,0.,
+                                            **kwargs)
+                                for ii in range(len(R))])
+
+    def _setup_interpolation(self):
+        """Set up the interpolations of the grids"""
+        self._EzZmaxsInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(self._EzZmaxs),k=3)
+        #First interpolate Ez=Ezmax
+        self._jzEzmaxInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(self._jzEzzmax+10.**-5.),k=3)
+        self._jzInterp= interpolate.RectBivariateSpline(self._Rs,
+                                                        numpy.linspace(0.,1.,self._nEz),
+                                                        self._jz,
+                                                        kx=3,ky=3,s=0.)
+        self._Lzmax= self._Lzs[-1]
+        self._RLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
+                                                                 self._RL,k=3)
+        self._ERRLmax= numpy.amax(self._ERRL)+1.
+        self._ERRLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
+                                                                   numpy.log(-(self._ERRL-self._ERRLmax)),k=3)
+        self._ERRamax= numpy.amax(self._ERRa)+1.
+        self._ERRaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
+                                                                   numpy.log(-(self._ERRa-self._ERRamax)),k=3)
         #First interpolate Ez=Ezmax
-        self._jr= jr
         self._jrERRaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                     numpy.log(jrERRa+10.**-5.),k=3)
+                                                                     numpy.log(self._jrERRa+10.**-5.),k=3)
         self._jrInterp= interpolate.RectBivariateSpline(self._Lzs,
-                                                        y,
-                                                        jr,
+                                                        numpy.linspace(0.,1.,self._nEr),
+                                                        self._jr,
                                                         kx=3,ky=3,s=0.)
         return None
 
@@ -22,7 +22,7 @@ for path in sys.path:
 if _lib is None:
     raise IOError('galpy actionAngle_c module not found')
 
-def actionAngleAdiabatic_c(pot,gamma,R,vR,vT,z,vz):
+def actionAngleAdiabatic_c(pot,gamma,R,vR,vT,z,vz,numcores=None):
     """
     NAME:
        actionAngleAdiabatic_c
@@ -32,6 +32,8 @@ def actionAngleAdiabatic_c(pot,gamma,R,vR,vT,z,vz):
        pot - Potential or list of such instances
        gamma - as in Lz -> Lz+\gamma * J_z
        R, vR, vT, z, vz - coordinates (arrays)
+       numcores= (None) number of OpenMP threads to use (default:
+                 OMP_NUM_THREADS or all available cores)
     OUTPUT:
        (jr,jz,err)
        jr,jz : array, shape (len(R))
@@ -39,6 +41,7 @@ def actionAngleAdiabatic_c(pot,gamma,R,vR,vT,z,vz):
     HISTORY:
        2012-12-10 - Written - Bovy (IAS)
     """
+    if numcores is None: numcores= 0 #lets OpenMP decide
     #Parse the potential
     npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
 
@@ -62,6 +65,7 @@ def actionAngleAdiabatic_c(pot,gamma,R,vR,vT,z,vz):
                                                 ctypes.c_double,
                                                 ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                                 ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                                ctypes.c_int,
                                                 ctypes.POINTER(ctypes.c_int)]
 
     #Array requirements, first store old order
@@ -91,6 +95,7 @@ def actionAngleAdiabatic_c(pot,gamma,R,vR,vT,z,vz):
                                      ctypes.c_double(gamma),
                                      jr,
                                      jz,
+                                     ctypes.c_int(numcores),
                                      ctypes.byref(err))
 
     #Reset input arrays
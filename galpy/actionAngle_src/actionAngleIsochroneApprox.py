@@ -49,6 +49,10 @@ class actionAngleIsochroneApprox():
 
            integrate_method= (default: 'dopr54_c') integration method to use
 
+           numcores= (None) number of OpenMP threads to use to integrate all orbits at once in C (default: OMP_NUM_THREADS or all available cores)
+
+           blocksize= (None) if set, orbits given as phase-space values are integrated in blocks of this many times and the sums needed for the actions and the angle-fit are accumulated on the fly, such that the memory per orbit does not grow with ntintJ (not used for Orbit inputs, for cumul=, or for the private _acfs= and _retacfs= options)
+
         OUTPUT:
         HISTORY:
            2013-09-10 - Written - Bovy (IAS)
@@ -84,6 +88,14 @@ class actionAngleIsochroneApprox():
             self._integrate_method= kwargs['integrate_method']
         else:
             self._integrate_method= 'dopr54_c'
+        if kwargs.has_key('numcores'):
+            self._numcores= kwargs['numcores']
+        else:
+            self._numcores= None
+        if kwargs.has_key('blocksize'):
+            self._blocksize= kwargs['blocksize']
+        else:
+            self._blocksize= None
         self._c= False
         ext_loaded= False
         if ext_loaded and ((kwargs.has_key('c') and kwargs['c'])
@@ -116,6 +128,14 @@ class actionAngleIsochroneApprox():
         HISTORY:
            2013-09-10 - Written - Bovy (IAS)
         """
+        if self._stream(*args) \
+                and not (kwargs.has_key('cumul') and kwargs['cumul']):
+            nonaxi= kwargs.has_key('nonaxi') and kwargs['nonaxi']
+            sums, lz= self._stream_sums(False,*args)
+            jr, lzI, jz= sums.actions(nonaxi=nonaxi)
+            if nonaxi:
+                lz= lzI
+            return (jr,lz,jz)
         R,vR,vT,z,vz,phi= self._parse_args(False,False,*args)
         if self._c:
             pass
@@ -212,6 +232,20 @@ class actionAngleIsochroneApprox():
             _firstFlip= kwargs['_firstFlip']
         else:
             _firstFlip= False
+        if kwargs.has_key('maxn'):
+            maxn= kwargs['maxn']
+        else:
+            maxn= 3
+        if self._stream(*args) and not kwargs.has_key('_acfs') \
+                and not (kwargs.has_key('_retacfs') and kwargs['_retacfs']) \
+                and not (kwargs.has_key('cumul') and kwargs['cumul']):
+            sums, lz= self._stream_sums(maxn,*args)
+            jr, lzI, jz= sums.actions()
+            OmegaR,Omegaphi,OmegaZ,angleR,anglephi,angleZ= sums.angleFit()
+            return (jr,lz,jz,OmegaR,Omegaphi,OmegaZ,
+                    angleR % _TWOPI,
+                    anglephi % _TWOPI,
+                    angleZ % _TWOPI)
         R,vR,vT,z,vz,phi= self._parse_args(True,_firstFlip,*args)
         if kwargs.has_key('ts') and not kwargs['ts'] is None:
             ts= kwargs['ts']
@@ -219,10 +253,6 @@ class actionAngleIsochroneApprox():
             ts= nu.empty(R.shape[1])
             ts[self._ntintJ-1:]= self._tsJ
             ts[:self._ntintJ-1]= -self._tsJ[1:][::-1]
-        if kwargs.has_key('maxn'):
-            maxn= kwargs['maxn']
-        else:
-            maxn= 3
         if self._c:
             pass
         else:
@@ -292,26 +322,22 @@ class actionAngleIsochroneApprox():
             mask[:2*maxn-3:2]= False
             gridR= gridR[mask]
             gridZ= gridZ[mask]
-            tangleR= nu.tile(angleRT.T,(nn,1,1)).T
-            tgridR= nu.tile(gridR,(no,nt,1))
-            tangleZ= nu.tile(angleZT.T,(nn,1,1)).T
-            tgridZ= nu.tile(gridZ,(no,nt,1))
-            sinnR= nu.sin(tgridR*tangleR+tgridZ*tangleZ)
-            A[:,:,2:]= sinnR
-            #Matrix magic
-            atainv= nu.empty((no,2+nn,2+nn))
-            AT= nu.transpose(A,axes=(0,2,1))
-            for ii in range(no):
-                atainv[ii,:,:,]= linalg.inv(nu.dot(AT[ii,:,:],A[ii,:,:]))
-            ATAR= nu.sum(AT*nu.transpose(nu.tile(angleRT,(2+nn,1,1)),axes=(1,0,2)),axis=2)
-            ATAT= nu.sum(AT*nu.transpose(nu.tile(anglephiT,(2+nn,1,1)),axes=(1,0,2)),axis=2)
-            ATAZ= nu.sum(AT*nu.transpose(nu.tile(angleZT,(2+nn,1,1)),axes=(1,0,2)),axis=2)
-            angleR= nu.sum(atainv[:,0,:]*ATAR,axis=1)
-            OmegaR= nu.sum(atainv[:,1,:]*ATAR,axis=1)
-            anglephi= nu.sum(atainv[:,0,:]*ATAT,axis=1)
-            Omegaphi= nu.sum(atainv[:,1,:]*ATAT,axis=1)
-            angleZ= nu.sum(atainv[:,0,:]*ATAZ,axis=1)
-            OmegaZ= nu.sum(atainv[:,1,:]*ATAZ,axis=1)
+            A[:,:,2:]= nu.sin(gridR*angleRT[:,:,nu.newaxis]
+                              +gridZ*angleZT[:,:,nu.newaxis])
+            #Matrix magic: solve the normal equations of all objects at once,
+            #for the three angles at once
+            ATA= nu.einsum('ijk,ijl->ikl',A,A)
+            ATY= nu.empty((no,2+nn,3))
+            ATY[:,:,0]= nu.einsum('ijk,ij->ik',A,angleRT)
+            ATY[:,:,1]= nu.einsum('ijk,ij->ik',A,anglephiT)
+            ATY[:,:,2]= nu.einsum('ijk,ij->ik',A,angleZT)
+            X= linalg.solve(ATA,ATY)
+            angleR= X[:,0,0]
+            OmegaR= X[:,1,0]
+            anglephi= X[:,0,1]
+            Omegaphi= X[:,1,1]
+            angleZ= X[:,0,2]
+            OmegaZ= X[:,1,2]
             Omegaphi[negFreqIndx]= -Omegaphi[negFreqIndx]
             anglephi[negFreqIndx]= _TWOPI-anglephi[negFreqIndx]
             if kwargs.has_key('_retacfs') and kwargs['_retacfs']:
@@ -549,7 +575,6 @@ class actionAngleIsochroneApprox():
     def _parse_args(self,freqsAngles=True,_firstFlip=False,*args):
         """Helper function to parse the arguments to the __call__ and actionsFreqsAngles functions"""
         from galpy.orbit import Orbit
-        RasOrbit= False
         integrated= True #whether the orbit was already integrated when given
         if len(args) == 5 or len(args) == 3:
             raise IOError("Must specify phi for actionAngleIsochroneApprox")
@@ -571,15 +596,11 @@ class actionAngleIsochroneApprox():
                 phi= nu.reshape(this_orbit[:,5],(1,self._ntintJ))           
                 integrated= False
             if len(R.shape) == 1: #not integrated yet
-                os= [Orbit([R[ii],vR[ii],vT[ii],z[ii],vz[ii],phi[ii]]) for ii in range(R.shape[0])]
-                RasOrbit= True
+                R,vR,vT,z,vz,phi= self._integrate_orbits(R,vR,vT,z,vz,phi)
                 integrated= False
         if isinstance(args[0],Orbit) \
-                or (isinstance(args[0],list) and isinstance(args[0][0],Orbit)) \
-                or RasOrbit:
-            if RasOrbit:
-                pass
-            elif not isinstance(args[0],list):
+                or (isinstance(args[0],list) and isinstance(args[0][0],Orbit)):
+            if not isinstance(args[0],list):
                 os= [args[0]]
                 if len(os[0]._orb.vxvv) == 3 or len(os[0]._orb.vxvv) == 5:
                     raise IOError("Must specify phi for actionAngleIsochroneApprox")
@@ -646,38 +667,245 @@ class actionAngleIsochroneApprox():
                 oz[:,nt-1:]= z
                 ovz[:,nt-1:]= vz
                 ophi[:,nt-1:]= phi
-            #load orbits
+            #integrate all orbits at once
             if _firstFlip:
-                os= [Orbit([R[ii,0],vR[ii,0],vT[ii,0],z[ii,0],vz[ii,0],phi[ii,0]]) for ii in range(R.shape[0])]
+                bR,bvR,bvT,bz,bvz,bphi= self._integrate_orbits(R[:,0],vR[:,0],
+                                                               vT[:,0],z[:,0],
+                                                               vz[:,0],phi[:,0])
             else:
-                os= [Orbit([R[ii,0],-vR[ii,0],-vT[ii,0],z[ii,0],-vz[ii,0],phi[ii,0]]) for ii in range(R.shape[0])]
-            #integrate orbits
-            [o.integrate(self._tsJ,pot=self._pot,
-                         method=self._integrate_method) for o in os]
+                bR,bvR,bvT,bz,bvz,bphi= self._integrate_orbits(R[:,0],-vR[:,0],
+                                                               -vT[:,0],z[:,0],
+                                                               -vz[:,0],phi[:,0])
             #extract phase-space points along the orbit
-            ts= self._tsJ
             if _firstFlip:
-                for ii in range(no):
-                    oR[ii,nt:]= os[ii].R(ts[1:]) #drop t=0, which we have
-                    ovR[ii,nt:]= os[ii].vR(ts[1:]) #already
-                    ovT[ii,nt:]= os[ii].vT(ts[1:]) # reverse, such that 
-                    if os[ii].getOrbit().shape[1] == 6:
-                        oz[ii,nt:]= os[ii].z(ts[1:]) #everything is in the 
-                        ovz[ii,nt:]= os[ii].vz(ts[1:]) #right order
-                    ophi[ii,nt:]= os[ii].phi(ts[1:]) #!
+                oR[:,nt:]= bR[:,1:] #drop t=0, which we have
+                ovR[:,nt:]= bvR[:,1:] #already
+                ovT[:,nt:]= bvT[:,1:] # reverse, such that 
+                oz[:,nt:]= bz[:,1:] #everything is in the 
+                ovz[:,nt:]= bvz[:,1:] #right order
+                ophi[:,nt:]= bphi[:,1:] #!
             else:
-                for ii in range(no):
-                    oR[ii,:nt-1]= os[ii].R(ts[1:])[::-1] #drop t=0, which we have
-                    ovR[ii,:nt-1]= -os[ii].vR(ts[1:])[::-1] #already
-                    ovT[ii,:nt-1]= -os[ii].vT(ts[1:])[::-1] # reverse, such that 
-                    if os[ii].getOrbit().shape[1] == 6:
-                        oz[ii,:nt-1]= os[ii].z(ts[1:])[::-1] #everything is in the 
-                        ovz[ii,:nt-1]= -os[ii].vz(ts[1:])[::-1] #right order
-                    ophi[ii,:nt-1]= os[ii].phi(ts[1:])[::-1] #!
+                oR[:,:nt-1]= bR[:,1:][:,::-1] #drop t=0, which we have
+                ovR[:,:nt-1]= -bvR[:,1:][:,::-1] #already
+                ovT[:,:nt-1]= -bvT[:,1:][:,::-1] # reverse, such that 
+                oz[:,:nt-1]= bz[:,1:][:,::-1] #everything is in the 
+                ovz[:,:nt-1]= -bvz[:,1:][:,::-1] #right order
+                ophi[:,:nt-1]= bphi[:,1:][:,::-1] #!
             return (oR,ovR,ovT,oz,ovz,ophi)
         else:
             return (R,vR,vT,z,vz,phi)
 
+    def _integrate_orbits(self,R,vR,vT,z,vz,phi):
+        """Integrate all orbits for self._tsJ at once (in a single call to
+        the C integrators when possible) and return the phase-space
+        coordinates along them as [N,ntintJ] arrays"""
+        from galpy.orbit import Orbit
+        vxvv= nu.empty((len(R),6))
+        vxvv[:,0]= R
+        vxvv[:,1]= vR
+        vxvv[:,2]= vT
+        vxvv[:,3]= z
+        vxvv[:,4]= vz
+        vxvv[:,5]= phi
+        o= Orbit(vxvv)
+        o.integrate(self._tsJ,pot=self._pot,method=self._integrate_method,
+                    numcores=self._numcores)
+        this_orbit= o.getOrbit()
+        return (this_orbit[:,:,0],this_orbit[:,:,1],this_orbit[:,:,2],
+                this_orbit[:,:,3],this_orbit[:,:,4],this_orbit[:,:,5])
+
+    def _stream(self,*args):
+        """Helper function to decide whether to integrate the orbits in blocks, accumulating the sums for the actions and the angle-fit on the fly"""
+        return not self._blocksize is None \
+            and (len(args) == 6 or len(args) == 4) \
+            and (isinstance(args[0],float)
+                 or (isinstance(args[0],nu.ndarray)
+                     and len(args[0].shape) == 1))
+
+    def _stream_sums(self,maxn,*args):
+        """Integrate the orbits starting at the given phase-space values in
+        blocks of self._blocksize times and accumulate the sums for the
+        actions (and for the angle-fit, integrating backward as well, if
+        maxn is not False); returns the _isochroneApproxSums instance and
+        the initial Lz"""
+        if len(args) == 6:
+            R,vR,vT, z, vz, phi= args
+        else:
+            R,vR,vT, phi= args
+            z, vz= 0., 0.
+        R= nu.atleast_1d(R)
+        vxvv= nu.empty((len(R),6))
+        vxvv[:,0]= R
+        vxvv[:,1]= vR
+        vxvv[:,2]= vT
+        vxvv[:,3]= z
+        vxvv[:,4]= vz
+        vxvv[:,5]= phi
+        sums= _isochroneApproxSums(self._aAI,len(R),maxn)
+        if maxn: #backward first, for the angle-fit
+            directions= [-1.,1.]
+        else:
+            directions= [1.]
+        for direction in directions:
+            sums.start(direction)
+            thisvxvv= vxvv.copy()
+            thisvxvv[:,[1,2,4]]*= direction
+            for tb, ob in self._stream_orbits(thisvxvv):
+                sums.add(direction*tb,ob[:,:,0],direction*ob[:,:,1],
+                         direction*ob[:,:,2],ob[:,:,3],direction*ob[:,:,4],
+                         ob[:,:,5])
+        return (sums,vxvv[:,0]*vxvv[:,2])
+
+    def _stream_orbits(self,vxvv):
+        """Generator that yields the orbits starting at vxvv for self._tsJ
+        in blocks of self._blocksize times"""
+        from galpy.orbit import Orbit
+        o= Orbit(vxvv)
+        return o.integrate_stream(self._tsJ,self._pot,
+                                  method=self._integrate_method,
+                                  blocksize=self._blocksize,
+                                  numcores=self._numcores)
+
+class _isochroneApproxSums:
+    """Running sums for the actions and for the normal equations of the angle-fit of actionAngleIsochroneApprox, accumulated block by block along the orbits"""
+    def __init__(self,aAI,no,maxn=False):
+        self._aAI= aAI
+        self._no= no
+        #Actions: sum of J x dangle and of dangle for (R,phi,Z)
+        self._jsums= nu.zeros((no,3))
+        self._danglesums= nu.zeros((no,3))
+        #For the angle-coverage warnings
+        self._anglemin= nu.zeros((no,3))+_TWOPI
+        self._anglemax= nu.zeros((no,3))
+        self._fit= bool(maxn)
+        if self._fit:
+            phig= list(nu.arange(-maxn+1,maxn,1))
+            phig.sort(key = lambda x: abs(x))
+            phig= nu.array(phig,dtype='int')
+            grid= nu.meshgrid(nu.arange(maxn),
+                              phig)
+            gridR= grid[0].T.flatten()[1:] #remove 0,0,0
+            gridZ= grid[1].T.flatten()[1:]
+            mask = nu.ones(len(gridR),dtype=bool)
+            mask[:2*maxn-3:2]= False
+            self._gridR= gridR[mask]
+            self._gridZ= gridZ[mask]
+            nn= len(self._gridR)
+            self._ATA= nu.zeros((no,2+nn,2+nn))
+            #(R,phi,Z) and the reversed azimuthal angle 2pi-anglephi, which
+            #is fit instead for orbits with a negative azimuthal frequency
+            self._ATY= nu.zeros((no,2+nn,4))
+            #To determine whether anglephi is decreasing along the orbit
+            self._nnegdphi= nu.zeros(no,dtype='int')
+            self._ndphi= 0
+        return None
+
+    def start(self,direction):
+        """Start a new stretch of orbit, going forward (direction=1) or backward (direction=-1) in time from t=0"""
+        self._direction= direction
+        self._last= None
+        if self._fit:
+            self._offset= nu.zeros((self._no,4))
+        return None
+
+    def add(self,t,R,vR,vT,z,vz,phi):
+        """Add the next block [N,nt] of the orbits, at times t in the order of the integration"""
+        acfs= self._aAI.actionsFreqsAngles(R.flatten(),
+                                           vR.flatten(),
+                                           vT.flatten(),
+                                           z.flatten(),
+                                           vz.flatten(),
+                                           phi.flatten())
+        js= nu.empty(R.shape+(3,))
+        js[:,:,0]= nu.reshape(acfs[0],R.shape)
+        js[:,:,1]= nu.reshape(acfs[1],R.shape)
+        js[:,:,2]= nu.reshape(acfs[2],R.shape)
+        angles= nu.empty(R.shape+(3,))
+        angles[:,:,0]= nu.reshape(acfs[6],R.shape)
+        angles[:,:,1]= nu.reshape(acfs[7],R.shape)
+        angles[:,:,2]= nu.reshape(acfs[8],R.shape)
+        self._anglemin= nu.minimum(self._anglemin,nu.amin(angles,axis=1))
+        self._anglemax= nu.maximum(self._anglemax,nu.amax(angles,axis=1))
+        if self._last is None: #t=0, which starts both the back- and forward
+            self._last= (js[:,0],angles[:,0])
+            if self._fit and self._direction > 0.: #only include t=0 once
+                self._addFit(t[:1],angles[:,:1])
+            t= t[1:]
+            js= js[:,1:]
+            angles= angles[:,1:]
+            if len(t) == 0: return None
+        lastjs, lastangles= self._last
+        self._last= (js[:,-1],angles[:,-1])
+        #Each step contributes the action at its earlier time
+        if self._direction > 0.:
+            dangles= (angles-nu.concatenate((lastangles[:,None],
+                                             angles[:,:-1]),axis=1)) % _TWOPI
+            ejs= nu.concatenate((lastjs[:,None],js[:,:-1]),axis=1)
+        else:
+            dangles= (nu.concatenate((lastangles[:,None],angles[:,:-1]),
+                                     axis=1)-angles) % _TWOPI
+            ejs= js
+        self._jsums+= nu.sum(ejs*dangles,axis=1)
+        self._danglesums+= nu.sum(dangles,axis=1)
+        if self._fit:
+            dphi= self._direction\
+                *(angles[:,:,1]-nu.concatenate((lastangles[:,None,1],
+                                                angles[:,:-1,1]),axis=1))
+            self._nnegdphi+= nu.sum(dphi < 0.,axis=1)
+            self._ndphi+= dphi.shape[1]
+            self._addFit(t,angles,lastangles=lastangles)
+        return None
+
+    def _addFit(self,t,angles,lastangles=None):
+        """Add the rows at times t to the normal equations of the angle-fit, de-perioding the angles continuously along the orbit"""
+        angles= nu.concatenate((angles,_TWOPI-angles[:,:,1:2]),axis=2)
+        if not lastangles is None:
+            lastangles= nu.concatenate((lastangles,_TWOPI-lastangles[:,1:2]),
+                                       axis=1)
+            diff= angles-nu.concatenate((lastangles[:,None],angles[:,:-1]),
+                                        axis=1)
+            if self._direction > 0.:
+                w= (diff < -6.).astype(int)
+            else:
+                w= -(diff > 6.).astype(int)
+            addto= self._offset[:,None]+_TWOPI*nu.cumsum(w,axis=1)
+            self._offset= addto[:,-1]
+            angles+= addto
+        A= nu.empty(angles.shape[:2]+(2+len(self._gridR),))
+        A[:,:,0]= 1.
+        A[:,:,1]= t
+        A[:,:,2:]= nu.sin(self._gridR*angles[:,:,0,nu.newaxis]
+                          +self._gridZ*angles[:,:,2,nu.newaxis])
+        self._ATA+= nu.einsum('ijk,ijl->ikl',A,A)
+        self._ATY+= nu.einsum('ijk,ijl->ikl',A,angles)
+        return None
+
+    def actions(self,nonaxi=False):
+        """Return the (jr,lz,jz) averaged over the angles, warning when the full angle range has not been covered"""
+        notcovered= (nu.fabs(self._anglemax-_TWOPI) > _ANGLETOL)\
+            *(nu.fabs(self._anglemin) > _ANGLETOL)
+        if nu.any(notcovered[:,0]):
+            warnings.warn("Full radial angle range not covered for at least one object; actions are likely not reliable",galpyWarning)
+        if nu.any(notcovered[:,2]):
+            warnings.warn("Full vertical angle range not covered for at least one object; actions are likely not reliable",galpyWarning)
+        if nonaxi and nu.any(notcovered[:,1]):
+            warnings.warn("Full azimuthal angle range not covered for at least one object; actions are likely not reliable",galpyWarning)
+        js= self._jsums/self._danglesums
+        return (js[:,0],js[:,1],js[:,2])
+
+    def angleFit(self):
+        """Solve the normal equations of the angle-fit, return (OmegaR,Omegaphi,OmegaZ,angleR,anglephi,angleZ)"""
+        X= linalg.solve(self._ATA,self._ATY)
+        angleR= X[:,0,0]
+        OmegaR= X[:,1,0]
+        angleZ= X[:,0,2]
+        OmegaZ= X[:,1,2]
+        #anglephi is decreasing when the median step over all blocks is < 0
+        negFreqIndx= self._nnegdphi > self._ndphi/2.
+        anglephi= nu.where(negFreqIndx,_TWOPI-X[:,0,3],X[:,0,1])
+        Omegaphi= nu.where(negFreqIndx,-X[:,1,3],X[:,1,1])
+        return (OmegaR,Omegaphi,OmegaZ,angleR,anglephi,angleZ)
+
 def estimateBIsochrone(R,z,pot=None):
     """
     NAME:
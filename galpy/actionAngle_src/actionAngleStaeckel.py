@@ -43,6 +43,9 @@ class actionAngleStaeckel():
            useu0 - use u0 to calculate dV (NOT recommended)
 
            c= if True, always use C for calculations
+
+           numcores= (None) number of OpenMP threads to use in the C code
+                     (default: OMP_NUM_THREADS or all available cores)
         OUTPUT:
         HISTORY:
            2012-11-27 - Written - Bovy (IAS)
@@ -64,6 +67,10 @@ class actionAngleStaeckel():
         else:
             self._useu0= False
         self._delta= kwargs['delta']
+        if kwargs.has_key('numcores'):
+            self._numcores= kwargs['numcores']
+        else:
+            self._numcores= None
         return None
     
     def __call__(self,*args,**kwargs):
@@ -78,12 +85,17 @@ class actionAngleStaeckel():
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
             c= True/False; overrides the object's c= keyword to use C or not
+            numcores= overrides the object's numcores= keyword
            scipy.integrate.quadrature keywords
         OUTPUT:
            (jr,lz,jz)
         HISTORY:
            2012-11-27 - Written - Bovy (IAS)
         """
+        if kwargs.has_key('numcores'):
+            numcores= kwargs.pop('numcores')
+        else:
+            numcores= self._numcores
         if ((self._c and not (kwargs.has_key('c') and not kwargs['c']))\
                 or (ext_loaded and ((kwargs.has_key('c') and kwargs['c'])))) \
                 and _check_c(self._pot):
@@ -118,7 +130,7 @@ class actionAngleStaeckel():
             else:
                 u0= None
             jr, jz, err= actionAngleStaeckel_c.actionAngleStaeckel_c(\
-                self._pot,self._delta,R,vR,vT,z,vz,u0=u0)
+                self._pot,self._delta,R,vR,vT,z,vz,u0=u0,numcores=numcores)
             if err == 0:
                 return (jr,Lz,jz)
             else:
@@ -163,12 +175,17 @@ class actionAngleStaeckel():
               a) R,vR,vT,z,vz
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
+            numcores= overrides the object's numcores= keyword
            scipy.integrate.quadrature keywords
         OUTPUT:
             (jr,lz,jz,Omegar,Omegaphi,Omegaz)
         HISTORY:
            2013-08-28 - Written - Bovy (IAS)
         """
+        if kwargs.has_key('numcores'):
+            numcores= kwargs.pop('numcores')
+        else:
+            numcores= self._numcores
         if ((self._c and not (kwargs.has_key('c') and not kwargs['c']))\
                 or (ext_loaded and ((kwargs.has_key('c') and kwargs['c'])))) \
                 and _check_c(self._pot):
@@ -203,7 +220,7 @@ class actionAngleStaeckel():
             else:
                 u0= None
             jr, jz, Omegar, Omegaphi, Omegaz, err= actionAngleStaeckel_c.actionAngleFreqStaeckel_c(\
-                self._pot,self._delta,R,vR,vT,z,vz,u0=u0)
+                self._pot,self._delta,R,vR,vT,z,vz,u0=u0,numcores=numcores)
             if err == 0:
                 return (jr,Lz,jz,Omegar,Omegaphi,Omegaz)
             else:
@@ -225,12 +242,17 @@ class actionAngleStaeckel():
               a) R,vR,vT,z,vz,phi (MUST HAVE PHI)
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
+            numcores= overrides the object's numcores= keyword
            scipy.integrate.quadrature keywords
         OUTPUT:
             (jr,lz,jz,Omegar,Omegaphi,Omegaz,angler,anglephi,anglez)
         HISTORY:
            2013-08-28 - Written - Bovy (IAS)
         """
+        if kwargs.has_key('numcores'):
+            numcores= kwargs.pop('numcores')
+        else:
+            numcores= self._numcores
         if ((self._c and not (kwargs.has_key('c') and not kwargs['c']))\
                 or (ext_loaded and ((kwargs.has_key('c') and kwargs['c'])))) \
                 and _check_c(self._pot):
@@ -267,7 +289,8 @@ class actionAngleStaeckel():
             else:
                 u0= None
             jr, jz, Omegar, Omegaphi, Omegaz, angler, anglephi,anglez, err= actionAngleStaeckel_c.actionAngleFreqAngleStaeckel_c(\
-                self._pot,self._delta,R,vR,vT,z,vz,phi,u0=u0)
+                self._pot,self._delta,R,vR,vT,z,vz,phi,u0=u0,
+                numcores=numcores)
             if err == 0:
                 return (jr,Lz,jz,Omegar,Omegaphi,Omegaz,angler,anglephi,anglez)
             else:
@@ -14,7 +14,8 @@ import math
 import warnings
 import numpy
 from scipy import interpolate, optimize, ndimage
-from galpy.util import galpyWarning
+from galpy.util import galpyWarning, cache_dir, load_npy_cache, \
+    save_npy_cache
 import actionAngleStaeckel
 from galpy.actionAngle_src.actionAngle import actionAngle, UnboundError
 try:
@@ -28,10 +29,13 @@ import galpy.potential
 from galpy.util import multi, bovy_coords
 from matplotlib import pyplot
 _PRINTOUTSIDEGRID= False
+#Grids that are saved in the on-disk cache
+_CACHEDGRIDS= ['_Lzs','_RL','_ERL','_ERa','_u0','thisv','_jr','_jz',
+               '_jrLzE','_jzLzE','_jrFiltered','_jzFiltered']
 class actionAngleStaeckelGrid():
     """Action-angle formalism for axisymmetric potentials using Binney (2012)'s Staeckel approximation, grid-based interpolation"""
     def __init__(self,pot=None,delta=None,Rmax=5.,
-                 nE=25,npsi=25,nLz=25,numcores=1,
+                 nE=25,npsi=25,nLz=25,numcores=1,cachedir=None,
                  **kwargs):
         """
         NAME:
@@ -49,10 +53,15 @@ class actionAngleStaeckelGrid():
 
            numcores= number of cpus to use to parallellize
 
+           cachedir= if set, save the grids in this directory, under a key that depends on the potential, delta, the grid settings, and the integration keywords; later instances with the same key load the (memory-mapped) grids instead of re-computing them
+
+           c= if True, use C to calculate the grids and to interpolate the actions (the grids are then interpolated with cubic B-splines in all dimensions)
+
            +scipy.integrate.quad keywords
         OUTPUT:
         HISTORY:
             2012-11-29 - Written - Bovy (IAS)
+            2026-10-18 - Added cachedir
         """
         if pot is None:
             raise IOError("Must specify pot= for actionAngleStaeckelGrid")
@@ -68,39 +77,50 @@ class actionAngleStaeckelGrid():
         self._Rmin= 0.01
         #Set up the actionAngleStaeckel object that we will use to interpolate
         self._aA= actionAngleStaeckel.actionAngleStaeckel(pot=self._pot,delta=self._delta,c=self._c)
-        #Build grid
         self._Lzmin= 0.01
+        self._Ramax= 200./8.
+        self._nLz= nLz
+        self._nE= nE
+        self._npsi= npsi
+        #Build grid or load it from the cache
+        self._cachedir= cache_dir(cachedir,self._pot,
+                                  (self._delta,self._Rmax,nE,npsi,nLz,
+                                   self._c,
+                                   dict([(key,val)
+                                         for key,val in kwargs.items()
+                                         if not key == 'c'])))
+        grids= load_npy_cache(self._cachedir,_CACHEDGRIDS)
+        if grids is None:
+            self._calc_grids(numcores)
+            save_npy_cache(self._cachedir,
+                           dict([(name,self.__dict__[name])
+                                 for name in _CACHEDGRIDS]))
+        else:
+            self.__dict__.update(grids)
+        self._setup_interpolation()
+        return None
+
+    def _calc_grids(self,numcores):
+        """Calculate the grids in (Lz,E,psi) that are interpolated"""
+        nE, npsi, nLz= self._nE, self._npsi, self._nLz
         self._Lzs= numpy.linspace(self._Lzmin,
                                   self._Rmax\
                                       *galpy.potential.vcirc(self._pot,
                                                              self._Rmax),
                                   nLz)
-        self._Lzmax= self._Lzs[-1]
-        self._nLz= nLz
         #Calculate E_c(R=RL), energy of circular orbit
         self._RL= numpy.array([galpy.potential.rl(self._pot,l) for l in self._Lzs])
-        self._RLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                 self._RL,k=3)
         try:
             self._ERL= galpy.potential.evaluatePotentials(self._RL,numpy.zeros(self._nLz),self._pot) +self._Lzs**2./2./self._RL**2.
         except TypeError:
             self._ERL= numpy.array([galpy.potential.evaluatePotentials(self._RL[ii],0.,self._pot) +self._Lzs[ii]**2./2./self._RL[ii]**2. for ii in range(nLz)])
-        self._ERLmax= numpy.amax(self._ERL)+1.
-        self._ERLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                  numpy.log(-(self._ERL-self._ERLmax)),k=3)
-        self._Ramax= 200./8.
         try:
             self._ERa= galpy.potential.evaluatePotentials(self._Ramax,0.,self._pot) +self._Lzs**2./2./self._Ramax**2.
         except TypeError:
             self._ERa= numpy.array([galpy.potential.evaluatePotentials(self._Ramax,0.,self._pot) +self._Lzs[ii]**2./2./self._Ramax**2. for ii in range(nLz)])
         #self._EEsc= numpy.array([self._ERL[ii]+galpy.potential.vesc(self._pot,self._RL[ii])**2./4. for ii in range(nLz)])
-        self._ERamax= numpy.amax(self._ERa)+1.
-        self._ERaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                  numpy.log(-(self._ERa-self._ERamax)),k=3)
         y= numpy.linspace(0.,1.,nE)
-        self._nE= nE
         psis= numpy.linspace(0.,1.,npsi)*numpy.pi/2.
-        self._npsi= npsi
         jr= numpy.zeros((nLz,nE,npsi))
         jz= numpy.zeros((nLz,nE,npsi))
         u0= numpy.zeros((nLz,nE))
@@ -173,24 +193,53 @@ class actionAngleStaeckelGrid():
         #Deal w/ 9999.99
         jr[(jr > 1.)]= 1.
         jz[(jz > 1.)]= 1.
-        #First interpolate the maxima
         self._jr= jr
         self._jz= jz
         self._u0= u0
         self._jrLzE= jrLzE
         self._jzLzE= jzLzE
+        #spline filter jr and jz, such that they can be used with ndimage.map_coordinates
+        self._jrFiltered= ndimage.spline_filter(numpy.log(self._jr+10.**-10.),order=3)
+        self._jzFiltered= ndimage.spline_filter(numpy.log(self._jz+10.**-10.),order=3)
+        return None
+
+    def _setup_interpolation(self):
+        """Set up the interpolations of the grids"""
+        self._Lzmax= self._Lzs[-1]
+        self._RLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
+                                                                 self._RL,k=3)
+        self._ERLmax= numpy.amax(self._ERL)+1.
+        self._ERLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
+                                                                  numpy.log(-(self._ERL-self._ERLmax)),k=3)
+        self._ERamax= numpy.amax(self._ERa)+1.
+        self._ERaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
+                                                                  numpy.log(-(self._ERa-self._ERamax)),k=3)
+        #First interpolate the maxima
         self._jrLzInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                   numpy.log(jrLzE+10.**-5.),k=3)
+                                                                   numpy.log(self._jrLzE+10.**-5.),k=3)
         self._jzLzInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                   numpy.log(jzLzE+10.**-5.),k=3)
+                                                                   numpy.log(self._jzLzE+10.**-5.),k=3)
         #Interpolate u0
         self._logu0Interp= interpolate.RectBivariateSpline(self._Lzs,
-                                                           y,
-                                                           numpy.log(u0),
+                                                           numpy.linspace(0.,1.,self._nE),
+                                                           numpy.log(self._u0),
                                                            kx=3,ky=3,s=0.)
-        #spline filter jr and jz, such that they can be used with ndimage.map_coordinates
-        self._jrFiltered= ndimage.spline_filter(numpy.log(self._jr+10.**-10.),order=3)
-        self._jzFiltered= ndimage.spline_filter(numpy.log(self._jz+10.**-10.),order=3)
+        if self._c:
+            #Knots and coefficients of the splines for the C code, these
+            #are the same splines as those above
+            self._LzKnots, self._logERLCoeffs, dum=\
+                interpolate.splrep(self._Lzs,numpy.log(-(self._ERL-self._ERLmax)),k=3,s=0.)
+            self._logERaCoeffs= interpolate.splrep(self._Lzs,numpy.log(-(self._ERa-self._ERamax)),k=3,s=0.)[1]
+            self._logjrLzCoeffs= interpolate.splrep(self._Lzs,numpy.log(self._jrLzE+10.**-5.),k=3,s=0.)[1]
+            self._logjzLzCoeffs= interpolate.splrep(self._Lzs,numpy.log(self._jzLzE+10.**-5.),k=3,s=0.)[1]
+            self._u0Knots= self._logu0Interp.get_knots()
+            self._logu0Coeffs= self._logu0Interp.get_coeffs()
+            self._jrFilteredC= numpy.require(self._jrFiltered,
+                                             dtype=numpy.float64,
+                                             requirements=['C'])
+            self._jzFilteredC= numpy.require(self._jzFiltered,
+                                             dtype=numpy.float64,
+                                             requirements=['C'])
         return None
 
     def __call__(self,*args,**kwargs):
@@ -202,11 +251,13 @@ class actionAngleStaeckelGrid():
         INPUT:
            Either:
               R,vR,vT,z,vz
+           numcores= (None) number of OpenMP threads to use in the C code
            scipy.integrate.quadrature keywords (for off-the-grid calcs)
         OUTPUT:
            (jr,lz,jz)
         HISTORY:
            2012-11-29 - Written - Bovy (IAS)
+           2026-10-18 - Interpolate in C when c=True
         """
         if len(args) == 5: #R,vR.vT, z, vz
             R,vR,vT, z, vz= args
@@ -219,6 +270,16 @@ class actionAngleStaeckelGrid():
             vT= meta._vT
             z= meta._z
             vz= meta._vz
+        if self._c and isinstance(R,numpy.ndarray) \
+                and not (kwargs.has_key('c') and not kwargs['c']):
+            #Interpolate in C, points outside of the grid are calculated
+            #directly, all at once
+            jr, jz, indx= actionAngleStaeckel_c.actionAngleStaeckelGrid_c(\
+                self,R,vR,vT,z,vz,numcores=kwargs.get('numcores',None))
+            if numpy.sum(indx) > 0:
+                jr[indx], dum, jz[indx]= self._aA(R[indx],vR[indx],vT[indx],
+                                                  z[indx],vz[indx],**kwargs)
+            return (jr,R*vT,jz)
         Lz= R*vT
         Phi= galpy.potential.evaluatePotentials(R,z,self._pot)
         E= Phi+vR**2./2.+vT**2./2.+vz**2./2.
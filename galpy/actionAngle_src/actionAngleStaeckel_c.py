@@ -22,7 +22,7 @@ if _lib is None:
 if _lib is None:
     raise IOError('galpy actionAngle_c module not found')
 
-def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
+def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None,numcores=None):
     """
     NAME:
        actionAngleStaeckel_c
@@ -32,6 +32,8 @@ def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
        pot - Potential or list of such instances
        delta - focal length of prolate spheroidal coordinates
        R, vR, vT, z, vz - coordinates (arrays)
+       numcores= (None) number of OpenMP threads to use (default:
+                 OMP_NUM_THREADS or all available cores)
     OUTPUT:
        (jr,jz,err)
        jr,jz : array, shape (len(R))
@@ -41,6 +43,7 @@ def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
     """
     if u0 is None:
         u0, dummy= bovy_coords.Rz_to_uv(R,z,delta=delta)
+    if numcores is None: numcores= 0 #lets OpenMP decide
     #Parse the potential
     npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
 
@@ -65,6 +68,7 @@ def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
                                ctypes.c_double,
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
                                ctypes.POINTER(ctypes.c_int)]
 
     #Array requirements, first store old order
@@ -97,6 +101,7 @@ def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
                                     ctypes.c_double(delta),
                                     jr,
                                     jz,
+                                    ctypes.c_int(numcores),
                                     ctypes.byref(err))
 
     #Reset input arrays
@@ -170,7 +175,8 @@ def actionAngleStaeckel_calcu0(E,Lz,pot,delta):
 
     return (u0,err.value)
 
-def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
+def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None,
+                              numcores=None):
     """
     NAME:
        actionAngleFreqStaeckel_c
@@ -181,6 +187,8 @@ def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
        pot - Potential or list of such instances
        delta - focal length of prolate spheroidal coordinates
        R, vR, vT, z, vz - coordinates (arrays)
+       numcores= (None) number of OpenMP threads to use (default:
+                 OMP_NUM_THREADS or all available cores)
     OUTPUT:
        (jr,jz,Omegar,Omegaphi,Omegaz,err)
        jr,jz,Omegar,Omegaphi,Omegaz : array, shape (len(R))
@@ -190,6 +198,7 @@ def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
     """
     if u0 is None:
         u0, dummy= bovy_coords.Rz_to_uv(R,z,delta=delta)
+    if numcores is None: numcores= 0 #lets OpenMP decide
     #Parse the potential
     npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
 
@@ -220,6 +229,7 @@ def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
                                ctypes.POINTER(ctypes.c_int)]
 
     #Array requirements, first store old order
@@ -259,6 +269,7 @@ def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
                                     Omegar,
                                     Omegaphi,
                                     Omegaz,
+                                    ctypes.c_int(numcores),
                                     ctypes.byref(err))
 
     #Reset input arrays
@@ -271,7 +282,8 @@ def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
 
     return (jr,jz,Omegar,Omegaphi,Omegaz,err.value)
 
-def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
+def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None,
+                                   numcores=None):
     """
     NAME:
        actionAngleFreqAngleStaeckel_c
@@ -282,6 +294,8 @@ def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
        pot - Potential or list of such instances
        delta - focal length of prolate spheroidal coordinates
        R, vR, vT, z, vz, phi - coordinates (arrays)
+       numcores= (None) number of OpenMP threads to use (default:
+                 OMP_NUM_THREADS or all available cores)
     OUTPUT:
        (jr,jz,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez,err)
        jr,jz,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez : array, shape (len(R))
@@ -291,6 +305,7 @@ def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
     """
     if u0 is None:
         u0, dummy= bovy_coords.Rz_to_uv(R,z,delta=delta)
+    if numcores is None: numcores= 0 #lets OpenMP decide
     #Parse the potential
     npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
 
@@ -327,6 +342,7 @@ def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
                                ctypes.POINTER(ctypes.c_int)]
 
     #Array requirements, first store old order
@@ -373,6 +389,7 @@ def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
                                     Angler,
                                     Anglephi,
                                     Anglez,
+                                    ctypes.c_int(numcores),
                                     ctypes.byref(err))
 
     #Reset input arrays
@@ -389,3 +406,119 @@ def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
     return (jr,jz,Omegar,Omegaphi,Omegaz,Angler,
             Anglephi,Anglez,err.value)
 
+
+def actionAngleStaeckelGrid_c(aA,R,vR,vT,z,vz,numcores=None):
+    """
+    NAME:
+       actionAngleStaeckelGrid_c
+    PURPOSE:
+       Use C to interpolate actions on the grid of an actionAngleStaeckelGrid
+       instance
+    INPUT:
+       aA - actionAngleStaeckelGrid instance
+       R, vR, vT, z, vz - coordinates (arrays)
+       numcores= (None) number of OpenMP threads to use (default:
+                 OMP_NUM_THREADS or all available cores)
+    OUTPUT:
+       (jr,jz,offgrid)
+       jr,jz : array, shape (len(R))
+       offgrid : boolean array, True for points outside of the grid, for
+                 which jr and jz are not set
+    HISTORY:
+       2026-10-18 - Written
+    """
+    if numcores is None: numcores= 0 #lets OpenMP decide
+    #Parse the potential
+    npot, pot_type, pot_args= _parse_pot(aA._pot,potforactions=True)
+
+    #Set up result arrays
+    jr= numpy.empty(len(R))
+    jz= numpy.empty(len(R))
+    offgrid= numpy.empty(len(R),dtype=numpy.int32)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    gridFlags= ('C_CONTIGUOUS',) #grids can be read-only memory maps
+    actionAngleStaeckelGrid_actionsFunc= _lib.actionAngleStaeckelGrid_actions
+    actionAngleStaeckelGrid_actionsFunc.argtypes=\
+        [ctypes.c_int,
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ctypes.c_int,
+         ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ctypes.c_double,
+         ctypes.c_int,
+         ctypes.c_int,
+         ctypes.c_int,
+         ctypes.c_double,
+         ctypes.c_double,
+         ctypes.c_double,
+         ctypes.c_double,
+         ctypes.c_int,
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ctypes.c_int,
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ctypes.c_int,
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ndpointer(dtype=numpy.float64,flags=gridFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+         ctypes.c_int,
+         ndpointer(dtype=numpy.int32,flags=ndarrayFlags)]
+
+    #Array requirements
+    R= numpy.require(R,dtype=numpy.float64,requirements=['C','W'])
+    vR= numpy.require(vR,dtype=numpy.float64,requirements=['C','W'])
+    vT= numpy.require(vT,dtype=numpy.float64,requirements=['C','W'])
+    z= numpy.require(z,dtype=numpy.float64,requirements=['C','W'])
+    vz= numpy.require(vz,dtype=numpy.float64,requirements=['C','W'])
+    pot_type= numpy.require(pot_type,dtype=numpy.int32,requirements=['C','W'])
+    pot_args= numpy.require(pot_args,dtype=numpy.float64,requirements=['C','W'])
+
+    #Run the C code
+    actionAngleStaeckelGrid_actionsFunc(len(R),
+                                        R,
+                                        vR,
+                                        vT,
+                                        z,
+                                        vz,
+                                        ctypes.c_int(npot),
+                                        pot_type,
+                                        pot_args,
+                                        ctypes.c_double(aA._delta),
+                                        ctypes.c_int(aA._nLz),
+                                        ctypes.c_int(aA._nE),
+                                        ctypes.c_int(aA._npsi),
+                                        ctypes.c_double(aA._Lzmin),
+                                        ctypes.c_double(aA._Lzmax),
+                                        ctypes.c_double(aA._ERLmax),
+                                        ctypes.c_double(aA._ERamax),
+                                        ctypes.c_int(len(aA._LzKnots)),
+                                        aA._LzKnots,
+                                        aA._logERLCoeffs,
+                                        aA._logERaCoeffs,
+                                        aA._logjrLzCoeffs,
+                                        aA._logjzLzCoeffs,
+                                        ctypes.c_int(len(aA._u0Knots[0])),
+                                        aA._u0Knots[0],
+                                        ctypes.c_int(len(aA._u0Knots[1])),
+                                        aA._u0Knots[1],
+                                        aA._logu0Coeffs,
+                                        aA._jrFilteredC,
+                                        aA._jzFilteredC,
+                                        jr,
+                                        jz,
+                                        ctypes.c_int(numcores),
+                                        offgrid)
+
+    return (jr,jz,offgrid.astype(bool))
@@ -1,4 +1,7 @@
 #include <stdlib.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 #include <galpy_potentials.h>
 #include <actionAngle.h>
 #include <cubic_bspline_2d_coeffs.h>
@@ -107,6 +110,33 @@ void parse_actionAngleArgs(int npot,
       potentialArgs->i2d= NULL;
       potentialArgs->acc= NULL;
       break;     
+    case 15: //BurkertPotential, 2 arguments
+      potentialArgs->potentialEval= &BurkertPotentialEval;
+      potentialArgs->nargs= 2;
+      potentialArgs->i2d= NULL;
+      potentialArgs->acc= NULL;
+      break;
+    case 16: //PowerSphericalPotentialwCutoff, 3 arguments
+      potentialArgs->potentialEval= &PowerSphericalPotentialwCutoffEval;
+      potentialArgs->nargs= 3;
+      potentialArgs->i2d= NULL;
+      potentialArgs->acc= NULL;
+      break;
+    case 17: //RazorThinExponentialDiskPotential, XX arguments
+      potentialArgs->potentialEval= &RazorThinExponentialDiskPotentialEval;
+      //Look at pot_args to figure out the number of arguments
+      potentialArgs->nargs= (int) (3 + 2 * *(pot_args+2));
+      potentialArgs->i2d= NULL;
+      potentialArgs->acc= NULL;
+      break;
+    case 18: //MovingObjectPotential, XX arguments
+      potentialArgs->potentialEval= &MovingObjectPotentialEval;
+      //Look at pot_args to figure out the number of arguments
+      potentialArgs->nargs= (int) ( *(pot_args+4) == 0 ? 8
+				    : 5 + 4 * *(pot_args+4));
+      potentialArgs->i2d= NULL;
+      potentialArgs->acc= NULL;
+      break;
     }
     potentialArgs->args= (double *) malloc( potentialArgs->nargs * sizeof(double));
     for (jj=0; jj < potentialArgs->nargs; jj++){
@@ -118,3 +148,20 @@ void parse_actionAngleArgs(int npot,
   }
   potentialArgs-= npot;
 }
+int set_actionAngle_nthreads(int nthreads){
+  //Set the number of OpenMP threads for a calculation (nthreads <= 0 keeps
+  //the current number); returns the previous number, to be restored with
+  //reset_actionAngle_nthreads
+#ifdef _OPENMP
+  int nthreads_old= omp_get_max_threads();
+  if ( nthreads > 0 ) omp_set_num_threads(nthreads);
+  return nthreads_old;
+#else
+  return 1;
+#endif
+}
+void reset_actionAngle_nthreads(int nthreads_old){
+#ifdef _OPENMP
+  omp_set_num_threads(nthreads_old);
+#endif
+}
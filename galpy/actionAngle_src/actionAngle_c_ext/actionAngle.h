@@ -25,4 +25,6 @@ struct pragmasolver{
 */
 double evaluatePotentials(double,double,int, struct potentialArg *);
 void parse_actionAngleArgs(int,struct potentialArg *,int *,double *);
+int set_actionAngle_nthreads(int);
+void reset_actionAngle_nthreads(int);
 #endif /* actionAngle.h */
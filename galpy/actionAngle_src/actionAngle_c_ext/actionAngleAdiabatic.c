@@ -40,7 +40,7 @@ struct JzAdiabaticArg{
 */
 void actionAngleAdiabatic_actions(int,double *,double *,double *,double *,
 				 double *,int,int *,double *,double,
-				 double *,double *,int *);
+				 double *,double *,int,int *);
 void calcJRAdiabatic(int,double *,double *,double *,double *,double *,
 		     int,struct potentialArg *,int);
 void calcJzAdiabatic(int,double *,double *,double *,double *,int,
@@ -70,7 +70,7 @@ inline void calcEREzL(int ndata,
 		      struct potentialArg * actionAngleArgs){
   int ii;
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk) private(ii)
+#pragma omp parallel for schedule(dynamic,chunk) private(ii)
   for (ii=0; ii < ndata; ii++){
     *(ER+ii)= evaluatePotentials(*(R+ii),0.,
 				 nargs,actionAngleArgs)
@@ -97,8 +97,11 @@ void actionAngleAdiabatic_actions(int ndata,
 				  double gamma,
 				  double *jr,
 				  double *jz,
-				  int * err){
+				  int nthreads,
+                                  int * err){
   int ii;
+  //Set the number of threads for this calculation
+  int nthreads_old= set_actionAngle_nthreads(nthreads);
   //Set up the potentials
   struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
   parse_actionAngleArgs(npot,actionAngleArgs,pot_type,pot_args);
@@ -115,7 +118,7 @@ void actionAngleAdiabatic_actions(int ndata,
   calcJzAdiabatic(ndata,jz,zmax,R,Ez,npot,actionAngleArgs,10);
   //Adjust planar effective potential for gamma
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk) private(ii)
+#pragma omp parallel for schedule(dynamic,chunk) private(ii)
   for (ii=0; ii < ndata; ii++){
     *(Lz+ii)= fabs( *(Lz+ii) ) + gamma * *(jz+ii);
     *(ER+ii)+= 0.5 * *(Lz+ii) * *(Lz+ii) / *(R+ii) / *(R+ii) 
@@ -137,6 +140,7 @@ void actionAngleAdiabatic_actions(int ndata,
   free(rperi);
   free(rap);
   free(zmax);
+  reset_actionAngle_nthreads(nthreads_old);
 }
 void calcJRAdiabatic(int ndata,
 		     double * jr,
@@ -162,7 +166,7 @@ void calcJRAdiabatic(int ndata,
   //Setup integrator
   gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii)							\
   shared(jr,rperi,rap,JRInt,params,T,ER,Lz)
   for (ii=0; ii < ndata; ii++){
@@ -215,7 +219,7 @@ void calcJzAdiabatic(int ndata,
   //Setup integrator
   gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii)							\
   shared(jz,zmax,JzInt,params,T,Ez,R)
   for (ii=0; ii < ndata; ii++){
@@ -276,7 +280,7 @@ void calcRapRperi(int ndata,
   }
   int chunk= CHUNKSIZE;
   gsl_set_error_handler_off();
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii,iter,status,R_lo,R_hi,meps,peps)			\
   shared(rperi,rap,JRRoot,params,s,R,ER,Lz,max_iter)
   for (ii=0; ii < ndata; ii++){
@@ -479,7 +483,7 @@ void calcZmax(int ndata,
   }
   int chunk= CHUNKSIZE;
   gsl_set_error_handler_off();
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii,iter,status,z_lo,z_hi)				\
   shared(zmax,JzRoot,params,s,z,Ez,R,max_iter)
   for (ii=0; ii < ndata; ii++){
@@ -89,17 +89,17 @@ struct u0EqArg{
 void calcu0(int,double *,double *,int,int *,double *,double,double *,int *);
 void actionAngleStaeckel_actions(int,double *,double *,double *,double *,
 				 double *,double *,int,int *,double *,double,
-				 double *,double *,int *);
+				 double *,double *,int,int *);
 void actionAngleStaeckel_actionsFreqsAngles(int,double *,double *,double *,
 					    double *,double *,double *,
 					    int,int *,double *,
 					    double,double *,double *,double *,
 					    double *,double *,double *,
-					    double *,double *,int *);
+					    double *,double *,int,int *);
 void actionAngleStaeckel_actionsFreqs(int,double *,double *,double *,double *,
 				      double *,double *,int,int *,double *,
 				      double,double *,double *,double *,
-				      double *,double *,int *);
+				      double *,double *,int,int *);
 void calcAnglesStaeckel(int,double *,double *,double *,double *,double *,
 			double *,double *,double *,double *,double *,double *,
 			double *,double *,double *,double *,double *,double *,
@@ -290,8 +290,11 @@ void actionAngleStaeckel_actions(int ndata,
 				 double delta,
 				 double *jr,
 				 double *jz,
-				 int * err){
+				 int nthreads,
+                                 int * err){
   int ii;
+  //Set the number of threads for this calculation
+  int nthreads_old= set_actionAngle_nthreads(nthreads);
   //Set up the potentials
   struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
   parse_actionAngleArgs(npot,actionAngleArgs,pot_type,pot_args);
@@ -318,7 +321,7 @@ void actionAngleStaeckel_actions(int ndata,
   double *I3U= (double *) malloc ( ndata * sizeof(double) );
   double *I3V= (double *) malloc ( ndata * sizeof(double) );
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk) private(ii)
+#pragma omp parallel for schedule(dynamic,chunk) private(ii)
   for (ii=0; ii < ndata; ii++){
     *(coshux+ii)= cosh(*(ux+ii));
     *(sinhux+ii)= sinh(*(ux+ii));
@@ -394,6 +397,7 @@ void actionAngleStaeckel_actions(int ndata,
   free(umin);
   free(umax);
   free(vmin);
+  reset_actionAngle_nthreads(nthreads_old);
 }
 void calcJRStaeckel(int ndata,
 		    double * jr,
@@ -427,7 +431,7 @@ void calcJRStaeckel(int ndata,
   //Setup integrator
   gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii)							\
   shared(jr,umin,umax,JRInt,params,T,delta,E,Lz,I3U,u0,sinh2u0,v0,sin2v0,potu0v0)
   for (ii=0; ii < ndata; ii++){
@@ -493,7 +497,7 @@ void calcJzStaeckel(int ndata,
   //Setup integrator
   gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii)							\
   shared(jz,vmin,JzInt,params,T,delta,E,Lz,I3V,u0,cosh2u0,sinh2u0,potupi2)
   for (ii=0; ii < ndata; ii++){
@@ -544,8 +548,11 @@ void actionAngleStaeckel_actionsFreqs(int ndata,
 				      double *Omegar,
 				      double *Omegaphi,
 				      double *Omegaz,
-				      int * err){
+				      int nthreads,
+                                      int * err){
   int ii;
+  //Set the number of threads for this calculation
+  int nthreads_old= set_actionAngle_nthreads(nthreads);
   //Set up the potentials
   struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
   parse_actionAngleArgs(npot,actionAngleArgs,pot_type,pot_args);
@@ -572,7 +579,7 @@ void actionAngleStaeckel_actionsFreqs(int ndata,
   double *I3U= (double *) malloc ( ndata * sizeof(double) );
   double *I3V= (double *) malloc ( ndata * sizeof(double) );
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk) private(ii)
+#pragma omp parallel for schedule(dynamic,chunk) private(ii)
   for (ii=0; ii < ndata; ii++){
     *(coshux+ii)= cosh(*(ux+ii));
     *(sinhux+ii)= sinh(*(ux+ii));
@@ -672,6 +679,7 @@ void actionAngleStaeckel_actionsFreqs(int ndata,
   free(detA);
   free(dJzdLz);
   free(dJzdI3);
+  reset_actionAngle_nthreads(nthreads_old);
 }
 void actionAngleStaeckel_actionsFreqsAngles(int ndata,
 					    double *R,
@@ -692,8 +700,11 @@ void actionAngleStaeckel_actionsFreqsAngles(int ndata,
 					    double *Angler,
 					    double *Anglephi,
 					    double *Anglez,
-					    int * err){
+					    int nthreads,
+                                            int * err){
   int ii;
+  //Set the number of threads for this calculation
+  int nthreads_old= set_actionAngle_nthreads(nthreads);
   //Set up the potentials
   struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
   parse_actionAngleArgs(npot,actionAngleArgs,pot_type,pot_args);
@@ -720,7 +731,7 @@ void actionAngleStaeckel_actionsFreqsAngles(int ndata,
   double *I3U= (double *) malloc ( ndata * sizeof(double) );
   double *I3V= (double *) malloc ( ndata * sizeof(double) );
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk) private(ii)
+#pragma omp parallel for schedule(dynamic,chunk) private(ii)
   for (ii=0; ii < ndata; ii++){
     *(coshux+ii)= cosh(*(ux+ii));
     *(sinhux+ii)= sinh(*(ux+ii));
@@ -836,6 +847,7 @@ void actionAngleStaeckel_actionsFreqsAngles(int ndata,
   free(detA);
   free(dI3dJR);
   free(dI3dJz);
+  reset_actionAngle_nthreads(nthreads_old);
 }
 void calcFreqsFromDerivsStaeckel(int ndata,
 				 double * Omegar,
@@ -917,7 +929,7 @@ void calcdJRStaeckel(int ndata,
   //Setup integrator
   gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii,mid)							\
   shared(djrdE,djrdLz,djrdI3,umin,umax,dJRInt,params,T,delta,E,Lz,I3U,u0,sinh2u0,v0,sin2v0,potu0v0)
   for (ii=0; ii < ndata; ii++){
@@ -1007,7 +1019,7 @@ void calcdJzStaeckel(int ndata,
   //Setup integrator
   gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii,mid)							\
   shared(djzdE,djzdLz,djzdI3,vmin,dJzInt,params,T,delta,E,Lz,I3V,u0,cosh2u0,sinh2u0,potupi2)
   for (ii=0; ii < ndata; ii++){
@@ -1127,7 +1139,7 @@ void calcAnglesStaeckel(int ndata,
   //Setup integrator
   gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
   int chunk= CHUNKSIZE;
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii,mid,midpoint,Or1,Or2,I3r1,I3r2,phitmp)			\
   shared(Angler,Anglephi,Anglez,Omegar,Omegaz,dI3dJR,dI3dJz,umin,umax,AngleuInt,AnglevInt,paramsu,paramsv,T,delta,E,Lz,I3U,u0,sinh2u0,v0,sin2v0,potu0v0,vmin,I3V,cosh2u0,potupi2)
   for (ii=0; ii < ndata; ii++){
@@ -1377,7 +1389,7 @@ void calcUminUmax(int ndata,
   }
   int chunk= CHUNKSIZE;
   gsl_set_error_handler_off();
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii,iter,status,u_lo,u_hi,meps,peps)				\
   shared(umin,umax,JRRoot,params,s,ux,delta,E,Lz,I3U,u0,sinh2u0,v0,sin2v0,potu0v0,max_iter)
   for (ii=0; ii < ndata; ii++){
@@ -1586,7 +1598,7 @@ void calcVmin(int ndata,
   }
   int chunk= CHUNKSIZE;
   gsl_set_error_handler_off();
-#pragma omp parallel for schedule(static,chunk)				\
+#pragma omp parallel for schedule(dynamic,chunk)				\
   private(tid,ii,iter,status,v_lo,v_hi)				\
   shared(vmin,JzRoot,params,s,vx,delta,E,Lz,I3V,u0,cosh2u0,sinh2u0,potupi2,max_iter)
   for (ii=0; ii < ndata; ii++){
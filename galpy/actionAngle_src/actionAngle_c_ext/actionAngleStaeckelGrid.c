@@ -0,0 +1,241 @@
+/*
+  C code for the interpolation of actions on the grid of
+  actionAngleStaeckelGrid
+*/
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+#define CHUNKSIZE 1000
+//Potentials
+#include <galpy_potentials.h>
+#include <actionAngle.h>
+#include <cubic_bspline_3d_interpol.h>
+#include <cubic_spline_fitpack.h>
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
+/*
+  Structure Declarations
+*/
+struct StaeckelGrid{
+  double delta;
+  int nLz;
+  int nE;
+  int npsi;
+  double Lzmin;
+  double Lzmax;
+  double ERLmax;
+  double ERamax;
+  //Cubic splines in Lz (FITPACK knots and coefficients)
+  int nLzKnots;
+  double * LzKnots;
+  double * logERL; //log(-(ERL-ERLmax))
+  double * logERa; //log(-(ERa-ERamax))
+  double * logjrLz; //log(jrLzE+10^-5)
+  double * logjzLz; //log(jzLzE+10^-5)
+  //Bicubic spline of log(u0) in (Lz,y) (FITPACK knots and coefficients)
+  int nu0Knots1;
+  double * u0Knots1;
+  int nu0Knots2;
+  double * u0Knots2;
+  double * logu0;
+  //B-spline coefficients of log(j+10^-10) on the uniform (Lz,E,psi) grid
+  double * jr; //[nLz,nE,npsi]
+  double * jz; //[nLz,nE,npsi]
+};
+/*
+  Function Declarations
+*/
+double evaluatePotentialsUV(double,double,double,int,struct potentialArg *);
+/*
+  Actual functions
+*/
+static int actionAngleStaeckelGrid_single(double R,
+					  double vR,
+					  double vT,
+					  double z,
+					  double vz,
+					  struct StaeckelGrid * grid,
+					  int npot,
+					  struct potentialArg * actionAngleArgs,
+					  double * jr,
+					  double * jz){
+  /*
+    Interpolate the actions for a single phase-space point, returns 1 if
+    the point is outside of the grid
+  */
+  double Lz, E, xLz, ERL, ERa, Erel, y, u0, sinh2u0, potu0, v2;
+  double d12, d22, u, v, sinhu, coshu, sinv, cosv, pu, pv, Er, Ez;
+  double cos2psi, sin2psi, xE;
+  double delta= grid->delta;
+  Lz= R * vT;
+  if ( Lz < grid->Lzmin || Lz > grid->Lzmax ) return 1;
+  E= evaluatePotentials(R,z,npot,actionAngleArgs)
+    + 0.5 * vR * vR + 0.5 * vT * vT + 0.5 * vz * vz;
+  xLz= (Lz - grid->Lzmin) / (grid->Lzmax - grid->Lzmin) * (grid->nLz - 1.);
+  ERL= -exp(cubic_spline_fitpack_1d(Lz,grid->nLzKnots,grid->LzKnots,grid->logERL))
+    + grid->ERLmax;
+  ERa= -exp(cubic_spline_fitpack_1d(Lz,grid->nLzKnots,grid->LzKnots,grid->logERa))
+    + grid->ERamax;
+  //Points just outside the energy range are put on its edge
+  Erel= (E - ERa) / (ERL - ERa);
+  if ( Erel > 1. && Erel - 1. < 0.01 ) E= ERL;
+  else if ( Erel < 0. && Erel > -0.01 ) E= ERa;
+  Erel= (E - ERa) / (ERL - ERa);
+  if ( Erel > 1. || Erel < 0. ) return 1;
+  //Energy coordinate of the grid, (Efunc(E)-Efunc(ERa))/(Efunc(ERL)-Efunc(ERa))
+  y= 1. - sqrt((E - ERL) / (ERa - ERL));
+  xE= y * (grid->nE - 1.);
+  u0= exp(cubic_spline_fitpack_2d(Lz,y,grid->nu0Knots1,grid->u0Knots1,
+				  grid->nu0Knots2,grid->u0Knots2,grid->logu0));
+  sinh2u0= sinh(u0) * sinh(u0);
+  potu0= evaluatePotentialsUV(u0,0.5 * M_PI,delta,npot,actionAngleArgs);
+  v2= 2. * (E - potu0) - Lz * Lz / delta / delta / sinh2u0;
+  //Prolate confocal coordinates of the point
+  d12= (z + delta) * (z + delta) + R * R;
+  d22= (z - delta) * (z - delta) + R * R;
+  coshu= 0.5 / delta * (sqrt(d12) + sqrt(d22));
+  cosv=  0.5 / delta * (sqrt(d12) - sqrt(d22));
+  u= acosh(coshu);
+  v= acos(cosv);
+  sinhu= sinh(u);
+  sinv= sin(v);
+  pu= vR * coshu * sinv + vz * sinhu * cosv;
+  pv= vR * sinhu * cosv - vz * coshu * sinv;
+  //'Radial' and 'vertical' energies
+  Er= 0.5 * pu * pu
+    + 0.5 * Lz * Lz / delta / delta * (1. / sinhu / sinhu - 1. / sinh2u0)
+    - E * (sinhu * sinhu - sinh2u0)
+    + (sinhu * sinhu + 1.) * evaluatePotentialsUV(u,0.5 * M_PI,delta,
+						  npot,actionAngleArgs)
+    - (sinh2u0 + 1.) * potu0;
+  Ez= 0.5 * pv * pv
+    + 0.5 * Lz * Lz / delta / delta * (1. / sinv / sinv - 1.)
+    - E * (sinv * sinv - 1.)
+    - (sinh2u0 + 1.) * potu0
+    + (sinh2u0 + sinv * sinv) * evaluatePotentialsUV(u0,v,delta,
+						     npot,actionAngleArgs);
+  cos2psi= 2. * Er / v2 / (1. + sinh2u0);
+  if ( cos2psi > 1. && cos2psi < 1.00001 ) cos2psi= 1.;
+  if ( cos2psi > 1. || cos2psi < 0. ) return 1;
+  sin2psi= 2. * Ez / v2 / (1. + sinh2u0);
+  if ( sin2psi > 1. && sin2psi < 1.00001 ) sin2psi= 1.;
+  if ( sin2psi > 1. || sin2psi < 0. ) return 1;
+  *jr= (exp(cubic_bspline_3d_interpol(grid->jr,grid->nLz,grid->nE,grid->npsi,
+				      xLz,xE,acos(sqrt(cos2psi)) / M_PI * 2.
+				      * (grid->npsi - 1.)))
+	- 1.e-10)
+    * (exp(cubic_spline_fitpack_1d(Lz,grid->nLzKnots,grid->LzKnots,grid->logjrLz))
+       - 1.e-5);
+  *jz= (exp(cubic_bspline_3d_interpol(grid->jz,grid->nLz,grid->nE,grid->npsi,
+				      xLz,xE,asin(sqrt(sin2psi)) / M_PI * 2.
+				      * (grid->npsi - 1.)))
+	- 1.e-10)
+    * (exp(cubic_spline_fitpack_1d(Lz,grid->nLzKnots,grid->LzKnots,grid->logjzLz))
+       - 1.e-5);
+  return 0;
+}
+/*
+  MAIN FUNCTIONS
+ */
+void actionAngleStaeckelGrid_actions(int ndata,
+				     double *R,
+				     double *vR,
+				     double *vT,
+				     double *z,
+				     double *vz,
+				     int npot,
+				     int * pot_type,
+				     double * pot_args,
+				     double delta,
+				     int nLz,
+				     int nE,
+				     int npsi,
+				     double Lzmin,
+				     double Lzmax,
+				     double ERLmax,
+				     double ERamax,
+				     int nLzKnots,
+				     double * LzKnots,
+				     double * logERL,
+				     double * logERa,
+				     double * logjrLz,
+				     double * logjzLz,
+				     int nu0Knots1,
+				     double * u0Knots1,
+				     int nu0Knots2,
+				     double * u0Knots2,
+				     double * logu0,
+				     double * jrcoeffs,
+				     double * jzcoeffs,
+				     double *jr,
+				     double *jz,
+				     int numcores,
+				     int * offgrid){
+  /*
+    Interpolate the actions on the grid for ndata points; offgrid is set to
+    1 for points outside of the grid, for which jr and jz are not set;
+    numcores <= 0 uses the default number of OpenMP threads
+  */
+  int ii, tid, nthreads;
+  //Set the number of threads for this calculation
+  int nthreads_old= set_actionAngle_nthreads(numcores);
+  struct StaeckelGrid grid;
+  grid.delta= delta;
+  grid.nLz= nLz;
+  grid.nE= nE;
+  grid.npsi= npsi;
+  grid.Lzmin= Lzmin;
+  grid.Lzmax= Lzmax;
+  grid.ERLmax= ERLmax;
+  grid.ERamax= ERamax;
+  grid.nLzKnots= nLzKnots;
+  grid.LzKnots= LzKnots;
+  grid.logERL= logERL;
+  grid.logERa= logERa;
+  grid.logjrLz= logjrLz;
+  grid.logjzLz= logjzLz;
+  grid.nu0Knots1= nu0Knots1;
+  grid.u0Knots1= u0Knots1;
+  grid.nu0Knots2= nu0Knots2;
+  grid.u0Knots2= u0Knots2;
+  grid.logu0= logu0;
+  grid.jr= jrcoeffs;
+  grid.jz= jzcoeffs;
+#ifdef _OPENMP
+  nthreads= omp_get_max_threads();
+#else
+  nthreads= 1;
+#endif
+  //Set up the potentials, one copy for each thread, because the
+  //interpolation accelerators cannot be shared between threads
+  struct potentialArg * actionAngleArgs= (struct potentialArg *) calloc ( nthreads * npot, sizeof (struct potentialArg) );
+  for (tid=0; tid < nthreads; tid++)
+    parse_actionAngleArgs(npot,actionAngleArgs+tid*npot,pot_type,pot_args);
+#pragma omp parallel for schedule(static,CHUNKSIZE) private(ii,tid)
+  for (ii=0; ii < ndata; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid= 0;
+#endif
+    *(offgrid+ii)= actionAngleStaeckelGrid_single(*(R+ii),*(vR+ii),*(vT+ii),
+						  *(z+ii),*(vz+ii),&grid,
+						  npot,
+						  actionAngleArgs+tid*npot,
+						  jr+ii,jz+ii);
+  }
+  //Free
+  for (ii=0; ii < nthreads * npot; ii++) {
+    if ( (actionAngleArgs+ii)->i2d )
+      interp_2d_free((actionAngleArgs+ii)->i2d) ;
+    if ((actionAngleArgs+ii)->acc )
+      gsl_interp_accel_free ((actionAngleArgs+ii)->acc);
+    free((actionAngleArgs+ii)->args);
+  }
+  free(actionAngleArgs);
+  reset_actionAngle_nthreads(nthreads_old);
+}
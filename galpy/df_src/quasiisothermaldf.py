@@ -4,9 +4,15 @@ import numpy
 from scipy import optimize, interpolate, integrate
 from galpy import potential
 from galpy import actionAngle
+from galpy.util.bovy_pool import StatePool
 _NSIGMA=4
 _DEFAULTNGL=10
 _DEFAULTNGL2=20
+_MAXGLBATCH=2**19 #maximum number of DF evaluations in a batch
+_NCHUNKSPERCORE=4 #number of chunks of points per process for numcores=
+_NSAMPLEGRID=21 #size of the (R,z) grids used when sampling
+_SAMPLEVBATCH=2**17 #maximum number of velocities sampled in a batch
+_SAMPLEVPAD=0.05 #padding of the log envelope when the peak is interpolated
 class quasiisothermaldf:
     """Class that represents a 'Binney' quasi-isothermal DF"""
     def __init__(self,hr,sr,sz,hsr,hsz,pot=None,aA=None,
@@ -105,6 +111,8 @@ class quasiisothermaldf:
             numpy.polynomial.legendre.leggauss(_DEFAULTNGL2)
         self._glxdef12, self._glwdef12= \
             numpy.polynomial.legendre.leggauss(_DEFAULTNGL/2)
+        #Pool of processes for numcores=, started when it is first needed
+        self._pool= StatePool()
         return None
 
     def __call__(self,*args,**kwargs):
@@ -246,7 +254,7 @@ class quasiisothermaldf:
         else:
             return out
 
-    def estimate_hr(self,R,z=0.,dR=10.**-8.,**kwargs):
+    def estimate_hr(self,R,z=0.,dR=10.**-8.,numcores=None,**kwargs):
         """
         NAME:
            estimate_hr
@@ -259,6 +267,8 @@ class quasiisothermaldf:
 
            dR- range in R to use
 
+           numcores= if set, evaluate the densities for array R on a pool of numcores processes
+
            density kwargs
         OUTPUT:
            estimated hR
@@ -267,14 +277,21 @@ class quasiisothermaldf:
            2013-01-28 - Re-written - Bovy
         """
         Rs= [R-dR/2.,R+dR/2.]
-        if z is None:
+        if not numcores is None:
+            Rs= numpy.array(Rs)
+            if z is None:
+                sf= self.surfacemass_z(Rs,numcores=numcores,**kwargs)
+            else:
+                sf= self.density(Rs,z+numpy.zeros(Rs.shape),
+                                 numcores=numcores,**kwargs)
+        elif z is None:
             sf= numpy.array([self.surfacemass_z(r,**kwargs) for r in Rs])
         else:
             sf= numpy.array([self.density(r,z,**kwargs) for r in Rs])
         lsf= numpy.log(sf)
         return -dR/(lsf[1]-lsf[0])
 
-    def estimate_hz(self,R,z,dz=10.**-8.,**kwargs):
+    def estimate_hz(self,R,z,dz=10.**-8.,numcores=None,**kwargs):
         """
         NAME:
            estimate_hz
@@ -285,6 +302,8 @@ class quasiisothermaldf:
 
            dz - z range to use
 
+           numcores= if set, evaluate the densities for array R,z on a pool of numcores processes
+
            density kwargs
         OUTPUT:
            estimated hz
@@ -293,6 +312,13 @@ class quasiisothermaldf:
 
            2013-01-28 - Re-written - Bovy
         """
+        if not numcores is None:
+            R, z= numpy.broadcast_arrays(R,z)
+            zs= numpy.array([z-dz/2.*(z != 0.),z+dz/2.*(1.+(z == 0.))])
+            sf= self.density(numpy.array([R,R]),zs,
+                             numcores=numcores,**kwargs)
+            lsf= numpy.log(sf)
+            return -dz/(lsf[1]-lsf[0])
         if z == 0.:
             zs= [z,z+dz]
         else:
@@ -350,7 +376,7 @@ class quasiisothermaldf:
         return -dR/(lsf[1]-lsf[0])
 
     def surfacemass_z(self,R,nz=7,zmax=1.,fixed_quad=True,fixed_order=8,
-                      **kwargs):
+                      numcores=None,**kwargs):
         """
         NAME:
            surfacemass_z
@@ -367,12 +393,25 @@ class quasiisothermaldf:
 
            zmax=m minimum z to use
 
+           numcores= if set, evaluate array R on a pool of numcores processes
+
            density kwargs
         OUTPUT:
            \Sigma(R)
         HISTORY:
            2012-08-30 - Written - Bovy (IAS)
         """
+        if isinstance(R,numpy.ndarray):
+            if not numcores is None and numcores > 1:
+                return self._parallel_eval('surfacemass_z',[R],numcores,
+                                           vectorized=False,nz=nz,zmax=zmax,
+                                           fixed_quad=fixed_quad,
+                                           fixed_order=fixed_order,**kwargs)
+            return numpy.reshape([self.surfacemass_z(r,nz=nz,zmax=zmax,
+                                                     fixed_quad=fixed_quad,
+                                                     fixed_order=fixed_order,
+                                                     **kwargs)
+                                  for r in R.flatten()],R.shape)
         if fixed_quad:
             return 2.*integrate.fixed_quad(lambda x: self.density(R*numpy.ones(fixed_order),x),
                                            0.,.5,n=fixed_order)[0]
@@ -395,7 +434,7 @@ class quasiisothermaldf:
                        _return_freqs=False,
                        _rg=None,_kappa=None,_nu=None,_Omega=None,
                        _sigmaR1=None,_sigmaz1=None,
-                       **kwargs):
+                       numcores=None,**kwargs):
         """
         NAME:
            vmomentdensity
@@ -426,12 +465,30 @@ class quasiisothermaldf:
 
            _return_freqs= if True, return the evaluated frequencies and rg (does not work with _returngl currently)
 
+           numcores= if set, evaluate array R,z on a pool of numcores processes
+
         OUTPUT:
            <vR^n vT^m  x density> at R,z
         HISTORY:
            2012-08-06 - Written - Bovy (IAS@MPIA)
+           2026-10-18 - Evaluate the Gauss-Legendre integrals for array input in batches
         """
+        if isinstance(R,numpy.ndarray) and not numcores is None \
+                and numcores > 1 and not _return_actions \
+                and not _return_freqs and _jr is None:
+            return self._parallel_eval('vmomentdensity',[R,z],numcores,
+                                       pkwargs={'_glqeval':_glqeval},
+                                       n=n,m=m,o=o,nsigma=nsigma,
+                                       mc=mc,nmc=nmc,gl=gl,ngl=ngl,
+                                       _returngl=_returngl,**kwargs)
         if isinstance(R,numpy.ndarray):
+            if gl and not mc and not _return_actions and not _return_freqs \
+                    and _jr is None:
+                #Evaluate the DF for all velocity grids at once
+                return self._vmomentdensity_glbatch(R,z,n,m,o,ngl=ngl,
+                                                    _returngl=_returngl,
+                                                    _glqeval=_glqeval,
+                                                    **kwargs)
             return numpy.array([self.vmomentdensity(r,zz,n,m,o,nsigma=nsigma,
                                                     mc=mc,nmc=nmc,
                                                     gl=gl,ngl=ngl,**kwargs) for r,zz in zip(R,z)])
@@ -589,6 +646,103 @@ class quasiisothermaldf:
                                      (R,z,self,sigmaR1,gamma,sigmaz1,n,m,o),
                                      **kwargs)[0]*sigmaR1**(2.+n+m)*gamma**(1.+m)*sigmaz1**(1.+o)
         
+    def _vmomentdensity_glbatch(self,R,z,n,m,o,ngl=_DEFAULTNGL,
+                                _returngl=False,_glqeval=None,**kwargs):
+        """
+        NAME:
+           _vmomentdensity_glbatch
+        PURPOSE:
+           calculate vmomentdensity using Gauss-Legendre integration for
+           arrays of (R,z), evaluating the DF on the velocity grids of
+           many (R,z) in a single call
+        INPUT:
+           R, z - arrays (broadcast against each other)
+           n, m, o - moment (vR^n vT^m vz^o)
+           ngl= order of the Gauss-Legendre integration
+           _returngl= if True, also return the evaluated log DF [...,ngl,ngl,ngl]
+           _glqeval= log DF evaluated previously with _returngl
+        OUTPUT:
+           <vR^n vT^m vz^o x density> at R,z (,log DF)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        R, z= numpy.broadcast_arrays(R,z)
+        shape= R.shape
+        R= R.flatten()
+        z= z.flatten()
+        npts= len(R)
+        if isinstance(self._aA,(actionAngle.actionAngleAdiabatic,
+                                actionAngle.actionAngleAdiabaticGrid)):
+            if n % 2 == 1. or o % 2 == 1.:
+                return numpy.zeros(shape) #we know this must be the case
+        if ngl % 2 == 1:
+            raise ValueError("ngl must be even")
+        if not _glqeval is None and _glqeval.shape[-3:] != (ngl,ngl,ngl):
+            _glqeval= None
+        if not _glqeval is None:
+            _glqeval= numpy.reshape(_glqeval,(npts,ngl**3))
+        vTu, vRu, vzu, wu= self._glvelocitygrid(ngl)
+        sigmaR1= self._sr*numpy.exp((self._ro-R)/self._hsr)
+        sigmaz1= self._sz*numpy.exp((self._ro-R)/self._hsz)
+        out= numpy.empty(npts)
+        if _returngl: logqevals= numpy.empty((npts,ngl**3))
+        #Evaluate the DF for as many points as fit in a batch
+        nbatch= max(1,_MAXGLBATCH//ngl**3)
+        for ii in range(0,npts,nbatch):
+            indx= slice(ii,min(ii+nbatch,npts))
+            thisn= indx.stop-indx.start
+            vR= numpy.outer(sigmaR1[indx],vRu)
+            vT= numpy.tile(vTu,(thisn,1))
+            vz= numpy.outer(sigmaz1[indx],vzu)
+            if _glqeval is None:
+                logqeval= self(numpy.repeat(R[indx],ngl**3),
+                               vR.flatten(),vT.flatten(),
+                               numpy.repeat(z[indx],ngl**3),
+                               vz.flatten(),log=True,**kwargs)
+                if numpy.ndim(logqeval) == 0:
+                    #An orbit in the batch is unbound, go point by point
+                    logqeval= numpy.array(\
+                        [self.vmomentdensity(R[jj],z[jj],0.,0.,0.,gl=True,
+                                             ngl=ngl,_returngl=True,
+                                             **kwargs)[1].flatten()
+                         for jj in range(indx.start,indx.stop)])
+                logqeval= numpy.reshape(logqeval,(thisn,ngl**3))
+            else:
+                logqeval= _glqeval[indx]
+            if _returngl: logqevals[indx]= logqeval
+            out[indx]= numpy.sum(numpy.exp(logqeval)*vR**n*vT**m*vz**o*wu,
+                                 axis=1)*sigmaR1[indx]*sigmaz1[indx]*3.
+        if _returngl:
+            return (numpy.reshape(out,shape),
+                    numpy.reshape(logqevals,shape+(ngl,ngl,ngl)))
+        else:
+            return numpy.reshape(out,shape)
+
+    def _glvelocitygrid(self,ngl):
+        """Gauss-Legendre nodes (vT,vR,vz, in units of sigmaR1, sigmaz1 for
+        vR and vz) and product weights for vmomentdensity, flattened in the
+        same order as the tiled grids in vmomentdensity"""
+        if ngl == _DEFAULTNGL:
+            glx, glw= self._glxdef, self._glwdef
+            glx12, glw12= self._glxdef12, self._glwdef12
+        elif ngl == _DEFAULTNGL2:
+            glx, glw= self._glxdef2, self._glwdef2
+            glx12, glw12= self._glxdef, self._glwdef
+        else:
+            glx, glw= numpy.polynomial.legendre.leggauss(ngl)
+            glx12, glw12= numpy.polynomial.legendre.leggauss(ngl/2)
+        if isinstance(self._aA,(actionAngle.actionAngleAdiabatic,
+                                actionAngle.actionAngleAdiabaticGrid)):
+            vRx= 2.*(glx+1.)
+            vRw= glw
+        else:
+            vRx= numpy.hstack((2.*(glx12+1.),-2.*(glx12+1.)))
+            vRw= numpy.hstack((glw12,glw12))
+        vTx= 1.5/2.*(glx+1.)
+        vTu, vRu, vzu= numpy.meshgrid(vTx,vRx,vRx,indexing='ij')
+        wu= glw[:,None,None]*vRw[None,:,None]*vRw[None,None,:]
+        return (vTu.flatten(),vRu.flatten(),vzu.flatten(),wu.flatten())
+
     def jmomentdensity(self,R,z,n,m,o,nsigma=None,mc=True,nmc=10000,
                        _returnmc=False,_vrs=None,_vts=None,_vzs=None,
                        **kwargs):
@@ -1308,6 +1462,82 @@ class quasiisothermaldf:
                                             nsigma=nsigma,mc=mc,nmc=nmc,
                                             **kwargs))
         
+    def sample(self,n=1,rrange=None,zrange=None,nR=_NSAMPLEGRID,
+               nz=_NSAMPLEGRID,numcores=None):
+        """
+        NAME:
+           sample
+        PURPOSE:
+           sample positions and velocities from the DF
+        INPUT:
+
+           n= number of samples
+
+           rrange= range of R to sample (default: [hr/10,5 hr])
+
+           zrange= range of z to sample (default: [-hr,hr])
+
+           nR, nz= number of R and z on which the density is tabulated to
+                   sample the positions (default: 21; see NOTE)
+
+           numcores= if set, tabulate the density on a pool of numcores processes
+
+        OUTPUT:
+           array [n,6] of (R,vR,vT,z,vz,phi)
+        HISTORY:
+           2026-10-18 - Written
+        NOTE:
+           the positions are not sampled from the density itself, but from
+           the bilinear interpolation of log(R x density) on an nR x nz grid
+           in (R,z); this is accurate for densities that are close to
+           exponential in R and |z| on the scale of a grid cell and an odd nz
+           with a symmetric zrange puts a grid line at z=0, where the density
+           has a cusp; increase nR and nz for densities that vary more
+           rapidly. The velocities are sampled exactly from the DF at these
+           positions (see sampleV)
+        """
+        if rrange is None: rrange= [self._hr/10.,5.*self._hr]
+        if zrange is None: zrange= [-self._hr,self._hr]
+        #Tabulate log(R x density), the positions are sampled from its
+        #bilinear interpolation, using the maximum over the corners of each
+        #cell as the envelope
+        Rs= numpy.linspace(rrange[0],rrange[1],nR)
+        zs= numpy.linspace(zrange[0],zrange[1],nz)
+        Rgrid, zgrid= numpy.meshgrid(Rs,zs,indexing='ij')
+        lRdens= numpy.log(Rgrid\
+                              *self.density(Rgrid,numpy.fabs(zgrid),
+                                            numcores=numcores))
+        cellmax= numpy.amax(numpy.array([lRdens[:-1,:-1],lRdens[1:,:-1],
+                                         lRdens[:-1,1:],lRdens[1:,1:]]),
+                            axis=0).flatten()
+        cellcdf= numpy.cumsum(numpy.exp(cellmax-numpy.amax(cellmax)))
+        cellcdf/= cellcdf[-1]
+        dR= Rs[1]-Rs[0]
+        dz= zs[1]-zs[0]
+        out= numpy.empty((n,6))
+        ndone= 0
+        while ndone < n:
+            nmore= n-ndone
+            cell= numpy.searchsorted(cellcdf,numpy.random.uniform(size=nmore))
+            iR= cell//(nz-1)
+            iz= cell % (nz-1)
+            xR= numpy.random.uniform(size=nmore)
+            xz= numpy.random.uniform(size=nmore)
+            lprop= (1.-xR)*(1.-xz)*lRdens[iR,iz]+xR*(1.-xz)*lRdens[iR+1,iz]\
+                +(1.-xR)*xz*lRdens[iR,iz+1]+xR*xz*lRdens[iR+1,iz+1]
+            indx= (lprop-cellmax[cell]) > numpy.log(numpy.random.random(size=nmore)) #accept
+            nacc= numpy.sum(indx)
+            out[ndone:ndone+nacc,0]= Rs[iR[indx]]+xR[indx]*dR
+            out[ndone:ndone+nacc,3]= zs[iz[indx]]+xz[indx]*dz
+            ndone+= nacc
+        #Velocities
+        vs= self.sampleV(out[:,0],out[:,3])
+        out[:,1]= vs[:,0]
+        out[:,2]= vs[:,1]
+        out[:,4]= vs[:,2]
+        out[:,5]= numpy.random.uniform(size=n)*2.*math.pi
+        return out
+
     def sampleV(self,R,z,n=1):
         """
         NAME:
@@ -1316,50 +1546,131 @@ class quasiisothermaldf:
            sample a radial, azimuthal, and vertical velocity at R,z
         INPUT:
 
-           R - Galactocentric distance
+           R - Galactocentric distance (can be array)
 
-           z - height
+           z - height (can be array)
 
-           n= number of distances to sample
+           n= number of distances to sample (if R and z are floats; for arrays one velocity is sampled at each R,z)
 
         OUTPUT:
-           list of samples
+           list of samples (array [n,3] or [R.shape,3])
         HISTORY:
            2012-12-17 - Written - Bovy (IAS)
+           2026-10-18 - Vectorized for arrays of R,z - Written
         """
-        #Determine the maximum of the velocity distribution
-        maxVR= 0.
-        maxVz= 0.
-        maxVT= optimize.fmin_powell((lambda x: -self(R,0.,x,z,0.,log=True)),
-                                    1.)
-        logmaxVD= self(R,maxVR,maxVT,z,maxVz,log=True)
-        #Now rejection-sample
-        vRs= []
-        vTs= []
-        vzs= []
-        while len(vRs) < n:
-            nmore= n-len(vRs)+1
+        R= numpy.asarray(R,dtype='float')
+        z= numpy.asarray(z,dtype='float')
+        if R.ndim == 0 and z.ndim == 0:
+            shape= (n,)
+            #Determine the maximum of the velocity distribution once
+            maxVT= self._vTpeak(numpy.atleast_1d(R),numpy.atleast_1d(z))
+            R= R+numpy.zeros(n)
+            z= z+numpy.zeros(n)
+            maxVT= maxVT+numpy.zeros(n)
+        else:
+            R, z= numpy.broadcast_arrays(R,z)
+            shape= R.shape
+            R= R.flatten()
+            z= z.flatten()
+            maxVT= self._sampleV_maxVT(R,z)
+        #The interpolated peak can be slightly off, so pad the envelope
+        if len(R) > _NSAMPLEGRID**2: logpad= _SAMPLEVPAD
+        else: logpad= 0.
+        out= numpy.empty((len(R),3))
+        for ii in range(0,len(R),_SAMPLEVBATCH):
+            indx= slice(ii,min(ii+_SAMPLEVBATCH,len(R)))
+            out[indx]= self._sampleV_rejection(R[indx],z[indx],maxVT[indx],
+                                               logpad=logpad)
+        return numpy.reshape(out,shape+(3,))
+
+    def _sampleV_rejection(self,R,z,maxVT,logpad=0.):
+        """Rejection-sample one velocity at each R,z from Gaussian proposals
+        with the local dispersions, centered on the peak of the velocity
+        distribution; the envelope is raised (and the velocity re-sampled)
+        for any proposal at which it lies below the DF"""
+        zero= numpy.zeros(len(R))
+        logmaxVD= self._logdf_array(R,zero,maxVT,z,zero)+logpad
+        sigmaR1= 2.*self._sr*numpy.exp((self._ro-R)/self._hsr)
+        sigmaz1= 2.*self._sz*numpy.exp((self._ro-R)/self._hsz)
+        out= numpy.empty((len(R),3))
+        todo= numpy.arange(len(R))
+        while len(todo) > 0:
+            nmore= len(todo)
             #sample
-            propvR= numpy.random.normal(size=nmore)*2.*self._sr
-            propvT= numpy.random.normal(size=nmore)*2.*self._sr+maxVT
-            propvz= numpy.random.normal(size=nmore)*2.*self._sz
-            VDatprop= self(R+numpy.zeros(nmore),
-                           propvR,propvT,z+numpy.zeros(nmore),
-                           propvz,log=True)-logmaxVD
-            VDatprop-= -0.5*(propvR**2./4./self._sr**2.+propvz**2./4./self._sz**2.\
-                                 +(propvT-maxVT)**2./4./self._sr**2.)
-            VDatprop= numpy.reshape(VDatprop,(nmore))
-            indx= (VDatprop > numpy.log(numpy.random.random(size=nmore))) #accept
-            vRs.extend(list(propvR[indx]))
-            vTs.extend(list(propvT[indx]))
-            vzs.extend(list(propvz[indx]))
-        out= numpy.empty((n,3))
-        out[:,0]= vRs[0:n]
-        out[:,1]= vTs[0:n]
-        out[:,2]= vzs[0:n]
+            propvR= numpy.random.normal(size=nmore)*sigmaR1[todo]
+            propvT= numpy.random.normal(size=nmore)*sigmaR1[todo]+maxVT[todo]
+            propvz= numpy.random.normal(size=nmore)*sigmaz1[todo]
+            VDatprop= self._logdf_array(R[todo],propvR,propvT,z[todo],
+                                        propvz)-logmaxVD[todo]
+            VDatprop-= -0.5*(propvR**2.+(propvT-maxVT[todo])**2.)\
+                /sigmaR1[todo]**2.-0.5*propvz**2./sigmaz1[todo]**2.
+            #Raise the envelope where it is violated and try again there
+            bad= VDatprop > 0.
+            logmaxVD[todo[bad]]+= VDatprop[bad]
+            indx= (VDatprop > numpy.log(numpy.random.random(size=nmore)))\
+                *(True^bad) #accept
+            out[todo[indx],0]= propvR[indx]
+            out[todo[indx],1]= propvT[indx]
+            out[todo[indx],2]= propvz[indx]
+            todo= todo[True^indx]
         return out
 
-    def pvR(self,vR,R,z,gl=True,ngl=_DEFAULTNGL2):
+    def _sampleV_maxVT(self,R,z):
+        """vT at the peak of the velocity distribution at arrays of R,z; for
+        many R,z this is interpolated on a grid in (R,|z|) that is kept for
+        later calls"""
+        absz= numpy.fabs(z)
+        if len(R) <= _NSAMPLEGRID**2:
+            return self._vTpeak(R,absz)
+        if not hasattr(self,'_sampleVgrid') \
+                or numpy.amin(R) < self._sampleVgrid[0] \
+                or numpy.amax(R) > self._sampleVgrid[1] \
+                or numpy.amax(absz) > self._sampleVgrid[2]:
+            Rmin, Rmax= numpy.amin(R)-0.01, numpy.amax(R)+0.01
+            zmax= numpy.amax(absz)+0.01
+            Rs= numpy.linspace(Rmin,Rmax,_NSAMPLEGRID)
+            zs= numpy.linspace(0.,zmax,_NSAMPLEGRID)
+            Rgrid, zgrid= numpy.meshgrid(Rs,zs,indexing='ij')
+            maxVTgrid= numpy.reshape(self._vTpeak(Rgrid.flatten(),
+                                                  zgrid.flatten()),
+                                     Rgrid.shape)
+            self._sampleVgrid= (Rmin,Rmax,zmax,
+                                interpolate.RectBivariateSpline(Rs,zs,
+                                                                maxVTgrid,
+                                                                kx=3,ky=3))
+        return self._sampleVgrid[3].ev(R,absz)
+
+    def _vTpeak(self,R,z,tol=10.**-4.):
+        """vT at the peak of the DF at vR=vz=0 for arrays of R,z, using a
+        golden-section search for all R,z at once"""
+        gr= (math.sqrt(5.)-1.)/2.
+        zero= numpy.zeros(len(R))
+        a= numpy.zeros(len(R))
+        b= 2.*numpy.ones(len(R))
+        c= b-gr*(b-a)
+        d= a+gr*(b-a)
+        fc= self._logdf_array(R,zero,c,z,zero)
+        fd= self._logdf_array(R,zero,d,z,zero)
+        while numpy.amax(b-a) > tol:
+            indx= fc > fd #peak in [a,d]
+            a= numpy.where(indx,a,c)
+            b= numpy.where(indx,d,b)
+            newx= numpy.where(indx,b-gr*(b-a),a+gr*(b-a))
+            fx= self._logdf_array(R,zero,newx,z,zero)
+            c, d= numpy.where(indx,newx,d), numpy.where(indx,c,newx)
+            fc, fd= numpy.where(indx,fx,fd), numpy.where(indx,fc,fx)
+        return (a+b)/2.
+
+    def _logdf_array(self,R,vR,vT,z,vz):
+        """log DF for arrays of R,vR,vT,z,vz; evaluated point by point when an
+        unbound orbit makes the evaluation for the whole array fail"""
+        out= self(R,vR,vT,z,vz,log=True)
+        if numpy.ndim(out) == 0:
+            out= numpy.hstack([self(R[ii],vR[ii],vT[ii],z[ii],vz[ii],log=True)
+                               for ii in range(len(R))])
+        return numpy.reshape(out,R.shape)
+
+    def pvR(self,vR,R,z,gl=True,ngl=_DEFAULTNGL2,numcores=None):
         """
         NAME:
            pvR
@@ -1377,11 +1688,16 @@ class quasiisothermaldf:
 
            ngl - order of Gauss-Legendre integration
 
+           numcores= if set, evaluate arrays of vR,R,z on a pool of numcores processes
+
         OUTPUT:
            p(vR,R,z)
         HISTORY:
            2012-12-22 - Written - Bovy (IAS)
         """
+        if not numcores is None:
+            return self._parallel_eval('pvR',[vR,R,z],numcores,
+                                       vectorized=False,gl=gl,ngl=ngl)
         sigmaz1= self._sz*numpy.exp((self._ro-R)/self._hsz)
         if gl:
             if ngl % 2 == 1:
@@ -1426,7 +1742,7 @@ class quasiisothermaldf:
                                     (ngl,ngl))
             return numpy.sum(numpy.exp(logqeval)*vTglw*vzglw*sigmaz1)
 
-    def pvT(self,vT,R,z,gl=True,ngl=_DEFAULTNGL2):
+    def pvT(self,vT,R,z,gl=True,ngl=_DEFAULTNGL2,numcores=None):
         """
         NAME:
            pvT
@@ -1444,11 +1760,16 @@ class quasiisothermaldf:
 
            ngl - order of Gauss-Legendre integration
 
+           numcores= if set, evaluate arrays of vT,R,z on a pool of numcores processes
+
         OUTPUT:
            p(vT,R,z)
         HISTORY:
            2012-12-22 - Written - Bovy (IAS)
         """
+        if not numcores is None:
+            return self._parallel_eval('pvT',[vT,R,z],numcores,
+                                       vectorized=False,gl=gl,ngl=ngl)
         sigmaR1= self._sr*numpy.exp((self._ro-R)/self._hsr)
         sigmaz1= self._sz*numpy.exp((self._ro-R)/self._hsz)
         if gl:
@@ -1507,7 +1828,7 @@ class quasiisothermaldf:
             _return_actions=False,_jr=None,_lz=None,_jz=None,
             _return_freqs=False,
             _rg=None,_kappa=None,_nu=None,_Omega=None,
-            _sigmaR1=None):
+            _sigmaR1=None,numcores=None):
         """
         NAME:
            pvz
@@ -1524,11 +1845,18 @@ class quasiisothermaldf:
 
            ngl - order of Gauss-Legendre integration
 
+           numcores= if set, evaluate arrays of vz,R,z on a pool of numcores processes
+
         OUTPUT:
            p(vz,R,z)
         HISTORY:
            2012-12-22 - Written - Bovy (IAS)
         """
+        if not numcores is None and not _return_actions \
+                and not _return_freqs and _jr is None:
+            if not gl:
+                raise NotImplementedError("numcores= is only supported for gl=True in pvz")
+            return self._parallel_eval('pvz',[vz,R,z],numcores,gl=gl,ngl=ngl)
         if _sigmaR1 is None:
             sigmaR1= self._sr*numpy.exp((self._ro-R)/self._hsr)
         else:
@@ -1835,6 +2163,88 @@ class quasiisothermaldf:
             if scalarOut: return out[0]
             else: return out
 
+    def _parallel_eval(self,method,pargs,numcores,vectorized=True,
+                       pkwargs={},**kwargs):
+        """
+        NAME:
+           _parallel_eval
+        PURPOSE:
+           evaluate a method for many points on the pool of processes; the
+           pool is kept until close_pool is called and each process only
+           receives the DF once (see StatePool)
+        INPUT:
+           method - name of the method
+           pargs - list of per-point arguments (broadcast against each other)
+           numcores - number of processes to use
+           vectorized= if True, the method accepts arrays of points,
+                       otherwise it is called point by point
+           pkwargs= per-point keywords (arrays whose leading dimensions are
+                    those of the points)
+           kwargs - other keywords for the method
+        OUTPUT:
+           method evaluated at the points (tuple of such if the method
+           returns a tuple)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        pargs= numpy.broadcast_arrays(*pargs)
+        shape= pargs[0].shape
+        npts= pargs[0].size
+        pargs= [a.flatten() for a in pargs]
+        pkwargs= dict([(key,numpy.reshape(val,(npts,)+val.shape[len(shape):]))
+                       for key,val in pkwargs.items() if not val is None])
+        #More chunks than processes, such that the load is balanced
+        nchunks= max(1,min(npts,_NCHUNKSPERCORE*numcores))
+        tasks= [(method,[a[indx] for a in pargs],
+                 dict([(key,val[indx]) for key,val in pkwargs.items()]),
+                 kwargs,vectorized)
+                for indx in numpy.array_split(numpy.arange(npts),nchunks)]
+        out= self._pool.map(self,'_parallel_eval_chunk',tasks,
+                            processes=numcores)
+        if isinstance(out[0],tuple):
+            return tuple([numpy.reshape(numpy.concatenate([o[ii] for o in out]),
+                                        shape+numpy.shape(out[0][ii])[1:])
+                          for ii in range(len(out[0]))])
+        else:
+            return numpy.reshape(numpy.concatenate(out),shape)
+
+    def _parallel_eval_chunk(self,method,pargs,pkwargs,kwargs,vectorized):
+        """Evaluate a method for a chunk of points for _parallel_eval"""
+        func= getattr(self,method)
+        if vectorized:
+            kwargs= dict(kwargs,**pkwargs)
+            return func(*pargs,**kwargs)
+        out= []
+        for ii in range(len(pargs[0])):
+            thiskwargs= dict(kwargs,**dict([(key,val[ii])
+                                            for key,val in pkwargs.items()]))
+            out.append(func(*[a[ii] for a in pargs],**thiskwargs))
+        return numpy.array(out)
+
+    def close_pool(self):
+        """
+        NAME:
+           close_pool
+        PURPOSE:
+           shut down the pool of processes used for numcores=; a new pool is
+           started when it is needed again
+        INPUT:
+           (none)
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        self._pool.close()
+        return None
+
+    def __setattr__(self,name,value):
+        #The state sent to the pool of processes needs to be updated
+        self.__dict__[name]= value
+        if not name == '_pool' and self.__dict__.has_key('_pool'):
+            self._pool.reset_state()
+        return None
+
     def _calc_epifreq(self,r):
         """
         NAME:
@@ -2,18 +2,27 @@
 import copy
 import numpy
 import multiprocessing
+import multiprocessing.pool
 import scipy
-from scipy import special, interpolate, integrate
+from scipy import special, interpolate, integrate, spatial
 if int(scipy.__version__.split('.')[1]) < 10:
     from scipy.maxentropy import logsumexp
 else:
     from scipy.misc import logsumexp
 from galpy.orbit import Orbit
 from galpy.util import bovy_coords, fast_cholesky_invert, \
-    bovy_conversion, multi, bovy_plot, stable_cho_factor, bovy_ars
+    bovy_conversion, bovy_plot, stable_cho_factor, bovy_ars, \
+    cache_dir, load_npy_cache, save_npy_cache
+from galpy.util.bovy_pool import StatePool
 _INTERPDURINGSETUP= True
 _USEINTERP= True
 _USESIMPLE= True
+_NCHUNKSPERCORE=4 #number of chunks of points per process for multi=
+_MAXGLBATCH=2**19 #maximum number of DF evaluations in a batch for callMarg
+#Arrays of the stream track and spread that are saved in the on-disk cache
+_CACHEDTRACK= ['_thetasTrack','_ObsTrack','_ObsTrackAA','_allAcfsTrack',
+               '_alljacsTrack','_allinvjacsTrack','_detdOdJps']
+_CACHEDSPREAD= ['_allErrCovs']
 _labelDict= {'x': r'$X$',
              'y': r'$Y$',
              'z': r'$Z$',
@@ -39,7 +48,7 @@ class streamdf:
                  Vnorm=220.,Rnorm=8.,
                  R0=8.,Zsun=0.025,vsun=[-11.1,8.*30.24,7.25],
                  multi=None,interpTrack=_INTERPDURINGSETUP,
-                 useInterp=_USEINTERP,nosetup=False):
+                 useInterp=_USEINTERP,nosetup=False,cachedir=None):
         """
         NAME:
            __init__
@@ -70,7 +79,8 @@ class streamdf:
                       calculating approximated frequencies and angles
            nosetup= (False) if True, don't setup the stream track and anything
                             else that is expensive
-           multi= (None) if set, use multi-processing
+           multi= (None) if set, use multi-processing; either the number of processes or a multiprocessing.Pool instance; the pool is kept for the lifetime of the object (see close_pool) and is re-used by the setup, callMarg, and sample
+           cachedir= (None) if set, save the stream track and its spread in this directory, under a key that depends on the progenitor, the potential, the actionAngle instance, and the parameters of the stream; later instances with the same key (also in other processes) load the (memory-mapped) track instead of re-computing its Jacobians
 
            Coordinate transformation inputs:
               Vnorm= (220) circular velocity to normalize velocities with
@@ -84,6 +94,8 @@ class streamdf:
         HISTORY:
            2013-09-16 - Started - Bovy (IAS)
            2013-11-25 - Started over - Bovy (IAS)
+           2026-10-18 - Added cachedir
+           2026-10-18 - multi= can be a multiprocessing.Pool
         """
         self._sigv= sigv
         if tdisrupt is None:
@@ -98,7 +110,13 @@ class streamdf:
         if not self._aA._pot == self._pot:
             raise IOError("Potential in aA does not appear to be the same as given potential pot")
         self._progenitor= progenitor
-        self._multi= multi
+        #The copies in the processes of the pool do not use multi-processing
+        if isinstance(multi,multiprocessing.pool.Pool):
+            self._pool= StatePool(pool=multi,workerattrs={'_multi':None})
+            self._multi= multi._processes
+        else:
+            self._pool= StatePool(workerattrs={'_multi':None})
+            self._multi= multi
         #Progenitor orbit: Calculate actions, frequencies, and angles for the progenitor
         acfs= aA.actionsFreqsAngles(self._progenitor,maxn=3,
                                     _firstFlip=(not leading))
@@ -172,6 +190,12 @@ class streamdf:
         self._R0= R0
         self._Zsun= Zsun
         self._vsun= vsun
+        self._cachedir= cache_dir(cachedir,self._pot,self._aA,
+                                  self._progenitor._orb.vxvv,
+                                  (self._sigv,self._tdisrupt,
+                                   self._sigMeanOffset,self._leading,
+                                   self._sigangle,deltaAngleTrack,
+                                   nTrackChunks))
         if not nosetup:
             self._determine_stream_track(deltaAngleTrack,nTrackChunks)
             self._useInterp= useInterp
@@ -591,56 +615,14 @@ class streamdf:
             self._progenitorTrack._orb.orbit[:,2]= -self._progenitorTrack._orb.orbit[:,2]
             self._progenitorTrack._orb.orbit[:,4]= -self._progenitorTrack._orb.orbit[:,4]
         #Now calculate the actions, frequencies, and angles + Jacobian for each chunk
-        allAcfsTrack= numpy.empty((self._nTrackChunks,9))
-        alljacsTrack= numpy.empty((self._nTrackChunks,6,6))
-        allinvjacsTrack= numpy.empty((self._nTrackChunks,6,6))
-        thetasTrack= numpy.linspace(0.,self._deltaAngleTrack,
-                                    self._nTrackChunks)
-        ObsTrack= numpy.empty((self._nTrackChunks,6))
-        ObsTrackAA= numpy.empty((self._nTrackChunks,6))
-        detdOdJps= numpy.empty((self._nTrackChunks))
-        if self._multi is None:
-            for ii in range(self._nTrackChunks):
-                multiOut= _determine_stream_track_single(self._aA,
-                                                         self._progenitorTrack,
-                                                         self._trackts[ii],
-                                                         self._progenitor_angle,
-                                                         self._sigMeanSign,
-                                                         self._dsigomeanProgDirection,
-                                                         self.meanOmega,
-                                                         thetasTrack[ii])
-                allAcfsTrack[ii,:]= multiOut[0]
-                alljacsTrack[ii,:,:]= multiOut[1]
-                allinvjacsTrack[ii,:,:]= multiOut[2]
-                ObsTrack[ii,:]= multiOut[3]
-                ObsTrackAA[ii,:]= multiOut[4]
-                detdOdJps[ii]= multiOut[5]
+        cached= load_npy_cache(self._cachedir,_CACHEDTRACK)
+        if cached is None:
+            self._calc_stream_track()
+            save_npy_cache(self._cachedir,
+                           dict([(name,self.__dict__[name])
+                                 for name in _CACHEDTRACK]))
         else:
-            multiOut= multi.parallel_map(\
-                (lambda x: _determine_stream_track_single(self._aA,self._progenitorTrack,self._trackts[x],
-                                                          self._progenitor_angle,
-                                                          self._sigMeanSign,
-                                                          self._dsigomeanProgDirection,
-                                                          self.meanOmega,
-                                                          thetasTrack[x])),
-                range(self._nTrackChunks),
-                numcores=numpy.amin([self._nTrackChunks,
-                                     multiprocessing.cpu_count(),
-                                     self._multi]))
-            for ii in range(self._nTrackChunks):
-                allAcfsTrack[ii,:]= multiOut[ii][0]
-                alljacsTrack[ii,:,:]= multiOut[ii][1]
-                allinvjacsTrack[ii,:,:]= multiOut[ii][2]
-                ObsTrack[ii,:]= multiOut[ii][3]
-                ObsTrackAA[ii,:]= multiOut[ii][4]
-                detdOdJps[ii]= multiOut[ii][5]
-        self._thetasTrack= thetasTrack
-        self._ObsTrack= ObsTrack
-        self._ObsTrackAA= ObsTrackAA
-        self._allAcfsTrack= allAcfsTrack
-        self._alljacsTrack= alljacsTrack
-        self._allinvjacsTrack= allinvjacsTrack
-        self._detdOdJps= detdOdJps
+            for name in cached: setattr(self,name,cached[name])
         self._meandetdOdJp= numpy.mean(self._detdOdJps)
         self._logmeandetdOdJp= numpy.log(self._meandetdOdJp)
         #Also calculate _ObsTrackXY in XYZ,vXYZ coordinates
@@ -661,31 +643,69 @@ class streamdf:
         self._ObsTrackXY[:,5]= TrackvZ
         return None
 
-    def _determine_stream_spread(self,simple=_USESIMPLE):
-        """Determine the spread around the stream track, just sets matrices that describe the covariances"""
-        allErrCovs= numpy.empty((self._nTrackChunks,6,6))
+    def _calc_stream_track(self):
+        """Calculate the actions, frequencies, and angles and the Jacobians
+        along the stream track"""
+        allAcfsTrack= numpy.empty((self._nTrackChunks,9))
+        alljacsTrack= numpy.empty((self._nTrackChunks,6,6))
+        allinvjacsTrack= numpy.empty((self._nTrackChunks,6,6))
+        thetasTrack= numpy.linspace(0.,self._deltaAngleTrack,
+                                    self._nTrackChunks)
+        ObsTrack= numpy.empty((self._nTrackChunks,6))
+        ObsTrackAA= numpy.empty((self._nTrackChunks,6))
+        detdOdJps= numpy.empty((self._nTrackChunks))
         if self._multi is None:
-            for ii in range(self._nTrackChunks):
-                allErrCovs[ii]= _determine_stream_spread_single(self._sigomatrixEig,
-                                                                self._thetasTrack[ii],
-                                                                self.sigOmega,
-                                                                lambda y: self.sigangledAngle(y,simple=simple),
-                                                                self._allinvjacsTrack[ii])
+            multiOut= [self._stream_track_single(thetasTrack[ii],
+                                                 self._progenitorTrack(self._trackts[ii]))
+                       for ii in range(self._nTrackChunks)]
         else:
-            multiOut= multi.parallel_map(\
-                (lambda x: _determine_stream_spread_single(self._sigomatrixEig,
-                                                                self._thetasTrack[x],
-                                                                self.sigOmega,
-                                                                lambda y: self.sigangledAngle(y,simple=simple),
-                                                                self._allinvjacsTrack[x])),
+            #Chunks near pericenter take longest, so hand those out first
+            multiOut= self._pool_map('_stream_track_single',
+                                     [(thetasTrack[ii],
+                                       self._progenitorTrack(self._trackts[ii]))
+                                      for ii in range(self._nTrackChunks)],
+                                     order=numpy.argsort(\
+                    self._progenitorTrack.R(self._trackts)))
+        for ii in range(self._nTrackChunks):
+            allAcfsTrack[ii,:]= multiOut[ii][0]
+            alljacsTrack[ii,:,:]= multiOut[ii][1]
+            allinvjacsTrack[ii,:,:]= multiOut[ii][2]
+            ObsTrack[ii,:]= multiOut[ii][3]
+            ObsTrackAA[ii,:]= multiOut[ii][4]
+            detdOdJps[ii]= multiOut[ii][5]
+        self._thetasTrack= thetasTrack
+        self._ObsTrack= ObsTrack
+        self._ObsTrackAA= ObsTrackAA
+        self._allAcfsTrack= allAcfsTrack
+        self._alljacsTrack= alljacsTrack
+        self._allinvjacsTrack= allinvjacsTrack
+        self._detdOdJps= detdOdJps
+        return None
 
-                range(self._nTrackChunks),
-                numcores=numpy.amin([self._nTrackChunks,
-                                     multiprocessing.cpu_count(),
-                                     self._multi]))
-            for ii in range(self._nTrackChunks):
-                allErrCovs[ii]= multiOut[ii]
-        self._allErrCovs= allErrCovs
+    def _stream_track_single(self,thetasTrack,progenitorTrackt):
+        """Calculate the actions, frequencies, and angles and the Jacobian
+        for a single chunk of the stream track (progenitorTrackt is the
+        progenitor's Orbit at the time of this chunk)"""
+        return _determine_stream_track_single(self._aA,
+                                              progenitorTrackt,
+                                              self._progenitor_angle,
+                                              self._sigMeanSign,
+                                              self._dsigomeanProgDirection,
+                                              self.meanOmega,
+                                              thetasTrack)
+
+    def _determine_stream_spread(self,simple=_USESIMPLE):
+        """Determine the spread around the stream track, just sets matrices that describe the covariances"""
+        #The spread depends on simple, so it is cached in a sub-directory
+        spreadcachedir= cache_dir(self._cachedir,simple)
+        cached= load_npy_cache(spreadcachedir,_CACHEDSPREAD)
+        if cached is None:
+            self._calc_stream_spread(simple)
+            save_npy_cache(spreadcachedir,
+                           dict([(name,self.__dict__[name])
+                                 for name in _CACHEDSPREAD]))
+        else:
+            for name in cached: setattr(self,name,cached[name])
         #Also propagate to XYZ coordinates
         allErrCovsXY= numpy.empty_like(self._allErrCovs)
         allErrCovsEigvalXY= numpy.empty((len(self._thetasTrack),6))
@@ -742,6 +762,78 @@ class streamdf:
         self._determine_stream_spreadLB(simple=simple)
         return None
 
+    def _calc_stream_spread(self,simple):
+        """Calculate the covariance matrices of the spread around the stream
+        track"""
+        allErrCovs= numpy.empty((self._nTrackChunks,6,6))
+        if self._multi is None:
+            for ii in range(self._nTrackChunks):
+                allErrCovs[ii]= self._stream_spread_single(ii,simple)
+        else:
+            multiOut= self._pool_map('_stream_spread_single',
+                                     [(ii,simple)
+                                      for ii in range(self._nTrackChunks)])
+            for ii in range(self._nTrackChunks):
+                allErrCovs[ii]= multiOut[ii]
+        self._allErrCovs= allErrCovs
+        return None
+
+    def _stream_spread_single(self,ii,simple):
+        """Calculate the covariance matrix of the spread around a single
+        point of the stream track"""
+        return _determine_stream_spread_single(self._sigomatrixEig,
+                                               self._thetasTrack[ii],
+                                               self.sigOmega,
+                                               lambda y: self.sigangledAngle(y,simple=simple),
+                                               self._allinvjacsTrack[ii])
+
+    def close_pool(self):
+        """
+        NAME:
+           close_pool
+        PURPOSE:
+           shut down the pool of processes used for multi= (if it was
+           started by this object); a new pool is started when it is needed
+           again
+        INPUT:
+           (none)
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        self._pool.close()
+        return None
+
+    def _pool_map(self,method,args,order=None):
+        """Evaluate a method for a list of argument tuples on the pool of
+        processes (see StatePool.map)"""
+        return self._pool.map(self,method,args,order=order,
+                              processes=numpy.amin([multiprocessing.cpu_count(),
+                                                    self._multi]))
+
+    def _pool_eval(self,method,pargs,**kwargs):
+        """Evaluate a vectorized method for arrays of points in chunks on the
+        pool of processes; the output is concatenated along its last axis"""
+        npts= len(pargs[0])
+        nchunks= max(1,min(npts,_NCHUNKSPERCORE*self._multi))
+        out= self._pool_map('_pool_eval_chunk',
+                            [(method,[a[indx] for a in pargs],kwargs)
+                             for indx in numpy.array_split(numpy.arange(npts),
+                                                           nchunks)])
+        return numpy.concatenate(out,axis=-1)
+
+    def _pool_eval_chunk(self,method,pargs,kwargs):
+        """Evaluate a method for a chunk of points for _pool_eval"""
+        return getattr(self,method)(*pargs,**kwargs)
+
+    def __setattr__(self,name,value):
+        #The state sent to the pool of processes needs to be updated
+        self.__dict__[name]= value
+        if not name == '_pool' and self.__dict__.has_key('_pool'):
+            self._pool.reset_state()
+        return None
+
     def _determine_stream_spreadLB(self,simple=_USESIMPLE,
                                    Rnorm=None,Vnorm=None,
                                    R0=None,Zsun=None,vsun=None):
@@ -1019,6 +1111,10 @@ class streamdf:
             self._interpolatedObsTrackLB[:,3]= svlbd[:,0]
             self._interpolatedObsTrackLB[:,4]= svlbd[:,1]
             self._interpolatedObsTrackLB[:,5]= svlbd[:,2]
+        if hasattr(self,'_closestTrackpointTrees'):
+            #Remove the KD-trees over the previous LB track
+            for key in self._closestTrackpointTrees.keys():
+                if key[0] == 'LB': del self._closestTrackpointTrees[key]
         if hasattr(self,'_allErrCovsLBUnscaled'):
             #Re-calculate this
             self._determine_stream_spreadLB(simple=_USESIMPLE,
@@ -1040,14 +1136,15 @@ class streamdf:
         PURPOSE:
            find the closest point on the stream track to a given point
         INPUT:
-           R,vR,vT,z,vz,phi - phase-space coordinates of the given point
+           R,vR,vT,z,vz,phi - phase-space coordinates of the given point (can be arrays)
            interp= (True), if True, return the index of the interpolated track
            xy= (False) if True, input is X,Y,Z,vX,vY,vZ in Galactocentric rectangular coordinates; if xy, some coordinates may be missing (given as None) and they will not be used
            usev= (False) if True, also use velocities to find the closest point
         OUTPUT:
-           index into the track of the closest track point
+           index into the track of the closest track point (array for array input)
         HISTORY:
            2013-12-04 - Written - Bovy (IAS)
+           2026-10-18 - Use a KD-tree over the track and allow array input
         """
         if xy:
             X= R
@@ -1067,30 +1164,10 @@ class streamdf:
             vZ= vz
         present= [not X is None,not Y is None,not Z is None]
         if usev: present.extend([not vX is None,not vY is None,not vZ is None])
-        present= numpy.array(present,dtype='float')
-        if X is None: X= 0.
-        if Y is None: Y= 0.
-        if Z is None: Z= 0.
-        if usev and vX is None: vX= 0.
-        if usev and vY is None: vY= 0.
-        if usev and vZ is None: vZ= 0.
-        if interp:
-            dist2= present[0]*(X-self._interpolatedObsTrackXY[:,0])**2.\
-                +present[1]*(Y-self._interpolatedObsTrackXY[:,1])**2.\
-                +present[2]*(Z-self._interpolatedObsTrackXY[:,2])**2.
-            if usev:
-                dist2+= present[3]*(vX-self._interpolatedObsTrackXY[:,3])**2.\
-                    +present[4]*(vY-self._interpolatedObsTrackXY[:,4])**2.\
-                    +present[5]*(vZ-self._interpolatedObsTrackXY[:,5])**2.
-        else:
-            dist2= present[0]*(X-self._ObsTrackXY[:,0])**2.\
-                +present[1]*(Y-self._ObsTrackXY[:,1])**2.\
-                +present[2]*(Z-self._ObsTrackXY[:,2])**2.
-            if usev:
-                dist2+= present[3]*(vX-self._ObsTrackXY[:,3])**2.\
-                    +present[4]*(vY-self._ObsTrackXY[:,4])**2.\
-                    +present[5]*(vZ-self._ObsTrackXY[:,5])**2.
-        return numpy.argmin(dist2)
+        coords= [c for c,p in zip([X,Y,Z,vX,vY,vZ] if usev else [X,Y,Z],
+                                  present) if p]
+        return self._query_closest_trackpoint('XY',interp,usev,present,
+                                              coords)
 
     def _find_closest_trackpointLB(self,l,b,D,vlos,pmll,pmbb,interp=True,
                                    usev=False):
@@ -1106,85 +1183,109 @@ class streamdf:
            find the closest point on the stream track to a given point in 
            (l,b,...) coordinates
         INPUT:
-           l,b,D,vlos,pmll,pmbb- coordinates in (deg,deg,kpc,km/s,mas/yr,mas/yr)
+           l,b,D,vlos,pmll,pmbb- coordinates in (deg,deg,kpc,km/s,mas/yr,mas/yr) (can be arrays)
            interp= (True) if True, return the closest index on the interpolated track
            usev= (False) if True, also use the velocity components (default is
                  to only use the positions)
         OUTPUT:
            index of closest track point on the interpolated or not-interpolated
-           track
+           track (array for array input)
         HISTORY:
            2013-12-17- Written - Bovy (IAS)
+           2026-10-18 - Use a KD-tree over the track and allow array input
         """
-        if interp:
-            nTrackPoints= len(self._interpolatedThetasTrack)
-        else:
-            nTrackPoints= len(self._thetasTrack)
-        if l is None:
-            l= 0.
-            trackL= numpy.zeros(nTrackPoints)
-        elif interp:
-            trackL= self._interpolatedObsTrackLB[:,0]
-        else:
-            trackL= self._ObsTrackLB[:,0]
-        if b is None:
-            b= 0.
-            trackB= numpy.zeros(nTrackPoints)
-        elif interp:
-            trackB= self._interpolatedObsTrackLB[:,1]
-        else:
-            trackB= self._ObsTrackLB[:,1]
-        if D is None:
-            D= 1.
-            trackD= numpy.ones(nTrackPoints)
-        elif interp:
-            trackD= self._interpolatedObsTrackLB[:,2]
-        else:
-            trackD= self._ObsTrackLB[:,2]
+        present= [not l is None,not b is None,not D is None]
         if usev:
-            if vlos is None:
-                vlos= 0.
-                trackVlos= numpy.zeros(nTrackPoints)
-            elif interp:
-                trackVlos= self._interpolatedObsTrackLB[:,3]
-            else:
-                trackVlos= self._ObsTrackLB[:,3]
-            if pmll is None:
-                pmll= 0.
-                trackPmll= numpy.zeros(nTrackPoints)
-            elif interp:
-                trackPmll= self._interpolatedObsTrackLB[:,4]
-            else:
-                trackPmll= self._ObsTrackLB[:,4]
-            if pmbb is None:
-                pmbb= 0.
-                trackPmbb= numpy.zeros(nTrackPoints)
-            elif interp:
-                trackPmbb= self._interpolatedObsTrackLB[:,5]
-            else:
-                trackPmbb= self._ObsTrackLB[:,5]
+            present.extend([not vlos is None,not pmll is None,
+                            not pmbb is None])
+        if l is None: l= 0.
+        if b is None: b= 0.
+        if D is None: D= 1.
+        scalarIn= numpy.array(l).shape == () and numpy.array(b).shape == () \
+            and numpy.array(D).shape == ()
+        l,b,D= numpy.broadcast_arrays(numpy.atleast_1d(l),
+                                      numpy.atleast_1d(b),
+                                      numpy.atleast_1d(D))
         #Calculate rectangular coordinates
         XYZ= bovy_coords.lbd_to_XYZ(l,b,D,degree=True)
-        trackXYZ= bovy_coords.lbd_to_XYZ(trackL,trackB,trackD,degree=True)
+        coords= [XYZ[:,0],XYZ[:,1],XYZ[:,2]]
         if usev:
-            vxvyvz= bovy_coords.vrpmllpmbb_to_vxvyvz(vlos,pmll,pmbb,
-                                                     XYZ[0],XYZ[1],XYZ[2],
+            if vlos is None: vlos= 0.
+            if pmll is None: pmll= 0.
+            if pmbb is None: pmbb= 0.
+            scalarIn= scalarIn and numpy.array(vlos).shape == () \
+                and numpy.array(pmll).shape == () \
+                and numpy.array(pmbb).shape == ()
+            vlos,pmll,pmbb,X,Y,Z= numpy.broadcast_arrays(vlos,pmll,pmbb,
+                                                         XYZ[:,0],XYZ[:,1],
+                                                         XYZ[:,2])
+            vxvyvz= bovy_coords.vrpmllpmbb_to_vxvyvz(vlos,pmll,pmbb,X,Y,Z,
                                                      XYZ=True)
-            trackvxvyvz= bovy_coords.vrpmllpmbb_to_vxvyvz(trackVlos,trackPmll,
-                                                          trackPmbb,
-                                                          trackXYZ[:,0],
-                                                          trackXYZ[:,1],
-                                                          trackXYZ[:,2],
-                                                          XYZ=True)
-        #Calculate distance
-        dist2= (XYZ[0]-trackXYZ[:,0])**2.\
-            +(XYZ[1]-trackXYZ[:,1])**2.\
-            +(XYZ[2]-trackXYZ[:,2])**2.
-        if usev:
-            dist2+= (vxvyvz[0]-trackvxvyvz[:,0])**2.\
-                +(vxvyvz[1]-trackvxvyvz[:,1])**2.\
-                +(vxvyvz[2]-trackvxvyvz[:,2])**2.
-        return numpy.argmin(dist2)            
+            coords= [X,Y,Z,vxvyvz[:,0],vxvyvz[:,1],vxvyvz[:,2]]
+        out= self._query_closest_trackpoint('LB',interp,usev,present,coords)
+        if scalarIn: return out[0]
+        else: return out
+
+    def _query_closest_trackpoint(self,frame,interp,usev,present,coords):
+        """Query the KD-tree over the stream track in frame ('XY' or 'LB')
+        for the closest track points to the points with coordinates coords
+        (list of the present coordinates for XY and of all rectangular
+        coordinates for LB); returns a scalar for scalar input"""
+        present= tuple(present)
+        if not numpy.any(present): #All points are equally close
+            if numpy.all([numpy.array(c).shape == () for c in coords]):
+                return 0
+            return numpy.zeros(numpy.broadcast(*coords).shape,dtype='int')
+        tree= self._closest_trackpoint_tree(frame,interp,usev,present)
+        scalarIn= numpy.all([numpy.array(c).shape == () for c in coords])
+        coords= numpy.broadcast_arrays(*[numpy.atleast_1d(c) for c in coords])
+        shape= coords[0].shape
+        pts= numpy.array([c.flatten() for c in coords]).T
+        out= tree.query(pts)[1]
+        if scalarIn: return out[0]
+        else: return numpy.reshape(out,shape)
+
+    def _closest_trackpoint_tree(self,frame,interp,usev,present):
+        """Build (or return the cached) KD-tree over the rectangular
+        coordinates of the (interpolated) stream track in frame ('XY' for
+        Galactocentric coordinates, only using the present ones; 'LB' for
+        heliocentric coordinates, where missing observed coordinates are set to
+        zero, or one for the distance, like they are for the data)"""
+        if not hasattr(self,'_closestTrackpointTrees'):
+            self._closestTrackpointTrees= {}
+        key= (frame,interp,usev,present)
+        if key in self._closestTrackpointTrees:
+            return self._closestTrackpointTrees[key]
+        if frame == 'XY':
+            if interp:
+                track= self._interpolatedObsTrackXY
+            else:
+                track= self._ObsTrackXY
+        else:
+            if interp:
+                track= copy.copy(self._interpolatedObsTrackLB)
+            else:
+                track= copy.copy(self._ObsTrackLB)
+            for ii, default in enumerate([0.,0.,1.,0.,0.,0.][:len(present)]):
+                if not present[ii]: track[:,ii]= default
+            trackXYZ= bovy_coords.lbd_to_XYZ(track[:,0],track[:,1],
+                                             track[:,2],degree=True)
+            if usev:
+                trackvxvyvz= bovy_coords.vrpmllpmbb_to_vxvyvz(track[:,3],
+                                                              track[:,4],
+                                                              track[:,5],
+                                                              trackXYZ[:,0],
+                                                              trackXYZ[:,1],
+                                                              trackXYZ[:,2],
+                                                              XYZ=True)
+                track= numpy.hstack((trackXYZ,trackvxvyvz))
+            else:
+                track= trackXYZ
+            present= [True for p in present]
+        indx= numpy.arange(len(present))[numpy.array(present)]
+        tree= spatial.cKDTree(track[:,indx])
+        self._closestTrackpointTrees[key]= tree
+        return tree
 
     def _find_closest_trackpointaA(self,Or,Op,Oz,ar,ap,az,interp=True):
         """
@@ -1194,22 +1295,35 @@ class streamdf:
            find the closest point on the stream track to a given point in
            frequency-angle coordinates
         INPUT:
-           Or,Op,Oz,ar,ap,az - phase-space coordinates of the given point
+           Or,Op,Oz,ar,ap,az - phase-space coordinates of the given point (can be arrays)
            interp= (True), if True, return the index of the interpolated track
         OUTPUT:
-           index into the track of the closest track point
+           index into the track of the closest track point (array for array input)
         HISTORY:
            2013-12-22 - Written - Bovy (IAS)
+           2026-10-18 - Allow array input
         """
         #Calculate angle offset along the stream parallel to the stream track
-        angle= numpy.hstack((ar,ap,az))
-        da= angle-self._progenitor_angle
-        dapar= self._sigMeanSign*numpy.sum(da*self._dsigomeanProgDirection)
+        scalarIn= numpy.array(ar).shape == ()
+        angle= numpy.array([numpy.atleast_1d(ar),numpy.atleast_1d(ap),
+                            numpy.atleast_1d(az)])
+        da= angle-numpy.reshape(self._progenitor_angle,(3,1))
+        dapar= self._sigMeanSign*numpy.dot(self._dsigomeanProgDirection,da)
         if interp:
-            dist= numpy.fabs(dapar-self._interpolatedThetasTrack)
+            thetas= self._interpolatedThetasTrack
         else:
-            dist= numpy.fabs(dapar-self._thetasTrack)
-        return numpy.argmin(dist)
+            thetas= self._thetasTrack
+        #Closest value in the sorted thetas, the first one for ties
+        sortIndx= numpy.argsort(thetas,kind='mergesort')
+        sthetas= thetas[sortIndx]
+        indx= numpy.searchsorted(sthetas,dapar)
+        indx[indx == len(sthetas)]= len(sthetas)-1
+        lower= (indx > 0)*(numpy.fabs(dapar-sthetas[indx-1])
+                           <= numpy.fabs(dapar-sthetas[indx]))
+        indx[lower]-= 1
+        out= sortIndx[indx]
+        if scalarIn: return out[0]
+        else: return out
 
 #########DISTRIBUTION AS A FUNCTION OF ANGLE ALONG THE STREAM##################
     def meanOmega(self,dangle,oned=False):
@@ -1458,6 +1572,7 @@ class streamdf:
            (Or,Op,Oz,ar,ap,az)
         HISTORY:
            2013-12-03 - Written - Bovy (IAS)
+           2026-10-18 - Vectorized
         """
         if isinstance(R,(int,float,numpy.float32,numpy.float64)): #Scalar input
             R= numpy.array([R])
@@ -1466,46 +1581,24 @@ class streamdf:
             z= numpy.array([z])
             vz= numpy.array([vz])
             phi= numpy.array([phi])
-        closestIndx= [self._find_closest_trackpoint(R[ii],vR[ii],vT[ii],
-                                                    z[ii],vz[ii],phi[ii],
-                                                    interp=interp,
-                                                    xy=False) 
-                      for ii in range(len(R))]
-        out= numpy.empty((6,len(R)))
-        for ii in range(len(R)):
-            dxv= numpy.empty(6)
-            if interp:
-                dxv[0]= R[ii]-self._interpolatedObsTrack[closestIndx[ii],0]
-                dxv[1]= vR[ii]-self._interpolatedObsTrack[closestIndx[ii],1]
-                dxv[2]= vT[ii]-self._interpolatedObsTrack[closestIndx[ii],2]
-                dxv[3]= z[ii]-self._interpolatedObsTrack[closestIndx[ii],3]
-                dxv[4]= vz[ii]-self._interpolatedObsTrack[closestIndx[ii],4]
-                dxv[5]= phi[ii]-self._interpolatedObsTrack[closestIndx[ii],5]
-                jacIndx= self._find_closest_trackpoint(R[ii],vR[ii],vT[ii],
-                                                       z[ii],vz[ii],phi[ii],
-                                                       interp=False,
-                                                       xy=False)
-            else:
-                dxv[0]= R[ii]-self._ObsTrack[closestIndx[ii],0]
-                dxv[1]= vR[ii]-self._ObsTrack[closestIndx[ii],1]
-                dxv[2]= vT[ii]-self._ObsTrack[closestIndx[ii],2]
-                dxv[3]= z[ii]-self._ObsTrack[closestIndx[ii],3]
-                dxv[4]= vz[ii]-self._ObsTrack[closestIndx[ii],4]
-                dxv[5]= phi[ii]-self._ObsTrack[closestIndx[ii],5]
-                jacIndx= closestIndx[ii]
-            #Make sure phi hasn't wrapped around
-            if dxv[5] > numpy.pi:
-                dxv[5]-= 2.*numpy.pi
-            elif dxv[5] < -numpy.pi:
-                dxv[5]+= 2.*numpy.pi
-            #Apply closest jacobian
-            out[:,ii]= numpy.dot(self._alljacsTrack[jacIndx,:,:],
-                                 dxv)
-            if interp:
-                out[:,ii]+= self._interpolatedObsTrackAA[closestIndx[ii]]
-            else:
-                out[:,ii]+= self._ObsTrackAA[closestIndx[ii]]
-        return out            
+        closestIndx= self._find_closest_trackpoint(R,vR,vT,z,vz,phi,
+                                                   interp=interp,xy=False)
+        if interp:
+            jacIndx= self._find_closest_trackpoint(R,vR,vT,z,vz,phi,
+                                                   interp=False,xy=False)
+            track= self._interpolatedObsTrack[closestIndx]
+            trackAA= self._interpolatedObsTrackAA[closestIndx]
+        else:
+            jacIndx= closestIndx
+            track= self._ObsTrack[closestIndx]
+            trackAA= self._ObsTrackAA[closestIndx]
+        dxv= numpy.array([R,vR,vT,z,vz,phi]).T-track
+        #Make sure phi hasn't wrapped around
+        dxv[dxv[:,5] > numpy.pi,5]-= 2.*numpy.pi
+        dxv[dxv[:,5] < -numpy.pi,5]+= 2.*numpy.pi
+        #Apply closest jacobian
+        return (numpy.einsum('ijk,ik->ij',self._alljacsTrack[jacIndx],dxv)
+                +trackAA).T
 
     def _approxaAInv(self,Or,Op,Oz,ar,ap,az,interp=True):
         """
@@ -1522,6 +1615,7 @@ class streamdf:
            (R,vR,vT,z,vz,phi)
         HISTORY:
            2013-12-22 - Written - Bovy (IAS)
+           2026-10-18 - Vectorized
         """
         if isinstance(Or,(int,float,numpy.float32,numpy.float64)): #Scalar input
             Or= numpy.array([Or])
@@ -1531,52 +1625,24 @@ class streamdf:
             ap= numpy.array([ap])
             az= numpy.array([az])
         #Calculate apar, angle offset along the stream
-        closestIndx= [self._find_closest_trackpointaA(Or[ii],Op[ii],Oz[ii],
-                                                      ar[ii],ap[ii],az[ii],
-                                                      interp=interp)\
-                          for ii in range(len(Or))]
-        out= numpy.empty((6,len(Or)))
-        for ii in range(len(Or)):
-            dOa= numpy.empty(6)
-            if interp:
-                dOa[0]= Or[ii]-self._interpolatedObsTrackAA[closestIndx[ii],0]
-                dOa[1]= Op[ii]-self._interpolatedObsTrackAA[closestIndx[ii],1]
-                dOa[2]= Oz[ii]-self._interpolatedObsTrackAA[closestIndx[ii],2]
-                dOa[3]= ar[ii]-self._interpolatedObsTrackAA[closestIndx[ii],3]
-                dOa[4]= ap[ii]-self._interpolatedObsTrackAA[closestIndx[ii],4]
-                dOa[5]= az[ii]-self._interpolatedObsTrackAA[closestIndx[ii],5]
-                jacIndx= self._find_closest_trackpointaA(Or[ii],Op[ii],Oz[ii],
-                                                         ar[ii],ap[ii],az[ii],
-                                                         interp=False)
-            else:
-                dOa[0]= Or[ii]-self._ObsTrackAA[closestIndx[ii],0]
-                dOa[1]= Op[ii]-self._ObsTrackAA[closestIndx[ii],1]
-                dOa[2]= Oz[ii]-self._ObsTrackAA[closestIndx[ii],2]
-                dOa[3]= ar[ii]-self._ObsTrackAA[closestIndx[ii],3]
-                dOa[4]= ap[ii]-self._ObsTrackAA[closestIndx[ii],4]
-                dOa[5]= az[ii]-self._ObsTrackAA[closestIndx[ii],5]
-                jacIndx= closestIndx[ii]
-            #Make sure the angles haven't wrapped around
-            if dOa[3] > numpy.pi:
-                dOa[3]-= 2.*numpy.pi
-            elif dOa[3] < -numpy.pi:
-                dOa[3]+= 2.*numpy.pi
-            if dOa[4] > numpy.pi:
-                dOa[4]-= 2.*numpy.pi
-            elif dOa[4] < -numpy.pi:
-                dOa[4]+= 2.*numpy.pi
-            if dOa[5] > numpy.pi:
-                dOa[5]-= 2.*numpy.pi
-            elif dOa[5] < -numpy.pi:
-                dOa[5]+= 2.*numpy.pi
-            #Apply closest jacobian
-            out[:,ii]= numpy.dot(self._allinvjacsTrack[jacIndx,:,:],
-                                 dOa)
-            if interp:
-                out[:,ii]+= self._interpolatedObsTrack[closestIndx[ii]]
-            else:
-                out[:,ii]+= self._ObsTrack[closestIndx[ii]]
-        return out            
+        closestIndx= self._find_closest_trackpointaA(Or,Op,Oz,ar,ap,az,
+                                                     interp=interp)
+        if interp:
+            jacIndx= self._find_closest_trackpointaA(Or,Op,Oz,ar,ap,az,
+                                                     interp=False)
+            trackAA= self._interpolatedObsTrackAA[closestIndx]
+            track= self._interpolatedObsTrack[closestIndx]
+        else:
+            jacIndx= closestIndx
+            trackAA= self._ObsTrackAA[closestIndx]
+            track= self._ObsTrack[closestIndx]
+        dOa= numpy.array([Or,Op,Oz,ar,ap,az]).T-trackAA
+        #Make sure the angles haven't wrapped around
+        dOa[:,3:][dOa[:,3:] > numpy.pi]-= 2.*numpy.pi
+        dOa[:,3:][dOa[:,3:] < -numpy.pi]+= 2.*numpy.pi
+        #Apply closest jacobian
+        return (numpy.einsum('ijk,ik->ij',self._allinvjacsTrack[jacIndx],dOa)
+                +track).T
 
 ################################EVALUATE THE DF################################
     def __call__(self,*args,**kwargs):
@@ -1708,11 +1774,11 @@ class streamdf:
            Galactocentric rectangular coordinates (or in observed 
            l,b,D,vlos,pmll,pmbb) coordinates)
         INPUT:
-           xy - phase-space point [X,Y,Z,vX,vY,vZ]; the distribution of the dimensions set to None is returned
+           xy - phase-space point [X,Y,Z,vX,vY,vZ]; the distribution of the dimensions set to None is returned; can also be a list of such points or an [N,6] array in which missing dimensions are NaN (points are grouped by their missing dimensions and closest track point and evaluated together)
            interp= (object-wide interp default) if True, use the interpolated
                    stream track
            cindx= index of the closest point on the (interpolated) stream track
-                  if not given, determined from the dimensions given          
+                  if not given, determined from the dimensions given (array for many points)
            nsigma= (3) number of sigma to marginalize the DF over (approximate sigma)
            ngl= (5) order of Gauss-Legendre integration
            lb= (False) if True, xy contains [l,b,D,vlos,pmll,pmbb] in [deg,deg,kpc,km/s,mas/yr,as/yr] and the marginalized PDF in these coordinates is returned          
@@ -1722,16 +1788,52 @@ class streamdf:
            Zsun= (0.025) Sun's height above the plane (kpc)
            vsun= ([-11.1,241.92,7.25]) Sun's motion in cylindrical coordinates (vR positive away from center)
         OUTPUT:
-           p(xy) marginalized over missing directions in xy
+           p(xy) marginalized over missing directions in xy (array for many points)
         HISTORY:
            2013-12-16 - Written - Bovy (IAS)
+           2026-10-18 - Evaluate many points at once
         """
-        coordGiven= numpy.array([not x is None for x in xy],dtype='bool')
-        if numpy.sum(coordGiven) == 6:
+        xy, coordGiven, scalarIn= _parse_marg_xy(xy)
+        if numpy.any(numpy.all(coordGiven,axis=1)):
             raise NotImplementedError("When specifying all coordinates, please use __call__ instead of callMarg")
-        #First construct the Gaussian approximation at this xy
-        gaussmean, gaussvar= self.gaussApprox(xy,**kwargs)
-        cholvar, chollower= stable_cho_factor(gaussvar)
+        if kwargs.has_key('interp'):
+            interp= kwargs['interp']
+        else:
+            interp= self._useInterp
+        if kwargs.has_key('lb'):
+            lb= kwargs['lb']
+        else:
+            lb= False
+        if kwargs.has_key('cindx'):
+            cindx= numpy.zeros(len(xy),dtype='int')+kwargs['cindx']
+        else:
+            cindx= None
+        out= numpy.empty(len(xy))
+        #Group the points by which dimensions are missing
+        for pattern in set([tuple(c) for c in coordGiven]):
+            pindx= numpy.all(coordGiven == numpy.array(pattern),axis=1)
+            out[pindx]= self._callMarg_samegiven(xy[pindx],
+                                                 numpy.array(pattern),
+                                                 None if cindx is None \
+                                                     else cindx[pindx],
+                                                 interp,lb,kwargs)
+        if scalarIn: return out[0]
+        else: return out
+
+    def _callMarg_samegiven(self,xy,coordGiven,cindx,interp,lb,kwargs):
+        """callMarg for [N,6] points xy that all have the same given
+        dimensions coordGiven"""
+        #First find the nearest track points
+        xyIn= [xy[:,ii] if coordGiven[ii] else None for ii in range(6)]
+        if cindx is None and lb:
+            cindx= self._find_closest_trackpointLB(*xyIn,interp=interp,
+                                                    usev=True)
+        elif cindx is None:
+            cindx= self._find_closest_trackpoint(*xyIn,xy=True,interp=interp,
+                                                  usev=True)
+        #Then construct the Gaussian approximation at all xy
+        gaussmean, gaussvar= self.gaussApprox(xy,interp=interp,lb=lb,
+                                              cindx=cindx)
         #Now Gauss-legendre integrate over missing directions
         if kwargs.has_key('ngl'):
             ngl= kwargs['ngl']
@@ -1742,57 +1844,67 @@ class streamdf:
         else:
             nsigma= 3
         glx, glw= numpy.polynomial.legendre.leggauss(ngl)
-        coordEval= []
-        weightEval= []
-        jj= 0
-        baseX= (glx+1)/2.
-        baseX= list(baseX)
-        baseX.extend(-(glx+1)/2.)
-        baseX= numpy.array(baseX)
-        baseW= glw
-        baseW= list(baseW)
-        baseW.extend(glw)
-        baseW= numpy.array(baseW)
-        for ii in range(6):
-            if not coordGiven[ii]:
-                coordEval.append(nsigma*baseX)
-                weightEval.append(baseW)
-                jj+= 1
+        baseX= numpy.hstack(((glx+1)/2.,-(glx+1)/2.))
+        baseW= numpy.hstack((glw,glw))
+        nMissing= 6-numpy.sum(coordGiven)
+        mgrid= numpy.meshgrid(*[nsigma*baseX for ii in range(nMissing)],
+                              indexing='ij')
+        mgrid= numpy.array([m.flatten() for m in mgrid])
+        logw= numpy.sum(numpy.log([m.flatten() for m in 
+                                   numpy.meshgrid(*[baseW for ii in range(nMissing)],
+                                                  indexing='ij')]),axis=0)
+        ngrid= mgrid.shape[1]
+        #Points with the same closest track point share the Gaussian's
+        #variance, so only transform the grid once for each
+        gridOffset= numpy.empty((len(xy),nMissing,ngrid))
+        logdetvar= numpy.empty(len(xy))
+        for c in numpy.unique(cindx):
+            cindxIndx= cindx == c
+            tvar= gaussvar[numpy.arange(len(xy))[cindxIndx][0]]
+            cholvar, chollower= stable_cho_factor(tvar)
+            gridOffset[cindxIndx]= numpy.dot(cholvar,mgrid)
+            logdetvar[cindxIndx]= 0.5*numpy.log(numpy.linalg.det(tvar))
+        #Add the additional Jacobian dXdY/dldb... if necessary
+        if lb:
+            #Only l,b,d,... to Galactic X,Y,Z,... is necessary because going
+            #from Galactic to Galactocentric has Jacobian determinant 1
+            if interp:
+                addLogDet= self._interpolatedTrackLogDetJacLB[cindx]
             else:
-                coordEval.append(xy[ii]*numpy.ones(1))
-                weightEval.append(numpy.ones(1))
-        mgrid= numpy.meshgrid(*coordEval,indexing='ij')
-        mgridNotGiven= numpy.array([mgrid[ii].flatten() for ii in range(6) 
-                                    if not coordGiven[ii]])
-        mgridNotGiven= numpy.dot(cholvar,mgridNotGiven)
-        jj= 0
-        if coordGiven[0]: iX= mgrid[0]
-        else:
-            iX= mgridNotGiven[jj]+gaussmean[jj]
-            jj+= 1
-        if coordGiven[1]: iY= mgrid[1]
-        else:
-            iY= mgridNotGiven[jj]+gaussmean[jj]
-            jj+= 1
-        if coordGiven[2]: iZ= mgrid[2]
-        else:
-            iZ= mgridNotGiven[jj]+gaussmean[jj]
-            jj+= 1
-        if coordGiven[3]: ivX= mgrid[3]
-        else:
-            ivX= mgridNotGiven[jj]+gaussmean[jj]
-            jj+= 1
-        if coordGiven[4]: ivY= mgrid[4]
-        else:
-            ivY= mgridNotGiven[jj]+gaussmean[jj]
-            jj+= 1
-        if coordGiven[5]: ivZ= mgrid[5]
+                addLogDet= self._trackLogDetJacLB[cindx]
         else:
-            ivZ= mgridNotGiven[jj]+gaussmean[jj]
-            jj+= 1
-        iXw, iYw, iZw, ivXw, ivYw, ivZw=\
-            numpy.meshgrid(*weightEval,indexing='ij')
-        if kwargs.has_key('lb') and kwargs['lb']: #Convert to Galactocentric cylindrical coordinates
+            addLogDet= 0.
+        #Evaluate the DF at the grids of many points at once
+        out= numpy.empty(len(xy))
+        nbatch= max(1,_MAXGLBATCH//ngrid)
+        for ii in range(0,len(xy),nbatch):
+            bindx= slice(ii,min(ii+nbatch,len(xy)))
+            icoords= []
+            jj= 0
+            for kk in range(6):
+                if coordGiven[kk]:
+                    icoords.append(numpy.tile(xy[bindx,kk],(ngrid,1)).T)
+                else:
+                    icoords.append(gridOffset[bindx,jj]
+                                   +numpy.tile(gaussmean[bindx,jj],
+                                               (ngrid,1)).T)
+                    jj+= 1
+            iR,ivR,ivT,iZ,ivZ,iphi= self._callMarg_cyl(icoords,lb,kwargs)
+            if self._multi is None:
+                logdf= self(iR,ivR,ivT,iZ,ivZ,iphi,log=True)
+            else:
+                logdf= self._pool_eval('__call__',[iR,ivR,ivT,iZ,ivZ,iphi],
+                                       log=True)
+            out[bindx]= _mylogsumexp(numpy.reshape(logdf,(-1,ngrid))+logw,
+                                     axis=1)
+        return out+logdetvar+addLogDet
+
+    def _callMarg_cyl(self,icoords,lb,kwargs):
+        """Convert the rectangular (or l,b,...) coordinates icoords of the
+        integration points of callMarg to Galactocentric cylindrical
+        coordinates"""
+        iX, iY, iZ, ivX, ivY, ivZ= icoords
+        if lb: #Convert to Galactocentric cylindrical coordinates
             #Setup coordinate transformation kwargs
             if not kwargs.has_key('Vnorm'):
                 Vnorm= self._Vnorm
@@ -1844,36 +1956,7 @@ class streamdf:
                 bovy_coords.rect_to_cyl_vec(ivX.flatten(),ivY.flatten(),
                                             ivZ.flatten(),
                                             iR,iphi,iZ,cyl=True)
-        #Add the additional Jacobian dXdY/dldb... if necessary
-        if kwargs.has_key('lb') and kwargs['lb']:
-            #Find the nearest track point
-            if kwargs.has_key('interp'):
-                interp= kwargs['interp']
-            else:
-                interp= self._useInterp
-            if not kwargs.has_key('cindx'):
-                cindx= self._find_closest_trackpointLB(*xy,interp=interp,
-                                                        usev=True)
-            else:
-                cindx= kwargs['cindx']
-            #Only l,b,d,... to Galactic X,Y,Z,... is necessary because going
-            #from Galactic to Galactocentric has Jacobian determinant 1
-            if interp:
-                addLogDet= self._interpolatedTrackLogDetJacLB[cindx]
-            else:
-                addLogDet= self._trackLogDetJacLB[cindx]
-        else:
-            addLogDet= 0.
-        logdf= self(iR,ivR,ivT,iZ,ivZ,iphi,log=True)
-        return logsumexp(logdf
-                         +numpy.log(iXw.flatten())
-                         +numpy.log(iYw.flatten())
-                         +numpy.log(iZw.flatten())
-                         +numpy.log(ivXw.flatten())
-                         +numpy.log(ivYw.flatten())
-                         +numpy.log(ivZw.flatten()))\
-                         +0.5*numpy.log(numpy.linalg.det(gaussvar))\
-                         +addLogDet
+        return (iR,ivR,ivT,iZ,ivZ,iphi)
 
     def gaussApprox(self,xy,**kwargs):
         """
@@ -1884,17 +1967,18 @@ class streamdf:
            stream DF at a given phase-space point in Galactocentric
            rectangular coordinates (distribution is over missing directions)
         INPUT:
-           xy - phase-space point [X,Y,Z,vX,vY,vZ]; the distribution of the dimensions set to None is returned
+           xy - phase-space point [X,Y,Z,vX,vY,vZ]; the distribution of the dimensions set to None is returned; can also be a list of such points or an [N,6] array in which missing dimensions are NaN (all points need to have the same missing dimensions)
            interp= (object-wide interp default) if True, use the interpolated
                    stream track
            cindx= index of the closest point on the (interpolated) stream track
-                  if not given, determined from the dimensions given
+                  if not given, determined from the dimensions given (array for many points)
            lb= (False) if True, xy contains [l,b,D,vlos,pmll,pmbb] in [deg,deg,kpc,km/s,mas/yr,as/yr] and the Gaussian approximation in these coordinates is returned
         OUTPUT:
            (mean,variance) of the approximate Gaussian DF for the missing 
-           directions in xy
+           directions in xy (with a leading dimension N for many points)
         HISTORY:
            2013-12-12 - Written - Bovy (IAS)
+           2026-10-18 - Evaluate many points at once
         """
         if kwargs.has_key('interp'):
             interp= kwargs['interp']
@@ -1905,53 +1989,70 @@ class streamdf:
         else:
             lb= False
         #What are we looking for
-        coordGiven= numpy.array([not x is None for x in xy],dtype='bool')
+        xy, coordGiven, scalarIn= _parse_marg_xy(xy)
+        if numpy.any(coordGiven != coordGiven[0]):
+            raise ValueError("All points in xy need to have the same missing dimensions")
+        coordGiven= coordGiven[0]
         nGiven= numpy.sum(coordGiven)
         #First find the nearest track point
+        xyIn= [xy[:,ii] if coordGiven[ii] else None for ii in range(6)]
         if not kwargs.has_key('cindx') and lb:
-            cindx= self._find_closest_trackpointLB(*xy,interp=interp,
-                                                  usev=True)
+            cindx= self._find_closest_trackpointLB(*xyIn,interp=interp,
+                                                    usev=True)
         elif not kwargs.has_key('cindx') and not lb:
-            cindx= self._find_closest_trackpoint(*xy,xy=True,interp=interp,
+            cindx= self._find_closest_trackpoint(*xyIn,xy=True,interp=interp,
                                                   usev=True)
         else:
-            cindx= kwargs['cindx']
-        #Get the covariance matrix
+            cindx= numpy.zeros(len(xy),dtype='int')+kwargs['cindx']
+        #Get the covariance matrices
         if interp and lb:
-            tcov= self._interpolatedAllErrCovsLBUnscaled[cindx]
-            tmean= self._interpolatedObsTrackLB[cindx]
+            tcovs= self._interpolatedAllErrCovsLBUnscaled
+            tmeans= self._interpolatedObsTrackLB
         elif interp and not lb:
-            tcov= self._interpolatedAllErrCovsXY[cindx]
-            tmean= self._interpolatedObsTrackXY[cindx]
+            tcovs= self._interpolatedAllErrCovsXY
+            tmeans= self._interpolatedObsTrackXY
         elif not interp and lb:
-            tcov= self._allErrCovsLBUnscaled[cindx]
-            tmean= self._ObsTrackLB[cindx]
+            tcovs= self._allErrCovsLBUnscaled
+            tmeans= self._ObsTrackLB
         elif not interp and not lb:
-            tcov= self._allErrCovsXY[cindx]
-            tmean= self._ObsTrackXY[cindx]
-        if lb:#Apply scale factors
-            tcov= copy.copy(tcov)
-            tcov*= numpy.tile(self._ErrCovsLBScale,(6,1))
-            tcov*= numpy.tile(self._ErrCovsLBScale,(6,1)).T
+            tcovs= self._allErrCovsXY
+            tmeans= self._ObsTrackXY
         #Fancy indexing to recover V22, V11, and V12; V22, V11, V12 as in Appendix B of 0905.2979v1
         V11indx0= numpy.array([[ii for jj in range(6-nGiven)] for ii in range(6) if not coordGiven[ii]])
         V11indx1= numpy.array([[ii for ii in range(6) if not coordGiven[ii]] for jj in range(6-nGiven)])
-        V11= tcov[V11indx0,V11indx1]
         V22indx0= numpy.array([[ii for jj in range(nGiven)] for ii in range(6) if coordGiven[ii]])
         V22indx1= numpy.array([[ii for ii in range(6) if coordGiven[ii]] for jj in range(nGiven)])
-        V22= tcov[V22indx0,V22indx1]
         V12indx0= numpy.array([[ii for jj in range(nGiven)] for ii in range(6) if not coordGiven[ii]])
         V12indx1= numpy.array([[ii for ii in range(6) if coordGiven[ii]] for jj in range(6-nGiven)])
-        V12= tcov[V12indx0,V12indx1]
-        #Also get m1 and m2, again following Appendix B of 0905.2979v1
-        m1= tmean[True-coordGiven]
-        m2= tmean[coordGiven]
-        #conditional mean and variance
-        V22inv= numpy.linalg.inv(V22)
-        v2= numpy.array([xy[ii] for ii in range(6) if coordGiven[ii]])
-        condMean= m1+numpy.dot(V12,numpy.dot(V22inv,v2-m2))
-        condVar= V11-numpy.dot(V12,numpy.dot(V22inv,V12.T))
-        return (condMean,condVar)
+        v2= xy[:,coordGiven]
+        condMean= numpy.empty((len(xy),6-nGiven))
+        condVar= numpy.empty((len(xy),6-nGiven,6-nGiven))
+        if lb:
+            lbScale= numpy.array([float(x) for x in self._ErrCovsLBScale])
+        #Points with the same closest track point share the covariance
+        for c in numpy.unique(cindx):
+            cindxIndx= cindx == c
+            tcov= tcovs[c]
+            tmean= tmeans[c]
+            if lb:#Apply scale factors
+                tcov= copy.copy(tcov)
+                tcov*= numpy.tile(lbScale,(6,1))
+                tcov*= numpy.tile(lbScale,(6,1)).T
+            V11= tcov[V11indx0,V11indx1]
+            V22= tcov[V22indx0,V22indx1]
+            V12= tcov[V12indx0,V12indx1]
+            #Also get m1 and m2, again following Appendix B of 0905.2979v1
+            m1= tmean[True-coordGiven]
+            m2= tmean[coordGiven]
+            #conditional mean and variance
+            V22inv= numpy.linalg.inv(V22)
+            condMean[cindxIndx]= m1+numpy.dot(numpy.dot(V12,V22inv),
+                                              (v2[cindxIndx]-m2).T).T
+            condVar[cindxIndx]= V11-numpy.dot(V12,numpy.dot(V22inv,V12.T))
+        if scalarIn:
+            return (condMean[0],condVar[0])
+        else:
+            return (condMean,condVar)
 
 ################################SAMPLE THE DF##################################
     def sample(self,n,returnaAdt=False,returndt=False,interp=None,
@@ -2013,9 +2114,15 @@ class streamdf:
         if returnaAdt:
             return (Om,angle,dt)
         #Propagate to R,vR,etc.
-        RvR= self._approxaAInv(Om[0,:],Om[1,:],Om[2,:],
-                               angle[0,:],angle[1,:],angle[2,:],
-                               interp=interp)
+        if self._multi is None:
+            RvR= self._approxaAInv(Om[0,:],Om[1,:],Om[2,:],
+                                   angle[0,:],angle[1,:],angle[2,:],
+                                   interp=interp)
+        else:
+            RvR= self._pool_eval('_approxaAInv',
+                                 [Om[0,:],Om[1,:],Om[2,:],
+                                  angle[0,:],angle[1,:],angle[2,:]],
+                                 interp=interp)
         if returndt and not xy and not lb:
             return (RvR,dt)
         elif not xy and not lb:
@@ -2081,7 +2188,7 @@ def _hp_ars(x,params):
     mO, sO2= params
     return -(x-mO)/sO2+1./x
 
-def _determine_stream_track_single(aA,progenitorTrack,trackt,
+def _determine_stream_track_single(aA,progenitorTrackt,
                                    progenitor_angle,sigMeanSign,
                                    dsigomeanProgDirection,meanOmega,
                                    thetasTrack):
@@ -2093,14 +2200,14 @@ def _determine_stream_track_single(aA,progenitorTrack,trackt,
     ObsTrackAA= numpy.empty((6))
     detdOdJ= numpy.empty(6)
     #Calculate
-    tacfs= aA.actionsFreqsAngles(progenitorTrack(trackt),
+    tacfs= aA.actionsFreqsAngles(progenitorTrackt,
                                        maxn=3)
     allAcfsTrack[0]= tacfs[0][0]
     allAcfsTrack[1]= tacfs[1][0]
     allAcfsTrack[2]= tacfs[2][0]
     for jj in range(3,9):
         allAcfsTrack[jj]= tacfs[jj]
-    tjac= calcaAJac(progenitorTrack(trackt)._orb.vxvv,
+    tjac= calcaAJac(progenitorTrackt._orb.vxvv,
                     aA,
                     dxv=None,actionsFreqsAngles=True,
                     lb=False,
@@ -2128,17 +2235,17 @@ def _determine_stream_track_single(aA,progenitorTrack,trackt,
     ObsTrack[:]= numpy.dot(tinvjac,
                               numpy.hstack((diffFreqs,diffAngles)))
     ObsTrack[0]+= \
-        progenitorTrack(trackt).R()
+        progenitorTrackt.R()
     ObsTrack[1]+= \
-        progenitorTrack(trackt).vR()
+        progenitorTrackt.vR()
     ObsTrack[2]+= \
-        progenitorTrack(trackt).vT()
+        progenitorTrackt.vT()
     ObsTrack[3]+= \
-        progenitorTrack(trackt).z()
+        progenitorTrackt.z()
     ObsTrack[4]+= \
-        progenitorTrack(trackt).vz()
+        progenitorTrackt.vz()
     ObsTrack[5]+= \
-        progenitorTrack(trackt).phi()
+        progenitorTrackt.phi()
     return [allAcfsTrack,alljacsTrack,allinvjacsTrack,ObsTrack,ObsTrackAA,
             detdOdJ]
 
@@ -2308,6 +2415,8 @@ def calcaAJac(xv,aA,dxv=None,freqs=False,dOdJ=False,actionsFreqsAngles=False,
 def _mylogsumexp(arr,axis=0):
     """Faster logsumexp?"""
     minarr= numpy.amax(arr,axis=axis)
+    #Don't shift by infinities, such that all -inf gives -inf rather than nan
+    minarr= numpy.where(numpy.isinf(minarr),0.,minarr)
     if axis == 1:
         minarr= numpy.reshape(minarr,(arr.shape[0],1))
     if axis == 0:
@@ -2322,6 +2431,18 @@ def _mylogsumexp(arr,axis=0):
         minarr= numpy.reshape(minarr,(arr.shape[0]))
     return minarr+numpy.log(numpy.sum(numpy.exp(arr-minminarr),axis=axis))
 
+def _parse_marg_xy(xy):
+    """Parse the xy input of callMarg and gaussApprox into an [N,6] array
+    (missing dimensions are NaN), the [N,6] array of which dimensions are
+    given, and whether xy was a single point"""
+    scalarIn= numpy.ndim(xy) == 1
+    if scalarIn: xy= [xy]
+    if not isinstance(xy,numpy.ndarray):
+        xy= numpy.array([[numpy.nan if x is None else x for x in p]
+                         for p in xy],dtype='float')
+    xy= numpy.atleast_2d(numpy.array(xy,dtype='float'))
+    return (xy,True-numpy.isnan(xy),scalarIn)
+
 def lbCoordFunc(xv,Vnorm,Rnorm,R0,Zsun,vsun):
     #Input is (l,b,D,vlos,pmll,pmbb) in (deg,deg,kpc,km/s,mas/yr,mas/yr)
     X,Y,Z= bovy_coords.lbd_to_XYZ(xv[0],xv[1],xv[2],degree=True)
@@ -3,7 +3,7 @@ import math as m
 import numpy as nu
 from scipy import integrate
 from galpy.potential_src.Potential import evaluateRforces, evaluatezforces,\
-    evaluatePotentials, evaluatephiforces, evaluateDensities
+    evaluatePotentials, evaluatephiforces, evaluateDensities, _check_c
 from galpy.util import galpyWarning
 import galpy.util.bovy_plot as plot
 import galpy.util.bovy_symplecticode as symplecticode
@@ -57,6 +57,8 @@ class FullOrbit(OrbitTop):
         if hasattr(self,'rs'): delattr(self,'rs')
         self.t= nu.array(t)
         self._pot= pot
+        if '_c' in method and not (ext_loaded and _check_c(pot)):
+            method= 'odeint'
         self.orbit= _integrateFullOrbit(self.vxvv,pot,t,method)
 
     def Jacobi(self,*args,**kwargs):
@@ -238,7 +240,7 @@ class FullOrbit(OrbitTop):
                                                 t=t[ii])\
                                  +thiso[4,ii]**2./2. for ii in range(len(t))])
 
-    def e(self,analytic=False,pot=None):
+    def e(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            e
@@ -247,6 +249,8 @@ class FullOrbit(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            eccentricity
         HISTORY:
@@ -256,13 +260,16 @@ class FullOrbit(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return (rap-rperi)/(rap+rperi)
+        if exact:
+            rperi, rap= self._exactExtrema('r',pot=pot)
+            return (rap-rperi)/(rap+rperi)
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
             self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
         return (nu.amax(self.rs)-nu.amin(self.rs))/(nu.amax(self.rs)+nu.amin(self.rs))
 
-    def rap(self,analytic=False,pot=None):
+    def rap(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            rap
@@ -271,6 +278,8 @@ class FullOrbit(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            R_ap
         HISTORY:
@@ -280,13 +289,15 @@ class FullOrbit(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return rap
+        if exact:
+            return self._exactExtrema('r',pot=pot)[1]
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
             self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
         return nu.amax(self.rs)
 
-    def rperi(self,analytic=False,pot=None):
+    def rperi(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            rperi
@@ -295,6 +306,8 @@ class FullOrbit(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            R_peri
         HISTORY:
@@ -304,13 +317,15 @@ class FullOrbit(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return rperi
+        if exact:
+            return self._exactExtrema('r',pot=pot)[0]
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
             self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
         return nu.amin(self.rs)
 
-    def zmax(self,analytic=False,pot=None):
+    def zmax(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            zmax
@@ -319,6 +334,8 @@ class FullOrbit(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            Z_max
         HISTORY:
@@ -329,6 +346,8 @@ class FullOrbit(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             zmax= self._aA.calczmax(self)
             return zmax
+        if exact:
+            return self._exactExtrema('z',pot=pot)[1]
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         return nu.amax(nu.fabs(self.orbit[:,3]))
@@ -4,6 +4,7 @@ from FullOrbit import FullOrbit
 from RZOrbit import RZOrbit
 from planarOrbit import planarOrbit, planarROrbit
 from linearOrbit import linearOrbit
+from multiOrbit import multiOrbit
 _K=4.74047
 def _zEqZeroBC(ar):
     return ar[3]
@@ -53,6 +54,12 @@ class Orbit:
 
            4) and 5) also work when leaving out b and mu_b/W
 
+           Multiple orbits can be set up at once by giving an array [N,4] 
+           ([R,vR,vT,phi]) or [N,6] ([R,vR,vT,z,vz,phi]) of Galactocentric 
+           cylindrical initial conditions; these are integrated together 
+           and accessors such as R(), E(), or jr() then return arrays with 
+           a leading dimension N
+
         OPTIONAL INPUTS:
 
            radec - if True, input is 2) (or 3) above
@@ -78,7 +85,15 @@ class Orbit:
 
            2010-07-20 - Written - Bovy (NYU)
 
+           2026-10-18 - Allow [N,4] or [N,6] arrays of initial conditions
+
         """
+        if isinstance(vxvv,nu.ndarray) and len(vxvv.shape) == 2:
+            if radec or lb:
+                raise NotImplementedError("Multiple orbits can only be initialized using Galactocentric cylindrical coordinates")
+            self._orb= multiOrbit(vxvv=vxvv)
+            self.vxvv= self._orb.vxvv
+            return None
         if isinstance(solarmotion,str) and solarmotion.lower() == 'hogg':
             vsolar= nu.array([-10.1,4.0,6.7])/vo
         elif isinstance(solarmotion,str) and solarmotion.lower() == 'dehnen':
@@ -211,14 +226,15 @@ class Orbit:
            2011-02-03 - Written - Bovy (NYU)
 
         """
-        if len(self.vxvv) == 2:
+        nd= nu.shape(self.vxvv)[-1]
+        if nd == 2:
             return 1
-        elif len(self.vxvv) == 3 or len(self.vxvv) == 4:
+        elif nd == 3 or nd == 4:
             return 2
-        elif len(self.vxvv) == 5 or len(self.vxvv) == 6:
+        elif nd == 5 or nd == 6:
             return 3
 
-    def integrate(self,t,pot,method='leapfrog_c'):
+    def integrate(self,t,pot,method='leapfrog_c',numcores=None):
         """
         NAME:
 
@@ -236,6 +252,13 @@ class Orbit:
 
            method= 'odeint' for scipy's odeint or 'leapfrog' for a simple leapfrog implementation
 
+           (multiple orbits are all integrated in a single call to the C 
+           code when possible)
+
+           numcores= (None) number of OpenMP threads over which to spread
+                     multiple orbits in the C integrators (default: 
+                     OMP_NUM_THREADS or all available cores)
+
         OUTPUT:
 
            (none) (get the actual orbit using getOrbit()
@@ -245,7 +268,89 @@ class Orbit:
            2010-07-10 - Written - Bovy (NYU)
 
         """
-        self._orb.integrate(t,pot,method=method)
+        if isinstance(self._orb,multiOrbit):
+            self._orb.integrate(t,pot,method=method,numcores=numcores)
+        else:
+            self._orb.integrate(t,pot,method=method)
+
+    def integrate_stream(self,t,pot,method='leapfrog_c',blocksize=10000,
+                         numcores=None):
+        """
+        NAME:
+
+           integrate_stream
+
+        PURPOSE:
+
+           integrate the orbit block by block, handing each block of the output to the caller as soon as it has been integrated, such that long integrations with many output times can be processed or stored with bounded memory
+
+        INPUT:
+
+           t - list of times at which to output (0 has to be in this!)
+
+           pot - potential instance or list of instances
+
+           method= integration method (see integrate)
+
+           blocksize= (10000) number of output times in each block
+
+           numcores= (None) number of OpenMP threads over which to spread multiple orbits in the C integrators (default: OMP_NUM_THREADS or all available cores)
+
+        OUTPUT:
+
+           generator that yields (t,orbit) for consecutive blocks of t, with orbit[nt,nd] (orbit[N,nt,nd] for multiple orbits); for example, to store the orbit in a memory-mapped file, fill a numpy.memmap block by block, or to reduce the orbit on the fly, use zmax= max([numpy.amax(numpy.fabs(ob[:,3])) for tb,ob in o.integrate_stream(t,pot)])
+
+        HISTORY:
+
+           2026-10-18 - Written
+
+        """
+        if isinstance(self._orb,multiOrbit):
+            return self._orb.integrate_stream(t,pot,method=method,
+                                              blocksize=blocksize,
+                                              numcores=numcores)
+        else:
+            return self._orb.integrate_stream(t,pot,method=method,
+                                              blocksize=blocksize)
+
+    def integrate_events(self,t,pot,events='vR',direction=0,maxevents=1000,
+                         rtol=None,atol=None):
+        """
+        NAME:
+
+           integrate_events
+
+        PURPOSE:
+
+           integrate the orbit with the dopr54_c integrator and find the times and phase-space positions of events using the dense output of the integrator (e.g., to construct a surface of section)
+
+        INPUT:
+
+           t - final time or [initial time,final time]
+
+           pot - potential instance or list of instances
+
+           events= event or list of events, each of which is either 'z' (crossing of z=0), 'vR' (vR=0), 'vr' (turning point in spherical r), 'vz' (vz=0), or a function f(t,vxvv) of time and phase-space position (in the same format as the initial condition) whose zero crossings are the events
+
+           direction= only detect zero crossings of the event function in this direction: 0 (both), 1 (increasing), or -1 (decreasing); either a single value or one for each event
+
+           maxevents= (1000) maximum number of occurrences of each event to record
+
+           rtol, atol= tolerances for the integrator
+
+        OUTPUT:
+
+           (t,vxvv) for each event, with t an array [nevent] and vxvv an array [nevent,dim]; a list of these when events is a list; for multiple orbits, a list with this output for each orbit
+
+        HISTORY:
+
+           2026-10-18 - Written
+
+        """
+        return self._orb.integrate_events(t,pot,events=events,
+                                          direction=direction,
+                                          maxevents=maxevents,
+                                          rtol=rtol,atol=atol)
 
     def integrateBC(self,pot,bc=_zEqZeroBC,method='odeint'):
         """
@@ -325,7 +430,7 @@ class Orbit:
 
         OUTPUT:
 
-           array orbit[nt,nd]
+           array orbit[nt,nd] (orbit[N,nt,nd] for multiple orbits)
 
         HISTORY:
 
@@ -469,7 +574,7 @@ class Orbit:
         """
         return self._orb.Jacobi(*args,**kwargs)
 
-    def e(self,analytic=False,pot=None):
+    def e(self,analytic=False,pot=None,exact=False):
         """
         NAME:
 
@@ -485,6 +590,8 @@ class Orbit:
 
            pot - potential to use for analytical calculation
 
+           exact - (False) locate the turning points of the orbit exactly, using event detection with the dopr54_c integrator
+
         OUTPUT:
 
            eccentricity
@@ -494,9 +601,9 @@ class Orbit:
            2010-09-15 - Written - Bovy (NYU)
 
         """
-        return self._orb.e(analytic=analytic,pot=pot)
+        return self._orb.e(analytic=analytic,pot=pot,exact=exact)
 
-    def rap(self,analytic=False,pot=None):
+    def rap(self,analytic=False,pot=None,exact=False):
         """
         NAME:
 
@@ -512,6 +619,8 @@ class Orbit:
 
            pot - potential to use for analytical calculation
 
+           exact - (False) locate the turning points of the orbit exactly, using event detection with the dopr54_c integrator
+
         OUTPUT:
 
            R_ap
@@ -521,9 +630,9 @@ class Orbit:
            2010-09-20 - Written - Bovy (NYU)
 
         """
-        return self._orb.rap(analytic=analytic,pot=pot)
+        return self._orb.rap(analytic=analytic,pot=pot,exact=exact)
 
-    def rperi(self,analytic=False,pot=None):
+    def rperi(self,analytic=False,pot=None,exact=False):
         """
         NAME:
 
@@ -539,6 +648,8 @@ class Orbit:
 
            pot - potential to use for analytical calculation
 
+           exact - (False) locate the turning points of the orbit exactly, using event detection with the dopr54_c integrator
+
         OUTPUT:
 
            R_peri
@@ -548,9 +659,9 @@ class Orbit:
            2010-09-20 - Written - Bovy (NYU)
 
         """
-        return self._orb.rperi(analytic=analytic,pot=pot)
+        return self._orb.rperi(analytic=analytic,pot=pot,exact=exact)
 
-    def zmax(self,analytic=False,pot=None):
+    def zmax(self,analytic=False,pot=None,exact=False):
         """
         NAME:
 
@@ -566,6 +677,8 @@ class Orbit:
 
            pot - potential to use for analytical calculation
 
+           exact - (False) locate the turning points of the orbit exactly, using event detection with the dopr54_c integrator
+
         OUTPUT:
 
            Z_max
@@ -575,7 +688,7 @@ class Orbit:
            2010-09-20 - Written - Bovy (NYU)
 
         """
-        return self._orb.zmax(analytic=analytic,pot=pot)
+        return self._orb.zmax(analytic=analytic,pot=pot,exact=exact)
 
     def resetaA(self,pot=None,type=None):
         """
@@ -645,7 +758,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA(self)[0]
+        return self._orb._aA(*self._aAargs())[0]
 
     def jp(self,pot=None,**kwargs):
         """
@@ -685,7 +798,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA(self)[1]
+        return self._orb._aA(*self._aAargs())[1]
 
     def jz(self,pot=None,**kwargs):
         """
@@ -725,7 +838,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA(self)[2]
+        return self._orb._aA(*self._aAargs())[2]
 
     def wr(self,pot=None,**kwargs):
         """
@@ -765,7 +878,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA.actionsFreqsAngles(self)[6][0]
+        return self._aAout(self._orb._aA.actionsFreqsAngles(*self._aAargs())[6])
 
     def wp(self,pot=None,**kwargs):
         """
@@ -805,7 +918,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA.actionsFreqsAngles(self)[7][0]
+        return self._aAout(self._orb._aA.actionsFreqsAngles(*self._aAargs())[7])
 
     def wz(self,pot=None,**kwargs):
         """
@@ -845,7 +958,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA.actionsFreqsAngles(self)[8][0]
+        return self._aAout(self._orb._aA.actionsFreqsAngles(*self._aAargs())[8])
 
     def Tr(self,pot=None,**kwargs):
         """
@@ -885,7 +998,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return 2.*nu.pi/self._orb._aA.actionsFreqs(self)[3][0]
+        return 2.*nu.pi/self._aAout(self._orb._aA.actionsFreqs(*self._aAargs())[3])
 
     def Tp(self,pot=None,**kwargs):
         """
@@ -925,7 +1038,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return 2.*nu.pi/self._orb._aA.actionsFreqs(self)[4][0]
+        return 2.*nu.pi/self._aAout(self._orb._aA.actionsFreqs(*self._aAargs())[4])
 
     def TrTp(self,pot=None,**kwargs):
         """
@@ -965,7 +1078,8 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA.actionsFreqs(self)[4][0]/self._orb._aA.actionsFreqs(self)[3][0]*nu.pi
+        acfs= self._orb._aA.actionsFreqs(*self._aAargs())
+        return self._aAout(acfs[4])/self._aAout(acfs[3])*nu.pi
  
     def Tz(self,pot=None,**kwargs):
         """
@@ -1005,7 +1119,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return 2.*nu.pi/self._orb._aA.actionsFreqs(self)[5][0]
+        return 2.*nu.pi/self._aAout(self._orb._aA.actionsFreqs(*self._aAargs())[5])
 
     def Or(self,pot=None,**kwargs):
         """
@@ -1043,7 +1157,7 @@ class Orbit:
 
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA.actionsFreqs(self)[3][0]
+        return self._aAout(self._orb._aA.actionsFreqs(*self._aAargs())[3])
 
     def Op(self,pot=None,**kwargs):
         """
@@ -1080,7 +1194,7 @@ class Orbit:
            2013-11-27 - Written - Bovy (IAS)
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA.actionsFreqs(self)[4][0]
+        return self._aAout(self._orb._aA.actionsFreqs(*self._aAargs())[4])
 
     def Oz(self,pot=None,**kwargs):
         """
@@ -1117,7 +1231,21 @@ class Orbit:
            2013-11-27 - Written - Bovy (IAS)
         """
         self._orb._setupaA(pot=pot,**kwargs)
-        return self._orb._aA.actionsFreqs(self)[5][0]
+        return self._aAout(self._orb._aA.actionsFreqs(*self._aAargs())[5])
+
+    def _aAargs(self):
+        """Arguments to pass to the actionAngle module for this Orbit"""
+        if isinstance(self._orb,multiOrbit):
+            return self._orb._aAargs()
+        else:
+            return (self,)
+
+    def _aAout(self,out):
+        """Strip the object dimension of actionAngle output for a single Orbit"""
+        if isinstance(self._orb,multiOrbit):
+            return out
+        else:
+            return out[0]
 
     def R(self,*args,**kwargs):
         """
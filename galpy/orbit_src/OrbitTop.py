@@ -1,10 +1,22 @@
 import math as m
+import warnings
 import numpy as nu
 from scipy import interpolate, optimize
 from galpy import actionAngle
 import galpy.util.bovy_plot as plot
 import galpy.util.bovy_coords as coords
+from galpy.util import galpyWarning
 from galpy.potential_src.planarPotential import RZToplanarPotential
+from galpy.potential_src.Potential import _check_c
+try:
+    from galpy.orbit_src.integrateFullOrbit import integrateFullOrbit_events_c
+    from galpy.orbit_src.integratePlanarOrbit import \
+        integratePlanarOrbit_events_c
+except IOError:
+    ext_loaded= False
+else:
+    ext_loaded= True
+_EVENT_TYPES= {'z':0,'vR':1,'vr':2,'vz':3}
 class OrbitTop:
     """General class that holds orbits and integrates them"""
     def __init__(self,vxvv=None):
@@ -86,6 +98,185 @@ class OrbitTop:
         t= nu.array([a,tout])
         return (self._BCIntegrateFunction(vxvv_a,thispot,t,method),a+tout)
     
+    def integrate_stream(self,t,pot,method='leapfrog_c',blocksize=10000,
+                         **kwargs):
+        """
+        NAME:
+           integrate_stream
+        PURPOSE:
+           integrate the orbit block by block, handing each block of the 
+           output to the caller as soon as it has been integrated, such that 
+           long integrations with many output times can be processed or 
+           stored with bounded memory
+        INPUT:
+           t - list of times at which to output (0 has to be in this!)
+           pot - potential instance or list of instances
+           method= integration method (see integrate)
+           blocksize= (10000) number of output times in each block
+           +further keywords of integrate (e.g., numcores= for multiple orbits)
+        OUTPUT:
+           generator that yields (t,orbit) for consecutive blocks of t, with 
+           orbit[nt,nd] (orbit[N,nt,nd] for multiple orbits); e.g., 
+           to store the orbit in a memory-mapped file
+              mm= numpy.memmap(filename,mode='w+',shape=(len(t),6))
+              for tb,ob in o.integrate_stream(t,pot): mm[ii:ii+len(tb)]= ob ...
+           or to reduce the orbit on the fly
+              zmax= max([numpy.amax(numpy.fabs(ob[:,3])) for tb,ob in o.integrate_stream(t,pot)])
+           (each block is integrated starting from the final phase-space
+           position of the previous block, so the results agree with
+           those of integrate to within the integration tolerance)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        t= nu.array(t)
+        vxvv= self.vxvv
+        for ii in range(0,len(t),blocksize):
+            #Each block starts at the last time of the previous block
+            istart= max(ii-1,0)
+            tblock= t[istart:ii+blocksize]
+            blockOrb= self.__class__(vxvv=vxvv)
+            blockOrb.integrate(tblock,pot,method=method,**kwargs)
+            orb= blockOrb.getOrbit()
+            if len(orb.shape) == 3: #multiple orbits
+                vxvv= orb[:,-1]
+                yield (tblock[ii-istart:],orb[:,ii-istart:])
+            else:
+                vxvv= orb[-1]
+                yield (tblock[ii-istart:],orb[ii-istart:])
+
+    def integrate_events(self,t,pot,events='vR',direction=0,maxevents=1000,
+                         rtol=None,atol=None,_warnmaxevents=True):
+        """
+        NAME:
+           integrate_events
+        PURPOSE:
+           integrate the orbit with the dopr54_c integrator and find the 
+           times and phase-space positions of events using the dense output 
+           of the integrator (e.g., to construct a surface of section)
+        INPUT:
+           t - final time or [initial time,final time]
+           pot - potential instance or list of instances
+           events= event or list of events, each of which is either
+                   'z' - crossing of the plane (z=0)
+                   'vR' - radial turning point (vR=0)
+                   'vr' - turning point in spherical r (vr=0)
+                   'vz' - vertical turning point (vz=0)
+                   or a function f(t,vxvv) of time and phase-space position 
+                   (in the same format as the initial condition) whose zero 
+                   crossings are the events
+           direction= only detect zero crossings of the event function in 
+                      this direction: 0 (both), 1 (increasing), or -1 
+                      (decreasing); either a single value or one for each 
+                      event
+           maxevents= (1000) maximum number of occurrences of each event to 
+                      record (a warning is raised when this is reached, 
+                      because later events are not recorded)
+           rtol, atol= tolerances for the integrator
+        OUTPUT:
+           (t,vxvv) for each event, with t an array [nevent] and vxvv an 
+           array [nevent,dim]; a list of these when events is a list
+           e.g., the surface of section z=0, vz > 0 is given by
+           integrate_events(t,pot,events='z',direction=1)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if not ext_loaded or not _check_c(pot):
+            raise NotImplementedError("integrate_events requires the C extension and a potential with a C implementation")
+        dim= len(self.vxvv)
+        if dim < 3:
+            raise NotImplementedError("integrate_events is not implemented for linear orbits")
+        t= nu.atleast_1d(t)
+        if len(t) == 1: t= nu.array([0.,t[0]])
+        listOut= isinstance(events,list)
+        if not listOut: events= [events]
+        if not isinstance(direction,list):
+            direction= [direction for ev in events]
+        #Parse the events
+        event_type= []
+        for ev in events:
+            if hasattr(ev,'__call__'):
+                event_type.append(4)
+            elif dim < 5 and ev == 'vr':
+                event_type.append(_EVENT_TYPES['vR'])
+            elif dim < 5 and ev in ['z','vz']:
+                raise ValueError("event '%s' is not defined for planar orbits" % ev)
+            elif ev in _EVENT_TYPES.keys():
+                event_type.append(_EVENT_TYPES[ev])
+            else:
+                raise ValueError("event '%s' not understood" % ev)
+        user_event= lambda tt,y,index: events[index](tt,_rectToOrbit(y,dim))
+        #Integrate
+        if dim > 4:
+            if dim == 5: vxvv= nu.append(self.vxvv,0.)
+            else: vxvv= self.vxvv
+            yo= nu.array([vxvv[0]*m.cos(vxvv[5]),
+                          vxvv[0]*m.sin(vxvv[5]),
+                          vxvv[3],
+                          vxvv[1]*m.cos(vxvv[5])-vxvv[2]*m.sin(vxvv[5]),
+                          vxvv[2]*m.cos(vxvv[5])+vxvv[1]*m.sin(vxvv[5]),
+                          vxvv[4]])
+            tevent, yevent, yf, err= \
+                integrateFullOrbit_events_c(pot,yo,t,event_type,direction,
+                                            user_event=user_event,
+                                            maxevents=maxevents,
+                                            rtol=rtol,atol=atol)
+        else:
+            if dim == 3: vxvv= nu.append(self.vxvv,0.)
+            else: vxvv= self.vxvv
+            yo= nu.array([vxvv[0]*m.cos(vxvv[3]),
+                          vxvv[0]*m.sin(vxvv[3]),
+                          vxvv[1]*m.cos(vxvv[3])-vxvv[2]*m.sin(vxvv[3]),
+                          vxvv[2]*m.cos(vxvv[3])+vxvv[1]*m.sin(vxvv[3])])
+            tevent, yevent, yf, err= \
+                integratePlanarOrbit_events_c(RZToplanarPotential(pot),yo,t,
+                                              event_type,direction,
+                                              user_event=user_event,
+                                              maxevents=maxevents,
+                                              rtol=rtol,atol=atol)
+        if _warnmaxevents \
+                and nu.any([len(tev) >= maxevents for tev in tevent]):
+            warnings.warn("integrate_events reached maxevents= occurrences of an event; later occurrences were not recorded",galpyWarning)
+        out= [(tevent[ii],_rectToOrbit(yevent[ii],dim))
+              for ii in range(len(events))]
+        if listOut: return out
+        else: return out[0]
+
+    def _exactExtrema(self,quant='r',pot=None):
+        """Minimum and maximum of r (spherical r for 3D orbits) or |z| over 
+        the integration time of the orbit, using the turning points found 
+        by integrate_events"""
+        if not hasattr(self,'orbit'):
+            raise AttributeError("Integrate the orbit first")
+        if pot is None: pot= self._pot
+        #Size the buffer for the turning points from the shortest orbital 
+        #time along the orbit, such that it does not depend on how finely 
+        #the orbit was output; double it until all turning points fit
+        dim= len(self.vxvv)
+        r2= self.orbit[:,0]**2.
+        v2= self.orbit[:,1]**2.+self.orbit[:,2]**2.
+        if dim > 4:
+            r2+= self.orbit[:,3]**2.
+            v2+= self.orbit[:,4]**2.
+        torb= nu.amin(2.*m.pi*nu.sqrt(r2/v2))
+        maxevents= int(4.*nu.fabs(self.t[-1]-self.t[0])/torb)+10
+        while True:
+            tev, vxvv= self.integrate_events([self.t[0],self.t[-1]],pot,
+                                             events='vz' if quant == 'z' \
+                                                 else 'vr',
+                                             maxevents=maxevents,
+                                             _warnmaxevents=False)
+            if len(tev) < maxevents: break
+            maxevents*= 2
+        if quant == 'z':
+            vals= nu.fabs(nu.hstack((vxvv[:,3],self.orbit[[0,-1],3])))
+        else:
+            vxvv= nu.vstack((vxvv,self.orbit[[0,-1]]))
+            if dim > 4:
+                vals= nu.sqrt(vxvv[:,0]**2.+vxvv[:,3]**2.)
+            else:
+                vals= vxvv[:,0]
+        return (nu.amin(vals),nu.amax(vals))
+
     def getOrbit(self):
         """
         NAME:
@@ -168,7 +359,7 @@ class OrbitTop:
         HISTORY:
            2010-09-21 - Written - Bovy (NYU)
         """
-        if len(self.vxvv) < 5:
+        if nu.shape(self.vxvv)[-1] < 5:
             raise AttributeError("linear and planar orbits do not have z()")
         thiso= self(*args,**kwargs)
         onet= (len(thiso.shape) == 1)
@@ -188,7 +379,7 @@ class OrbitTop:
         HISTORY:
            2010-09-21 - Written - Bovy (NYU)
         """
-        if len(self.vxvv) < 5:
+        if nu.shape(self.vxvv)[-1] < 5:
             raise AttributeError("linear and planar orbits do not have vz()")
         thiso= self(*args,**kwargs)
         onet= (len(thiso.shape) == 1)
@@ -208,7 +399,7 @@ class OrbitTop:
         HISTORY:
            2010-09-21 - Written - Bovy (NYU)
         """
-        if len(self.vxvv) != 4 and len(self.vxvv) != 6:
+        if nu.shape(self.vxvv)[-1] != 4 and nu.shape(self.vxvv)[-1] != 6:
             raise AttributeError("orbit must track azimuth to use phi()")
         thiso= self(*args,**kwargs)
         onet= (len(thiso.shape) == 1)
@@ -229,7 +420,7 @@ class OrbitTop:
            2010-09-21 - Written - Bovy (NYU)
         """
         thiso= self(*args,**kwargs)
-        if not len(thiso.shape) == 2: thiso= thiso.reshape((thiso.shape[0],1))
+        if len(thiso.shape) == 1: thiso= thiso.reshape((thiso.shape[0],1))
         if len(thiso[:,0]) == 2:
             return thiso[:,0]
         if len(thiso[:,0]) != 4 and len(thiso[:,0]) != 6:
@@ -253,7 +444,7 @@ class OrbitTop:
            2010-09-21 - Written - Bovy (NYU)
         """
         thiso= self(*args,**kwargs)
-        if not len(thiso.shape) == 2: thiso= thiso.reshape((thiso.shape[0],1))
+        if len(thiso.shape) == 1: thiso= thiso.reshape((thiso.shape[0],1))
         if len(thiso[:,0]) != 4 and len(thiso[:,0]) != 6:
             raise AttributeError("orbit must track azimuth to use x()")
         elif len(thiso[:,0]) == 4:
@@ -275,7 +466,7 @@ class OrbitTop:
            2010-11-30 - Written - Bovy (NYU)
         """
         thiso= self(*args,**kwargs)
-        if not len(thiso.shape) == 2: thiso= thiso.reshape((thiso.shape[0],1))
+        if len(thiso.shape) == 1: thiso= thiso.reshape((thiso.shape[0],1))
         if len(thiso[:,0]) == 2:
             return thiso[:,1]
         if len(thiso[:,0]) != 4 and len(thiso[:,0]) != 6:
@@ -300,7 +491,7 @@ class OrbitTop:
            2010-11-30 - Written - Bovy (NYU)
         """
         thiso= self(*args,**kwargs)
-        if not len(thiso.shape) == 2: thiso= thiso.reshape((thiso.shape[0],1))
+        if len(thiso.shape) == 1: thiso= thiso.reshape((thiso.shape[0],1))
         if len(thiso[:,0]) != 4 and len(thiso[:,0]) != 6:
             raise AttributeError("orbit must track azimuth to use vx()")
         elif len(thiso[:,0]) == 4:
@@ -323,7 +514,7 @@ class OrbitTop:
            2010-09-21 - Written - Bovy (NYU)
         """
         thiso= self(*args,**kwargs)
-        if not len(thiso.shape) == 2: thiso= thiso.reshape((thiso.shape[0],1))
+        if len(thiso.shape) == 1: thiso= thiso.reshape((thiso.shape[0],1))
         return thiso[2,:]/thiso[0,:]
 
     def ra(self,*args,**kwargs):
@@ -696,7 +887,7 @@ class OrbitTop:
         """Calculate heliocentric rectangular coordinates"""
         obs, ro, vo= _parse_radec_kwargs(kwargs)
         thiso= self(*args,**kwargs)
-        if not len(thiso.shape) == 2: thiso= thiso.reshape((thiso.shape[0],1))
+        if len(thiso.shape) == 1: thiso= thiso.reshape((thiso.shape[0],1))
         if len(thiso[:,0]) != 4 and len(thiso[:,0]) != 6:
             raise AttributeError("orbit must track azimuth to use radeclbd functions")
         elif len(thiso[:,0]) == 4: #planarOrbit
@@ -751,7 +942,7 @@ class OrbitTop:
         """Calculate X,Y,Z,U,V,W"""
         obs, ro, vo= _parse_radec_kwargs(kwargs,vel=True)
         thiso= self(*args,**kwargs)
-        if not len(thiso.shape) == 2: thiso= thiso.reshape((thiso.shape[0],1))
+        if len(thiso.shape) == 1: thiso= thiso.reshape((thiso.shape[0],1))
         if len(thiso[:,0]) != 4 and len(thiso[:,0]) != 6:
             raise AttributeError("orbit must track azimuth to use radeclbduvw functions")
         elif len(thiso[:,0]) == 4: #planarOrbit
@@ -872,7 +1063,7 @@ class OrbitTop:
             t= kwargs['t']
             kwargs.pop('t')
         thiso= self(*args,**kwargs)
-        if not len(thiso.shape) == 2: thiso= thiso.reshape((thiso.shape[0],1))
+        if len(thiso.shape) == 1: thiso= thiso.reshape((thiso.shape[0],1))
         if len(thiso[:,0]) < 3:
             raise AttributeError("'linearOrbit has no angular momentum")
         elif len(thiso[:,0]) == 3 or len(thiso[:,0]) == 4:
@@ -1720,6 +1911,26 @@ class OrbitTop:
         return None
 
 
+def _rectToOrbit(y,dim):
+    """Convert rectangular phase-space positions [...,4] or [...,6] to the 
+    cylindrical format of an orbit with dimension dim"""
+    y= nu.array(y)
+    if y.shape[-1] == 6:
+        x, yy, z, vx, vy, vz= [y[...,ii] for ii in range(6)]
+    else:
+        x, yy, vx, vy= [y[...,ii] for ii in range(4)]
+    R= nu.sqrt(x**2.+yy**2.)
+    phi= nu.arctan2(yy,x)
+    phi= phi+2.*m.pi*(phi < 0.)
+    vR= vx*nu.cos(phi)+vy*nu.sin(phi)
+    vT= vy*nu.cos(phi)-vx*nu.sin(phi)
+    if y.shape[-1] == 6:
+        out= [R,vR,vT,z,vz,phi]
+    else:
+        out= [R,vR,vT,phi]
+    if dim == 5 or dim == 3: out= out[:-1]
+    return nu.rollaxis(nu.array(out),0,len(y.shape))
+
 class _fakeInterp: 
     """Fake class to simulate interpolation when orbit was not integrated"""
     def __init__(self,x):
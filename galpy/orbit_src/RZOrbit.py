@@ -229,7 +229,7 @@ class RZOrbit(OrbitTop):
         else:
             return self.E(*args,**kwargs)-OmegaP*self.L(*args,**kwargs)[:,2]
 
-    def e(self,analytic=False,pot=None):
+    def e(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            e
@@ -238,6 +238,8 @@ class RZOrbit(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            eccentricity
         HISTORY:
@@ -247,13 +249,16 @@ class RZOrbit(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return (rap-rperi)/(rap+rperi)
+        if exact:
+            rperi, rap= self._exactExtrema('r',pot=pot)
+            return (rap-rperi)/(rap+rperi)
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
             self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
         return (nu.amax(self.rs)-nu.amin(self.rs))/(nu.amax(self.rs)+nu.amin(self.rs))
 
-    def rap(self,analytic=False,pot=None):
+    def rap(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            rap
@@ -262,6 +267,8 @@ class RZOrbit(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            R_ap
         HISTORY:
@@ -271,13 +278,15 @@ class RZOrbit(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return rap
+        if exact:
+            return self._exactExtrema('r',pot=pot)[1]
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
             self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
         return nu.amax(self.rs)
 
-    def rperi(self,analytic=False,pot=None):
+    def rperi(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            rperi
@@ -286,6 +295,8 @@ class RZOrbit(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            R_peri
         HISTORY:
@@ -295,19 +306,25 @@ class RZOrbit(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return rperi
+        if exact:
+            return self._exactExtrema('r',pot=pot)[0]
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
             self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
         return nu.amin(self.rs)
 
-    def zmax(self,analytic=False,pot=None):
+    def zmax(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            zmax
         PURPOSE:
            return the maximum vertical height
         INPUT:
+           analytic - compute this analytically
+           pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            Z_max
         HISTORY:
@@ -317,6 +334,8 @@ class RZOrbit(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             zmax= self._aA.calczmax(self)
             return zmax
+        if exact:
+            return self._exactExtrema('z',pot=pot)[1]
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         return nu.amax(nu.fabs(self.orbit[:,3]))
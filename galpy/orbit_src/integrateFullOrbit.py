@@ -3,8 +3,10 @@ import ctypes
 import ctypes.util
 from numpy.ctypeslib import ndpointer
 import os
+from scipy import interpolate
 from galpy import potential, potential_src
-from galpy.orbit_src.integratePlanarOrbit import _parse_integrator, _parse_tol
+from galpy.orbit_src.integratePlanarOrbit import _parse_integrator, _parse_tol, \
+    _cached_parse, _integrate_events_c
 #Find and load the library
 _lib = None
 _libname = ctypes.util.find_library('galpy_integrate_c')
@@ -23,7 +25,8 @@ if _lib is None:
     raise IOError('galpy integration module not found')
 
 def _parse_pot(pot,potforactions=False):
-    """Parse the potential so it can be fed to C"""
+    """Parse the potential so it can be fed to C (each potential is only parsed
+    once, after which the parsed arguments are re-used)"""
     #Figure out what's in pot
     if not isinstance(pot,list):
         pot= [pot]
@@ -32,60 +35,108 @@ def _parse_pot(pot,potforactions=False):
     pot_args= []
     npot= len(pot)
     for p in pot:
-        if isinstance(p,potential.LogarithmicHaloPotential):
-            pot_type.append(0)
-            pot_args.extend([p._amp,p._q,p._core2])
-        elif isinstance(p,potential.MiyamotoNagaiPotential):
-            pot_type.append(5)
-            pot_args.extend([p._amp,p._a,p._b])
-        elif isinstance(p,potential.PowerSphericalPotential):
-            pot_type.append(7)
-            pot_args.extend([p._amp,p.alpha])
-        elif isinstance(p,potential.HernquistPotential):
-            pot_type.append(8)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential.NFWPotential):
-            pot_type.append(9)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential.JaffePotential):
-            pot_type.append(10)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential.DoubleExponentialDiskPotential):
-            pot_type.append(11)
-            pot_args.extend([p._amp,p._alpha,p._beta,p._kmaxFac,
-                             p._nzeros,p._glorder])
-            pot_args.extend([p._glx[ii] for ii in range(p._glorder)])
-            pot_args.extend([p._glw[ii] for ii in range(p._glorder)])
-            pot_args.extend([p._j0zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._dj0zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._j1zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._dj1zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._kp._amp,p._kp.alpha])
-        elif isinstance(p,potential.FlattenedPowerPotential):
-            pot_type.append(12)
-            pot_args.extend([p._amp,p.alpha,p.q2,p.core2])
-        elif isinstance(p,potential.interpRZPotential):
-            pot_type.append(13)
-            pot_args.extend([len(p._rgrid),len(p._zgrid)])
-            if p._logR:
-                pot_args.extend([p._logrgrid[ii] for ii in range(len(p._rgrid))])
-            else:
-                pot_args.extend([p._rgrid[ii] for ii in range(len(p._rgrid))])
-            pot_args.extend([p._zgrid[ii] for ii in range(len(p._zgrid))])
-            if potforactions:
-                pot_args.extend([x for x in p._potGrid_splinecoeffs.flatten(order='C')])
-            else:
-                pot_args.extend([x for x in p._rforceGrid_splinecoeffs.flatten(order='C')])
-                pot_args.extend([x for x in p._zforceGrid_splinecoeffs.flatten(order='C')])
-            pot_args.extend([p._amp,int(p._logR)])
-        elif isinstance(p,potential.IsochronePotential):
-            pot_type.append(14)
-            pot_args.extend([p._amp,p.b])
+        #The parsed arguments are cached on the potential instance
+        this_type, this_args= _cached_parse(p,('full',potforactions),
+                                            _parse_single_pot,potforactions)
+        pot_type.extend(this_type)
+        pot_args.append(this_args)
     pot_type= nu.array(pot_type,dtype=nu.int32,order='C')
+    if len(pot_args) > 0:
+        pot_args= nu.concatenate(pot_args)
     pot_args= nu.array(pot_args,dtype=nu.float64,order='C')
     return (npot,pot_type,pot_args)
 
-def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
+def _parse_single_pot(p,potforactions=False):
+    """Parse a single potential instance into its C type and arguments"""
+    pot_type= []
+    pot_args= []
+    if isinstance(p,potential.LogarithmicHaloPotential):
+        pot_type.append(0)
+        pot_args.extend([p._amp,p._q,p._core2])
+    elif isinstance(p,potential.MiyamotoNagaiPotential):
+        pot_type.append(5)
+        pot_args.extend([p._amp,p._a,p._b])
+    elif isinstance(p,potential.PowerSphericalPotential):
+        pot_type.append(7)
+        pot_args.extend([p._amp,p.alpha])
+    elif isinstance(p,potential.HernquistPotential):
+        pot_type.append(8)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential.NFWPotential):
+        pot_type.append(9)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential.JaffePotential):
+        pot_type.append(10)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential.DoubleExponentialDiskPotential):
+        pot_type.append(11)
+        pot_args.extend([p._amp,p._alpha,p._beta,p._kmaxFac,
+                         p._nzeros,p._glorder])
+        pot_args.extend([p._glx[ii] for ii in range(p._glorder)])
+        pot_args.extend([p._glw[ii] for ii in range(p._glorder)])
+        pot_args.extend([p._j0zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._dj0zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._j1zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._dj1zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._kp._amp,p._kp.alpha])
+    elif isinstance(p,potential.FlattenedPowerPotential):
+        pot_type.append(12)
+        pot_args.extend([p._amp,p.alpha,p.q2,p.core2])
+    elif isinstance(p,potential.interpRZPotential):
+        pot_type.append(13)
+        pot_args.extend([len(p._rgrid),len(p._zgrid)])
+        if p._logR:
+            pot_args.extend([p._logrgrid[ii] for ii in range(len(p._rgrid))])
+        else:
+            pot_args.extend([p._rgrid[ii] for ii in range(len(p._rgrid))])
+        pot_args.extend([p._zgrid[ii] for ii in range(len(p._zgrid))])
+        if potforactions:
+            pot_args.extend([x for x in p._potGrid_splinecoeffs.flatten(order='C')])
+        else:
+            pot_args.extend([x for x in p._rforceGrid_splinecoeffs.flatten(order='C')])
+            pot_args.extend([x for x in p._zforceGrid_splinecoeffs.flatten(order='C')])
+        pot_args.extend([p._amp,int(p._logR)])
+    elif isinstance(p,potential.IsochronePotential):
+        pot_type.append(14)
+        pot_args.extend([p._amp,p.b])
+    elif isinstance(p,potential.BurkertPotential):
+        pot_type.append(15)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential.PowerSphericalPotentialwCutoff):
+        pot_type.append(16)
+        pot_args.extend([p._amp,p.alpha,p.rc])
+    elif isinstance(p,potential.RazorThinExponentialDiskPotential):
+        pot_type.append(17)
+        pot_args.extend([p._amp,p._alpha,p._glorder])
+        pot_args.extend([p._glx[ii] for ii in range(p._glorder)])
+        pot_args.extend([p._glw[ii] for ii in range(p._glorder)])
+    elif isinstance(p,potential.MovingObjectPotential):
+        pot_type.append(18)
+        pot_args.extend([p._amp,p._gm,0,
+                         p._softening._softening_length])
+        pot_args.extend(_parse_moving_object_orbit(p._orb))
+    return (pot_type,pot_args)
+
+def _parse_moving_object_orbit(orb):
+    """Parse the orbit of a MovingObjectPotential into the number of knots
+    followed by the knots and the coefficients of the cubic splines of R, phi,
+    and z as a function of time that Orbit uses to interpolate the orbit
+    (or by R, phi, and z when the orbit has not been integrated)"""
+    if not hasattr(orb._orb,'orbit'):
+        return [0,orb.R(),orb.phi(),orb.z()]
+    ts= orb._orb.t
+    this_orbit= orb._orb.orbit
+    if ts[-1] < ts[0]:
+        ts= ts[::-1]
+        this_orbit= this_orbit[::-1]
+    out= []
+    for ii in [0,5,3]: #R, phi, z
+        knots, coeffs, k= interpolate.splrep(ts,this_orbit[:,ii],k=3,s=0.)
+        if ii == 0: out.extend([len(knots)]+list(knots))
+        out.extend(coeffs)
+    return out
+
+def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,numcores=None):
     """
     NAME:
        integrateFullOrbit_c
@@ -93,32 +144,44 @@ def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
        C integrate an ode for a FullOrbit
     INPUT:
        pot - Potential or list of such instances
-       yo - initial condition [q,p]
+       yo - initial condition [q,p], shape [6] or [N,6] to integrate N orbits
+            at once
        t - set of times at which one wants the result
        int_method= 'leapfrog_c', 'rk4_c', 'rk6_c', 'symplec4_c'
        rtol, atol
+       numcores= (None) number of OpenMP threads to use when integrating N orbits
+                 (default: OMP_NUM_THREADS or all available cores); the GIL
+                 is released while the C code runs
     OUTPUT:
        (y,err)
-       y : array, shape (len(y0), len(t))
+       y : array, shape (len(t),6) or (N,len(t),6)
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
-       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators
+       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators (one per orbit when integrating N orbits)
     HISTORY:
        2011-11-13 - Written - Bovy (IAS)
+       2026-10-18 - Integrate multiple orbits in a single call
+       2026-10-18 - Integrate multiple orbits in parallel using OpenMP
     """
     rtol, atol= _parse_tol(rtol,atol)
     npot, pot_type, pot_args= _parse_pot(pot)
     int_method_c= _parse_integrator(int_method)
+    if numcores is None: numcores= 0 #lets OpenMP decide
+    yo= nu.atleast_1d(yo)
+    oneobj= (len(yo.shape) == 1)
+    if oneobj: yo= yo.reshape((1,6))
+    nobj= yo.shape[0]
 
     #Set up result array
-    result= nu.empty((len(t),6))
-    err= ctypes.c_int(0)
+    result= nu.empty((nobj,len(t),6))
+    err= nu.zeros(nobj,dtype=nu.int32)
 
     #Set up the C code
     ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
     integrationFunc= _lib.integrateFullOrbit
-    integrationFunc.argtypes= [ndpointer(dtype=nu.float64,flags=ndarrayFlags),
-                               ctypes.c_int,                             
+    integrationFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
                                ctypes.c_int,
                                ndpointer(dtype=nu.int32,flags=ndarrayFlags),
@@ -126,7 +189,8 @@ def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
                                ctypes.c_double,
                                ctypes.c_double,
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
-                               ctypes.POINTER(ctypes.c_int),
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ctypes.c_int,
                                ctypes.c_int]
 
     #Array requirements, first store old order
@@ -135,9 +199,11 @@ def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
     yo= nu.require(yo,dtype=nu.float64,requirements=['C','W'])
     t= nu.require(t,dtype=nu.float64,requirements=['C','W'])
     result= nu.require(result,dtype=nu.float64,requirements=['C','W'])
+    err= nu.require(err,dtype=nu.int32,requirements=['C','W'])
 
     #Run the C code
-    integrationFunc(yo,
+    integrationFunc(ctypes.c_int(nobj),
+                    yo,
                     ctypes.c_int(len(t)),
                     t,
                     ctypes.c_int(npot),
@@ -145,14 +211,56 @@ def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
                     pot_args,
                     ctypes.c_double(rtol),ctypes.c_double(atol),
                     result,
-                    ctypes.byref(err),
-                    ctypes.c_int(int_method_c))
+                    err,
+                    ctypes.c_int(int_method_c),
+                    ctypes.c_int(numcores))
 
     #Reset input arrays
     if f_cont[0]: yo= nu.asfortranarray(yo)
     if f_cont[1]: t= nu.asfortranarray(t)
 
-    return (result,err.value)
+    if oneobj:
+        return (result[0],int(err[0]))
+    else:
+        return (result,err)
+
+def integrateFullOrbit_events_c(pot,yo,t,event_type,event_direction,
+                                user_event=None,maxevents=1000,
+                                rtol=None,atol=None):
+    """
+    NAME:
+       integrateFullOrbit_events_c
+    PURPOSE:
+       C integrate an ode for a FullOrbit with dopr54 and locate events 
+       using the dense output of the integrator
+    INPUT:
+       pot - Potential or list of such instances
+       yo - initial condition [q,p]
+       t - [initial time,final time]
+       event_type - list of event types (0: z=0, 1: vR=0, 2: spherical 
+                    vr=0, 3: vz=0, 4: user-defined)
+       event_direction - list of crossing directions to detect for each 
+                         event (0: all, 1: increasing, -1: decreasing)
+       user_event= function user_event(t,y,index) of the time, the 
+                   rectangular phase-space position, and the index of the 
+                   event (for event type 4)
+       maxevents= (1000) maximum number of each event to record
+       rtol, atol
+    OUTPUT:
+       (tevent,yevent,yf,err)
+       tevent: list of arrays with the times of each event
+       yevent: list of arrays [nevent,6] with the phase-space position at 
+               each event
+       yf: phase-space position at the final time
+       err: error message, if not zero: 1 means maximum step reduction happened
+    HISTORY:
+       2026-10-18 - Written
+    """
+    npot, pot_type, pot_args= _parse_pot(pot)
+    return _integrate_events_c(_lib.integrateFullOrbit_events,6,
+                               npot,pot_type,pot_args,yo,t,
+                               event_type,event_direction,user_event,
+                               maxevents,rtol,atol)
 
 def integrateFullOrbit_dxdv_c(pot,yo,dyo,t,int_method,rtol=None,atol=None):
     """
@@ -0,0 +1,117 @@
+import numpy as nu
+import ctypes
+import ctypes.util
+from numpy.ctypeslib import ndpointer
+from galpy import potential
+from galpy.orbit_src.integratePlanarOrbit import _lib, _parse_integrator, \
+    _parse_tol, _cached_parse
+
+def _parse_pot(pot):
+    """Parse the potential so it can be fed to C (each potential is only parsed
+    once, after which the parsed arguments are re-used)"""
+    #Figure out what's in pot
+    if not isinstance(pot,list):
+        pot= [pot]
+    #Initialize everything
+    pot_type= []
+    pot_args= []
+    npot= len(pot)
+    for p in pot:
+        this_type, this_args= _cached_parse(p,'linear',_parse_single_pot)
+        pot_type.extend(this_type)
+        pot_args.append(this_args)
+    pot_type= nu.array(pot_type,dtype=nu.int32,order='C')
+    if len(pot_args) > 0:
+        pot_args= nu.concatenate(pot_args)
+    pot_args= nu.array(pot_args,dtype=nu.float64,order='C')
+    return (npot,pot_type,pot_args)
+
+def _parse_single_pot(p):
+    """Parse a single potential instance into its C type and arguments"""
+    pot_type= []
+    pot_args= []
+    if isinstance(p,potential.KGPotential):
+        pot_type.append(19)
+        pot_args.extend([p._amp,p._K,p._F,p._D2])
+    return (pot_type,pot_args)
+
+def integrateLinearOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,numcores=None):
+    """
+    NAME:
+       integrateLinearOrbit_c
+    PURPOSE:
+       C integrate an ode for a linearOrbit
+    INPUT:
+       pot - linearPotential or list of such instances
+       yo - initial condition [x,vx], shape [2] or [N,2] to integrate N orbits
+            at once
+       t - set of times at which one wants the result
+       int_method= 'leapfrog_c', 'rk4_c', 'rk6_c', 'symplec4_c', 'symplec6_c',
+                   'dopr54_c'
+       rtol, atol
+       numcores= (None) number of OpenMP threads to use when integrating N orbits
+                 (default: OMP_NUM_THREADS or all available cores)
+    OUTPUT:
+       (y,err)
+       y : array, shape (len(t),2) or (N,len(t),2)
+       Array containing the value of y for each desired time in t, \
+       with the initial value y0 in the first row.
+       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators (one per orbit when integrating N orbits)
+    HISTORY:
+       2026-10-18 - Written
+    """
+    rtol, atol= _parse_tol(rtol,atol)
+    npot, pot_type, pot_args= _parse_pot(pot)
+    int_method_c= _parse_integrator(int_method)
+    if numcores is None: numcores= 0 #lets OpenMP decide
+    yo= nu.atleast_1d(yo)
+    oneobj= (len(yo.shape) == 1)
+    if oneobj: yo= yo.reshape((1,2))
+    nobj= yo.shape[0]
+    t= nu.array(t)
+
+    #Set up result array
+    result= nu.empty((nobj,len(t),2))
+    err= nu.zeros(nobj,dtype=nu.int32)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    integrationFunc= _lib.integrateLinearOrbit
+    integrationFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_double,
+                               ctypes.c_double,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ctypes.c_int]
+
+    #Array requirements
+    yo= nu.require(yo,dtype=nu.float64,requirements=['C','W'])
+    t= nu.require(t,dtype=nu.float64,requirements=['C','W'])
+    result= nu.require(result,dtype=nu.float64,requirements=['C','W'])
+    err= nu.require(err,dtype=nu.int32,requirements=['C','W'])
+
+    #Run the C code
+    integrationFunc(ctypes.c_int(nobj),
+                    yo,
+                    ctypes.c_int(len(t)),
+                    t,
+                    ctypes.c_int(npot),
+                    pot_type,
+                    pot_args,
+                    ctypes.c_double(rtol),ctypes.c_double(atol),
+                    result,
+                    err,
+                    ctypes.c_int(int_method_c),
+                    ctypes.c_int(numcores))
+
+    if oneobj:
+        return (result[0],int(err[0]))
+    else:
+        return (result,err)
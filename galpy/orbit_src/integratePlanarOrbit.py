@@ -3,6 +3,7 @@ import ctypes
 import ctypes.util
 from numpy.ctypeslib import ndpointer
 import os
+import sys
 from galpy import potential, potential_src
 #Find and load the library
 _lib = None
@@ -22,7 +23,8 @@ if _lib is None:
     raise IOError('galpy integration module not found')
 
 def _parse_pot(pot):
-    """Parse the potential so it can be fed to C"""
+    """Parse the potential so it can be fed to C (each potential is only parsed
+    once, after which the parsed arguments are re-used)"""
     #Figure out what's in pot
     if not isinstance(pot,list):
         pot= [pot]
@@ -31,123 +33,169 @@ def _parse_pot(pot):
     pot_args= []
     npot= len(pot)
     for p in pot:
-        if isinstance(p,potential.LogarithmicHaloPotential):
-            pot_type.append(0)
-            pot_args.extend([p._amp,p._core2])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._RZPot,potential.LogarithmicHaloPotential):
-            pot_type.append(0)
-            pot_args.extend([p._RZPot._amp,p._RZPot._core2])
-        elif isinstance(p,potential.DehnenBarPotential):
-            pot_type.append(1)
-            pot_args.extend([p._amp,p._tform,p._tsteady,p._rb,p._af,p._omegab,
-                             p._barphi])
-        elif isinstance(p,potential.TransientLogSpiralPotential):
-            pot_type.append(2)
-            pot_args.extend([p._amp,p._A,p._to,p._sigma2,p._alpha,p._m,
-                             p._omegas,p._gamma])
-        elif isinstance(p,potential.SteadyLogSpiralPotential):
-            pot_type.append(3)
-            if p._tform is None:
-                pot_args.extend([p._amp,float('nan'), float('nan'),
-                                 p._A,p._alpha,p._m,
-                                 p._omegas,p._gamma])
-            else:
-                pot_args.extend([p._amp,p._tform,p._tsteady,p._A,p._alpha,p._m,
-                                 p._omegas,p._gamma])
-        elif isinstance(p,potential.EllipticalDiskPotential):
-            pot_type.append(4)
-            if p._tform is None:
-                pot_args.extend([p._amp,float('nan'), float('nan'),
-                                 p._twophio,p._p,p._phib])
-            else:
-                pot_args.extend([p._amp,p._tform,p._tsteady,
-                                 p._twophio,p._p,p._phib])
-        elif isinstance(p,potential.MiyamotoNagaiPotential):
-            pot_type.append(5)
-            pot_args.extend([p._amp,p._a,p._b])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._RZPot,potential.MiyamotoNagaiPotential):
-            pot_type.append(5)
-            pot_args.extend([p._RZPot._amp,p._RZPot._a,p._RZPot._b])
-        elif isinstance(p,potential.LopsidedDiskPotential):
-            pot_type.append(6)
-            if p._tform is None:
-                pot_args.extend([p._amp,float('nan'), float('nan'),
-                                 p._mphio,p._p,p._phib])
-            else:
-                pot_args.extend([p._amp,p._tform,p._tsteady,
-                                 p._mphio,p._p,p._phib])
-        elif isinstance(p,potential.PowerSphericalPotential):
-            pot_type.append(7)
-            pot_args.extend([p._amp,p.alpha])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._RZPot,potential.PowerSphericalPotential):
-            pot_type.append(7)
-            pot_args.extend([p._RZPot._amp,p._RZPot.alpha])
-        elif isinstance(p,potential.HernquistPotential):
-            pot_type.append(8)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._RZPot,potential.HernquistPotential):
-            pot_type.append(8)
-            pot_args.extend([p._RZPot._amp,p._RZPot.a])
-        elif isinstance(p,potential.NFWPotential):
-            pot_type.append(9)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._RZPot,potential.NFWPotential):
-            pot_type.append(9)
-            pot_args.extend([p._RZPot._amp,p._RZPot.a])
-        elif isinstance(p,potential.JaffePotential):
-            pot_type.append(10)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._RZPot,potential.JaffePotential):
-            pot_type.append(10)
-            pot_args.extend([p._RZPot._amp,p._RZPot.a])
-        elif isinstance(p,potential.DoubleExponentialDiskPotential):
-            pot_type.append(11)
-            pot_args.extend([p._amp,p._alpha,p._beta,p._kmaxFac,
-                             p._nzeros,p._glorder])
-            pot_args.extend([p._glx[ii] for ii in range(p._glorder)])
-            pot_args.extend([p._glw[ii] for ii in range(p._glorder)])
-            pot_args.extend([p._j0zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._dj0zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._j1zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._dj1zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._kp._amp,p._kp.alpha])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                and isinstance(p._RZPot,potential.DoubleExponentialDiskPotential):
-            pot_type.append(11)
-            pot_args.extend([p._RZPot._amp,p._RZPot._alpha,
-                             p._RZPot._beta,p._RZPot._kmaxFac,
-                             p._RZPot._nzeros,p._RZPot._glorder])
-            pot_args.extend([p._RZPot._glx[ii] for ii in range(p._RZPot._glorder)])
-            pot_args.extend([p._RZPot._glw[ii] for ii in range(p._RZPot._glorder)])
-            pot_args.extend([p._RZPot._j0zeros[ii] for ii in range(p._RZPot._nzeros+1)])
-            pot_args.extend([p._RZPot._dj0zeros[ii] for ii in range(p._RZPot._nzeros+1)])
-            pot_args.extend([p._RZPot._j1zeros[ii] for ii in range(p._RZPot._nzeros+1)])
-            pot_args.extend([p._RZPot._dj1zeros[ii] for ii in range(p._RZPot._nzeros+1)])
-            pot_args.extend([p._RZPot._kp._amp,p._RZPot._kp.alpha])
-        elif isinstance(p,potential.FlattenedPowerPotential):
-            pot_type.append(12)
-            pot_args.extend([p._amp,p.alpha,p.core2])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                and isinstance(p._RZPot,potential.FlattenedPowerPotential):
-            pot_type.append(12)
-            pot_args.extend([p._RZPot._amp,p._RZPot.alpha,p._RZPot.core2])
-        elif isinstance(p,potential.IsochronePotential):
-            pot_type.append(14)
-            pot_args.extend([p._amp,p.b])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._RZPot,potential.IsochronePotential):
-            pot_type.append(14)
-            pot_args.extend([p._RZPot._amp,p._RZPot.b])
+        #The parsed arguments are cached on the potential instance
+        this_type, this_args= _cached_parse(p,'planar',_parse_single_pot)
+        pot_type.extend(this_type)
+        pot_args.append(this_args)
     pot_type= nu.array(pot_type,dtype=nu.int32,order='C')
+    if len(pot_args) > 0:
+        pot_args= nu.concatenate(pot_args)
     pot_args= nu.array(pot_args,dtype=nu.float64,order='C')
     return (npot,pot_type,pot_args)
 
+def _parse_single_pot(p):
+    """Parse a single potential instance into its C type and arguments"""
+    pot_type= []
+    pot_args= []
+    if isinstance(p,potential.LogarithmicHaloPotential):
+        pot_type.append(0)
+        pot_args.extend([p._amp,p._core2])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.LogarithmicHaloPotential):
+        pot_type.append(0)
+        pot_args.extend([p._RZPot._amp,p._RZPot._core2])
+    elif isinstance(p,potential.DehnenBarPotential):
+        pot_type.append(1)
+        pot_args.extend([p._amp,p._tform,p._tsteady,p._rb,p._af,p._omegab,
+                         p._barphi])
+    elif isinstance(p,potential.TransientLogSpiralPotential):
+        pot_type.append(2)
+        pot_args.extend([p._amp,p._A,p._to,p._sigma2,p._alpha,p._m,
+                         p._omegas,p._gamma])
+    elif isinstance(p,potential.SteadyLogSpiralPotential):
+        pot_type.append(3)
+        if p._tform is None:
+            pot_args.extend([p._amp,float('nan'), float('nan'),
+                             p._A,p._alpha,p._m,
+                             p._omegas,p._gamma])
+        else:
+            pot_args.extend([p._amp,p._tform,p._tsteady,p._A,p._alpha,p._m,
+                             p._omegas,p._gamma])
+    elif isinstance(p,potential.EllipticalDiskPotential):
+        pot_type.append(4)
+        if p._tform is None:
+            pot_args.extend([p._amp,float('nan'), float('nan'),
+                             p._twophio,p._p,p._phib])
+        else:
+            pot_args.extend([p._amp,p._tform,p._tsteady,
+                             p._twophio,p._p,p._phib])
+    elif isinstance(p,potential.MiyamotoNagaiPotential):
+        pot_type.append(5)
+        pot_args.extend([p._amp,p._a,p._b])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.MiyamotoNagaiPotential):
+        pot_type.append(5)
+        pot_args.extend([p._RZPot._amp,p._RZPot._a,p._RZPot._b])
+    elif isinstance(p,potential.LopsidedDiskPotential):
+        pot_type.append(6)
+        if p._tform is None:
+            pot_args.extend([p._amp,float('nan'), float('nan'),
+                             p._mphio,p._p,p._phib])
+        else:
+            pot_args.extend([p._amp,p._tform,p._tsteady,
+                             p._mphio,p._p,p._phib])
+    elif isinstance(p,potential.PowerSphericalPotential):
+        pot_type.append(7)
+        pot_args.extend([p._amp,p.alpha])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.PowerSphericalPotential):
+        pot_type.append(7)
+        pot_args.extend([p._RZPot._amp,p._RZPot.alpha])
+    elif isinstance(p,potential.HernquistPotential):
+        pot_type.append(8)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.HernquistPotential):
+        pot_type.append(8)
+        pot_args.extend([p._RZPot._amp,p._RZPot.a])
+    elif isinstance(p,potential.NFWPotential):
+        pot_type.append(9)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.NFWPotential):
+        pot_type.append(9)
+        pot_args.extend([p._RZPot._amp,p._RZPot.a])
+    elif isinstance(p,potential.JaffePotential):
+        pot_type.append(10)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.JaffePotential):
+        pot_type.append(10)
+        pot_args.extend([p._RZPot._amp,p._RZPot.a])
+    elif isinstance(p,potential.DoubleExponentialDiskPotential):
+        pot_type.append(11)
+        pot_args.extend([p._amp,p._alpha,p._beta,p._kmaxFac,
+                         p._nzeros,p._glorder])
+        pot_args.extend([p._glx[ii] for ii in range(p._glorder)])
+        pot_args.extend([p._glw[ii] for ii in range(p._glorder)])
+        pot_args.extend([p._j0zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._dj0zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._j1zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._dj1zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._kp._amp,p._kp.alpha])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+            and isinstance(p._RZPot,potential.DoubleExponentialDiskPotential):
+        pot_type.append(11)
+        pot_args.extend([p._RZPot._amp,p._RZPot._alpha,
+                         p._RZPot._beta,p._RZPot._kmaxFac,
+                         p._RZPot._nzeros,p._RZPot._glorder])
+        pot_args.extend([p._RZPot._glx[ii] for ii in range(p._RZPot._glorder)])
+        pot_args.extend([p._RZPot._glw[ii] for ii in range(p._RZPot._glorder)])
+        pot_args.extend([p._RZPot._j0zeros[ii] for ii in range(p._RZPot._nzeros+1)])
+        pot_args.extend([p._RZPot._dj0zeros[ii] for ii in range(p._RZPot._nzeros+1)])
+        pot_args.extend([p._RZPot._j1zeros[ii] for ii in range(p._RZPot._nzeros+1)])
+        pot_args.extend([p._RZPot._dj1zeros[ii] for ii in range(p._RZPot._nzeros+1)])
+        pot_args.extend([p._RZPot._kp._amp,p._RZPot._kp.alpha])
+    elif isinstance(p,potential.FlattenedPowerPotential):
+        pot_type.append(12)
+        pot_args.extend([p._amp,p.alpha,p.core2])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+            and isinstance(p._RZPot,potential.FlattenedPowerPotential):
+        pot_type.append(12)
+        pot_args.extend([p._RZPot._amp,p._RZPot.alpha,p._RZPot.core2])
+    elif isinstance(p,potential.IsochronePotential):
+        pot_type.append(14)
+        pot_args.extend([p._amp,p.b])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.IsochronePotential):
+        pot_type.append(14)
+        pot_args.extend([p._RZPot._amp,p._RZPot.b])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.BurkertPotential):
+        pot_type.append(15)
+        pot_args.extend([p._RZPot._amp,p._RZPot.a])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.PowerSphericalPotentialwCutoff):
+        pot_type.append(16)
+        pot_args.extend([p._RZPot._amp,p._RZPot.alpha,p._RZPot.rc])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._RZPot,potential.RazorThinExponentialDiskPotential):
+        pot_type.append(17)
+        pot_args.extend([p._RZPot._amp,p._RZPot._alpha,p._RZPot._glorder])
+        pot_args.extend([p._RZPot._glx[ii] for ii in range(p._RZPot._glorder)])
+        pot_args.extend([p._RZPot._glw[ii] for ii in range(p._RZPot._glorder)])
+    return (pot_type,pot_args)
+
+def _cached_parse(p,key,parse_func,*args):
+    """Parse a single potential instance for C only once and cache the result
+    on the instance (on the wrapped potential for planarPotentialFromRZPotential
+    instances, because these are re-created by each RZToplanarPotential call);
+    MovingObjectPotentials are parsed each time, because their orbit can change"""
+    if isinstance(p,potential.MovingObjectPotential):
+        pot_type, pot_args= parse_func(p,*args)
+        return (pot_type,nu.array(pot_args,dtype=nu.float64,order='C'))
+    if isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential):
+        holder= p._RZPot
+    else:
+        holder= p
+    if not hasattr(holder,'_c_parsed'):
+        holder._c_parsed= {}
+    if not key in holder._c_parsed:
+        pot_type, pot_args= parse_func(p,*args)
+        holder._c_parsed[key]= (pot_type,
+                                nu.array(pot_args,dtype=nu.float64,order='C'))
+    return holder._c_parsed[key]
+
 def _parse_integrator(int_method):
     """parse the integrator method to pass to C"""
     #Pick integrator
@@ -178,7 +226,7 @@ def _parse_tol(rtol,atol):
         atol= nu.log(atol)
     return (rtol,atol)
 
-def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
+def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,numcores=None):
     """
     NAME:
        integratePlanarOrbit_c
@@ -186,32 +234,44 @@ def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
        C integrate an ode for a planarOrbit
     INPUT:
        pot - Potential or list of such instances
-       yo - initial condition [q,p]
+       yo - initial condition [q,p], shape [4] or [N,4] to integrate N orbits
+            at once
        t - set of times at which one wants the result
        int_method= 'leapfrog_c', 'rk4_c', 'rk6_c', 'symplec4_c'
        rtol, atol
+       numcores= (None) number of OpenMP threads to use when integrating N orbits
+                 (default: OMP_NUM_THREADS or all available cores); the GIL
+                 is released while the C code runs
     OUTPUT:
        (y,err)
-       y : array, shape (len(y0), len(t))
+       y : array, shape (len(t),4) or (N,len(t),4)
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
-       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators
+       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators (one per orbit when integrating N orbits)
     HISTORY:
        2011-10-03 - Written - Bovy (IAS)
+       2026-10-18 - Integrate multiple orbits in a single call
+       2026-10-18 - Integrate multiple orbits in parallel using OpenMP
     """
     rtol, atol= _parse_tol(rtol,atol)
     npot, pot_type, pot_args= _parse_pot(pot)
     int_method_c= _parse_integrator(int_method)
+    if numcores is None: numcores= 0 #lets OpenMP decide
+    yo= nu.atleast_1d(yo)
+    oneobj= (len(yo.shape) == 1)
+    if oneobj: yo= yo.reshape((1,4))
+    nobj= yo.shape[0]
 
     #Set up result array
-    result= nu.empty((len(t),4))
-    err= ctypes.c_int(0)
+    result= nu.empty((nobj,len(t),4))
+    err= nu.zeros(nobj,dtype=nu.int32)
 
     #Set up the C code
     ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
     integrationFunc= _lib.integratePlanarOrbit
-    integrationFunc.argtypes= [ndpointer(dtype=nu.float64,flags=ndarrayFlags),
-                               ctypes.c_int,                             
+    integrationFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
                                ctypes.c_int,
                                ndpointer(dtype=nu.int32,flags=ndarrayFlags),
@@ -219,7 +279,8 @@ def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
                                ctypes.c_double,
                                ctypes.c_double,
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
-                               ctypes.POINTER(ctypes.c_int),
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ctypes.c_int,
                                ctypes.c_int]
 
     #Array requirements, first store old order
@@ -228,9 +289,11 @@ def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
     yo= nu.require(yo,dtype=nu.float64,requirements=['C','W'])
     t= nu.require(t,dtype=nu.float64,requirements=['C','W'])
     result= nu.require(result,dtype=nu.float64,requirements=['C','W'])
+    err= nu.require(err,dtype=nu.int32,requirements=['C','W'])
 
     #Run the C code
-    integrationFunc(yo,
+    integrationFunc(ctypes.c_int(nobj),
+                    yo,
                     ctypes.c_int(len(t)),
                     t,
                     ctypes.c_int(npot),
@@ -238,15 +301,143 @@ def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
                     pot_args,
                     ctypes.c_double(rtol),ctypes.c_double(atol),
                     result,
-                    ctypes.byref(err),
-                    ctypes.c_int(int_method_c))
+                    err,
+                    ctypes.c_int(int_method_c),
+                    ctypes.c_int(numcores))
 
     #Reset input arrays
     if f_cont[0]: yo= nu.asfortranarray(yo)
     if f_cont[1]: t= nu.asfortranarray(t)
 
-    return (result,err.value)
+    if oneobj:
+        return (result[0],int(err[0]))
+    else:
+        return (result,err)
+
+
+def integratePlanarOrbit_events_c(pot,yo,t,event_type,event_direction,
+                                  user_event=None,maxevents=1000,
+                                  rtol=None,atol=None):
+    """
+    NAME:
+       integratePlanarOrbit_events_c
+    PURPOSE:
+       C integrate an ode for a planarOrbit with dopr54 and locate events 
+       using the dense output of the integrator
+    INPUT:
+       pot - Potential or list of such instances
+       yo - initial condition [q,p]
+       t - [initial time,final time]
+       event_type - list of event types (1: vR=0, 4: user-defined)
+       event_direction - list of crossing directions to detect for each 
+                         event (0: all, 1: increasing, -1: decreasing)
+       user_event= function user_event(t,y,index) of the time, the 
+                   rectangular phase-space position, and the index of the 
+                   event (for event type 4)
+       maxevents= (1000) maximum number of each event to record
+       rtol, atol
+    OUTPUT:
+       (tevent,yevent,yf,err)
+       tevent: list of arrays with the times of each event
+       yevent: list of arrays [nevent,4] with the phase-space position at 
+               each event
+       yf: phase-space position at the final time
+       err: error message, if not zero: 1 means maximum step reduction happened
+    HISTORY:
+       2026-10-18 - Written
+    """
+    npot, pot_type, pot_args= _parse_pot(pot)
+    return _integrate_events_c(_lib.integratePlanarOrbit_events,4,
+                               npot,pot_type,pot_args,yo,t,
+                               event_type,event_direction,user_event,
+                               maxevents,rtol,atol)
+
+#Type of the C function that evaluates user-defined events
+_USEREVENTFUNC= ctypes.CFUNCTYPE(ctypes.c_double,
+                                 ctypes.c_double,
+                                 ctypes.POINTER(ctypes.c_double),
+                                 ctypes.c_int)
+def _integrate_events_c(integrationFunc,dim,npot,pot_type,pot_args,yo,t,
+                        event_type,event_direction,user_event,maxevents,
+                        rtol,atol):
+    """Run the C integration with event detection for a full or planar 
+    orbit"""
+    rtol, atol= _parse_tol(rtol,atol)
+    nevent= len(event_type)
+    event_type= nu.array(event_type,dtype=nu.int32,order='C')
+    event_direction= nu.array(event_direction,dtype=nu.int32,order='C')
+    #Exceptions cannot propagate through the C code, so they are stored and
+    #re-raised once the integration returns
+    user_exc= []
+    if user_event is None:
+        user_func= ctypes.cast(None,_USEREVENTFUNC)
+    else:
+        def _user_func(tt,y,index):
+            if len(user_exc) > 0: return 0.
+            try:
+                return user_event(tt,nu.array([y[ii] for ii in range(dim)]),
+                                  index)
+            except Exception:
+                user_exc.append(sys.exc_info())
+                return 0.
+        user_func= _USEREVENTFUNC(_user_func)
+
+    #Set up result arrays
+    tevent= nu.zeros((nevent,maxevents))
+    yevent= nu.zeros((nevent,maxevents,dim))
+    nevents= nu.zeros(nevent,dtype=nu.int32)
+    yf= nu.zeros(dim)
+    err= ctypes.c_int(0)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    integrationFunc.argtypes= [ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_double,
+                               ctypes.c_double,
+                               ctypes.c_int,
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_double,
+                               ctypes.c_double,
+                               ctypes.c_int,
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               _USEREVENTFUNC,
+                               ctypes.c_int,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.POINTER(ctypes.c_int)]
+
+    #Array requirements
+    yo= nu.require(nu.array(yo,dtype=nu.float64),dtype=nu.float64,
+                   requirements=['C','W'])
+
+    #Run the C code
+    integrationFunc(yo,
+                    ctypes.c_double(t[0]),
+                    ctypes.c_double(t[1]),
+                    ctypes.c_int(npot),
+                    pot_type,
+                    pot_args,
+                    ctypes.c_double(rtol),ctypes.c_double(atol),
+                    ctypes.c_int(nevent),
+                    event_type,
+                    event_direction,
+                    user_func,
+                    ctypes.c_int(maxevents),
+                    tevent,
+                    yevent,
+                    nevents,
+                    yf,
+                    ctypes.byref(err))
 
+    if len(user_exc) > 0:
+        raise user_exc[0][0], user_exc[0][1], user_exc[0][2]
+    return ([tevent[ii,:nevents[ii]] for ii in range(nevent)],
+            [yevent[ii,:nevents[ii]] for ii in range(nevent)],
+            yf,err.value)
 
 def integratePlanarOrbit_dxdv_c(pot,yo,dyo,t,int_method,rtol=None,atol=None):
     """
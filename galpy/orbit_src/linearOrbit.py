@@ -1,10 +1,20 @@
+import warnings
 import numpy as nu
 from scipy import integrate
 from OrbitTop import OrbitTop
+from galpy.util import galpyWarning
 from galpy.potential_src.linearPotential import evaluatelinearForces,\
     evaluatelinearPotentials
 import galpy.util.bovy_plot as plot
 import galpy.util.bovy_symplecticode as symplecticode
+try:
+    from galpy.orbit_src.integrateLinearOrbit import integrateLinearOrbit_c
+except IOError:
+    warnings.warn("integrateLinearOrbit_c extension module not loaded",
+                  galpyWarning)
+    ext_loaded= False
+else:
+    ext_loaded= True
 class linearOrbit(OrbitTop):
     """Class that represents an orbit in a (effectively) one-dimensional potential"""
     def __init__(self,vxvv=[1.,0.]):
@@ -33,13 +43,27 @@ class linearOrbit(OrbitTop):
         INPUT:
            t - list of times at which to output (0 has to be in this!)
            pot - potential instance or list of instances
-           method= 'odeint'= scipy's odeint, or 'leapfrog'
+           method= 'odeint'= scipy's odeint, or 'leapfrog'; C versions
+                   ('leapfrog_c', 'rk4_c', 'rk6_c', 'symplec4_c', 'symplec6_c',
+                   'dopr54_c') are used if all potentials have a C
+                   implementation
         OUTPUT:
            (none) (get the actual orbit using getOrbit()
         HISTORY:
            2010-07-13 - Written - Bovy (NYU)
+           2026-10-18 - Added C integrators
         """
-        if method == 'leapfrog_c': method= 'odeint'
+        if isinstance(pot,list):
+            c_possible= True
+            for p in pot:
+                if not p.hasC:
+                    c_possible= False
+                    break
+        else:
+            c_possible= pot.hasC
+        c_possible*= ext_loaded
+        if '_c' in method and not c_possible:
+            method= 'odeint'
         if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
         self.t= nu.array(t)
         self._pot= pot
@@ -82,7 +106,7 @@ class linearOrbit(OrbitTop):
                                  +thiso[1,ii]**2./2.\
                                  for ii in range(len(t))])
 
-    def e(self,analytic=False,pot=None):
+    def e(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            e
@@ -96,13 +120,13 @@ class linearOrbit(OrbitTop):
         """
         raise AttributeError("linearOrbit does not have an eccentricity")
 
-    def rap(self,analytic=False,pot=None):
+    def rap(self,analytic=False,pot=None,exact=False):
         raise AttributeError("linearOrbit does not have an apocenter")
 
-    def rperi(self,analytic=False,pot=None):
+    def rperi(self,analytic=False,pot=None,exact=False):
         raise AttributeError("linearOrbit does not have a pericenter")
 
-    def zmax(self):
+    def zmax(self,analytic=False,pot=None,exact=False):
         raise AttributeError("linearOrbit does not have a zmax")
 
     def plotE(self,*args,**kwargs):
@@ -177,6 +201,12 @@ def _integrateLinearOrbit(vxvv,pot,t,method):
     if method.lower() == 'leapfrog':
         return symplecticode.leapfrog(evaluatelinearForces,nu.array(vxvv),
                                       t,args=(pot,),rtol=10.**-8)
+    elif ext_loaded and \
+            (method.lower() == 'leapfrog_c' or method.lower() == 'rk4_c' \
+            or method.lower() == 'rk6_c' or method.lower() == 'symplec4_c' \
+            or method.lower() == 'symplec6_c' or method.lower() == 'dopr54_c'):
+        out, msg= integrateLinearOrbit_c(pot,nu.array(vxvv),t,method)
+        return out
     elif method.lower() == 'odeint':
         return integrate.odeint(_linearEOM,vxvv,t,args=(pot,),rtol=10.**-8.)
 
@@ -0,0 +1,452 @@
+import math as m
+import warnings
+import numpy as nu
+from scipy import interpolate
+from galpy.potential_src.Potential import evaluatePotentials, _check_c
+from galpy.potential_src.planarPotential import RZToplanarPotential, \
+    evaluateplanarPotentials
+from galpy.util import galpyWarning
+from OrbitTop import OrbitTop
+from FullOrbit import FullOrbit, _integrateFullOrbit
+from planarOrbit import planarOrbit, _integrateOrbit
+try:
+    from galpy.orbit_src.integrateFullOrbit import integrateFullOrbit_c
+    from galpy.orbit_src.integratePlanarOrbit import integratePlanarOrbit_c
+except IOError:
+    warnings.warn("integrateFullOrbit_c extension module not loaded",
+                  galpyWarning)
+    ext_loaded= False
+else:
+    ext_loaded= True
+_C_METHODS= ['leapfrog_c','rk4_c','rk6_c','symplec4_c','symplec6_c',
+             'dopr54_c']
+class multiOrbit(OrbitTop):
+    """Class that holds and integrates N orbits at once, either in the plane or in 3D"""
+    def __init__(self,vxvv=None):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           intialize a set of N orbits
+        INPUT:
+           vxvv - initial conditions, array [N,4] ([R,vR,vT,phi]) or [N,6]
+                  ([R,vR,vT,z,vz,phi])
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        vxvv= nu.array(vxvv,dtype='float')
+        if not len(vxvv.shape) == 2 or not vxvv.shape[1] in [4,6]:
+            raise ValueError("vxvv for multiple orbits needs to be an array of shape [N,4] or [N,6]")
+        self.vxvv= vxvv
+        self._nobj= vxvv.shape[0]
+        self._dim= vxvv.shape[1]
+        return None
+
+    def integrate(self,t,pot,method='leapfrog_c',numcores=None):
+        """
+        NAME:
+           integrate
+        PURPOSE:
+           integrate all orbits; when the potential has a C implementation
+           and a C integrator is requested, all orbits are integrated in a
+           single call to the C code
+        INPUT:
+           t - list of times at which to output (0 has to be in this!)
+           pot - potential instance or list of instances
+           method= 'odeint' for scipy's odeint, 'leapfrog' for a simple
+                   leapfrog implementation, 'leapfrog_c', 'rk4_c', 'rk6_c',
+                   'symplec4_c', 'symplec6_c', 'dopr54_c' for C integrators
+           numcores= (None) number of OpenMP threads to use for the C
+                     integrators (default: OMP_NUM_THREADS or all cores)
+        OUTPUT:
+           error message number for each orbit (get the actual orbits using
+           getOrbit())
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
+        self.t= nu.array(t)
+        self._pot= pot
+        if self._dim == 4: thispot= RZToplanarPotential(pot)
+        else: thispot= pot
+        c_possible= ext_loaded and _check_c(pot)
+        if method.lower() in _C_METHODS and c_possible:
+            if self._dim == 4:
+                self.orbit, msg= _integratePlanarOrbits_c(self.vxvv,thispot,
+                                                          self.t,method,
+                                                          numcores=numcores)
+            else:
+                self.orbit, msg= _integrateFullOrbits_c(self.vxvv,thispot,
+                                                        self.t,method,
+                                                        numcores=numcores)
+            return msg
+        #Fall back onto integrating the orbits one by one
+        if '_c' in method: method= 'odeint'
+        self.orbit= nu.empty((self._nobj,len(self.t),self._dim))
+        msg= nu.zeros(self._nobj,dtype='int')
+        for ii in range(self._nobj):
+            if self._dim == 4:
+                self.orbit[ii], msg[ii]= _integrateOrbit(self.vxvv[ii],
+                                                         thispot,self.t,
+                                                         method)
+            else:
+                self.orbit[ii]= _integrateFullOrbit(self.vxvv[ii],thispot,
+                                                    self.t,method)
+        return msg
+
+    def integrate_events(self,t,pot,events='vR',direction=0,maxevents=1000,
+                         rtol=None,atol=None,_warnmaxevents=True):
+        """
+        NAME:
+           integrate_events
+        PURPOSE:
+           integrate the orbits with the dopr54_c integrator and find the
+           times and phase-space positions of events for each orbit
+           (the orbits are integrated one by one)
+        INPUT:
+           t - final time or [initial time,final time]
+           pot - potential instance or list of instances
+           events=, direction=, maxevents=, rtol=, atol= see
+              OrbitTop.integrate_events
+        OUTPUT:
+           list with the output of OrbitTop.integrate_events for each orbit
+        HISTORY:
+           2026-10-18 - Written
+        """
+        return [o.integrate_events(t,pot,events=events,direction=direction,
+                                   maxevents=maxevents,rtol=rtol,atol=atol,
+                                   _warnmaxevents=_warnmaxevents)
+                for o in self._orbits()]
+
+    def getOrbit(self):
+        """
+        NAME:
+           getOrbit
+        PURPOSE:
+           return previously calculated orbits
+        INPUT:
+           (none)
+        OUTPUT:
+           array orbit[N,nt,nd]
+        HISTORY:
+           2026-10-18 - Written
+        """
+        return self.orbit
+
+    def __call__(self,*args,**kwargs):
+        """
+        NAME:
+           __call__
+        PURPOSE:
+           return the orbit vectors at time t
+        INPUT:
+           t - desired time (float or array)
+        OUTPUT:
+           [nd,N] array for a single time, [nd,N,nt] array for multiple times
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if len(args) == 0:
+            return self.vxvv.T
+        t= args[0]
+        onet= isinstance(t,(int,float))
+        t= nu.atleast_1d(t)
+        if not hasattr(self,'t'):
+            out= nu.tile(self.vxvv.T[:,:,nu.newaxis],(1,1,len(t)))
+        else:
+            sindx= nu.argsort(self.t)
+            indx= nu.searchsorted(self.t[sindx],t)
+            indx[indx >= len(self.t)]= len(self.t)-1
+            indx= sindx[indx]
+            if nu.all(self.t[indx] == t):
+                out= nu.transpose(self.orbit[:,indx,:],(2,0,1))
+            else:
+                self._setupOrbitInterp()
+                out= nu.transpose(self._orbInterp(t),(2,0,1))
+        if onet: return out[:,:,0]
+        else: return out
+
+    def _setupOrbitInterp(self):
+        if not hasattr(self,"_orbInterp"):
+            if len(self.t) < 4:
+                raise LookupError("Orbit interpolaton failed; integrate on finer grid")
+            orbit= nu.copy(self.orbit)
+            #Unwrap the azimuth before interpolating
+            orbit[:,:,-1]= nu.unwrap(orbit[:,:,-1],axis=1)
+            self._orbInterp= interpolate.interp1d(self.t,orbit,axis=1,
+                                                  kind='cubic')
+        return None
+
+    def E(self,*args,**kwargs):
+        """
+        NAME:
+           E
+        PURPOSE:
+           calculate the energy of all orbits
+        INPUT:
+           t - (optional) time at which to get the energy
+           pot= potential instance or list of such instances
+        OUTPUT:
+           energy [N] or [N,nt]
+        HISTORY:
+           2026-10-18 - Written
+        """
+        pot= self._parse_pot_kwarg(kwargs)
+        if len(args) > 0:
+            t= args[0]
+        else:
+            t= 0.
+        thiso= self(*args,**kwargs)
+        if self._dim == 4:
+            pot= RZToplanarPotential(pot)
+            return evaluateplanarPotentials(thiso[0],pot,phi=thiso[3],t=t)\
+                +thiso[1]**2./2.+thiso[2]**2./2.
+        else:
+            return evaluatePotentials(thiso[0],thiso[3],pot,
+                                      phi=thiso[5],t=t)\
+                                      +thiso[1]**2./2.\
+                                      +thiso[2]**2./2.\
+                                      +thiso[4]**2./2.
+
+    def L(self,*args,**kwargs):
+        """
+        NAME:
+           L
+        PURPOSE:
+           calculate the angular momentum of all orbits
+        INPUT:
+           t - (optional) time at which to get the angular momentum
+        OUTPUT:
+           Lz [N] or [N,nt] for planar orbits, L [N,3] or [N,nt,3] for 3D orbits
+        HISTORY:
+           2026-10-18 - Written
+        """
+        thiso= self(*args,**kwargs)
+        if self._dim == 4:
+            return thiso[0]*thiso[2]
+        x= thiso[0]*nu.cos(thiso[5])
+        y= thiso[0]*nu.sin(thiso[5])
+        z= thiso[3]
+        vx= thiso[1]*nu.cos(thiso[5])-thiso[2]*nu.sin(thiso[5])
+        vy= thiso[2]*nu.cos(thiso[5])+thiso[1]*nu.sin(thiso[5])
+        vz= thiso[4]
+        out= nu.empty(x.shape+(3,))
+        out[...,0]= y*vz-z*vy
+        out[...,1]= z*vx-x*vz
+        out[...,2]= x*vy-y*vx
+        return out
+
+    def rap(self,analytic=False,pot=None,exact=False):
+        """
+        NAME:
+           rap
+        PURPOSE:
+           return the apocenter radius of all orbits
+        INPUT:
+           analytic - compute this analytically
+           pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbits exactly,
+                   using event detection with the dopr54_c integrator
+                   (analytic and exact evaluate the orbits one by one)
+        OUTPUT:
+           R_ap [N]
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if analytic or exact:
+            return nu.array([o.rap(analytic=analytic,pot=pot,exact=exact)
+                             for o in self._orbits()]).flatten()
+        return nu.amax(self._rs(),axis=1)
+
+    def rperi(self,analytic=False,pot=None,exact=False):
+        """
+        NAME:
+           rperi
+        PURPOSE:
+           return the pericenter radius of all orbits
+        INPUT:
+           analytic - compute this analytically
+           pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbits exactly,
+                   using event detection with the dopr54_c integrator
+                   (analytic and exact evaluate the orbits one by one)
+        OUTPUT:
+           R_peri [N]
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if analytic or exact:
+            return nu.array([o.rperi(analytic=analytic,pot=pot,exact=exact)
+                             for o in self._orbits()]).flatten()
+        return nu.amin(self._rs(),axis=1)
+
+    def e(self,analytic=False,pot=None,exact=False):
+        """
+        NAME:
+           e
+        PURPOSE:
+           calculate the eccentricity of all orbits
+        INPUT:
+           analytic - compute this analytically
+           pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbits exactly,
+                   using event detection with the dopr54_c integrator
+                   (analytic and exact evaluate the orbits one by one)
+        OUTPUT:
+           eccentricity [N]
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if analytic or exact:
+            return nu.array([o.e(analytic=analytic,pot=pot,exact=exact)
+                             for o in self._orbits()]).flatten()
+        rs= self._rs()
+        return (nu.amax(rs,axis=1)-nu.amin(rs,axis=1))\
+            /(nu.amax(rs,axis=1)+nu.amin(rs,axis=1))
+
+    def zmax(self,analytic=False,pot=None,exact=False):
+        """
+        NAME:
+           zmax
+        PURPOSE:
+           return the maximum vertical height of all orbits
+        INPUT:
+           analytic - compute this analytically
+           pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbits exactly,
+                   using event detection with the dopr54_c integrator
+                   (analytic and exact evaluate the orbits one by one)
+        OUTPUT:
+           Z_max [N]
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if analytic or exact:
+            if self._dim == 4: return nu.zeros(self._nobj)
+            return nu.array([o.zmax(analytic=analytic,pot=pot,exact=exact)
+                             for o in self._orbits()]).flatten()
+        if not hasattr(self,'orbit'):
+            raise AttributeError("Integrate the orbit first")
+        if self._dim == 4: return nu.zeros(self._nobj)
+        return nu.amax(nu.fabs(self.orbit[:,:,3]),axis=1)
+
+    def _orbits(self):
+        """Return the orbits as a list of single-orbit instances that share
+        the integrated orbits"""
+        out= []
+        for ii in range(self._nobj):
+            if self._dim == 4:
+                o= planarOrbit(vxvv=self.vxvv[ii])
+            else:
+                o= FullOrbit(vxvv=self.vxvv[ii])
+            if hasattr(self,'orbit'):
+                o.t= self.t
+                o.orbit= self.orbit[ii]
+                if self._dim == 4: o._pot= RZToplanarPotential(self._pot)
+                else: o._pot= self._pot
+            out.append(o)
+        return out
+
+    def _rs(self):
+        if not hasattr(self,'orbit'):
+            raise AttributeError("Integrate the orbit first")
+        if self._dim == 4: return self.orbit[:,:,0]
+        return nu.sqrt(self.orbit[:,:,0]**2.+self.orbit[:,:,3]**2.)
+
+    def _parse_pot_kwarg(self,kwargs):
+        if not kwargs.has_key('pot') or kwargs['pot'] is None:
+            try:
+                pot= self._pot
+            except AttributeError:
+                raise AttributeError("Integrate orbit or specify pot=")
+            if kwargs.has_key('pot') and kwargs['pot'] is None:
+                kwargs.pop('pot')
+        else:
+            pot= kwargs['pot']
+            kwargs.pop('pot')
+        return pot
+
+    def _aAargs(self):
+        """Return the initial conditions as the arrays that the actionAngle modules take"""
+        if self._dim == 4:
+            return (self.vxvv[:,0],self.vxvv[:,1],self.vxvv[:,2],
+                    nu.zeros(self._nobj),nu.zeros(self._nobj),self.vxvv[:,3])
+        else:
+            return (self.vxvv[:,0],self.vxvv[:,1],self.vxvv[:,2],
+                    self.vxvv[:,3],self.vxvv[:,4],self.vxvv[:,5])
+
+def _integrateFullOrbits_c(vxvv,pot,t,method,numcores=None):
+    """
+    NAME:
+       _integrateFullOrbits_c
+    PURPOSE:
+       integrate N orbits in a Phi(R,z,phi) potential in a single C call
+    INPUT:
+       vxvv - array [N,6] with the initial conditions [R,vR,vT,z,vz,phi]
+       pot - Potential instance or list of such instances
+       t - list of times at which to output (0 has to be in this!)
+       method - C integrator to use
+       numcores= (None) number of OpenMP threads to use
+    OUTPUT:
+       ([N,nt,6] array of [R,vR,vT,z,vz,phi] at each t,error message for each orbit)
+    HISTORY:
+       2026-10-18 - Written
+    """
+    cp, sp= nu.cos(vxvv[:,5]), nu.sin(vxvv[:,5])
+    this_vxvv= nu.array([vxvv[:,0]*cp,
+                         vxvv[:,0]*sp,
+                         vxvv[:,3],
+                         vxvv[:,1]*cp-vxvv[:,2]*sp,
+                         vxvv[:,2]*cp+vxvv[:,1]*sp,
+                         vxvv[:,4]]).T
+    tmp_out, msg= integrateFullOrbit_c(pot,this_vxvv,t,method,
+                                       numcores=numcores)
+    #go back to the cylindrical frame
+    R= nu.sqrt(tmp_out[:,:,0]**2.+tmp_out[:,:,1]**2.)
+    phi= nu.arctan2(tmp_out[:,:,1],tmp_out[:,:,0])
+    phi[phi < 0.]+= 2.*m.pi
+    out= nu.empty(tmp_out.shape)
+    out[:,:,0]= R
+    out[:,:,1]= tmp_out[:,:,3]*nu.cos(phi)+tmp_out[:,:,4]*nu.sin(phi)
+    out[:,:,2]= tmp_out[:,:,4]*nu.cos(phi)-tmp_out[:,:,3]*nu.sin(phi)
+    out[:,:,3]= tmp_out[:,:,2]
+    out[:,:,4]= tmp_out[:,:,5]
+    out[:,:,5]= phi
+    return (out,msg)
+
+def _integratePlanarOrbits_c(vxvv,pot,t,method,numcores=None):
+    """
+    NAME:
+       _integratePlanarOrbits_c
+    PURPOSE:
+       integrate N orbits in a Phi(R,phi) potential in a single C call
+    INPUT:
+       vxvv - array [N,4] with the initial conditions [R,vR,vT,phi]
+       pot - planarPotential instance or list of such instances
+       t - list of times at which to output (0 has to be in this!)
+       method - C integrator to use
+       numcores= (None) number of OpenMP threads to use
+    OUTPUT:
+       ([N,nt,4] array of [R,vR,vT,phi] at each t,error message for each orbit)
+    HISTORY:
+       2026-10-18 - Written
+    """
+    cp, sp= nu.cos(vxvv[:,3]), nu.sin(vxvv[:,3])
+    this_vxvv= nu.array([vxvv[:,0]*cp,
+                         vxvv[:,0]*sp,
+                         vxvv[:,1]*cp-vxvv[:,2]*sp,
+                         vxvv[:,2]*cp+vxvv[:,1]*sp]).T
+    tmp_out, msg= integratePlanarOrbit_c(pot,this_vxvv,t,method,
+                                         numcores=numcores)
+    #go back to the cylindrical frame
+    R= nu.sqrt(tmp_out[:,:,0]**2.+tmp_out[:,:,1]**2.)
+    phi= nu.arctan2(tmp_out[:,:,1],tmp_out[:,:,0])
+    phi[phi < 0.]+= 2.*m.pi
+    out= nu.empty(tmp_out.shape)
+    out[:,:,0]= R
+    out[:,:,1]= tmp_out[:,:,2]*nu.cos(phi)+tmp_out[:,:,3]*nu.sin(phi)
+    out[:,:,2]= tmp_out[:,:,3]*nu.cos(phi)-tmp_out[:,:,2]*nu.sin(phi)
+    out[:,:,3]= phi
+    return (out,msg)
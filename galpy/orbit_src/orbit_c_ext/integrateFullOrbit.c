@@ -9,6 +9,10 @@
 #include <bovy_rk.h>
 //Potentials
 #include <galpy_potentials.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+#define CHUNKSIZE 1
 #ifndef M_PI
 #define M_PI 3.14159265358979323846
 #endif
@@ -33,6 +37,7 @@ double calcphi2deriv(double, double, double,double,
 			   int, struct potentialArg *);
 double calcRphideriv(double, double, double,double, 
 			   int, struct potentialArg *);
+double evalRectEvent(double, double *, struct dopr54Event *);
 /*
   Actual functions
 */
@@ -162,6 +167,33 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->phiforce= &ZeroForce;
       potentialArgs->nargs= 2;
       break;
+    case 15: //BurkertPotential, 2 arguments
+      potentialArgs->Rforce= &BurkertPotentialRforce;
+      potentialArgs->zforce= &BurkertPotentialzforce;
+      potentialArgs->phiforce= &ZeroForce;
+      potentialArgs->nargs= 2;
+      break;
+    case 16: //PowerSphericalPotentialwCutoff, 3 arguments
+      potentialArgs->Rforce= &PowerSphericalPotentialwCutoffRforce;
+      potentialArgs->zforce= &PowerSphericalPotentialwCutoffzforce;
+      potentialArgs->phiforce= &ZeroForce;
+      potentialArgs->nargs= 3;
+      break;
+    case 17: //RazorThinExponentialDiskPotential, XX arguments
+      potentialArgs->Rforce= &RazorThinExponentialDiskPotentialRforce;
+      potentialArgs->zforce= &RazorThinExponentialDiskPotentialzforce;
+      potentialArgs->phiforce= &ZeroForce;
+      //Look at pot_args to figure out the number of arguments
+      potentialArgs->nargs= (int) (3 + 2 * *(pot_args+2));
+      break;
+    case 18: //MovingObjectPotential, XX arguments
+      potentialArgs->Rforce= &MovingObjectPotentialRforce;
+      potentialArgs->zforce= &MovingObjectPotentialzforce;
+      potentialArgs->phiforce= &MovingObjectPotentialphiforce;
+      //Look at pot_args to figure out the number of arguments
+      potentialArgs->nargs= (int) ( *(pot_args+4) == 0 ? 8
+				    : 5 + 4 * *(pot_args+4));
+      break;
     }
     potentialArgs->args= (double *) malloc( potentialArgs->nargs * sizeof(double));
     for (jj=0; jj < potentialArgs->nargs; jj++){
@@ -173,7 +205,8 @@ void parse_leapFuncArgs_Full(int npot,
   }
   potentialArgs-= npot;
 }
-void integrateFullOrbit(double *yo,
+void integrateFullOrbit(int nobj,
+			double *yo,
 			int nt, 
 			double *t,
 			int npot,
@@ -183,12 +216,21 @@ void integrateFullOrbit(double *yo,
 			double atol,
 			double *result,
 			int * err,
-			int odeint_type){
-  //Set up the forces, first count
-  int ii;
+			int odeint_type,
+			int nthreads){
+  int ii, tid;
   int dim;
-  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
-  parse_leapFuncArgs_Full(npot,potentialArgs,pot_type,pot_args);
+#ifdef _OPENMP
+  if ( nthreads <= 0 ) nthreads= omp_get_max_threads();
+#else
+  nthreads= 1;
+#endif
+  if ( nthreads > nobj ) nthreads= nobj;
+  if ( nthreads < 1 ) nthreads= 1;
+  //Set up the forces, one copy for each thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( nthreads * npot * sizeof (struct potentialArg) );
+  for (tid=0; tid < nthreads; tid++)
+    parse_leapFuncArgs_Full(npot,potentialArgs+tid*npot,pot_type,pot_args);
   //Integrate
   void (*odeint_func)(void (*func)(double, double *, double *,
 			   int, struct potentialArg *),
@@ -232,14 +274,25 @@ void integrateFullOrbit(double *yo,
     dim= 6;
     break;
   }
-  odeint_func(odeint_deriv_func,dim,yo,nt,t,npot,potentialArgs,rtol,atol,
-	      result,err);
+  int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(dynamic,chunk) num_threads(nthreads) \
+  private(ii,tid)							\
+  shared(odeint_func,odeint_deriv_func,dim,yo,nt,t,npot,potentialArgs,rtol,atol,result,err)
+  for (ii=0; ii < nobj; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid= 0;
+#endif
+    odeint_func(odeint_deriv_func,dim,yo+6*ii,nt,t,npot,potentialArgs+tid*npot,
+		rtol,atol,result+6*nt*ii,err+ii);
+  }
   //Free allocated memory
-  for (ii=0; ii < npot; ii++) {
+  for (ii=0; ii < nthreads * npot; ii++) {
     free(potentialArgs->args);
     potentialArgs++;
   }
-  potentialArgs-= npot;
+  potentialArgs-= nthreads * npot;
   free(potentialArgs);
   //Done!
 }
@@ -315,6 +368,70 @@ void integrateOrbit_dxdv(double *yo,
   //Done!
 }
 
+void integrateFullOrbit_events(double *yo,
+                               double to,
+                               double tf,
+                               int npot,
+                               int * pot_type,
+                               double * pot_args,
+                               double rtol,
+                               double atol,
+                               int nevent,
+                               int * event_type,
+                               int * event_direction,
+                               double (*userFunc)(double, double *, int),
+                               int maxevents,
+                               double * tevent,
+                               double * yevent,
+                               int * nevents,
+                               double * yf,
+                               int * err){
+  int ii;
+  //Set up the forces
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(npot,potentialArgs,pot_type,pot_args);
+  //Set up the events
+  struct dopr54Event * events= (struct dopr54Event *) malloc ( nevent * sizeof (struct dopr54Event) );
+  for (ii=0; ii < nevent; ii++){
+    (events+ii)->eventFunc= &evalRectEvent;
+    (events+ii)->type= *(event_type+ii);
+    (events+ii)->index= ii;
+    (events+ii)->userFunc= userFunc;
+    (events+ii)->direction= *(event_direction+ii);
+    (events+ii)->maxevents= maxevents;
+    (events+ii)->tevent= tevent+ii*maxevents;
+    (events+ii)->yevent= yevent+6*ii*maxevents;
+  }
+  //Integrate
+  bovy_dopr54_events(&evalRectDeriv,6,yo,to,tf,npot,potentialArgs,rtol,atol,
+		     nevent,events,yf,err);
+  for (ii=0; ii < nevent; ii++)
+    *(nevents+ii)= (events+ii)->nevents;
+  //Free allocated memory
+  for (ii=0; ii < npot; ii++) {
+    free(potentialArgs->args);
+    potentialArgs++;
+  }
+  potentialArgs-= npot;
+  free(potentialArgs);
+  free(events);
+  //Done!
+}
+double evalRectEvent(double t, double *y, struct dopr54Event * event){
+  switch ( event->type ) {
+  case 0: //z=0
+    return *(y+2);
+  case 1: //vR=0 (x vx + y vy has the sign of vR)
+    return *y * *(y+3) + *(y+1) * *(y+4);
+  case 2: //spherical vr=0
+    return *y * *(y+3) + *(y+1) * *(y+4) + *(y+2) * *(y+5);
+  case 3: //vz=0
+    return *(y+5);
+  default: //user-defined event
+    return event->userFunc(t,y,event->index);
+  }
+}
+
 void evalRectForce(double t, double *q, double *a,
 		   int nargs, struct potentialArg * potentialArgs){
   double sinphi, cosphi, x, y, phi,R,Rforce,phiforce, z, zforce;
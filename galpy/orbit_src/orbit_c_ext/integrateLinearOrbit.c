@@ -0,0 +1,161 @@
+/*
+  Wrappers around the C integration code for linear Orbits
+*/
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdbool.h>
+#include <math.h>
+#include <bovy_symplecticode.h>
+#include <bovy_rk.h>
+//Potentials
+#include <galpy_potentials.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+#define CHUNKSIZE 1
+/*
+  Function Declarations
+*/
+void evalLinearForce(double, double *, double *,
+		     int, struct potentialArg *);
+void evalLinearDeriv(double, double *, double *,
+		     int, struct potentialArg *);
+double calcLinearForce(double, double, int, struct potentialArg *);
+/*
+  Actual functions
+*/
+inline void parse_leapFuncArgs_Linear(int npot,
+				      struct potentialArg * potentialArgs,
+				      int * pot_type,
+				      double * pot_args){
+  int ii,jj;
+  for (ii=0; ii < npot; ii++){
+    switch ( *pot_type++ ) {
+    case 19: //KGPotential, 4 arguments
+      potentialArgs->linearForce= &KGPotentialLinearForce;
+      potentialArgs->nargs= 4;
+      break;
+    }
+    potentialArgs->args= (double *) malloc( potentialArgs->nargs * sizeof(double));
+    for (jj=0; jj < potentialArgs->nargs; jj++){
+      *(potentialArgs->args)= *pot_args++;
+      potentialArgs->args++;
+    }
+    potentialArgs->args-= potentialArgs->nargs;
+    potentialArgs++;
+  }
+  potentialArgs-= npot;
+}
+void integrateLinearOrbit(int nobj,
+			  double *yo,
+			  int nt,
+			  double *t,
+			  int npot,
+			  int * pot_type,
+			  double * pot_args,
+			  double rtol,
+			  double atol,
+			  double *result,
+			  int * err,
+			  int odeint_type,
+			  int nthreads){
+  int ii, tid;
+  int dim;
+#ifdef _OPENMP
+  if ( nthreads <= 0 ) nthreads= omp_get_max_threads();
+#else
+  nthreads= 1;
+#endif
+  if ( nthreads > nobj ) nthreads= nobj;
+  if ( nthreads < 1 ) nthreads= 1;
+  //Set up the forces, one copy for each thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( nthreads * npot * sizeof (struct potentialArg) );
+  for (tid=0; tid < nthreads; tid++)
+    parse_leapFuncArgs_Linear(npot,potentialArgs+tid*npot,pot_type,pot_args);
+  //Integrate
+  void (*odeint_func)(void (*func)(double, double *, double *,
+			   int, struct potentialArg *),
+		      int,
+		      double *,
+		      int, double *,
+		      int, struct potentialArg *,
+		      double, double,
+		      double *,int *);
+  void (*odeint_deriv_func)(double, double *, double *,
+			    int,struct potentialArg *);
+  switch ( odeint_type ) {
+  case 0: //leapfrog
+    odeint_func= &leapfrog;
+    odeint_deriv_func= &evalLinearForce;
+    dim= 1;
+    break;
+  case 1: //RK4
+    odeint_func= &bovy_rk4;
+    odeint_deriv_func= &evalLinearDeriv;
+    dim= 2;
+    break;
+  case 2: //RK6
+    odeint_func= &bovy_rk6;
+    odeint_deriv_func= &evalLinearDeriv;
+    dim= 2;
+    break;
+  case 3: //symplec4
+    odeint_func= &symplec4;
+    odeint_deriv_func= &evalLinearForce;
+    dim= 1;
+    break;
+  case 4: //symplec6
+    odeint_func= &symplec6;
+    odeint_deriv_func= &evalLinearForce;
+    dim= 1;
+    break;
+  case 5: //DOPR54
+    odeint_func= &bovy_dopr54;
+    odeint_deriv_func= &evalLinearDeriv;
+    dim= 2;
+    break;
+  }
+  int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(dynamic,chunk) num_threads(nthreads) \
+  private(ii,tid)							\
+  shared(odeint_func,odeint_deriv_func,dim,yo,nt,t,npot,potentialArgs,rtol,atol,result,err)
+  for (ii=0; ii < nobj; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid= 0;
+#endif
+    odeint_func(odeint_deriv_func,dim,yo+2*ii,nt,t,npot,potentialArgs+tid*npot,
+		rtol,atol,result+2*nt*ii,err+ii);
+  }
+  //Free allocated memory
+  for (ii=0; ii < nthreads * npot; ii++) {
+    free(potentialArgs->args);
+    potentialArgs++;
+  }
+  potentialArgs-= nthreads * npot;
+  free(potentialArgs);
+  //Done!
+}
+void evalLinearForce(double t, double *q, double *a,
+		     int nargs, struct potentialArg * potentialArgs){
+  *a= calcLinearForce(*q,t,nargs,potentialArgs);
+}
+void evalLinearDeriv(double t, double *q, double *a,
+		     int nargs, struct potentialArg * potentialArgs){
+  //first derivative is just the velocity
+  *a++= *(q+1);
+  //second is the force
+  *a= calcLinearForce(*q,t,nargs,potentialArgs);
+}
+double calcLinearForce(double x, double t,
+		       int nargs, struct potentialArg * potentialArgs){
+  int ii;
+  double force= 0.;
+  for (ii=0; ii < nargs; ii++){
+    force+= potentialArgs->linearForce(x,t,potentialArgs);
+    potentialArgs++;
+  }
+  potentialArgs-= nargs;
+  return force;
+}
@@ -9,6 +9,10 @@
 #include <bovy_rk.h>
 //Potentials
 #include <galpy_potentials.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+#define CHUNKSIZE 1
 #ifndef M_PI
 #define M_PI 3.14159265358979323846
 #endif
@@ -31,6 +35,7 @@ double calcPlanarphi2deriv(double, double, double,
 			   int, struct potentialArg *);
 double calcPlanarRphideriv(double, double, double, 
 			   int, struct potentialArg *);
+double evalPlanarRectEvent(double, double *, struct dopr54Event *);
 /*
   Actual functions
 */
@@ -147,6 +152,31 @@ inline void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->planarRphideriv= &ZeroPlanarForce;
       potentialArgs->nargs= 2;
       break;
+    case 15: //BurkertPotential, 2 arguments
+      potentialArgs->planarRforce= &BurkertPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &ZeroPlanarForce;
+      potentialArgs->planarR2deriv= &BurkertPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &ZeroPlanarForce;
+      potentialArgs->planarRphideriv= &ZeroPlanarForce;
+      potentialArgs->nargs= 2;
+      break;
+    case 16: //PowerSphericalPotentialwCutoff, 3 arguments
+      potentialArgs->planarRforce= &PowerSphericalPotentialwCutoffPlanarRforce;
+      potentialArgs->planarphiforce= &ZeroPlanarForce;
+      potentialArgs->planarR2deriv= &PowerSphericalPotentialwCutoffPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &ZeroPlanarForce;
+      potentialArgs->planarRphideriv= &ZeroPlanarForce;
+      potentialArgs->nargs= 3;
+      break;
+    case 17: //RazorThinExponentialDiskPotential, XX arguments
+      potentialArgs->planarRforce= &RazorThinExponentialDiskPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &ZeroPlanarForce;
+      potentialArgs->planarR2deriv= &RazorThinExponentialDiskPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &ZeroPlanarForce;
+      potentialArgs->planarRphideriv= &ZeroPlanarForce;
+      //Look at pot_args to figure out the number of arguments
+      potentialArgs->nargs= (int) (3 + 2 * *(pot_args+2));
+      break;
     }
     potentialArgs->args= (double *) malloc( potentialArgs->nargs * sizeof(double));
     for (jj=0; jj < potentialArgs->nargs; jj++){
@@ -158,7 +188,8 @@ inline void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
   }
   potentialArgs-= npot;
 }
-void integratePlanarOrbit(double *yo,
+void integratePlanarOrbit(int nobj,
+			  double *yo,
 			  int nt, 
 			  double *t,
 			  int npot,
@@ -168,12 +199,21 @@ void integratePlanarOrbit(double *yo,
 			  double atol,
 			  double *result,
 			  int * err,
-			  int odeint_type){
-  //Set up the forces, first count
-  int ii;
+			  int odeint_type,
+			  int nthreads){
+  int ii, tid;
   int dim;
-  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
-  parse_leapFuncArgs(npot,potentialArgs,pot_type,pot_args);
+#ifdef _OPENMP
+  if ( nthreads <= 0 ) nthreads= omp_get_max_threads();
+#else
+  nthreads= 1;
+#endif
+  if ( nthreads > nobj ) nthreads= nobj;
+  if ( nthreads < 1 ) nthreads= 1;
+  //Set up the forces, one copy for each thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( nthreads * npot * sizeof (struct potentialArg) );
+  for (tid=0; tid < nthreads; tid++)
+    parse_leapFuncArgs(npot,potentialArgs+tid*npot,pot_type,pot_args);
   //Integrate
   void (*odeint_func)(void (*func)(double, double *, double *,
 			   int, struct potentialArg *),
@@ -217,14 +257,25 @@ void integratePlanarOrbit(double *yo,
     dim= 4;
     break;
   }
-  odeint_func(odeint_deriv_func,dim,yo,nt,t,npot,potentialArgs,rtol,atol,
-	      result,err);
+  int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(dynamic,chunk) num_threads(nthreads) \
+  private(ii,tid)							\
+  shared(odeint_func,odeint_deriv_func,dim,yo,nt,t,npot,potentialArgs,rtol,atol,result,err)
+  for (ii=0; ii < nobj; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid= 0;
+#endif
+    odeint_func(odeint_deriv_func,dim,yo+4*ii,nt,t,npot,potentialArgs+tid*npot,
+		rtol,atol,result+4*nt*ii,err+ii);
+  }
   //Free allocated memory
-  for (ii=0; ii < npot; ii++) {
+  for (ii=0; ii < nthreads * npot; ii++) {
     free(potentialArgs->args);
     potentialArgs++;
   }
-  potentialArgs-= npot;
+  potentialArgs-= nthreads * npot;
   free(potentialArgs);
   //Done!
 }
@@ -300,6 +351,64 @@ void integratePlanarOrbit_dxdv(double *yo,
   //Done!
 }
 
+void integratePlanarOrbit_events(double *yo,
+                                 double to,
+                                 double tf,
+                                 int npot,
+                                 int * pot_type,
+                                 double * pot_args,
+                                 double rtol,
+                                 double atol,
+                                 int nevent,
+                                 int * event_type,
+                                 int * event_direction,
+                                 double (*userFunc)(double, double *, int),
+                                 int maxevents,
+                                 double * tevent,
+                                 double * yevent,
+                                 int * nevents,
+                                 double * yf,
+                                 int * err){
+  int ii;
+  //Set up the forces
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs(npot,potentialArgs,pot_type,pot_args);
+  //Set up the events
+  struct dopr54Event * events= (struct dopr54Event *) malloc ( nevent * sizeof (struct dopr54Event) );
+  for (ii=0; ii < nevent; ii++){
+    (events+ii)->eventFunc= &evalPlanarRectEvent;
+    (events+ii)->type= *(event_type+ii);
+    (events+ii)->index= ii;
+    (events+ii)->userFunc= userFunc;
+    (events+ii)->direction= *(event_direction+ii);
+    (events+ii)->maxevents= maxevents;
+    (events+ii)->tevent= tevent+ii*maxevents;
+    (events+ii)->yevent= yevent+4*ii*maxevents;
+  }
+  //Integrate
+  bovy_dopr54_events(&evalPlanarRectDeriv,4,yo,to,tf,npot,potentialArgs,rtol,atol,
+		     nevent,events,yf,err);
+  for (ii=0; ii < nevent; ii++)
+    *(nevents+ii)= (events+ii)->nevents;
+  //Free allocated memory
+  for (ii=0; ii < npot; ii++) {
+    free(potentialArgs->args);
+    potentialArgs++;
+  }
+  potentialArgs-= npot;
+  free(potentialArgs);
+  free(events);
+  //Done!
+}
+double evalPlanarRectEvent(double t, double *y, struct dopr54Event * event){
+  switch ( event->type ) {
+  case 1: //vR=0 (x vx + y vy has the sign of vR)
+    return *y * *(y+2) + *(y+1) * *(y+3);
+  default: //user-defined event
+    return event->userFunc(t,y,event->index);
+  }
+}
+
 void evalPlanarRectForce(double t, double *q, double *a,
 			 int nargs, struct potentialArg * potentialArgs){
   double sinphi, cosphi, x, y, phi,R,Rforce,phiforce;
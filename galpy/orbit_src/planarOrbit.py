@@ -36,7 +36,7 @@ class planarOrbitTop(OrbitTop):
         """
         return None
 
-    def e(self,analytic=False,pot=None):
+    def e(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            e
@@ -45,6 +45,8 @@ class planarOrbitTop(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            eccentricity
         HISTORY:
@@ -54,6 +56,9 @@ class planarOrbitTop(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return (rap-rperi)/(rap+rperi)
+        if exact:
+            rperi, rap= self._exactExtrema('r',pot=pot)
+            return (rap-rperi)/(rap+rperi)
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
@@ -99,7 +104,7 @@ class planarOrbitTop(OrbitTop):
             kwargs.pop('OmegaP')
         return self.E(*args,**kwargs)-OmegaP*self.L(*args,**kwargs)
 
-    def rap(self,analytic=False,pot=None):
+    def rap(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            rap
@@ -108,6 +113,8 @@ class planarOrbitTop(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            R_ap
         HISTORY:
@@ -117,13 +124,15 @@ class planarOrbitTop(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return rap
+        if exact:
+            return self._exactExtrema('r',pot=pot)[1]
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
             self.rs= self.orbit[:,0]
         return nu.amax(self.rs)
 
-    def rperi(self,analytic=False,pot=None):
+    def rperi(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            rperi
@@ -132,6 +141,8 @@ class planarOrbitTop(OrbitTop):
         INPUT:
            analytic - compute this analytically
            pot - potential to use for analytical calculation
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            R_peri
         HISTORY:
@@ -141,13 +152,15 @@ class planarOrbitTop(OrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return rperi
+        if exact:
+            return self._exactExtrema('r',pot=pot)[0]
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
             self.rs= self.orbit[:,0]
         return nu.amin(self.rs)
 
-    def zmax(self,pot=None,analytic=False):
+    def zmax(self,pot=None,analytic=False,exact=False):
         raise AttributeError("planarOrbit does not have a zmax")
     
     def plotJacobi(self,*args,**kwargs):
@@ -511,7 +524,7 @@ class planarOrbit(planarOrbitTop):
                                  +thiso[1,ii]**2./2.\
                                  +thiso[2,ii]**2./2. for ii in range(len(t))])
 
-    def e(self,analytic=False,pot=None):
+    def e(self,analytic=False,pot=None,exact=False):
         """
         NAME:
            e
@@ -520,6 +533,8 @@ class planarOrbit(planarOrbitTop):
         INPUT:
            analytic - calculate e analytically
            pot - potential used to analytically calculate e
+           exact - (False) locate the turning points of the orbit exactly,
+                   using event detection with the dopr54_c integrator
         OUTPUT:
            eccentricity
         HISTORY:
@@ -529,6 +544,9 @@ class planarOrbit(planarOrbitTop):
             self._setupaA(pot=pot,type='adiabatic')
             (rperi,rap)= self._aA.calcRapRperi(self)
             return (rap-rperi)/(rap+rperi)
+        if exact:
+            rperi, rap= self._exactExtrema('r',pot=pot)
+            return (rap-rperi)/(rap+rperi)
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
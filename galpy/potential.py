@@ -22,6 +22,7 @@ from galpy.potential_src import EllipticalDiskPotential
 from galpy.potential_src import CosmphiDiskPotential
 from galpy.potential_src import RazorThinExponentialDiskPotential
 from galpy.potential_src import FlattenedPowerPotential
+from galpy.potential_src import BurkertPotential
 #
 # Functions
 #
@@ -87,6 +88,7 @@ LopsidedDiskPotential= CosmphiDiskPotential.LopsidedDiskPotential
 CosmphiDiskPotential= CosmphiDiskPotential.CosmphiDiskPotential
 RazorThinExponentialDiskPotential= RazorThinExponentialDiskPotential.RazorThinExponentialDiskPotential
 FlattenedPowerPotential= FlattenedPowerPotential.FlattenedPowerPotential
+BurkertPotential= BurkertPotential.BurkertPotential
 #Softenings
 PlummerSoftening= ForceSoftening.PlummerSoftening
 
@@ -3,7 +3,8 @@
 #   potential
 ###############################################################################
 import math
-from planarPotential import planarPotential
+import numpy as nu
+from planarPotential import planarPotential, _smooth
 _degtorad= math.pi/180.
 class CosmphiDiskPotential(planarPotential):
     """Class that implements the disk potential
@@ -92,20 +93,10 @@ class CosmphiDiskPotential(planarPotential):
            2011-10-19 - Started - Bovy (IAS)
         """
         #Calculate relevant time
-        if not self._tform is None:
-            if t < self._tform:
-                smooth= 0.
-            elif t < self._tsteady:
-                deltat= t-self._tform
-                xi= 2.*deltat/(self._tsteady-self._tform)-1.
-                smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-            else: #fully on
-                smooth= 1.
-        else:
-            smooth= 1.
+        smooth= _smooth(t,self._tform,self._tsteady)
         if dR == 0 and dphi == 0:
             return smooth*self._mphio/self._m*R**self._p\
-                *math.cos(self._m*(phi-self._phib))
+                *nu.cos(self._m*(phi-self._phib))
         elif dR == 1 and dphi == 0:
             return -self._Rforce(R,phi=phi,t=t)
         elif dR == 0 and dphi == 1:
@@ -133,19 +124,9 @@ class CosmphiDiskPotential(planarPotential):
            2011-10-19 - Written - Bovy (IAS)
         """
         #Calculate relevant time
-        if not self._tform is None:
-            if t < self._tform:
-                smooth= 0.
-            elif t < self._tsteady:
-                deltat= t-self._tform
-                xi= 2.*deltat/(self._tsteady-self._tform)-1.
-                smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-            else: #fully on
-                smooth= 1.
-        else:
-            smooth= 1.
+        smooth= _smooth(t,self._tform,self._tsteady)
         return -smooth*self._p*self._mphio/self._m*R**(self._p-1.)\
-            *math.cos(self._m*(phi-self._phib))
+            *nu.cos(self._m*(phi-self._phib))
         
     def _phiforce(self,R,phi=0.,t=0.):
         """
@@ -163,64 +144,24 @@ class CosmphiDiskPotential(planarPotential):
            2011-10-19 - Written - Bovy (IAS)
         """
         #Calculate relevant time
-        if not self._tform is None:
-            if t < self._tform:
-                smooth= 0.
-            elif t < self._tsteady:
-                deltat= t-self._tform
-                xi= 2.*deltat/(self._tsteady-self._tform)-1.
-                smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-            else: #fully on
-                smooth= 1.
-        else:
-            smooth= 1.
-        return smooth*self._mphio*R**self._p*math.sin(self._m*(phi-self._phib))
+        smooth= _smooth(t,self._tform,self._tsteady)
+        return smooth*self._mphio*R**self._p*nu.sin(self._m*(phi-self._phib))
 
     def _R2deriv(self,R,phi=0.,t=0.):
         #Calculate relevant time
-        if not self._tform is None:
-            if t < self._tform:
-                smooth= 0.
-            elif t < self._tsteady:
-                deltat= t-self._tform
-                xi= 2.*deltat/(self._tsteady-self._tform)-1.
-                smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-            else: #fully on
-                smooth= 1.
-        else:
-            smooth= 1.
+        smooth= _smooth(t,self._tform,self._tsteady)
         return smooth*self._p*(self._p-1.)/self._m*self._mphio*R**(self._p-2.)\
-            *math.cos(self._m*(phi-self._phib))
+            *nu.cos(self._m*(phi-self._phib))
         
     def _phi2deriv(self,R,phi=0.,t=0.):
         #Calculate relevant time
-        if not self._tform is None:
-            if t < self._tform:
-                smooth= 0.
-            elif t < self._tsteady:
-                deltat= t-self._tform
-                xi= 2.*deltat/(self._tsteady-self._tform)-1.
-                smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-            else: #perturbation is fully on
-                smooth= 1.
-        else:
-            smooth= 1.
-        return -self._m*smooth*self._mphio*R**self._p*math.cos(self._m*(phi-self._phib))
+        smooth= _smooth(t,self._tform,self._tsteady)
+        return -self._m*smooth*self._mphio*R**self._p*nu.cos(self._m*(phi-self._phib))
 
     def _Rphideriv(self,R,phi=0.,t=0.):
         #Calculate relevant time
-        if not self._tform is None:
-            if t < self._tform:
-                smooth= 0.
-            elif t < self._tsteady:
-                deltat= t-self._tform
-                xi= 2.*deltat/(self._tsteady-self._tform)-1.
-                smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-            else: #perturbation is fully on
-                smooth= 1.
-        else:
-            smooth= 1.
-        return -smooth*self._p*self._mphio*R**(self._p-1.)*math.sin(self._m*(phi-self._phib))
+        smooth= _smooth(t,self._tform,self._tsteady)
+        return -smooth*self._p*self._mphio*R**(self._p-1.)*nu.sin(self._m*(phi-self._phib))
 
     def tform(self):
         """
@@ -2,7 +2,8 @@
 #   DehnenBarPotential: Dehnen (2000)'s bar potential
 ###############################################################################
 import math as m
-from planarPotential import planarPotential
+import numpy as nu
+from planarPotential import planarPotential, _smooth
 _degtorad= m.pi/180.
 class DehnenBarPotential(planarPotential):
     """Class that implements the Dehnen bar potential (Dehnen 2000)
@@ -99,22 +100,12 @@ class DehnenBarPotential(planarPotential):
            2010-11-24 - Started - Bovy (NYU)
         """
         #Calculate relevant time
-        if t < self._tform:
-            smooth= 0.
-        elif t < self._tsteady:
-            deltat= t-self._tform
-            xi= 2.*deltat/(self._tsteady-self._tform)-1.
-            smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-        else: #bar is fully on
-            smooth= 1.
+        smooth= _smooth(t,self._tform,self._tsteady)
         if dR == 0 and dphi == 0:
-            if R <= self._rb:
-                return self._af*smooth*m.cos(2.*(phi-self._omegab*t-self._barphi))\
-                       *((R/self._rb)**3.-2.)
-            else:
-                return -self._af*smooth*m.cos(2.*(phi-self._omegab*t-
-                                                  self._barphi))\
-                                                  *(self._rb/R)**3.
+            angular= self._af*smooth*nu.cos(2.*(phi-self._omegab*t-self._barphi))
+            return _where(R <= self._rb,
+                          angular*((R/self._rb)**3.-2.),
+                          -angular*(self._rb/R)**3.)
         elif dR == 1 and dphi == 0:
             return -self._Rforce(R,phi=phi,t=t)
         elif dR == 0 and dphi == 1:
@@ -142,22 +133,11 @@ class DehnenBarPotential(planarPotential):
            2010-11-24 - Written - Bovy (NYU)
         """
         #Calculate relevant time
-        if t < self._tform:
-            smooth= 0.
-        elif t < self._tsteady:
-            deltat= t-self._tform
-            xi= 2.*deltat/(self._tsteady-self._tform)-1.
-            smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-        else: #bar is fully on
-            smooth= 1.
-        if R <= self._rb:
-            return -3.*self._af*smooth*m.cos(2.*(phi-self._omegab*t
-                                              -self._barphi))\
-                                              *(R/self._rb)**3./R
-        else:
-            return -3.*self._af*smooth*m.cos(2.*(phi-self._omegab*t-
-                                              self._barphi))\
-                                              *(self._rb/R)**3./R
+        smooth= _smooth(t,self._tform,self._tsteady)
+        angular= self._af*smooth*nu.cos(2.*(phi-self._omegab*t-self._barphi))
+        return _where(R <= self._rb,
+                      -3.*angular*(R/self._rb)**3./R,
+                      -3.*angular*(self._rb/R)**3./R)
         
     def _phiforce(self,R,phi=0.,t=0.):
         """
@@ -175,79 +155,35 @@ class DehnenBarPotential(planarPotential):
            2010-11-24 - Written - Bovy (NYU)
         """
         #Calculate relevant time
-        if t < self._tform:
-            smooth= 0.
-        elif t < self._tsteady:
-            deltat= t-self._tform
-            xi= 2.*deltat/(self._tsteady-self._tform)-1.
-            smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-        else: #bar is fully on
-            smooth= 1.
-        if R <= self._rb:
-            return 2.*self._af*smooth*m.sin(2.*(phi-self._omegab*t-
-                                                self._barphi))\
-                                                *((R/self._rb)**3.-2.)
-        else:
-            return -2.*self._af*smooth*m.sin(2.*(phi-self._omegab*t-
-                                                 self._barphi))\
-                                                 *(self._rb/R)**3.
+        smooth= _smooth(t,self._tform,self._tsteady)
+        angular= self._af*smooth*nu.sin(2.*(phi-self._omegab*t-self._barphi))
+        return _where(R <= self._rb,
+                      2.*angular*((R/self._rb)**3.-2.),
+                      -2.*angular*(self._rb/R)**3.)
 
     def _R2deriv(self,R,phi=0.,t=0.):
         #Calculate relevant time
-        if t < self._tform:
-            smooth= 0.
-        elif t < self._tsteady:
-            deltat= t-self._tform
-            xi= 2.*deltat/(self._tsteady-self._tform)-1.
-            smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-        else: #bar is fully on
-            smooth= 1.
-        if R <= self._rb:
-            return 6.*self._af*smooth*m.cos(2.*(phi-self._omegab*t
-                                              -self._barphi))\
-                                              *(R/self._rb)**3./R**2.
-        else:
-            return -12.*self._af*smooth*m.cos(2.*(phi-self._omegab*t-
-                                                  self._barphi))\
-                                                  *(self._rb/R)**3./R**2.
+        smooth= _smooth(t,self._tform,self._tsteady)
+        angular= self._af*smooth*nu.cos(2.*(phi-self._omegab*t-self._barphi))
+        return _where(R <= self._rb,
+                      6.*angular*(R/self._rb)**3./R**2.,
+                      -12.*angular*(self._rb/R)**3./R**2.)
         
     def _phi2deriv(self,R,phi=0.,t=0.):
         #Calculate relevant time
-        if t < self._tform:
-            smooth= 0.
-        elif t < self._tsteady:
-            deltat= t-self._tform
-            xi= 2.*deltat/(self._tsteady-self._tform)-1.
-            smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-        else: #bar is fully on
-            smooth= 1.
-        if R <= self._rb:
-            return -4.*self._af*smooth*m.cos(2.*(phi-self._omegab*t-
-                                                 self._barphi))\
-                                                 *((R/self._rb)**3.-2.)
-        else:
-            return 4.*self._af*smooth*m.cos(2.*(phi-self._omegab*t-
-                                                 self._barphi))\
-                                                 *(self._rb/R)**3.       
+        smooth= _smooth(t,self._tform,self._tsteady)
+        angular= self._af*smooth*nu.cos(2.*(phi-self._omegab*t-self._barphi))
+        return _where(R <= self._rb,
+                      -4.*angular*((R/self._rb)**3.-2.),
+                      4.*angular*(self._rb/R)**3.)
 
     def _Rphideriv(self,R,phi=0.,t=0.):
         #Calculate relevant time
-        if t < self._tform:
-            smooth= 0.
-        elif t < self._tsteady:
-            deltat= t-self._tform
-            xi= 2.*deltat/(self._tsteady-self._tform)-1.
-            smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-        else: #bar is fully on
-            smooth= 1.
-        if R <= self._rb:
-            return -6.*self._af*smooth*m.sin(2.*(phi-self._omegab*t
-                                              -self._barphi))\
-                                              *(R/self._rb)**3./R
-        else:
-            return -6.*self._af*smooth*m.sin(2.*(phi-self._omegab*t-
-                                              self._barphi))\
-                                              *(self._rb/R)**3./R
+        smooth= _smooth(t,self._tform,self._tsteady)
+        angular= self._af*smooth*nu.sin(2.*(phi-self._omegab*t-self._barphi))
+        return _where(R <= self._rb,
+                      -6.*angular*(R/self._rb)**3./R,
+                      -6.*angular*(self._rb/R)**3./R)
 
     def tform(self):
         """
@@ -299,3 +235,9 @@ class DehnenBarPotential(planarPotential):
 
         """
         return self._omegab
+
+def _where(cond,x,y):
+    """numpy.where that returns a float for scalar input"""
+    out= nu.where(cond,x,y)
+    if out.ndim == 0: return float(out)
+    else: return out
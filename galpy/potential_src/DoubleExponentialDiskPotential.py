@@ -8,7 +8,7 @@ import numpy as nu
 import warnings
 from scipy import special, integrate
 from galpy.util import galpyWarning
-from Potential import Potential
+from Potential import Potential, _broadcast_Rz, _return_Rz, _chunks
 from PowerSphericalPotential import KeplerPotential
 _TOL= 1.4899999999999999e-15
 _MAXITER= 20
@@ -124,27 +124,16 @@ class DoubleExponentialDiskPotential(Potential):
             warnings.warn("High-order derivatives for DoubleExponentialDiskPotential not implemented",galpyWarning)
             return None
         if self._new:
-            if isinstance(R,float):
-                floatIn= True
-                R= nu.array([R])
-                z= nu.array([z])
-            else:
-                floatIn= False
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
             out= nu.empty(len(R))
             indx= (R <= 6.)
-            out[True-indx]= self._kp(R[True-indx],z[True-indx])
-            R4max= nu.copy(R)
-            R4max[(R < 1.)]= 1.
-            kmax= self._kmaxFac*self._beta
-            for jj in range(len(R)):
-                if not indx[jj]: continue
-                maxj0zeroIndx= nu.argmin((self._j0zeros-kmax*R4max[jj])**2.) #close enough
-                ks= nu.array([0.5*(self._glx+1.)*self._dj0zeros[ii+1] + self._j0zeros[ii] for ii in range(maxj0zeroIndx)]).flatten()
-                weights= nu.array([self._glw*self._dj0zeros[ii+1] for ii in range(maxj0zeroIndx)]).flatten()
-                evalInt= special.jn(0,ks*R[jj])*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z[jj]))-ks*nu.exp(-self._beta*nu.fabs(z[jj])))/(self._beta**2.-ks**2.)
-                out[jj]= -2.*nu.pi*self._alpha*nu.sum(weights*evalInt)
-            if floatIn: return out[0]
-            else: return out
+            if nu.any(True^indx):
+                out[True^indx]= self._kp(R[True^indx],z[True^indx])
+            out[indx]= -2.*nu.pi*self._alpha\
+                *self._glsum(R[indx],z[indx],self._j0zeros,self._dj0zeros,
+                             self._kmaxFac*self._beta,
+                             lambda ks,R,z: special.j0(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+            return _return_Rz(out,shape,scalarIn)
         #Old code, uses scipy's quadrature to do the relevant integrals, split into two
         notConvergedSmall= True
         notConvergedLarge= True
@@ -213,20 +202,16 @@ class DoubleExponentialDiskPotential(Potential):
         DOCTEST:
         """
         if self._new:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._Rforce(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if R > 6.: return self._kp.Rforce(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
-            kmax= self._kmaxFac*self._beta
-            kmax= 2.*self._kmaxFac*self._beta
-            maxj1zeroIndx= nu.argmin((self._j1zeros-kmax*R4max)**2.) #close enough
-            ks= nu.array([0.5*(self._glx+1.)*self._dj1zeros[ii+1] + self._j1zeros[ii] for ii in range(maxj1zeroIndx)]).flatten()
-            weights= nu.array([self._glw*self._dj1zeros[ii+1] for ii in range(maxj1zeroIndx)]).flatten()
-            evalInt= ks*special.jn(1,ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)
-            return -2.*nu.pi*self._alpha*nu.sum(weights*evalInt)
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
+            out= nu.empty(len(R))
+            indx= (R <= 6.)
+            if nu.any(True^indx):
+                out[True^indx]= self._kp.Rforce(R[True^indx],z[True^indx])
+            out[indx]= -2.*nu.pi*self._alpha\
+                *self._glsum(R[indx],z[indx],self._j1zeros,self._dj1zeros,
+                             2.*self._kmaxFac*self._beta,
+                             lambda ks,R,z: ks*special.j1(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+            return _return_Rz(out,shape,scalarIn)
         #Old code, uses scipy's quadrature to do the relevant integrals, split into two
         notConvergedSmall= True
         notConvergedLarge= True
@@ -297,22 +282,17 @@ class DoubleExponentialDiskPotential(Potential):
         DOCTEST:
         """
         if self._new:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._zforce(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if R > 6.: return self._kp.zforce(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
-            kmax= self._kmaxFac*self._beta
-            maxj0zeroIndx= nu.argmin((self._j0zeros-kmax*R4max)**2.) #close enough
-            ks= nu.array([0.5*(self._glx+1.)*self._dj0zeros[ii+1] + self._j0zeros[ii] for ii in range(maxj0zeroIndx)]).flatten()
-            weights= nu.array([self._glw*self._dj0zeros[ii+1] for ii in range(maxj0zeroIndx)]).flatten()
-            evalInt= ks*special.jn(0,ks*R)*(self._alpha**2.+ks**2.)**-1.5*(nu.exp(-ks*nu.fabs(z))-nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)
-            if z > 0.:
-                return -2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
-            else:
-                return 2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
+            out= nu.empty(len(R))
+            indx= (R <= 6.)
+            if nu.any(True^indx):
+                out[True^indx]= self._kp.zforce(R[True^indx],z[True^indx])
+            out[indx]= 2.*nu.pi*self._alpha*self._beta\
+                *(1.-2.*(z[indx] > 0.))\
+                *self._glsum(R[indx],z[indx],self._j0zeros,self._dj0zeros,
+                             self._kmaxFac*self._beta,
+                             lambda ks,R,z: ks*special.j0(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(nu.exp(-ks*nu.fabs(z))-nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+            return _return_Rz(out,shape,scalarIn)
         #Old code, uses scipy's quadrature to do the relevant integrals, split into two
         if self._zforceNotSetUp:
             self._zforceNotSetUp= False
@@ -406,24 +386,20 @@ class DoubleExponentialDiskPotential(Potential):
            2012-12-27 - Written - Bovy (IAS)
         """
         if self._new:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._R2deriv(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if R > 16.*self._hr or R > 6.: return self._kp.R2deriv(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
+            out= nu.empty(len(R))
+            indx= (R <= 16.*self._hr)*(R <= 6.)
+            if nu.any(True^indx):
+                out[True^indx]= self._kp.R2deriv(R[True^indx],z[True^indx])
             kmax= 2.*self._kmaxFac*self._beta
-            maxj0zeroIndx= nu.argmin((self._j0zeros-kmax*R4max)**2.) #close enough
-            maxj2zeroIndx= nu.argmin((self._j2zeros-kmax*R4max)**2.) #close enough
-            ks0= nu.array([0.5*(self._glx+1.)*self._dj0zeros[ii+1] + self._j0zeros[ii] for ii in range(maxj0zeroIndx)]).flatten()
-            weights0= nu.array([self._glw*self._dj0zeros[ii+1] for ii in range(maxj0zeroIndx)]).flatten()
-            ks2= nu.array([0.5*(self._glx+1.)*self._dj2zeros[ii+1] + self._j2zeros[ii] for ii in range(maxj2zeroIndx)]).flatten()
-            weights2= nu.array([self._glw*self._dj2zeros[ii+1] for ii in range(maxj2zeroIndx)]).flatten()
-            evalInt0= ks0**2.*special.jn(0,ks0*R)*(self._alpha**2.+ks0**2.)**-1.5*(self._beta*nu.exp(-ks0*nu.fabs(z))-ks0*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks0**2.)
-            evalInt2= ks2**2.*special.jn(2,ks2*R)*(self._alpha**2.+ks2**2.)**-1.5*(self._beta*nu.exp(-ks2*nu.fabs(z))-ks2*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks2**2.)
-            return nu.pi*self._alpha*(nu.sum(weights0*evalInt0)
-                                      -nu.sum(weights2*evalInt2))
+            out[indx]= nu.pi*self._alpha\
+                *(self._glsum(R[indx],z[indx],self._j0zeros,self._dj0zeros,
+                              kmax,
+                              lambda ks,R,z: ks**2.*special.j0(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+                  -self._glsum(R[indx],z[indx],self._j2zeros,self._dj2zeros,
+                               kmax,
+                               lambda ks,R,z: ks**2.*special.jn(2,ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)))
+            return _return_Rz(out,shape,scalarIn)
         #Old code, uses scipy's quadrature to do the relevant integrals, split into two
         notConvergedSmall= True
         notConvergedLarge= True
@@ -493,19 +469,16 @@ class DoubleExponentialDiskPotential(Potential):
            2012-12-26 - Written - Bovy (IAS)
         """
         if self._new:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._z2deriv(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if R > 6.: return self._kp.z2deriv(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
-            kmax= self._kmaxFac*self._beta
-            maxj0zeroIndx= nu.argmin((self._j0zeros-kmax*R4max)**2.) #close enough
-            ks= nu.array([0.5*(self._glx+1.)*self._dj0zeros[ii+1] + self._j0zeros[ii] for ii in range(maxj0zeroIndx)]).flatten()
-            weights= nu.array([self._glw*self._dj0zeros[ii+1] for ii in range(maxj0zeroIndx)]).flatten()
-            evalInt= ks*special.jn(0,ks*R)*(self._alpha**2.+ks**2.)**-1.5*(ks*nu.exp(-ks*nu.fabs(z))-self._beta*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)
-            return -2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
+            out= nu.empty(len(R))
+            indx= (R <= 6.)
+            if nu.any(True^indx):
+                out[True^indx]= self._kp.z2deriv(R[True^indx],z[True^indx])
+            out[indx]= -2.*nu.pi*self._alpha*self._beta\
+                *self._glsum(R[indx],z[indx],self._j0zeros,self._dj0zeros,
+                             self._kmaxFac*self._beta,
+                             lambda ks,R,z: ks*special.j0(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(ks*nu.exp(-ks*nu.fabs(z))-self._beta*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+            return _return_Rz(out,shape,scalarIn)
         raise NotImplementedError("none 'new' z2deriv not implemented for DoubleExponentialDiskPotential")
 
     def _Rzderiv(self,R,z,phi=0.,t=0.):
@@ -525,24 +498,44 @@ class DoubleExponentialDiskPotential(Potential):
            2013-08-28 - Written - Bovy (IAS)
         """
         if self._new:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._Rzderiv(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if R > 6.: return self._kp.Rzderiv(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
-            kmax= 2.*self._kmaxFac*self._beta
-            maxj1zeroIndx= nu.argmin((self._j1zeros-kmax*R4max)**2.) #close enough
-            ks= nu.array([0.5*(self._glx+1.)*self._dj1zeros[ii+1] + self._j1zeros[ii] for ii in range(maxj1zeroIndx)]).flatten()
-            weights= nu.array([self._glw*self._dj1zeros[ii+1] for ii in range(maxj1zeroIndx)]).flatten()
-            evalInt= ks**2.*special.jn(1,ks*R)*(self._alpha**2.+ks**2.)**-1.5*(nu.exp(-ks*nu.fabs(z))-nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)
-            if z >= 0.:
-                return -2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
-            else:
-                return 2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
+            out= nu.empty(len(R))
+            indx= (R <= 6.)
+            if nu.any(True^indx):
+                out[True^indx]= self._kp.Rzderiv(R[True^indx],z[True^indx])
+            out[indx]= 2.*nu.pi*self._alpha*self._beta\
+                *(1.-2.*(z[indx] >= 0.))\
+                *self._glsum(R[indx],z[indx],self._j1zeros,self._dj1zeros,
+                             2.*self._kmaxFac*self._beta,
+                             lambda ks,R,z: ks**2.*special.j1(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(nu.exp(-ks*nu.fabs(z))-nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+            return _return_Rz(out,shape,scalarIn)
         raise NotImplementedError("none 'new' Rzderiv not implemented for DoubleExponentialDiskPotential")
 
+    def _glsum(self,R,z,zeros,dzeros,kmax,integrand):
+        """Gauss-Legendre integral of integrand(k,R,z) between the zeros
+        of a Bessel function up to the zero closest to kmax x max(R,1), for
+        all (R,z) at once (points with the same number of zeros are done
+        together)"""
+        out= nu.zeros(len(R))
+        if len(R) == 0: return out
+        R4max= nu.copy(R)
+        R4max[(R < 1.)]= 1.
+        kR= kmax*R4max
+        #Index of the closest zero (the first one for ties)
+        maxIndx= nu.searchsorted(zeros,kR)
+        maxIndx[(maxIndx > len(zeros)-1)]= len(zeros)-1
+        lower= (maxIndx > 0)*((kR-zeros[maxIndx-1]) <= (zeros[maxIndx]-kR))
+        maxIndx[lower]-= 1
+        for indx in nu.unique(maxIndx):
+            if indx == 0: continue
+            ks= (0.5*(self._glx+1.)*dzeros[1:indx+1,None]
+                 +zeros[:indx,None]).flatten()
+            weights= (self._glw*dzeros[1:indx+1,None]).flatten()
+            for pts in _chunks((maxIndx == indx),len(ks)):
+                out[pts]= nu.sum(weights*integrand(ks,R[pts,None],
+                                                   z[pts,None]),axis=1)
+        return out
+
     def _dens(self,R,z,phi=0.,t=0.):
         """
         NAME:
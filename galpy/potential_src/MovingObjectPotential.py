@@ -68,6 +68,9 @@ class MovingObjectPotential(Potential):
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)):
             self.normalize(normalize)
+        #C implementation only for Plummer softening and 3D orbits
+        self.hasC= isinstance(self._softening,PlummerSoftening) \
+            and len(self._orb._orb.vxvv) == 6
         return None
 
     def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
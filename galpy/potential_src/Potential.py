@@ -22,6 +22,7 @@ import galpy.util.bovy_plot as plot
 from plotRotcurve import plotRotcurve, vcirc
 from plotEscapecurve import plotEscapecurve
 _INF= 1000000.
+_MAXCHUNKELEMENTS= 2**20 #maximum number of values computed at once for arrays
 class Potential:
     """Top-level class for a potential"""
     def __init__(self,amp=1.):
@@ -41,6 +42,13 @@ class Potential:
         self.hasC= False
         return None
 
+    def __setattr__(self,name,value):
+        #Arguments parsed for the C code are no longer valid when a parameter
+        #changes
+        self.__dict__[name]= value
+        if not name == '_c_parsed': self.__dict__.pop('_c_parsed',None)
+        return None
+
     def __call__(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
         """
         NAME:
@@ -536,10 +544,8 @@ class Potential:
         else:
             Rs= nu.linspace(rmin,rmax,nrs)
             zs= nu.linspace(zmin,zmax,nzs)
-            potRz= nu.zeros((nrs,nzs))
-            for ii in range(nrs):
-                for jj in range(nzs):
-                    potRz[ii,jj]= self._evaluate(Rs[ii],zs[jj],t=t)
+            Rgrid, zgrid= nu.meshgrid(Rs,zs,indexing='ij')
+            potRz= self._evaluate(Rgrid,zgrid,t=t)
             if not savefilename == None:
                 print "Writing savefile "+savefilename+" ..."
                 savefile= open(savefilename,'wb')
@@ -979,7 +985,7 @@ class PotentialError(Exception):
     def __str__(self):
         return repr(self.value)
 
-def evaluatePotentials(R,z,Pot,phi=0.,t=0.):
+def evaluatePotentials(R,z,Pot,phi=0.,t=0.,use_c=False):
     """
     NAME:
        evaluatePotentials
@@ -995,11 +1001,20 @@ def evaluatePotentials(R,z,Pot,phi=0.,t=0.):
        phi - azimuth
 
        t - time
+
+       use_c= (False) if True, evaluate using the C implementations of the potentials
+              for arrays of points, if they all have one
     OUTPUT:
        Phi(R,z)
     HISTORY:
        2010-04-16 - Written - Bovy (NYU)
+       2026-10-18 - Added use_c
     """
+    if use_c:
+        from evaluate_arrays_c import _check_c_array, eval_potential_array_c
+        if _check_c_array(Pot,quantity='potential'):
+            return eval_potential_array_c(Pot,R,z,phi=phi,t=t,
+                                          quantity='potential')
     if isinstance(Pot,list):
         sum= 0.
         for pot in Pot:
@@ -1055,7 +1070,7 @@ def evaluateDensities(R,z,Pot,phi=0.,t=0.,forcepoisson=False):
     else:
         raise PotentialError("Input to 'evaluateDensities' is neither a Potential-instance or a list of such instances")
 
-def evaluateRforces(R,z,Pot,phi=0.,t=0.):
+def evaluateRforces(R,z,Pot,phi=0.,t=0.,use_c=False):
     """
     NAME:
        evaluateRforce
@@ -1071,11 +1086,20 @@ def evaluateRforces(R,z,Pot,phi=0.,t=0.):
        phi - azimuth (optional)
 
        t - time (optional)
+
+       use_c= (False) if True, evaluate using the C implementations of the potentials
+              for arrays of points, if they all have one
     OUTPUT:
        F_R(R,z,phi,t)
     HISTORY:
        2010-04-16 - Written - Bovy (NYU)
+       2026-10-18 - Added use_c
     """
+    if use_c:
+        from evaluate_arrays_c import _check_c_array, eval_potential_array_c
+        if _check_c_array(Pot,quantity='Rforce'):
+            return eval_potential_array_c(Pot,R,z,phi=phi,t=t,
+                                          quantity='Rforce')
     if isinstance(Pot,list):
         sum= 0.
         for pot in Pot:
@@ -1086,7 +1110,7 @@ def evaluateRforces(R,z,Pot,phi=0.,t=0.):
     else:
         raise PotentialError("Input to 'evaluateRforces' is neither a Potential-instance or a list of such instances")
 
-def evaluatephiforces(R,z,Pot,phi=0.,t=0.):
+def evaluatephiforces(R,z,Pot,phi=0.,t=0.,use_c=False):
     """
     NAME:
 
@@ -1107,6 +1131,9 @@ def evaluatephiforces(R,z,Pot,phi=0.,t=0.):
 
        t - time (optional)
 
+       use_c= (False) if True, evaluate using the C implementations of the potentials
+              for arrays of points, if they all have one
+
     OUTPUT:
 
        F_phi(R,z,phi,t)
@@ -1115,7 +1142,14 @@ def evaluatephiforces(R,z,Pot,phi=0.,t=0.):
 
        2010-04-16 - Written - Bovy (NYU)
 
+       2026-10-18 - Added use_c
+
     """
+    if use_c:
+        from evaluate_arrays_c import _check_c_array, eval_potential_array_c
+        if _check_c_array(Pot,quantity='phiforce'):
+            return eval_potential_array_c(Pot,R,z,phi=phi,t=t,
+                                          quantity='phiforce')
     if isinstance(Pot,list):
         sum= 0.
         for pot in Pot:
@@ -1126,7 +1160,7 @@ def evaluatephiforces(R,z,Pot,phi=0.,t=0.):
     else:
         raise PotentialError("Input to 'evaluatephiforces' is neither a Potential-instance or a list of such instances")
 
-def evaluatezforces(R,z,Pot,phi=0.,t=0.):
+def evaluatezforces(R,z,Pot,phi=0.,t=0.,use_c=False):
     """
     NAME:
 
@@ -1148,6 +1182,9 @@ def evaluatezforces(R,z,Pot,phi=0.,t=0.):
 
        t - time (optional)
 
+       use_c= (False) if True, evaluate using the C implementations of the potentials
+              for arrays of points, if they all have one
+
     OUTPUT:
 
        F_z(R,z,phi,t)
@@ -1156,7 +1193,14 @@ def evaluatezforces(R,z,Pot,phi=0.,t=0.):
 
        2010-04-16 - Written - Bovy (NYU)
 
+       2026-10-18 - Added use_c
+
     """
+    if use_c:
+        from evaluate_arrays_c import _check_c_array, eval_potential_array_c
+        if _check_c_array(Pot,quantity='zforce'):
+            return eval_potential_array_c(Pot,R,z,phi=phi,t=t,
+                                          quantity='zforce')
     if isinstance(Pot,list):
         sum= 0.
         for pot in Pot:
@@ -1300,11 +1344,8 @@ def plotPotentials(Pot,rmin=0.,rmax=1.5,nrs=21,zmin=-0.5,zmax=0.5,nzs=21,
         else:
             Rs= nu.linspace(rmin,rmax,nrs)
             zs= nu.linspace(zmin,zmax,nzs)
-            potRz= nu.zeros((nrs,nzs))
-            for ii in range(nrs):
-                for jj in range(nzs):
-                    potRz[ii,jj]= evaluatePotentials(nu.fabs(Rs[ii]),
-                                                     zs[jj],Pot)
+            Rgrid, zgrid= nu.meshgrid(nu.fabs(Rs),zs,indexing='ij')
+            potRz= evaluatePotentials(Rgrid,zgrid,Pot)
             if not savefilename == None:
                 print "Writing savefile "+savefilename+" ..."
                 savefile= open(savefilename,'wb')
@@ -1365,11 +1406,8 @@ def plotDensities(Pot,rmin=0.,rmax=1.5,nrs=21,zmin=-0.5,zmax=0.5,nzs=21,
         else:
             Rs= nu.linspace(rmin,rmax,nrs)
             zs= nu.linspace(zmin,zmax,nzs)
-            potRz= nu.zeros((nrs,nzs))
-            for ii in range(nrs):
-                for jj in range(nzs):
-                    potRz[ii,jj]= evaluateDensities(nu.fabs(Rs[ii]),
-                                                    zs[jj],Pot)
+            Rgrid, zgrid= nu.meshgrid(nu.fabs(Rs),zs,indexing='ij')
+            potRz= evaluateDensities(Rgrid,zgrid,Pot)
             if not savefilename == None:
                 print "Writing savefile "+savefilename+" ..."
                 savefile= open(savefilename,'wb')
@@ -1689,6 +1727,8 @@ def _check_c(Pot):
     PURPOSE:
 
        check whether a potential or list thereof has a C implementation
+       (planar potentials obtained from 3D potentials are checked through
+       their 3D potential)
 
     INPUT:
 
@@ -1703,7 +1743,31 @@ def _check_c(Pot):
        2014-02-17 - Written - Bovy (IAS)
 
     """
-    if isinstance(Pot,list):
-        return nu.all(nu.array([p.hasC for p in Pot],dtype='bool'))
-    elif isinstance(Pot,Potential):
-        return Pot.hasC
+    from galpy.potential_src.planarPotential import \
+        planarPotentialFromRZPotential #here bc of the circular import
+    if not isinstance(Pot,list): Pot= [Pot]
+    for p in Pot:
+        if isinstance(p,planarPotentialFromRZPotential): p= p._RZPot
+        if not getattr(p,'hasC',False): return False
+    return True
+
+def _broadcast_Rz(R,z):
+    """Broadcast R and z against each other and flatten them, returns
+    (R,z,shape,scalarIn) with scalarIn True if R and z were both scalars"""
+    scalarIn= nu.ndim(R) == 0 and nu.ndim(z) == 0
+    R, z= nu.broadcast_arrays(nu.asarray(R,dtype='float'),
+                              nu.asarray(z,dtype='float'))
+    return (R.flatten(),z.flatten(),R.shape,scalarIn)
+
+def _return_Rz(out,shape,scalarIn):
+    """Reshape the output of a calculation on the output of _broadcast_Rz"""
+    if scalarIn: return out[0]
+    else: return out.reshape(shape)
+
+def _chunks(indx,nperpoint):
+    """Split the indices of the points where the boolean array indx is True
+    into chunks, such that arrays with nperpoint values for each point in a
+    chunk remain small"""
+    pts= nu.arange(len(indx))[indx]
+    nchunk= max(1,_MAXCHUNKELEMENTS//nperpoint)
+    return [pts[ii:ii+nchunk] for ii in range(0,len(pts),nchunk)]
@@ -42,7 +42,7 @@ class PowerSphericalPotentialwCutoff(Potential):
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)):
             self.normalize(normalize)
-        self.hasC= False
+        self.hasC= True
 
     def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
         """
@@ -6,7 +6,7 @@
 ###############################################################################
 import numpy as nu
 from scipy import special, integrate
-from Potential import Potential
+from Potential import Potential, _broadcast_Rz, _return_Rz, _chunks
 _TOL= 1.4899999999999999e-15
 _MAXITER= 20
 class RazorThinExponentialDiskPotential(Potential):
@@ -59,6 +59,7 @@ class RazorThinExponentialDiskPotential(Potential):
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)):
             self.normalize(normalize)
+        self.hasC= True
         #Load Kepler potential for large R
         #self._kp= KeplerPotential(normalize=4.*nu.pi/self._alpha**2./self._beta)
 
@@ -87,17 +88,22 @@ class RazorThinExponentialDiskPotential(Potential):
         elif dR != 0 and dphi != 0:
             raise NotImplementedWarning("High-order derivatives for RazorThinExponentialDiskPotential not implemented")
         if self._new:
-            #if R > 6.: return self._kp(R,z)
-            if nu.fabs(z) < 10.**-6.:
-                y= 0.5*self._alpha*R
-                return -nu.pi*R*(special.i0(y)*special.k1(y)-special.i1(y)*special.k0(y))
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
+            out= nu.empty(len(R))
+            zindx= (nu.fabs(z) < 10.**-6.)
+            y= 0.5*self._alpha*R[zindx]
+            out[zindx]= -nu.pi*R[zindx]*(special.i0(y)*special.k1(y)-special.i1(y)*special.k0(y))
             kalphamax= 10.
             ks= kalphamax*0.5*(self._glx+1.)
             weights= kalphamax*self._glw
-            sqrtp= nu.sqrt(z**2.+(ks+R)**2.)
-            sqrtm= nu.sqrt(z**2.+(ks-R)**2.)
-            evalInt= nu.arcsin(2.*ks/(sqrtp+sqrtm))*ks*special.k0(self._alpha*ks)
-            return -2.*self._alpha*nu.sum(weights*evalInt)
+            for pts in _chunks(True^zindx,self._glorder):
+                tR= R[pts,None]
+                tz= z[pts,None]
+                sqrtp= nu.sqrt(tz**2.+(ks+tR)**2.)
+                sqrtm= nu.sqrt(tz**2.+(ks-tR)**2.)
+                evalInt= nu.arcsin(2.*ks/(sqrtp+sqrtm))*ks*special.k0(self._alpha*ks)
+                out[pts]= -2.*self._alpha*nu.sum(weights*evalInt,axis=1)
+            return _return_Rz(out,shape,scalarIn)
         raise NotImplementedError("Not new=True not implemented for RazorThinExponentialDiskPotential")
 
     def _Rforce(self,R,z,phi=0.,t=0.):
@@ -118,26 +124,32 @@ class RazorThinExponentialDiskPotential(Potential):
         """
         if self._new:
             #if R > 6.: return self._kp(R,z)
-            if nu.fabs(z) < 10.**-6.:
-                y= 0.5*self._alpha*R
-                return -2.*nu.pi*y*(special.i0(y)*special.k0(y)-special.i1(y)*special.k1(y))
-            kalphamax1= R
-            ks1= kalphamax1*0.5*(self._glx+1.)
-            weights1= kalphamax1*self._glw
-            sqrtp= nu.sqrt(z**2.+(ks1+R)**2.)
-            sqrtm= nu.sqrt(z**2.+(ks1-R)**2.)
-            evalInt1= ks1**2.*special.k0(ks1*self._alpha)*((ks1+R)/sqrtp-(ks1-R)/sqrtm)/nu.sqrt(R**2.+z**2.-ks1**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
-            if R < 10.:
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
+            out= nu.empty(len(R))
+            zindx= (nu.fabs(z) < 10.**-6.)
+            y= 0.5*self._alpha*R[zindx]
+            out[zindx]= -2.*nu.pi*y*(special.i0(y)*special.k0(y)-special.i1(y)*special.k1(y))
+            for pts in _chunks(True^zindx,2*self._glorder):
+                tR= R[pts,None]
+                tz= z[pts,None]
+                kalphamax1= tR
+                ks1= kalphamax1*0.5*(self._glx+1.)
+                weights1= kalphamax1*self._glw
+                sqrtp= nu.sqrt(tz**2.+(ks1+tR)**2.)
+                sqrtm= nu.sqrt(tz**2.+(ks1-tR)**2.)
+                evalInt1= ks1**2.*special.k0(ks1*self._alpha)*((ks1+tR)/sqrtp-(ks1-tR)/sqrtm)/nu.sqrt(tR**2.+tz**2.-ks1**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
+                #Second part of the integral only for R < 10
                 kalphamax2= 10.
+                kalphamax1= nu.minimum(tR,kalphamax2)
                 ks2= (kalphamax2-kalphamax1)*0.5*(self._glx+1.)+kalphamax1
                 weights2= (kalphamax2-kalphamax1)*self._glw
-                sqrtp= nu.sqrt(z**2.+(ks2+R)**2.)
-                sqrtm= nu.sqrt(z**2.+(ks2-R)**2.)
-                evalInt2= ks2**2.*special.k0(ks2*self._alpha)*((ks2+R)/sqrtp-(ks2-R)/sqrtm)/nu.sqrt(R**2.+z**2.-ks2**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
-                return -2.*nu.sqrt(2.)*self._alpha*nu.sum(weights1*evalInt1
-                                                          +weights2*evalInt2)
-            else:
-                return -2.*nu.sqrt(2.)*self._alpha*nu.sum(weights1*evalInt1)
+                sqrtp= nu.sqrt(tz**2.+(ks2+tR)**2.)
+                sqrtm= nu.sqrt(tz**2.+(ks2-tR)**2.)
+                evalInt2= ks2**2.*special.k0(ks2*self._alpha)*((ks2+tR)/sqrtp-(ks2-tR)/sqrtm)/nu.sqrt(tR**2.+tz**2.-ks2**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
+                out[pts]= -2.*nu.sqrt(2.)*self._alpha*nu.sum(weights1*evalInt1
+                                                             +weights2*evalInt2,
+                                                             axis=1)
+            return _return_Rz(out,shape,scalarIn)
         raise NotImplementedError("Not new=True not implemented for RazorThinExponentialDiskPotential")
 
     def _zforce(self,R,z,phi=0.,t=0.):
@@ -158,25 +170,29 @@ class RazorThinExponentialDiskPotential(Potential):
         """
         if self._new:
             #if R > 6.: return self._kp(R,z)
-            if nu.fabs(z) < 10.**-6.:
-                return 0.
-            kalphamax1= R
-            ks1= kalphamax1*0.5*(self._glx+1.)
-            weights1= kalphamax1*self._glw
-            sqrtp= nu.sqrt(z**2.+(ks1+R)**2.)
-            sqrtm= nu.sqrt(z**2.+(ks1-R)**2.)
-            evalInt1= ks1**2.*special.k0(ks1*self._alpha)*(1./sqrtp+1./sqrtm)/nu.sqrt(R**2.+z**2.-ks1**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
-            if R < 10.:
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
+            out= nu.zeros(len(R))
+            zindx= (nu.fabs(z) < 10.**-6.)
+            for pts in _chunks(True^zindx,2*self._glorder):
+                tR= R[pts,None]
+                tz= z[pts,None]
+                kalphamax1= tR
+                ks1= kalphamax1*0.5*(self._glx+1.)
+                weights1= kalphamax1*self._glw
+                sqrtp= nu.sqrt(tz**2.+(ks1+tR)**2.)
+                sqrtm= nu.sqrt(tz**2.+(ks1-tR)**2.)
+                evalInt1= ks1**2.*special.k0(ks1*self._alpha)*(1./sqrtp+1./sqrtm)/nu.sqrt(tR**2.+tz**2.-ks1**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
+                #Second part of the integral only for R < 10
                 kalphamax2= 10.
+                kalphamax1= nu.minimum(tR,kalphamax2)
                 ks2= (kalphamax2-kalphamax1)*0.5*(self._glx+1.)+kalphamax1
                 weights2= (kalphamax2-kalphamax1)*self._glw
-                sqrtp= nu.sqrt(z**2.+(ks2+R)**2.)
-                sqrtm= nu.sqrt(z**2.+(ks2-R)**2.)
-                evalInt2= ks2**2.*special.k0(ks2*self._alpha)*(1./sqrtp+1./sqrtm)/nu.sqrt(R**2.+z**2.-ks2**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
-                return -z*2.*nu.sqrt(2.)*self._alpha*nu.sum(weights1*evalInt1
-                                                            +weights2*evalInt2)
-            else:
-                return -z*2.*nu.sqrt(2.)*self._alpha*nu.sum(weights1*evalInt1)
+                sqrtp= nu.sqrt(tz**2.+(ks2+tR)**2.)
+                sqrtm= nu.sqrt(tz**2.+(ks2-tR)**2.)
+                evalInt2= ks2**2.*special.k0(ks2*self._alpha)*(1./sqrtp+1./sqrtm)/nu.sqrt(tR**2.+tz**2.-ks2**2.+sqrtp*sqrtm)/(sqrtp+sqrtm)
+                out[pts]= -z[pts]*2.*nu.sqrt(2.)*self._alpha\
+                    *nu.sum(weights1*evalInt1+weights2*evalInt2,axis=1)
+            return _return_Rz(out,shape,scalarIn)
         raise NotImplementedError("Not new=True not implemented for RazorThinExponentialDiskPotential")
 
 
@@ -197,10 +213,12 @@ class RazorThinExponentialDiskPotential(Potential):
            2012-12-27 - Written - Bovy (IAS)
         """
         if self._new:
-            if nu.fabs(z) < 10.**-6.:
+            R, z, shape, scalarIn= _broadcast_Rz(R,z)
+            if nu.all(nu.fabs(z) < 10.**-6.):
                 y= 0.5*self._alpha*R
-                return nu.pi*self._alpha*(special.i0(y)*special.k0(y)-special.i1(y)*special.k1(y)) \
+                out= nu.pi*self._alpha*(special.i0(y)*special.k0(y)-special.i1(y)*special.k1(y)) \
                     +nu.pi/4.*self._alpha**2.*R*(special.i1(y)*(3.*special.k0(y)+special.kn(2,y))-special.k1(y)*(3.*special.i0(y)+special.iv(2,y)))
+                return _return_Rz(out,shape,scalarIn)
             raise NotImplementedError("'R2deriv' for RazorThinExponentialDisk not implemented for z =/= 0")
 
     def _z2deriv(self,R,z,phi=0.,t=0.):
@@ -219,4 +237,5 @@ class RazorThinExponentialDiskPotential(Potential):
         HISTORY:
            2012-12-27 - Written - Bovy (IAS)
         """
-        return nu.infty
+        R, z, shape, scalarIn= _broadcast_Rz(R,z)
+        return _return_Rz(nu.infty*nu.ones(len(R)),shape,scalarIn)
@@ -2,7 +2,8 @@
 #   SteadyLogSpiralPotential: a steady-state spiral potential
 ###############################################################################
 import math
-from planarPotential import planarPotential
+import numpy as nu
+from planarPotential import planarPotential, _smooth
 _degtorad= math.pi/180.
 class SteadyLogSpiralPotential(planarPotential):
     """Class that implements a steady-state spiral potential
@@ -91,18 +92,8 @@ class SteadyLogSpiralPotential(planarPotential):
            2011-03-27 - Started - Bovy (NYU)
         """
         if dR == 0 and dphi == 0:
-            if not self._tform is None:
-                if t < self._tform:
-                    smooth= 0.
-                elif t < self._tsteady:
-                    deltat= t-self._tform
-                    xi= 2.*deltat/(self._tsteady-self._tform)-1.
-                    smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-                else: #spiral is fully on
-                    smooth= 1.
-            else:
-                smooth= 1.
-            return smooth*self._A/self._alpha*math.cos(self._alpha*math.log(R)
+            smooth= _smooth(t,self._tform,self._tsteady)
+            return smooth*self._A/self._alpha*nu.cos(self._alpha*nu.log(R)
                                                    -self._m*(phi-self._omegas*t
                                                              -self._gamma))
         elif dR == 1 and dphi == 0:
@@ -125,18 +116,8 @@ class SteadyLogSpiralPotential(planarPotential):
         HISTORY:
            2010-11-24 - Written - Bovy (NYU)
         """
-        if not self._tform is None:
-            if t < self._tform:
-                smooth= 0.
-            elif t < self._tsteady:
-                deltat= t-self._tform
-                xi= 2.*deltat/(self._tsteady-self._tform)-1.
-                smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-            else: #spiral is fully on
-                smooth= 1.
-        else:
-            smooth= 1.
-        return smooth*self._A/R*math.sin(self._alpha*math.log(R)
+        smooth= _smooth(t,self._tform,self._tsteady)
+        return smooth*self._A/R*nu.sin(self._alpha*nu.log(R)
                                          -self._m*(phi-self._omegas*t
                                                    -self._gamma))
        
@@ -155,18 +136,8 @@ class SteadyLogSpiralPotential(planarPotential):
         HISTORY:
            2010-11-24 - Written - Bovy (NYU)
         """
-        if not self._tform is None:
-            if t < self._tform:
-                smooth= 0.
-            elif t < self._tsteady:
-                deltat= t-self._tform
-                xi= 2.*deltat/(self._tsteady-self._tform)-1.
-                smooth= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
-            else: #spiral is fully on
-                smooth= 1.
-        else:
-            smooth= 1.
-        return -smooth*self._A/self._alpha*self._m*math.sin(self._alpha*math.log(R)
+        smooth= _smooth(t,self._tform,self._tsteady)
+        return -smooth*self._A/self._alpha*self._m*nu.sin(self._alpha*nu.log(R)
                                                            -self._m*(phi
                                                                      -self._omegas*t
                                                                      -self._gamma))
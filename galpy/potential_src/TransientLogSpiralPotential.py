@@ -2,6 +2,7 @@
 #   TransientLogSpiralPotential: a transient spiral potential
 ###############################################################################
 import math
+import numpy as nu
 from planarPotential import planarPotential
 _degtorad= math.pi/180.
 class TransientLogSpiralPotential(planarPotential):
@@ -88,8 +89,8 @@ class TransientLogSpiralPotential(planarPotential):
            2011-03-27 - Started - Bovy (NYU)
         """
         if dR == 0 and dphi == 0:
-            return self._A*math.exp(-(t-self._to)**2./2./self._sigma2)\
-                /self._alpha*math.cos(self._alpha*math.log(R)
+            return self._A*nu.exp(-(t-self._to)**2./2./self._sigma2)\
+                /self._alpha*nu.cos(self._alpha*nu.log(R)
                                       -self._m*(phi-self._omegas*t-self._gamma))
         elif dR == 1 and dphi == 0:
             return -self._Rforce(R,phi=phi,t=t)
@@ -111,8 +112,8 @@ class TransientLogSpiralPotential(planarPotential):
         HISTORY:
            2010-11-24 - Written - Bovy (NYU)
         """
-        return self._A*math.exp(-(t-self._to)**2./2./self._sigma2)\
-            /R*math.sin(self._alpha*math.log(R)
+        return self._A*nu.exp(-(t-self._to)**2./2./self._sigma2)\
+            /R*nu.sin(self._alpha*nu.log(R)
                         -self._m*(phi-self._omegas*t-self._gamma))
     
     def _phiforce(self,R,phi=0.,t=0.):
@@ -130,8 +131,8 @@ class TransientLogSpiralPotential(planarPotential):
         HISTORY:
            2010-11-24 - Written - Bovy (NYU)
         """
-        return -self._A*math.exp(-(t-self._to)**2./2./self._sigma2)\
-            /self._alpha*self._m*math.sin(self._alpha*math.log(R)
+        return -self._A*nu.exp(-(t-self._to)**2./2./self._sigma2)\
+            /self._alpha*self._m*nu.sin(self._alpha*nu.log(R)
                                           -self._m*(phi-self._omegas*t
                                                     -self._gamma))
 
@@ -0,0 +1,143 @@
+#Evaluate potentials, forces, and second derivatives for arrays of points
+#using the C implementations of the potentials
+import ctypes
+import numpy as nu
+from numpy.ctypeslib import ndpointer
+from galpy.potential_src.interpRZPotential import _lib, ext_loaded, \
+    interpRZPotential
+from galpy.potential_src.planarPotential import planarPotentialFromRZPotential
+from galpy.potential_src.DoubleExponentialDiskPotential import \
+    DoubleExponentialDiskPotential
+from galpy.potential_src.SteadyLogSpiralPotential import \
+    SteadyLogSpiralPotential
+from galpy.potential_src.TransientLogSpiralPotential import \
+    TransientLogSpiralPotential
+_QUANTITIES= {'potential':0,'rforce':1,'zforce':2,'phiforce':3}
+_PLANARQUANTITIES= {'rforce':0,'phiforce':1,'r2deriv':2,'phi2deriv':3,
+                    'rphideriv':4}
+#Planar potentials (and their C types) without second derivatives in C
+_NOPLANAR2DERIVS= (TransientLogSpiralPotential,SteadyLogSpiralPotential,
+                   DoubleExponentialDiskPotential)
+_NOPLANAR2DERIVS_TYPES= [2,3,11]
+def eval_potential_array_c(pot,R,z,phi=0.,t=0.,quantity='potential',
+                           numcores=None):
+    """
+    NAME:
+       eval_potential_array_c
+    PURPOSE:
+       Use C to evaluate a potential or its forces for arrays of points
+    INPUT:
+       pot - Potential or list of such instances (must have a C implementation)
+       R - cylindrical Galactocentric distance (float or numpy.ndarray)
+       z - distance above the plane (float or numpy.ndarray)
+       phi= azimuth (float or numpy.ndarray)
+       t= time (float or numpy.ndarray)
+       quantity= 'potential', 'Rforce', 'zforce', or 'phiforce'
+       numcores= (None) number of OpenMP threads to use (default:
+                 OMP_NUM_THREADS or all available cores)
+    OUTPUT:
+       quantity evaluated at (R,z,phi,t) broadcast against each other
+    HISTORY:
+       2026-10-18 - Written
+    """
+    from galpy.orbit_src.integrateFullOrbit import _parse_pot #here bc otherwise there is an infinite loop
+    quantity_c= _QUANTITIES[quantity.lower()]
+    #Parse the potential
+    npot, pot_type, pot_args= _parse_pot(pot,potforactions=(quantity_c == 0))
+    return _eval_c(_lib.eval_potential_array,[R,z,phi,t],
+                   npot,pot_type,pot_args,quantity_c,numcores)
+
+def eval_planarpotential_array_c(pot,R,phi=0.,t=0.,quantity='Rforce',
+                                 numcores=None):
+    """
+    NAME:
+       eval_planarpotential_array_c
+    PURPOSE:
+       Use C to evaluate the forces or second derivatives of a planar
+       potential for arrays of points
+    INPUT:
+       pot - planarPotential or list of such instances (must have a C
+             implementation)
+       R - cylindrical Galactocentric distance (float or numpy.ndarray)
+       phi= azimuth (float or numpy.ndarray)
+       t= time (float or numpy.ndarray)
+       quantity= 'Rforce', 'phiforce', 'R2deriv', 'phi2deriv', or 'Rphideriv'
+       numcores= (None) number of OpenMP threads to use (default:
+                 OMP_NUM_THREADS or all available cores)
+    OUTPUT:
+       quantity evaluated at (R,phi,t) broadcast against each other
+    HISTORY:
+       2026-10-18 - Written
+    """
+    from galpy.orbit_src.integratePlanarOrbit import _parse_pot
+    quantity_c= _PLANARQUANTITIES[quantity.lower()]
+    #Parse the potential
+    npot, pot_type, pot_args= _parse_pot(pot)
+    if quantity_c > 1 and nu.any([p in _NOPLANAR2DERIVS_TYPES for p in pot_type]):
+        raise NotImplementedError("Second derivatives of some of the input potentials are not implemented in C")
+    return _eval_c(_lib.eval_planarpotential_array,[R,phi,t],
+                   npot,pot_type,pot_args,quantity_c,numcores)
+
+def _check_c_array(Pot,quantity='potential',planar=False):
+    """Check whether the C array evaluation can be used for this potential
+    (or list thereof) and quantity"""
+    if not ext_loaded: return False
+    if not isinstance(Pot,list): Pot= [Pot]
+    for p in Pot:
+        if isinstance(p,planarPotentialFromRZPotential): p= p._RZPot
+        if not getattr(p,'hasC',False): return False
+        if planar and _PLANARQUANTITIES[quantity.lower()] > 1 \
+                and isinstance(p,_NOPLANAR2DERIVS):
+            return False
+        #interpolated potentials only have C implementations of what is
+        #interpolated
+        if isinstance(p,interpRZPotential):
+            if planar or not p._enable_c: return False
+            if quantity.lower() == 'potential' and not p._interpPot:
+                return False
+            elif quantity.lower() != 'potential' \
+                    and not (p._interpRforce and p._interpzforce):
+                return False
+    return True
+
+def _eval_c(evalFunc,coords,npot,pot_type,pot_args,quantity_c,numcores):
+    """Run one of the C array evaluations, coords is the list of
+    coordinates that are broadcast against each other"""
+    coords= nu.broadcast_arrays(*[nu.asarray(c,dtype=nu.float64)
+                                  for c in coords])
+    shape= coords[0].shape
+    coords= [nu.require(c.flatten(),dtype=nu.float64,requirements=['C','W'])
+             for c in coords]
+    n= len(coords[0])
+    if numcores is None: numcores= 0 #lets OpenMP decide
+    pot_type= nu.require(pot_type,dtype=nu.int32,requirements=['C','W'])
+    pot_args= nu.require(pot_args,dtype=nu.float64,requirements=['C','W'])
+
+    #Set up result array
+    out= nu.empty(n)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    evalFunc.argtypes= [ctypes.c_int]\
+        +[ndpointer(dtype=nu.float64,flags=ndarrayFlags) for c in coords]\
+        +[ctypes.c_int,
+          ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+          ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+          ctypes.c_int,
+          ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+          ctypes.c_int]
+
+    #Run the C code
+    evalFunc(*([ctypes.c_int(n)]
+               +coords
+               +[ctypes.c_int(npot),
+                 pot_type,
+                 pot_args,
+                 ctypes.c_int(quantity_c),
+                 out,
+                 ctypes.c_int(numcores)]))
+
+    if len(shape) == 0:
+        return out[0]
+    else:
+        return out.reshape(shape)
@@ -6,7 +6,7 @@ import warnings
 import numpy
 from numpy.ctypeslib import ndpointer
 from scipy import interpolate
-from galpy.util import multi, galpyWarning
+from galpy.util import multi, galpyWarning, cache_dir, save_npy
 from Potential import Potential
 _DEBUG= False
 #Find and load the library
@@ -41,7 +41,7 @@ class interpRZPotential(Potential):
                  interpdvcircdr=False,
                  interpepifreq=False,interpverticalfreq=False,
                  use_c=False,enable_c=False,zsym=True,
-                 numcores=None):
+                 numcores=None,cachedir=None):
         """
         NAME:
            __init__
@@ -57,11 +57,13 @@ class interpRZPotential(Potential):
            enable_c= enable use of C for interpolations
            zsym= if True (default), the potential is assumed to be symmetric around z=0 (so you can use, e.g.,  zgrid=(0.,1.,101)).
            numcores= if set to an integer, use this many cores (only used for vcirc, dvcircdR, epifreq, and verticalfreq; NOT NECESSARILY FASTER, TIME TO MAKE SURE)
+           cachedir= if set, cache the interpolation grids (and the C spline coefficients) in this directory, under a key that depends on the parameters of RZPot and on the grids; later instances with the same key load the grids from the (memory-mapped) cache instead of re-computing them
         OUTPUT:
            instance
         HISTORY:
            2010-07-21 - Written - Bovy (NYU)
            2013-01-24 - Started with new implementation - Bovy (IAS)
+           2026-10-18 - Added cachedir
         """
         Potential.__init__(self,amp=1.)
         self.hasC= True
@@ -82,16 +84,11 @@ class interpRZPotential(Potential):
         self._interpverticalfreq= interpverticalfreq
         self._enable_c= enable_c*ext_loaded
         self._zsym= zsym
+        self._cachedir= _grid_cachedir(cachedir,RZPot,rgrid,zgrid,logR,
+                                       use_c*ext_loaded)
         if interpPot:
-            if use_c*ext_loaded:
-                self._potGrid, err= calc_potential_c(self._origPot,self._rgrid,self._zgrid)
-            else:
-                from galpy.potential import evaluatePotentials
-                potGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        potGrid[ii,jj]= evaluatePotentials(self._rgrid[ii],self._zgrid[jj],self._origPot)
-                self._potGrid= potGrid
+            self._potGrid= self._cached_grid('potGrid',self._calc_grid,
+                                             'potential',use_c*ext_loaded)
             if self._logR:
                 self._potInterp= interpolate.RectBivariateSpline(self._logrgrid,
                                                                  self._zgrid,
@@ -103,17 +100,12 @@ class interpRZPotential(Potential):
                                                                  self._potGrid,
                                                                  kx=3,ky=3,s=0.)
             if enable_c*ext_loaded:
-                self._potGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._potGrid)
+                self._potGrid_splinecoeffs= self._cached_grid('potGrid_splinecoeffs',
+                                                              calc_2dsplinecoeffs_c,
+                                                              self._potGrid)
         if interpRforce:
-            if use_c*ext_loaded:
-                self._rforceGrid, err= calc_potential_c(self._origPot,self._rgrid,self._zgrid,rforce=True)
-            else:
-                from galpy.potential import evaluateRforces
-                rforceGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        rforceGrid[ii,jj]= evaluateRforces(self._rgrid[ii],self._zgrid[jj],self._origPot)
-                self._rforceGrid= rforceGrid
+            self._rforceGrid= self._cached_grid('rforceGrid',self._calc_grid,
+                                                'Rforce',use_c*ext_loaded)
             if self._logR:
                 self._rforceInterp= interpolate.RectBivariateSpline(self._logrgrid,
                                                                     self._zgrid,
@@ -125,17 +117,12 @@ class interpRZPotential(Potential):
                                                                     self._rforceGrid,
                                                                     kx=3,ky=3,s=0.)
             if enable_c*ext_loaded:
-                self._rforceGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._rforceGrid)
+                self._rforceGrid_splinecoeffs= self._cached_grid('rforceGrid_splinecoeffs',
+                                                                 calc_2dsplinecoeffs_c,
+                                                                 self._rforceGrid)
         if interpzforce:
-            if use_c*ext_loaded:
-                self._zforceGrid, err= calc_potential_c(self._origPot,self._rgrid,self._zgrid,zforce=True)
-            else:
-                from galpy.potential import evaluatezforces
-                zforceGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        zforceGrid[ii,jj]= evaluatezforces(self._rgrid[ii],self._zgrid[jj],self._origPot)
-                self._zforceGrid= zforceGrid
+            self._zforceGrid= self._cached_grid('zforceGrid',self._calc_grid,
+                                                'zforce',use_c*ext_loaded)
             if self._logR:
                 self._zforceInterp= interpolate.RectBivariateSpline(self._logrgrid,
                                                                     self._zgrid,
@@ -147,18 +134,12 @@ class interpRZPotential(Potential):
                                                                     self._zforceGrid,
                                                                     kx=3,ky=3,s=0.)
             if enable_c*ext_loaded:
-                self._zforceGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._zforceGrid)
+                self._zforceGrid_splinecoeffs= self._cached_grid('zforceGrid_splinecoeffs',
+                                                                 calc_2dsplinecoeffs_c,
+                                                                 self._zforceGrid)
         if interpDens:
-            if False:
-                raise NotImplementedError("Using C to calculate an interpolation grid for the density is not supported currently")
-                self._densGrid, err= calc_dens_c(self._origPot,self._rgrid,self._zgrid)
-            else:
-                from galpy.potential import evaluateDensities
-                densGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        densGrid[ii,jj]= evaluateDensities(self._rgrid[ii],self._zgrid[jj],self._origPot)
-                self._densGrid= densGrid
+            self._densGrid= self._cached_grid('densGrid',self._calc_grid,
+                                              'dens',False)
             if self._logR:
                 self._densInterp= interpolate.RectBivariateSpline(self._logrgrid,
                                                                   self._zgrid,
@@ -172,34 +153,22 @@ class interpRZPotential(Potential):
             if False:
                 self._densGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._densGrid)
         if interpvcirc:
-            from galpy.potential import vcirc
-            if not numcores is None:
-                self._vcircGrid= multi.parallel_map((lambda x: vcirc(self._origPot,self._rgrid[x])),
-                                                    range(len(self._rgrid)),numcores=numcores)
-            else:
-                self._vcircGrid= numpy.array([vcirc(self._origPot,r) for r in self._rgrid])
+            self._vcircGrid= self._cached_grid('vcircGrid',self._calc_grid1d,
+                                               'vcirc',numcores)
             if self._logR:
                 self._vcircInterp= interpolate.InterpolatedUnivariateSpline(self._logrgrid,self._vcircGrid,k=3)
             else:
                 self._vcircInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid,self._vcircGrid,k=3)
         if interpdvcircdr:
-            from galpy.potential import dvcircdR
-            if not numcores is None:
-                self._dvcircdrGrid= multi.parallel_map((lambda x: dvcircdR(self._origPot,self._rgrid[x])),
-                                                       range(len(self._rgrid)),numcores=numcores)
-            else:
-                self._dvcircdrGrid= numpy.array([dvcircdR(self._origPot,r) for r in self._rgrid])
+            self._dvcircdrGrid= self._cached_grid('dvcircdrGrid',self._calc_grid1d,
+                                                  'dvcircdR',numcores)
             if self._logR:
                 self._dvcircdrInterp= interpolate.InterpolatedUnivariateSpline(self._logrgrid,self._dvcircdrGrid,k=3)
             else:
                 self._dvcircdrInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid,self._dvcircdrGrid,k=3)
         if interpepifreq:
-            from galpy.potential import epifreq
-            if not numcores is None:
-                self._epifreqGrid= multi.parallel_map((lambda x: epifreq(self._origPot,self._rgrid[x])),
-                                                      range(len(self._rgrid)),numcores=numcores)
-            else:
-                self._epifreqGrid= numpy.array([epifreq(self._origPot,r) for r in self._rgrid])
+            self._epifreqGrid= self._cached_grid('epifreqGrid',self._calc_grid1d,
+                                                 'epifreq',numcores)
             indx= True-numpy.isnan(self._epifreqGrid)
             if numpy.sum(indx) < 4:
                 if self._logR:
@@ -212,18 +181,61 @@ class interpRZPotential(Potential):
                 else:
                     self._epifreqInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid[indx],self._epifreqGrid[indx],k=3)
         if interpverticalfreq:
-            from galpy.potential import verticalfreq
-            if not numcores is None:
-                self._verticalfreqGrid= multi.parallel_map((lambda x: verticalfreq(self._origPot,self._rgrid[x])),
-                                                       range(len(self._rgrid)),numcores=numcores)
-            else:
-                self._verticalfreqGrid= numpy.array([verticalfreq(self._origPot,r) for r in self._rgrid])
+            self._verticalfreqGrid= self._cached_grid('verticalfreqGrid',self._calc_grid1d,
+                                                      'verticalfreq',numcores)
             if self._logR:
                 self._verticalfreqInterp= interpolate.InterpolatedUnivariateSpline(self._logrgrid,self._verticalfreqGrid,k=3)
             else:
                 self._verticalfreqInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid,self._verticalfreqGrid,k=3)
         return None
                                                  
+    def _cached_grid(self,name,calc_func,*args):
+        """Return the grid name, loaded from the on-disk cache if it exists
+        there, otherwise calculated as calc_func(*args) (and stored in the
+        cache)"""
+        if self._cachedir is None:
+            return calc_func(*args)
+        filename= os.path.join(self._cachedir,name+'.npy')
+        if os.path.exists(filename):
+            return numpy.load(filename,mmap_mode='r')
+        out= numpy.asarray(calc_func(*args),dtype=numpy.float64)
+        save_npy(filename,out)
+        return out
+
+    def _calc_grid(self,quantity,use_c):
+        """Calculate the potential ('potential'), forces ('Rforce',
+        'zforce'), or density ('dens') on the (R,z) grid"""
+        if use_c:
+            return calc_potential_c(self._origPot,self._rgrid,self._zgrid,
+                                    rforce=(quantity == 'Rforce'),
+                                    zforce=(quantity == 'zforce'))[0]
+        from galpy.potential import evaluatePotentials, evaluateRforces, \
+            evaluatezforces, evaluateDensities
+        evalFunc= {'potential':evaluatePotentials,
+                   'Rforce':evaluateRforces,
+                   'zforce':evaluatezforces,
+                   'dens':evaluateDensities}[quantity]
+        out= numpy.zeros((len(self._rgrid),len(self._zgrid)))
+        for ii in range(len(self._rgrid)):
+            for jj in range(len(self._zgrid)):
+                out[ii,jj]= evalFunc(self._rgrid[ii],self._zgrid[jj],
+                                     self._origPot)
+        return out
+
+    def _calc_grid1d(self,quantity,numcores):
+        """Calculate vcirc, dvcircdR, epifreq, or verticalfreq on the R
+        grid"""
+        import galpy.potential
+        evalFunc= getattr(galpy.potential,quantity)
+        if not numcores is None:
+            return multi.parallel_map((lambda x: evalFunc(self._origPot,
+                                                          self._rgrid[x])),
+                                      range(len(self._rgrid)),
+                                      numcores=numcores)
+        else:
+            return numpy.array([evalFunc(self._origPot,r)
+                                for r in self._rgrid])
+
     def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
         if self._interpPot and self._enable_c:
             if isinstance(R,float):
@@ -423,6 +435,12 @@ class interpRZPotential(Potential):
             from galpy.potential import verticalfreq
             return verticalfreq(self._origPot,R)
     
+def _grid_cachedir(cachedir,RZPot,rgrid,zgrid,logR,use_c):
+    """Directory in the on-disk cache that holds the grids for this
+    potential and grid specification (None if not caching)"""
+    return cache_dir(cachedir,RZPot,
+                     (tuple(rgrid),tuple(zgrid),bool(logR),bool(use_c)))
+
 def calc_potential_c(pot,R,z,rforce=False,zforce=False):
     """
     NAME:
@@ -533,55 +551,10 @@ def eval_potential_c(pot,R,z):
        potential evaluated R and z
     HISTORY:
        2013-01-24 - Written - Bovy (IAS)
+       2026-10-18 - Use the general C array evaluation
     """
-    from galpy.orbit_src.integrateFullOrbit import _parse_pot #here bc otherwise there is an infinite loop
-    #Parse the potential
-    npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
-
-    #check input
-    if isinstance(z,float):
-        z= numpy.ones(len(R))*z
-    if isinstance(R,float):
-        R= numpy.ones(len(z))*R
-
-    #Set up result arrays
-    out= numpy.empty((len(R)))
-    err= ctypes.c_int(0)
-
-    #Set up the C code
-    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
-    interppotential_calc_potentialFunc= _lib.eval_potential
-    interppotential_calc_potentialFunc.argtypes= [ctypes.c_int,
-                                                  ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
-                                                  ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
-                                                  ctypes.c_int,
-                                                  ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
-                                                  ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
-                                                  ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
-                                                  ctypes.POINTER(ctypes.c_int)]
-
-    #Array requirements, first store old order
-    f_cont= [R.flags['F_CONTIGUOUS'],
-             z.flags['F_CONTIGUOUS']]
-    R= numpy.require(R,dtype=numpy.float64,requirements=['C','W'])
-    z= numpy.require(z,dtype=numpy.float64,requirements=['C','W'])
-    out= numpy.require(out,dtype=numpy.float64,requirements=['C','W'])
-
-    #Run the C code
-    interppotential_calc_potentialFunc(len(R),
-                                       R,
-                                       z,
-                                       ctypes.c_int(npot),
-                                       pot_type,
-                                       pot_args,
-                                       out,
-                                       ctypes.byref(err))
-    
-    #Reset input arrays
-    if f_cont[0]: R= numpy.asfortranarray(R)
-    if f_cont[1]: z= numpy.asfortranarray(z)
-
-    return (out,err.value)
+    from galpy.potential_src.evaluate_arrays_c import eval_potential_array_c
+    return (eval_potential_array_c(pot,R,z,quantity='potential'),0)
 
 def eval_force_c(pot,R,z,zforce=False):
     """
@@ -598,58 +571,14 @@ def eval_force_c(pot,R,z,zforce=False):
        force evaluated R and z
     HISTORY:
        2013-01-29 - Written - Bovy (IAS)
+       2026-10-18 - Use the general C array evaluation
     """
-    from galpy.orbit_src.integrateFullOrbit import _parse_pot #here bc otherwise there is an infinite loop
-    #Parse the potential
-    npot, pot_type, pot_args= _parse_pot(pot)
-
-    #check input
-    if isinstance(z,float):
-        z= numpy.ones(len(R))*z
-    if isinstance(R,float):
-        R= numpy.ones(len(z))*R
-
-    #Set up result arrays
-    out= numpy.empty((len(R)))
-    err= ctypes.c_int(0)
-
-    #Set up the C code
-    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    from galpy.potential_src.evaluate_arrays_c import eval_potential_array_c
     if zforce:
-        interppotential_calc_forceFunc= _lib.eval_zforce
+        quantity= 'zforce'
     else:
-        interppotential_calc_forceFunc= _lib.eval_rforce
-    interppotential_calc_forceFunc.argtypes= [ctypes.c_int,
-                                                  ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
-                                                  ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
-                                                  ctypes.c_int,
-                                                  ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
-                                                  ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
-                                                  ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
-                                                  ctypes.POINTER(ctypes.c_int)]
-
-    #Array requirements, first store old order
-    f_cont= [R.flags['F_CONTIGUOUS'],
-             z.flags['F_CONTIGUOUS']]
-    R= numpy.require(R,dtype=numpy.float64,requirements=['C','W'])
-    z= numpy.require(z,dtype=numpy.float64,requirements=['C','W'])
-    out= numpy.require(out,dtype=numpy.float64,requirements=['C','W'])
-
-    #Run the C code
-    interppotential_calc_forceFunc(len(R),
-                                   R,
-                                   z,
-                                   ctypes.c_int(npot),
-                                   pot_type,
-                                   pot_args,
-                                   out,
-                                   ctypes.byref(err))
-    
-    #Reset input arrays
-    if f_cont[0]: R= numpy.asfortranarray(R)
-    if f_cont[1]: z= numpy.asfortranarray(z)
-
-    return (out,err.value)
+        quantity= 'Rforce'
+    return (eval_potential_array_c(pot,R,z,quantity=quantity),0)
 
 def sign(x):
     out= numpy.ones_like(x)
@@ -0,0 +1,191 @@
+/*
+  C code for evaluating a potential, its forces, and its second derivatives
+  for arrays of (R,z,phi,t)
+*/
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+//Potentials
+#include <galpy_potentials.h>
+#include <actionAngle.h>
+#include <integrateFullOrbit.h>
+#include <interp_2d.h>
+//Number of points handed to a thread at a time
+#define EVAL_CHUNKSIZE 256
+/*
+  Function declarations
+*/
+void parse_leapFuncArgs(int,struct potentialArg *,int *,double *);
+/*
+  HELPER FUNCTIONS
+*/
+static int set_nthreads(int nthreads,int n){
+  //nthreads <= 0 lets OpenMP decide, never use more threads than chunks
+#ifdef _OPENMP
+  if ( nthreads <= 0 ) nthreads= omp_get_max_threads();
+#else
+  nthreads= 1;
+#endif
+  if ( nthreads > n / EVAL_CHUNKSIZE + 1 ) nthreads= n / EVAL_CHUNKSIZE + 1;
+  if ( nthreads < 1 ) nthreads= 1;
+  return nthreads;
+}
+static void free_potentialArgs(int n,struct potentialArg * potentialArgs){
+  int ii;
+  for (ii=0; ii < n; ii++) {
+    if ( (potentialArgs+ii)->i2d )
+      interp_2d_free((potentialArgs+ii)->i2d) ;
+    if ( (potentialArgs+ii)->acc )
+      gsl_interp_accel_free ((potentialArgs+ii)->acc);
+    if ( (potentialArgs+ii)->i2drforce )
+      interp_2d_free((potentialArgs+ii)->i2drforce) ;
+    if ( (potentialArgs+ii)->accrforce )
+      gsl_interp_accel_free ((potentialArgs+ii)->accrforce);
+    if ( (potentialArgs+ii)->i2dzforce )
+      interp_2d_free((potentialArgs+ii)->i2dzforce) ;
+    if ( (potentialArgs+ii)->acczforce )
+      gsl_interp_accel_free ((potentialArgs+ii)->acczforce);
+    free((potentialArgs+ii)->args);
+  }
+  free(potentialArgs);
+}
+static struct potentialArg * alloc_potentialArgs(int nthreads,int npot){
+  //calloc, such that all interpolation pointers start out as NULL
+  return (struct potentialArg *) calloc ( nthreads * npot,
+					  sizeof (struct potentialArg) );
+}
+/*
+  MAIN FUNCTIONS
+*/
+void eval_potential_array(int n,
+			  double *R,
+			  double *z,
+			  double *phi,
+			  double *t,
+			  int npot,
+			  int * pot_type,
+			  double * pot_args,
+			  int quantity,
+			  double *out,
+			  int nthreads){
+  /*
+    Evaluate the sum of npot potentials for n points
+    Input: R,z,phi,t [n], quantity: 0: potential, 1: Rforce, 2: zforce,
+           3: phiforce
+    Output: out [n]
+  */
+  int ii, jj, tid;
+  double sum;
+  struct potentialArg * thisArgs;
+  nthreads= set_nthreads(nthreads,n);
+  //Set up the potentials, one copy for each thread, because the
+  //interpolation accelerators cannot be shared between threads
+  struct potentialArg * potentialArgs= alloc_potentialArgs(nthreads,npot);
+  for (tid=0; tid < nthreads; tid++)
+    if ( quantity == 0 )
+      parse_actionAngleArgs(npot,potentialArgs+tid*npot,pot_type,pot_args);
+    else
+      parse_leapFuncArgs_Full(npot,potentialArgs+tid*npot,pot_type,pot_args);
+  //Run through the points and evaluate
+#pragma omp parallel for schedule(dynamic,EVAL_CHUNKSIZE) num_threads(nthreads) \
+  private(ii,jj,tid,sum,thisArgs)					\
+  shared(n,R,z,phi,t,npot,potentialArgs,quantity,out)
+  for (ii=0; ii < n; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid= 0;
+#endif
+    thisArgs= potentialArgs+tid*npot;
+    sum= 0.;
+    for (jj=0; jj < npot; jj++){
+      switch ( quantity ) {
+      case 0:
+	sum+= (thisArgs+jj)->potentialEval(*(R+ii),*(z+ii),*(phi+ii),*(t+ii),
+					   thisArgs+jj);
+	break;
+      case 1:
+	sum+= (thisArgs+jj)->Rforce(*(R+ii),*(z+ii),*(phi+ii),*(t+ii),
+				    thisArgs+jj);
+	break;
+      case 2:
+	sum+= (thisArgs+jj)->zforce(*(R+ii),*(z+ii),*(phi+ii),*(t+ii),
+				    thisArgs+jj);
+	break;
+      case 3:
+	sum+= (thisArgs+jj)->phiforce(*(R+ii),*(z+ii),*(phi+ii),*(t+ii),
+				      thisArgs+jj);
+	break;
+      }
+    }
+    *(out+ii)= sum;
+  }
+  free_potentialArgs(nthreads*npot,potentialArgs);
+}
+void eval_planarpotential_array(int n,
+				double *R,
+				double *phi,
+				double *t,
+				int npot,
+				int * pot_type,
+				double * pot_args,
+				int quantity,
+				double *out,
+				int nthreads){
+  /*
+    Evaluate the sum of npot planar potentials for n points
+    Input: R,phi,t [n], quantity: 0: Rforce, 1: phiforce, 2: R2deriv,
+           3: phi2deriv, 4: Rphideriv
+    Output: out [n]
+  */
+  int ii, jj, tid;
+  double sum;
+  struct potentialArg * thisArgs;
+  nthreads= set_nthreads(nthreads,n);
+  //Set up the potentials, one copy for each thread
+  struct potentialArg * potentialArgs= alloc_potentialArgs(nthreads,npot);
+  for (tid=0; tid < nthreads; tid++)
+    parse_leapFuncArgs(npot,potentialArgs+tid*npot,pot_type,pot_args);
+  //Run through the points and evaluate
+#pragma omp parallel for schedule(dynamic,EVAL_CHUNKSIZE) num_threads(nthreads) \
+  private(ii,jj,tid,sum,thisArgs)					\
+  shared(n,R,phi,t,npot,potentialArgs,quantity,out)
+  for (ii=0; ii < n; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid= 0;
+#endif
+    thisArgs= potentialArgs+tid*npot;
+    sum= 0.;
+    for (jj=0; jj < npot; jj++){
+      switch ( quantity ) {
+      case 0:
+	sum+= (thisArgs+jj)->planarRforce(*(R+ii),*(phi+ii),*(t+ii),
+					  thisArgs+jj);
+	break;
+      case 1:
+	sum+= (thisArgs+jj)->planarphiforce(*(R+ii),*(phi+ii),*(t+ii),
+					    thisArgs+jj);
+	break;
+      case 2:
+	sum+= (thisArgs+jj)->planarR2deriv(*(R+ii),*(phi+ii),*(t+ii),
+					   thisArgs+jj);
+	break;
+      case 3:
+	sum+= (thisArgs+jj)->planarphi2deriv(*(R+ii),*(phi+ii),*(t+ii),
+					     thisArgs+jj);
+	break;
+      case 4:
+	sum+= (thisArgs+jj)->planarRphideriv(*(R+ii),*(phi+ii),*(t+ii),
+					     thisArgs+jj);
+	break;
+      }
+    }
+    *(out+ii)= sum;
+  }
+  free_potentialArgs(nthreads*npot,potentialArgs);
+}
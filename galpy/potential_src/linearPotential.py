@@ -12,6 +12,13 @@ class linearPotential:
         self.hasC= False
         return None
 
+    def __setattr__(self,name,value):
+        #Arguments parsed for the C code are no longer valid when a parameter
+        #changes
+        self.__dict__[name]= value
+        if not name == '_c_parsed': self.__dict__.pop('_c_parsed',None)
+        return None
+
     def __call__(self,x,t=0.):
         """
         NAME:
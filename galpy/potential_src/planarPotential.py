@@ -14,6 +14,13 @@ class planarPotential:
         self.hasC= False
         return None
 
+    def __setattr__(self,name,value):
+        #Arguments parsed for the C code are no longer valid when a parameter
+        #changes
+        self.__dict__[name]= value
+        if not name == '_c_parsed': self.__dict__.pop('_c_parsed',None)
+        return None
+
     def __call__(self,R,phi=0.,t=0.,dR=0,dphi=0):
         """
         NAME:
@@ -574,7 +581,7 @@ def evaluateplanarPotentials(R,Pot,phi=None,t=0.,dR=0,dphi=0):
     else:
         raise TypeError("Input to 'evaluateplanarPotentials' is neither a Potential-instance or a list of such instances")
 
-def evaluateplanarRforces(R,Pot,phi=None,t=0.):
+def evaluateplanarRforces(R,Pot,phi=None,t=0.,use_c=False):
     """
     NAME:
 
@@ -594,6 +601,9 @@ def evaluateplanarRforces(R,Pot,phi=None,t=0.):
 
        t= time (optional)
 
+       use_c= (False) if True, evaluate using the C implementations of the
+              potentials for arrays of points, if they all have one
+
     OUTPUT:
 
        F_R(R(,phi,t))
@@ -602,6 +612,8 @@ def evaluateplanarRforces(R,Pot,phi=None,t=0.):
 
        2010-07-13 - Written - Bovy (NYU)
 
+       2026-10-18 - Added use_c
+
     """
     isList= isinstance(Pot,list)
     if isList:
@@ -611,6 +623,13 @@ def evaluateplanarRforces(R,Pot,phi=None,t=0.):
         nonAxi= Pot.isNonAxi
     if nonAxi and phi is None:
         raise PotentialError("The (list of) planarPotential instances is non-axisymmetric, but you did not provide phi")
+    if use_c:
+        from evaluate_arrays_c import _check_c_array, \
+            eval_planarpotential_array_c
+        if _check_c_array(Pot,quantity='Rforce',planar=True):
+            if phi is None: phi= 0.
+            return eval_planarpotential_array_c(Pot,R,phi=phi,t=t,
+                                                quantity='Rforce')
     if isinstance(Pot,list):
         sum= 0.
         for pot in Pot:
@@ -627,7 +646,7 @@ def evaluateplanarRforces(R,Pot,phi=None,t=0.):
     else:
         raise TypeError("Input to 'evaluateplanarRforces' is neither a Potential-instance or a list of such instances")
 
-def evaluateplanarphiforces(R,Pot,phi=None,t=0.):
+def evaluateplanarphiforces(R,Pot,phi=None,t=0.,use_c=False):
     """
     NAME:
 
@@ -647,6 +666,9 @@ def evaluateplanarphiforces(R,Pot,phi=None,t=0.):
 
        t= time (optional)
 
+       use_c= (False) if True, evaluate using the C implementations of the
+              potentials for arrays of points, if they all have one
+
     OUTPUT:
 
        F_phi(R(,phi,t))
@@ -655,6 +677,8 @@ def evaluateplanarphiforces(R,Pot,phi=None,t=0.):
 
        2010-07-13 - Written - Bovy (NYU)
 
+       2026-10-18 - Added use_c
+
     """
     isList= isinstance(Pot,list)
     if isList:
@@ -664,6 +688,13 @@ def evaluateplanarphiforces(R,Pot,phi=None,t=0.):
         nonAxi= Pot.isNonAxi
     if nonAxi and phi is None:
         raise PotentialError("The (list of) planarPotential instances is non-axisymmetric, but you did not provide phi")
+    if use_c:
+        from evaluate_arrays_c import _check_c_array, \
+            eval_planarpotential_array_c
+        if _check_c_array(Pot,quantity='phiforce',planar=True):
+            if phi is None: phi= 0.
+            return eval_planarpotential_array_c(Pot,R,phi=phi,t=t,
+                                                quantity='phiforce')
     if isinstance(Pot,list):
         sum= 0.
         for pot in Pot:
@@ -680,7 +711,7 @@ def evaluateplanarphiforces(R,Pot,phi=None,t=0.):
     else:
         raise TypeError("Input to 'evaluateplanarphiforces' is neither a Potential-instance or a list of such instances")
 
-def evaluateplanarR2derivs(R,Pot,phi=None,t=0.):
+def evaluateplanarR2derivs(R,Pot,phi=None,t=0.,use_c=False):
     """
     NAME:
 
@@ -700,6 +731,9 @@ def evaluateplanarR2derivs(R,Pot,phi=None,t=0.):
 
        t= time (optional)
 
+       use_c= (False) if True, evaluate using the C implementations of the
+              potentials for arrays of points, if they all have one
+
     OUTPUT:
 
        F_R(R(,phi,t))
@@ -708,6 +742,8 @@ def evaluateplanarR2derivs(R,Pot,phi=None,t=0.):
 
        2010-10-09 - Written - Bovy (IAS)
 
+       2026-10-18 - Added use_c
+
     """
     isList= isinstance(Pot,list)
     if isList:
@@ -717,6 +753,13 @@ def evaluateplanarR2derivs(R,Pot,phi=None,t=0.):
         nonAxi= Pot.isNonAxi
     if nonAxi and phi is None:
         raise PotentialError("The (list of) planarPotential instances is non-axisymmetric, but you did not provide phi")
+    if use_c:
+        from evaluate_arrays_c import _check_c_array, \
+            eval_planarpotential_array_c
+        if _check_c_array(Pot,quantity='R2deriv',planar=True):
+            if phi is None: phi= 0.
+            return eval_planarpotential_array_c(Pot,R,phi=phi,t=t,
+                                                quantity='R2deriv')
     if isinstance(Pot,list):
         sum= 0.
         for pot in Pot:
@@ -875,3 +918,23 @@ def plotplanarPotentials(Pot,*args,**kwargs):
         return plot.bovy_plot(Rs,potR,*args,**kwargs)
                               
     
+
+def _smooth(t,tform,tsteady):
+    """Smooth growth factor of a perturbation that is grown between tform
+    and tsteady (Dehnen 2000), for scalar or array t"""
+    if tform is None: return 1.
+    if not isinstance(t,nu.ndarray):
+        if t < tform:
+            return 0.
+        elif t < tsteady:
+            deltat= t-tform
+            xi= 2.*deltat/(tsteady-tform)-1.
+            return (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
+        else: #fully on
+            return 1.
+    out= nu.ones(t.shape)
+    out[(t < tform)]= 0.
+    indx= (t >= tform)*(t < tsteady)
+    xi= 2.*(t[indx]-tform)/(tsteady-tform)-1.
+    out[indx]= (3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5)
+    return out
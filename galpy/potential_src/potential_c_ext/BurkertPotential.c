@@ -0,0 +1,68 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//BurkertPotential
+//2 arguments: amp, a
+double BurkertPotentialEval(double R,double Z, double phi,
+			    double t,
+			    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //Calculate potential
+  double x= sqrt(R*R+Z*Z)/a;
+  return - amp * M_PI * a * a * ( 2. * ( 1. + x ) / x * atan(x)
+				  + 2. * ( 1. + x ) / x * log(1. + x)
+				  - ( x - 1. ) / x * log(1. + x * x));
+}
+double BurkertPotentialRforce(double R,double Z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //Calculate Rforce
+  double r= sqrt(R*R+Z*Z);
+  double x= r/a;
+  return - amp * M_PI * a * a * a / r / r
+    * ( 2. * log(1. + x) + log(1. + x * x) - 2. * atan(x)) * R / r;
+}
+double BurkertPotentialPlanarRforce(double R,double phi,
+				    double t,
+				    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //Calculate Rforce
+  double x= R/a;
+  return - amp * M_PI * a * a * a / R / R
+    * ( 2. * log(1. + x) + log(1. + x * x) - 2. * atan(x));
+}
+double BurkertPotentialzforce(double R,double Z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //Calculate zforce
+  double r= sqrt(R*R+Z*Z);
+  double x= r/a;
+  return - amp * M_PI * a * a * a / r / r
+    * ( 2. * log(1. + x) + log(1. + x * x) - 2. * atan(x)) * Z / r;
+}
+double BurkertPotentialPlanarR2deriv(double R,double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //Calculate R2deriv
+  double x= R/a;
+  return amp * M_PI * ( 4. * x * x * x / ( 1. + x + x * x + x * x * x )
+			+ 4. * atan(x) - 4. * log(1. + x)
+			- 2. * log(1. + x * x)) / x / x / x;
+}
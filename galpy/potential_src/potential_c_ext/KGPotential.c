@@ -0,0 +1,15 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//KGPotential (one-dimensional)
+//4 arguments: amp, K, F, D^2
+double KGPotentialLinearForce(double x, double t,
+			      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double K= *args++;
+  double F= *args++;
+  double D2= *args;
+  //Calculate force
+  return - amp * x * ( K / sqrt(x * x + D2) + 2. * F );
+}
@@ -0,0 +1,103 @@
+#include <math.h>
+#include <galpy_potentials.h>
+#include <cubic_spline_fitpack.h>
+//MovingObjectPotential
+//5 + 3 or 5 + 4 x nknots arguments: amp, GM, softening type, softening
+//length, nknots, followed by R, phi, z of a static object (nknots=0) or by
+//the knots and the coefficients of the cubic splines of R(t), phi(t), and
+//z(t) along the orbit of the object (FITPACK knots and coefficients, each
+//of length nknots)
+//Softening types: 0: Plummer
+static double softening_potential(double d2,int type,double eps){
+  //Softened potential (without GM) at squared distance d2
+  switch ( type ) {
+  case 0: //Plummer
+    return 1. / sqrt(d2 + eps * eps);
+  }
+  return -1.;
+}
+static double softening_force_over_d(double d2,int type,double eps){
+  //Softened force divided by the distance (without GM) at squared distance d2
+  switch ( type ) {
+  case 0: //Plummer
+    return pow(d2 + eps * eps,-1.5);
+  }
+  return -1.;
+}
+static void object_position(double t,double * args,
+			    double * x,double * y,double * z){
+  //Rectangular coordinates of the object at time t
+  int nknots= (int) *args++;
+  double R, phi;
+  if ( nknots == 0 ) {
+    R= *args++;
+    phi= *args++;
+    *z= *args;
+  }
+  else {
+    R= cubic_spline_fitpack_1d(t,nknots,args,args+nknots);
+    phi= cubic_spline_fitpack_1d(t,nknots,args,args+2*nknots);
+    *z= cubic_spline_fitpack_1d(t,nknots,args,args+3*nknots);
+  }
+  *x= R * cos(phi);
+  *y= R * sin(phi);
+}
+static double object_force_over_d(double R,double Z,double phi,double t,
+				  double * args,
+				  double * xd,double * yd,double * zd){
+  //Difference vector between the object and the point and the softened
+  //force divided by the distance
+  double amp= *args++;
+  double GM= *args++;
+  int type= (int) *args++;
+  double eps= *args++;
+  double x, y, z;
+  object_position(t,args,&x,&y,&z);
+  *xd= x - R * cos(phi);
+  *yd= y - R * sin(phi);
+  *zd= z - Z;
+  return amp * GM * softening_force_over_d(*xd * *xd + *yd * *yd + *zd * *zd,
+					   type,eps);
+}
+double MovingObjectPotentialEval(double R,double Z, double phi,
+				 double t,
+				 struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double GM= *args++;
+  int type= (int) *args++;
+  double eps= *args++;
+  double x, y, z, xd, yd, zd;
+  //Calculate potential
+  object_position(t,args,&x,&y,&z);
+  xd= x - R * cos(phi);
+  yd= y - R * sin(phi);
+  zd= z - Z;
+  return - amp * GM * softening_potential(xd * xd + yd * yd + zd * zd,
+					  type,eps);
+}
+double MovingObjectPotentialRforce(double R,double Z, double phi,
+				   double t,
+				   struct potentialArg * potentialArgs){
+  double xd, yd, zd;
+  double forceoverd= object_force_over_d(R,Z,phi,t,potentialArgs->args,
+					 &xd,&yd,&zd);
+  return forceoverd * ( cos(phi) * xd + sin(phi) * yd );
+}
+double MovingObjectPotentialzforce(double R,double Z, double phi,
+				   double t,
+				   struct potentialArg * potentialArgs){
+  double xd, yd, zd;
+  double forceoverd= object_force_over_d(R,Z,phi,t,potentialArgs->args,
+					 &xd,&yd,&zd);
+  return forceoverd * zd;
+}
+double MovingObjectPotentialphiforce(double R,double Z, double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  double xd, yd, zd;
+  double forceoverd= object_force_over_d(R,Z,phi,t,potentialArgs->args,
+					 &xd,&yd,&zd);
+  return forceoverd * R * ( cos(phi) * yd - sin(phi) * xd );
+}
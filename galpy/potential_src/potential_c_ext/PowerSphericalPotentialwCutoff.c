@@ -0,0 +1,73 @@
+#include <math.h>
+#include <gsl/gsl_sf_gamma.h>
+#include <galpy_potentials.h>
+//PowerSphericalPotentialwCutoff
+//3 arguments: amp, alpha, rc
+static double mass(double r,double alpha,double rc){
+  //Helper function that has the mass (without amp)
+  return 2. * M_PI * pow(rc,3. - alpha) * gsl_sf_gamma(1.5 - 0.5 * alpha)
+    * gsl_sf_gamma_inc_P(1.5 - 0.5 * alpha, r * r / rc / rc);
+}
+double PowerSphericalPotentialwCutoffEval(double R,double Z, double phi,
+					  double t,
+					  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double alpha= *args++;
+  double rc= *args;
+  //Calculate potential
+  double r= sqrt(R*R+Z*Z);
+  return amp * 2. * M_PI * pow(rc,3. - alpha) / r
+    * ( r / rc * gsl_sf_gamma(1. - 0.5 * alpha)
+	* gsl_sf_gamma_inc_P(1. - 0.5 * alpha, r * r / rc / rc)
+	- gsl_sf_gamma(1.5 - 0.5 * alpha)
+	* gsl_sf_gamma_inc_P(1.5 - 0.5 * alpha, r * r / rc / rc));
+}
+double PowerSphericalPotentialwCutoffRforce(double R,double Z, double phi,
+					    double t,
+					    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double alpha= *args++;
+  double rc= *args;
+  //Calculate Rforce
+  double r= sqrt(R*R+Z*Z);
+  return - amp * mass(r,alpha,rc) * R / r / r / r;
+}
+double PowerSphericalPotentialwCutoffPlanarRforce(double R,double phi,
+						  double t,
+						  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double alpha= *args++;
+  double rc= *args;
+  //Calculate Rforce
+  return - amp * mass(R,alpha,rc) / R / R;
+}
+double PowerSphericalPotentialwCutoffzforce(double R,double Z, double phi,
+					    double t,
+					    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double alpha= *args++;
+  double rc= *args;
+  //Calculate zforce
+  double r= sqrt(R*R+Z*Z);
+  return - amp * mass(r,alpha,rc) * Z / r / r / r;
+}
+double PowerSphericalPotentialwCutoffPlanarR2deriv(double R,double phi,
+						   double t,
+						   struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double alpha= *args++;
+  double rc= *args;
+  //Calculate R2deriv
+  return amp * ( 4. * M_PI * pow(R,-alpha) * exp(-R * R / rc / rc)
+		 - 2. * mass(R,alpha,rc) / R / R / R);
+}
@@ -0,0 +1,129 @@
+#include <math.h>
+#include <gsl/gsl_sf_bessel.h>
+#include <galpy_potentials.h>
+//RazorThinExponentialDiskPotential
+//2 + 2 x glorder arguments: amp, alpha, glorder, glx[glorder], glw[glorder]
+//(Gauss-Legendre points and weights on [-1,1] for the integrals off the
+//plane); the products of the Bessel functions in the plane are calculated
+//using the scaled Bessel functions, which do not overflow
+static double besselK0(double x){
+  return gsl_sf_bessel_K0_scaled(x) * exp(-x);
+}
+double RazorThinExponentialDiskPotentialEval(double R,double Z, double phi,
+					     double t,
+					     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double alpha= *args++;
+  int glorder= (int) *args++;
+  double * glx= args;
+  double * glw= args+glorder;
+  int ii;
+  double y, k, sqrtp, sqrtm, out;
+  double kalphamax= 10.;
+  //Calculate potential
+  if ( fabs(Z) < 1.e-6 ) {
+    y= 0.5 * alpha * R;
+    return - amp * M_PI * R
+      * ( gsl_sf_bessel_I0_scaled(y) * gsl_sf_bessel_K1_scaled(y)
+	  - gsl_sf_bessel_I1_scaled(y) * gsl_sf_bessel_K0_scaled(y));
+  }
+  out= 0.;
+  for (ii=0; ii < glorder; ii++) {
+    k= 0.5 * kalphamax * ( *(glx+ii) + 1. );
+    sqrtp= sqrt(Z * Z + ( k + R ) * ( k + R ));
+    sqrtm= sqrt(Z * Z + ( k - R ) * ( k - R ));
+    out+= kalphamax * *(glw+ii) * asin(2. * k / ( sqrtp + sqrtm )) * k
+      * besselK0(alpha * k);
+  }
+  return - amp * 2. * alpha * out;
+}
+static double RzforceIntegral(double R,double Z,double alpha,int glorder,
+			      double * glx,double * glw,int zforce){
+  //Integral for the R (zforce=0) or z (zforce=1) force off the plane,
+  //split into [0,R] and [min(R,10),10]
+  int ii, jj;
+  double k, kmin, kmax, w, sqrtp, sqrtm, out= 0.;
+  for (jj=0; jj < 2; jj++) {
+    if ( jj == 0 ) {
+      kmin= 0.;
+      kmax= R;
+    }
+    else {
+      kmin= ( R < 10. ) ? R : 10.;
+      kmax= 10.;
+    }
+    for (ii=0; ii < glorder; ii++) {
+      k= ( kmax - kmin ) * 0.5 * ( *(glx+ii) + 1. ) + kmin;
+      w= ( kmax - kmin ) * *(glw+ii);
+      sqrtp= sqrt(Z * Z + ( k + R ) * ( k + R ));
+      sqrtm= sqrt(Z * Z + ( k - R ) * ( k - R ));
+      out+= w * k * k * besselK0(k * alpha)
+	* ( zforce ? 1. / sqrtp + 1. / sqrtm
+	    : ( k + R ) / sqrtp - ( k - R ) / sqrtm )
+	/ sqrt(R * R + Z * Z - k * k + sqrtp * sqrtm) / ( sqrtp + sqrtm );
+    }
+  }
+  return out;
+}
+double RazorThinExponentialDiskPotentialRforce(double R,double Z, double phi,
+					       double t,
+					       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double alpha= *args++;
+  int glorder= (int) *args++;
+  double * glx= args;
+  double * glw= args+glorder;
+  double y;
+  //Calculate Rforce
+  if ( fabs(Z) < 1.e-6 ) {
+    y= 0.5 * alpha * R;
+    return - amp * 2. * M_PI * y
+      * ( gsl_sf_bessel_I0_scaled(y) * gsl_sf_bessel_K0_scaled(y)
+	  - gsl_sf_bessel_I1_scaled(y) * gsl_sf_bessel_K1_scaled(y));
+  }
+  return - amp * 2. * M_SQRT2 * alpha
+    * RzforceIntegral(R,Z,alpha,glorder,glx,glw,0);
+}
+double RazorThinExponentialDiskPotentialPlanarRforce(double R,double phi,
+						     double t,
+						     struct potentialArg * potentialArgs){
+  return RazorThinExponentialDiskPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double RazorThinExponentialDiskPotentialzforce(double R,double Z, double phi,
+					       double t,
+					       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double alpha= *args++;
+  int glorder= (int) *args++;
+  double * glx= args;
+  double * glw= args+glorder;
+  //Calculate zforce
+  if ( fabs(Z) < 1.e-6 ) return 0.;
+  return - amp * Z * 2. * M_SQRT2 * alpha
+    * RzforceIntegral(R,Z,alpha,glorder,glx,glw,1);
+}
+double RazorThinExponentialDiskPotentialPlanarR2deriv(double R,double phi,
+						      double t,
+						      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double alpha= *args;
+  //Calculate R2deriv
+  double y= 0.5 * alpha * R;
+  double I0= gsl_sf_bessel_I0_scaled(y);
+  double I1= gsl_sf_bessel_I1_scaled(y);
+  double I2= gsl_sf_bessel_In_scaled(2,y);
+  double K0= gsl_sf_bessel_K0_scaled(y);
+  double K1= gsl_sf_bessel_K1_scaled(y);
+  double K2= gsl_sf_bessel_Kn_scaled(2,y);
+  return amp * ( M_PI * alpha * ( I0 * K0 - I1 * K1 )
+		 + 0.25 * M_PI * alpha * alpha * R
+		 * ( I1 * ( 3. * K0 + K2 ) - K1 * ( 3. * I0 + I2 )));
+}
@@ -30,6 +30,8 @@ struct potentialArg{
 			    struct potentialArg *);
   double (*planarRphideriv)(double R,double phi, double t,
 			    struct potentialArg *);
+  double (*linearForce)(double x, double t,
+			struct potentialArg *);
   int nargs;
   double * args;
   interp_2d * i2d;
@@ -194,4 +196,49 @@ double IsochronePotentialzforce(double,double,double,double,
 				struct potentialArg *);
 double IsochronePotentialPlanarR2deriv(double ,double, double,
 				       struct potentialArg *);
+//BurkertPotential
+double BurkertPotentialEval(double ,double , double, double,
+			    struct potentialArg *);
+double BurkertPotentialRforce(double ,double , double, double,
+			      struct potentialArg *);
+double BurkertPotentialPlanarRforce(double ,double, double,
+				    struct potentialArg *);
+double BurkertPotentialzforce(double,double,double,double,
+			      struct potentialArg *);
+double BurkertPotentialPlanarR2deriv(double ,double, double,
+				     struct potentialArg *);
+//PowerSphericalPotentialwCutoff
+double PowerSphericalPotentialwCutoffEval(double ,double , double, double,
+					  struct potentialArg *);
+double PowerSphericalPotentialwCutoffRforce(double ,double , double, double,
+					    struct potentialArg *);
+double PowerSphericalPotentialwCutoffPlanarRforce(double ,double, double,
+						  struct potentialArg *);
+double PowerSphericalPotentialwCutoffzforce(double,double,double,double,
+					    struct potentialArg *);
+double PowerSphericalPotentialwCutoffPlanarR2deriv(double ,double, double,
+						   struct potentialArg *);
+//RazorThinExponentialDiskPotential
+double RazorThinExponentialDiskPotentialEval(double ,double , double, double,
+					     struct potentialArg *);
+double RazorThinExponentialDiskPotentialRforce(double ,double , double, double,
+					       struct potentialArg *);
+double RazorThinExponentialDiskPotentialPlanarRforce(double ,double, double,
+						     struct potentialArg *);
+double RazorThinExponentialDiskPotentialzforce(double,double,double,double,
+					       struct potentialArg *);
+double RazorThinExponentialDiskPotentialPlanarR2deriv(double ,double, double,
+						      struct potentialArg *);
+//MovingObjectPotential
+double MovingObjectPotentialEval(double ,double , double, double,
+				 struct potentialArg *);
+double MovingObjectPotentialRforce(double ,double , double, double,
+				   struct potentialArg *);
+double MovingObjectPotentialzforce(double,double,double,double,
+				   struct potentialArg *);
+double MovingObjectPotentialphiforce(double,double,double,double,
+				     struct potentialArg *);
+//KGPotential
+double KGPotentialLinearForce(double,double,
+			      struct potentialArg *);
 #endif /* galpy_potentials.h */
@@ -1,8 +1,20 @@
+import warnings
 import numpy as nu
 from galpy.orbit import Orbit
 from galpy.potential_src.planarPotential import RZToplanarPotential
+from galpy.potential_src.Potential import _check_c
+from galpy.util import galpyWarning
 import galpy.util.bovy_plot as plot
 from directnbody import direct_nbody
+from bhtree import bhtree_nbody
+try:
+    from directnbody_c import direct_nbody_c, bhtree_nbody_c
+except IOError:
+    warnings.warn("direct_nbody_c extension module not loaded",
+                  galpyWarning)
+    ext_loaded= False
+else:
+    ext_loaded= True
 class Snapshot:
     """General snapshot = collection of particles class"""
     def __init__(self,*args,**kwargs):
@@ -39,16 +51,52 @@ class Snapshot:
         INPUT:
            t - numpy.array of times to save the snapshots at (must start at 0)
            pot= potential object or list of such objects (default=None)
-           method= method to use ('test-particle' or 'direct-python' for now)
+           method= method to use ('test-particle', 'direct-python',
+                   'direct-c', 'tree-python', or 'tree-c' [Barnes-Hut
+                   tree]); the C methods require a 3D snapshot and a
+                   potential with a C implementation ('direct-c' and
+                   'tree-c' fall back onto 'direct-python' and
+                   'tree-python' otherwise)
+           Keywords for the N-body methods:
+              softening_model= type of softening to use ('plummer'; C
+                               methods also take a PlummerSoftening instance)
+              softening_length= softening length (default: 0.01)
+              'direct-c', 'tree-python', and 'tree-c' only:
+              ndt= (1) number of steps per output interval
+              'direct-c' and 'tree-c' only:
+              numcores= (None) number of OpenMP threads to use
+              'tree-python' and 'tree-c' only:
+              opening_angle= (0.7) opening angle of the tree
         OUTPUT:
            list of snapshots at times t
         HISTORY:
            2011-02-02 - Written - Bovy (NYU)
+           2026-10-18 - Added 'direct-c' and 'tree-c'
+           2026-10-18 - Added 'tree-python'
         """
         if method.lower() == 'test-particle':
             return self._integrate_test_particle(t,pot)
         elif method.lower() == 'direct-python':
             return self._integrate_direct_python(t,pot,**kwargs)
+        elif method.lower() == 'direct-c':
+            if ext_loaded and self.orbits[0].dim() == 3 \
+                    and (pot is None or _check_c(pot)):
+                return self._integrate_direct_c(t,pot,**kwargs)
+            warnings.warn("Cannot use C N-body code (using direct-python instead)",
+                          galpyWarning)
+            kwargs.pop('ndt',None)
+            kwargs.pop('numcores',None)
+            return self._integrate_direct_python(t,pot,**kwargs)
+        elif method.lower() == 'tree-python':
+            return self._integrate_tree_python(t,pot,**kwargs)
+        elif method.lower() == 'tree-c':
+            if ext_loaded and self.orbits[0].dim() == 3 \
+                    and (pot is None or _check_c(pot)):
+                return self._integrate_tree_c(t,pot,**kwargs)
+            warnings.warn("Cannot use C N-body code (using tree-python instead)",
+                          galpyWarning)
+            kwargs.pop('numcores',None)
+            return self._integrate_tree_python(t,pot,**kwargs)
 
     def _integrate_test_particle(self,t,pot):
         """Integrate the snapshot as a set of test particles in an external \
@@ -68,7 +116,38 @@ class Snapshot:
     def _integrate_direct_python(self,t,pot,**kwargs):
         """Integrate the snapshot using a direct force summation method \
         written entirely in python"""
-        #Prepare input for direct_nbody
+        q, p, thispot= self._rect_phasespace(pot)
+        #Run simulation
+        nbody_out= direct_nbody(q,p,self.masses,t,pot=thispot,**kwargs)
+        return self._snapshots_from_rect(nbody_out)
+
+    def _integrate_direct_c(self,t,pot,**kwargs):
+        """Integrate the snapshot using a direct force summation method \
+        written in C"""
+        q, p, thispot= self._rect_phasespace(pot)
+        #Run simulation
+        nbody_out= direct_nbody_c(q,p,self.masses,t,pot=thispot,**kwargs)
+        return self._snapshots_from_rect(nbody_out)
+
+    def _integrate_tree_python(self,t,pot,**kwargs):
+        """Integrate the snapshot using a Barnes-Hut tree code written \
+        entirely in python"""
+        q, p, thispot= self._rect_phasespace(pot)
+        #Run simulation
+        nbody_out= bhtree_nbody(q,p,self.masses,t,pot=thispot,**kwargs)
+        return self._snapshots_from_rect(nbody_out)
+
+    def _integrate_tree_c(self,t,pot,**kwargs):
+        """Integrate the snapshot using a Barnes-Hut tree code written in \
+        C"""
+        q, p, thispot= self._rect_phasespace(pot)
+        #Run simulation
+        nbody_out= bhtree_nbody_c(q,p,self.masses,t,pot=thispot,**kwargs)
+        return self._snapshots_from_rect(nbody_out)
+
+    def _rect_phasespace(self,pot):
+        """Prepare the input for the N-body codes: rectangular positions and \
+        momenta and the external potential"""
         q= []
         p= []
         nq= len(self.orbits)
@@ -82,25 +161,29 @@ class Snapshot:
         for ii in range(nq):
             #Transform to rectangular frame
             if dim == 1:
-                thisq= nu.array([self.orbits[ii].x()]).flatten()
-                thisp= nu.array([self.orbits[ii].vx()]).flatten()
+                thisq= nu.hstack([self.orbits[ii].x()])
+                thisp= nu.hstack([self.orbits[ii].vx()])
             elif dim == 2:
-                thisq= nu.array([self.orbits[ii].x(),
-                                 self.orbits[ii].y()]).flatten()
-                thisp= nu.array([self.orbits[ii].vx(),
-                                 self.orbits[ii].vy()]).flatten()
+                thisq= nu.hstack([self.orbits[ii].x(),
+                                  self.orbits[ii].y()])
+                thisp= nu.hstack([self.orbits[ii].vx(),
+                                  self.orbits[ii].vy()])
             elif dim == 3:
-                thisq= nu.array([self.orbits[ii].x(),
-                                 self.orbits[ii].y(),
-                                 self.orbits[ii].z()]).flatten()
-                thisp= nu.array([self.orbits[ii].vx(),
-                                 self.orbits[ii].vy(),
-                                 self.orbits[ii].vz()]).flatten()
+                thisq= nu.hstack([self.orbits[ii].x(),
+                                  self.orbits[ii].y(),
+                                  self.orbits[ii].z()])
+                thisp= nu.hstack([self.orbits[ii].vx(),
+                                  self.orbits[ii].vy(),
+                                  self.orbits[ii].vz()])
             q.append(thisq)
             p.append(thisp)
-        #Run simulation
-        nbody_out= direct_nbody(q,p,self.masses,t,pot=thispot,**kwargs)
-        #Post-process output
+        return (q,p,thispot)
+
+    def _snapshots_from_rect(self,nbody_out):
+        """Turn the output of the N-body codes back into a list of \
+        snapshots"""
+        nq= len(self.orbits)
+        dim= self.orbits[0].dim()
         nt= len(nbody_out)
         out= []
         for ii in range(nt):
@@ -0,0 +1,165 @@
+#Barnes-Hut tree N-body code, python implementation
+import numpy as nu
+import galpy.util.bovy_symplecticode as symplecticode
+from galpy.potential_src.ForceSoftening import ForceSoftening
+from directnbody import _external_force, _plummer_soft
+_MAXDEPTH= 64 #particles that end up in the same cell at this depth share a leaf
+def bhtree_nbody(q,p,m,t,pot=None,softening_model='plummer',
+                 softening_length=None,opening_angle=0.7,ndt=1):
+    """
+    NAME:
+       bhtree_nbody
+    PURPOSE:
+       N-body code using a Barnes-Hut tree for force evaluation (python
+       version of bhtree_nbody_c)
+    INPUT:
+       q - list of initial positions (numpy.ndarrays)
+       p - list of initial momenta (numpy.ndarrays)
+       m - list of masses
+       t - times at which output is desired
+       pot= external potential (galpy.potential or list of galpy.potentials)
+       softening_model=  type of softening to use ('plummer' or a
+                         ForceSoftening instance)
+       softening_length= (optional)
+       opening_angle= (0.7) opening angle of the tree; cells are opened
+                      when size/distance > opening_angle; 0 is direct
+                      summation
+       ndt= (1) number of drift-kick-drift steps per output interval
+    OUTPUT:
+       list of [q,p] at times t
+    HISTORY:
+       2026-10-18 - Written
+    """
+    if opening_angle >= 2./nu.sqrt(3.):
+        raise ValueError("opening_angle must be < 2/sqrt(3)")
+    #Set up everything
+    if isinstance(softening_model,ForceSoftening):
+        softening= softening_model
+    elif softening_model.lower() == 'plummer':
+        #determine appropriate softening length if not given
+        if softening_length is None:
+            softening_length= 0.01
+        softening= lambda d: _plummer_soft(d,softening_length)
+    else:
+        raise NotImplementedError("softening_model '%s' not implemented" % softening_model)
+    out= []
+    out.append([q,p])
+    qo= q
+    po= p
+    to= t[0]
+    #Run simulation
+    for ii in range(1,len(t)):
+        dt= (t[ii]-t[ii-1])/ndt
+        for jj in range(ndt): #loop over number of sub-intervals
+            (qo,po)= _bhtree_nbody_step(qo,po,m,to,dt,pot,
+                                        softening,opening_angle)
+            to+= dt
+        out.append([qo,po])
+    #Return output
+    return out
+
+def _bhtree_nbody_step(q,p,m,t,dt,pot,softening,opening_angle):
+    """One N-body step: drift-kick-drift"""
+    #drift
+    q12= [symplecticode.leapfrog_leapq(q[ii],p[ii],dt/2.) \
+              for ii in range(len(q))]
+    #kick
+    force= _bhtree_nbody_force(q12,m,t+dt/2.,pot,softening,opening_angle)
+    p= [symplecticode.leapfrog_leapp(p[ii],dt,force[ii]) \
+            for ii in range(len(p))]
+    #drift
+    q= [symplecticode.leapfrog_leapq(q12[ii],p[ii],dt/2.) \
+            for ii in range(len(q12))]
+    return (q,p)
+
+def _bhtree_nbody_force(q,m,t,pot,softening,opening_angle):
+    """Calculate the force, using the monopole of the cells of the tree"""
+    qarr= nu.array(q)
+    marr= nu.array(m,dtype='float')
+    tree= _BHCell(qarr,marr,opening_angle)
+    force= []
+    for ii in range(len(q)):
+        thisforce= nu.zeros(qarr.shape[1])
+        stack= [tree]
+        while len(stack) > 0:
+            cell= stack.pop()
+            if cell.children is None: #leaf, sum over its particles
+                for jj in cell.indx:
+                    if ii == jj: continue
+                    dist_vec= qarr[jj]-qarr[ii]
+                    dist= nu.sqrt(nu.sum(dist_vec**2.))
+                    thisforce+= marr[jj]*softening(dist)/dist*dist_vec
+                continue
+            dist_vec= cell.com-qarr[ii]
+            dist2= nu.sum(dist_vec**2.)
+            if dist2 > cell.open2: #use the monopole of the cell
+                dist= nu.sqrt(dist2)
+                thisforce+= cell.mass*softening(dist)/dist*dist_vec
+            else:
+                stack.extend(cell.children)
+        force.append(thisforce)
+    #Then add the external force
+    if pot is None: return force
+    for ii in range(len(q)):
+        force[ii]+= _external_force(q[ii],t,pot)
+    return force
+
+class _BHCell:
+    """Cell of a Barnes-Hut tree"""
+    def __init__(self,q,m,opening_angle,indx=None,center=None,hsize=None,
+                 depth=0):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           build the (sub-)tree for the particles indx
+        INPUT:
+           q - positions [nobj,dim]
+           m - masses [nobj]
+           opening_angle - opening angle of the tree
+           indx= indices of the particles in this cell (default: all)
+           center=, hsize= center and half-size of the cell (default: the
+                           bounding box of all particles)
+           depth= depth of the cell in the tree
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if indx is None:
+            indx= nu.arange(len(m))
+            qmin= nu.amin(q,axis=0)
+            qmax= nu.amax(q,axis=0)
+            center= 0.5*(qmax+qmin)
+            hsize= 0.5*nu.amax(qmax-qmin)
+            if hsize <= 0.: hsize= 1.
+            hsize*= 1.0001
+        self.indx= indx
+        self.mass= nu.sum(m[indx])
+        if self.mass > 0.:
+            self.com= nu.sum(m[indx]*q[indx].T,axis=1)/self.mass
+        else:
+            self.com= center
+        #A cell is opened when a particle is closer than size/opening_angle
+        #+delta to its center of mass, with delta the offset between the
+        #center of mass and the geometric center (Barnes 1994)
+        if opening_angle > 0.:
+            self.open2= (2.*hsize/opening_angle
+                         +nu.sqrt(nu.sum((self.com-center)**2.)))**2.
+        else:
+            self.open2= nu.inf
+        if len(indx) == 1 or depth >= _MAXDEPTH:
+            self.children= None
+            return None
+        #Split into the 2^dim sub-cells
+        above= q[indx] > center
+        sub= nu.sum(above*2**nu.arange(q.shape[1]),axis=1)
+        self.children= []
+        for ss in nu.unique(sub):
+            subcenter= center+nu.where(above[sub == ss][0],
+                                       0.5*hsize,-0.5*hsize)
+            self.children.append(_BHCell(q,m,opening_angle,
+                                         indx=indx[sub == ss],
+                                         center=subcenter,hsize=0.5*hsize,
+                                         depth=depth+1))
+        return None
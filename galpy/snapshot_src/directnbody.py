@@ -44,7 +44,6 @@ def direct_nbody(q,p,m,t,pot=None,softening_model='plummer',
         softening_length= 0.01
     #Run simulation
     for ii in range(1,len(t)):
-        print ii
         for jj in range(ndt): #loop over number of sub-intervals
             (qo,po)= _direct_nbody_step(qo,po,m,to,dt,pot,
                                         softening,(softening_length,))
@@ -0,0 +1,135 @@
+#N-body codes (direct force summation and Barnes-Hut tree), C implementation
+import numpy as nu
+import ctypes
+from numpy.ctypeslib import ndpointer
+from galpy.potential_src.ForceSoftening import PlummerSoftening
+#The C code is part of the orbit-integration library, which also holds the
+#C potentials used for the external force
+from galpy.orbit_src.integrateFullOrbit import _lib, _parse_pot
+def direct_nbody_c(q,p,m,t,pot=None,softening_model='plummer',
+                   softening_length=None,ndt=1,numcores=None):
+    """
+    NAME:
+       direct_nbody_c
+    PURPOSE:
+       N-body code using direct summation for force evaluation, in C
+    INPUT:
+       q - initial positions (numpy.ndarray [N,3] or list of numpy.ndarrays)
+       p - initial momenta (numpy.ndarray [N,3] or list of numpy.ndarrays)
+       m - list of masses
+       t - times at which output is desired
+       pot= external potential (galpy.potential or list of galpy.potentials;
+            must have a C implementation)
+       softening_model=  type of softening to use ('plummer' or a
+                         PlummerSoftening instance)
+       softening_length= (optional)
+       ndt= (1) number of drift-kick-drift steps per output interval
+       numcores= (None) number of OpenMP threads to use (default:
+                 OMP_NUM_THREADS or all available cores)
+    OUTPUT:
+       list of [q,p] at times t, with q and p numpy.ndarrays [N,3]
+    HISTORY:
+       2026-10-18 - Written
+    """
+    return _nbody_c(_lib.direct_nbody,[],q,p,m,t,pot,softening_model,
+                    softening_length,ndt,numcores)
+
+def bhtree_nbody_c(q,p,m,t,pot=None,softening_model='plummer',
+                   softening_length=None,opening_angle=0.7,ndt=1,
+                   numcores=None):
+    """
+    NAME:
+       bhtree_nbody_c
+    PURPOSE:
+       N-body code using a Barnes-Hut tree for force evaluation, in C
+    INPUT:
+       q - initial positions (numpy.ndarray [N,3] or list of numpy.ndarrays)
+       p - initial momenta (numpy.ndarray [N,3] or list of numpy.ndarrays)
+       m - list of masses
+       t - times at which output is desired
+       pot= external potential (galpy.potential or list of galpy.potentials;
+            must have a C implementation)
+       softening_model=  type of softening to use ('plummer' or a
+                         PlummerSoftening instance)
+       softening_length= (optional)
+       opening_angle= (0.7) opening angle of the tree; cells are opened
+                      when size/distance > opening_angle; 0 is direct
+                      summation, must be < 2/sqrt(3)
+       ndt= (1) number of drift-kick-drift steps per output interval
+       numcores= (None) number of OpenMP threads to use (default:
+                 OMP_NUM_THREADS or all available cores)
+    OUTPUT:
+       list of [q,p] at times t, with q and p numpy.ndarrays [N,3]
+    HISTORY:
+       2026-10-18 - Written
+    """
+    if opening_angle >= 2./nu.sqrt(3.):
+        raise ValueError("opening_angle must be < 2/sqrt(3)")
+    return _nbody_c(_lib.bhtree_nbody,
+                    [(ctypes.c_double,ctypes.c_double(opening_angle))],
+                    q,p,m,t,pot,softening_model,
+                    softening_length,ndt,numcores)
+
+def _nbody_c(nbodyFunc,extra_args,q,p,m,t,pot,softening_model,
+             softening_length,ndt,numcores):
+    """Run one of the C N-body codes, extra_args is a list of (argtype,arg)
+    inserted after the softening length"""
+    if isinstance(softening_model,PlummerSoftening):
+        if softening_length is None:
+            softening_length= softening_model._softening_length
+    elif softening_model.lower() != 'plummer':
+        raise NotImplementedError("softening_model '%s' not implemented in C" % softening_model)
+    #determine appropriate softening length if not given
+    if softening_length is None:
+        softening_length= 0.01
+    if numcores is None: numcores= 0 #lets OpenMP decide
+    if pot is None:
+        npot= 0
+        pot_type= nu.zeros(0,dtype=nu.int32)
+        pot_args= nu.zeros(0)
+    else:
+        npot, pot_type, pot_args= _parse_pot(pot)
+    q= nu.require(nu.array(q),dtype=nu.float64,requirements=['C','W'])
+    p= nu.require(nu.array(p),dtype=nu.float64,requirements=['C','W'])
+    m= nu.require(nu.array(m),dtype=nu.float64,requirements=['C','W'])
+    t= nu.require(nu.array(t),dtype=nu.float64,requirements=['C','W'])
+    pot_type= nu.require(pot_type,dtype=nu.int32,requirements=['C','W'])
+    pot_args= nu.require(pot_args,dtype=nu.float64,requirements=['C','W'])
+    nobj= q.shape[0]
+
+    #Set up result array
+    result= nu.empty((len(t),nobj,6))
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    nbodyFunc.argtypes= [ctypes.c_int,
+                         ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                         ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                         ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                         ctypes.c_int,
+                         ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                         ctypes.c_int,
+                         ctypes.c_double]\
+                         +[a[0] for a in extra_args]\
+                         +[ctypes.c_int,
+                           ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                           ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                           ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                           ctypes.c_int]
+
+    #Run the C code
+    nbodyFunc(*([ctypes.c_int(nobj),
+                 q,p,m,
+                 ctypes.c_int(len(t)),
+                 t,
+                 ctypes.c_int(ndt),
+                 ctypes.c_double(softening_length)]
+                +[a[1] for a in extra_args]
+                +[ctypes.c_int(npot),
+                  pot_type,
+                  pot_args,
+                  result,
+                  ctypes.c_int(numcores)]))
+
+    #Return output in the same format as direct_nbody
+    return [[result[ii,:,:3],result[ii,:,3:]] for ii in range(len(t))]
@@ -0,0 +1,324 @@
+/*
+  C implementation of a Barnes-Hut tree code for the mutual gravity of
+  N-body particles
+*/
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include <galpy_nbody.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+//Particles that end up in the same cell at this depth share a leaf
+#define BHTREE_MAXDEPTH 64
+#define BHTREE_STACKSIZE (8*BHTREE_MAXDEPTH+8)
+#define BHTREE_CHUNKSIZE 64
+/*
+  Function Declarations
+*/
+static void bhtree_grow(struct bhtree *);
+static int bhtree_newnode(struct bhtree *,int,int);
+static inline int bhtree_octant(struct bhtree *,int,double,double,double);
+/*
+  Actual functions
+*/
+struct bhtree * bhtree_alloc(int nobj){
+  struct bhtree * tree= (struct bhtree *) malloc ( sizeof (struct bhtree) );
+  tree->nnode= 0;
+  tree->maxnode= 2 * nobj + 8;
+  tree->nobj= nobj;
+  tree->xc= (double *) malloc ( tree->maxnode * sizeof(double) );
+  tree->yc= (double *) malloc ( tree->maxnode * sizeof(double) );
+  tree->zc= (double *) malloc ( tree->maxnode * sizeof(double) );
+  tree->hsize= (double *) malloc ( tree->maxnode * sizeof(double) );
+  tree->mass= (double *) malloc ( tree->maxnode * sizeof(double) );
+  tree->xm= (double *) malloc ( tree->maxnode * sizeof(double) );
+  tree->ym= (double *) malloc ( tree->maxnode * sizeof(double) );
+  tree->zm= (double *) malloc ( tree->maxnode * sizeof(double) );
+  tree->open2= (double *) malloc ( tree->maxnode * sizeof(double) );
+  tree->child= (int *) malloc ( 8 * tree->maxnode * sizeof(int) );
+  tree->first= (int *) malloc ( tree->maxnode * sizeof(int) );
+  tree->next= (int *) malloc ( nobj * sizeof(int) );
+  return tree;
+}
+void bhtree_free(struct bhtree * tree){
+  free(tree->xc);
+  free(tree->yc);
+  free(tree->zc);
+  free(tree->hsize);
+  free(tree->mass);
+  free(tree->xm);
+  free(tree->ym);
+  free(tree->zm);
+  free(tree->open2);
+  free(tree->child);
+  free(tree->first);
+  free(tree->next);
+  free(tree);
+}
+static void bhtree_grow(struct bhtree * tree){
+  tree->maxnode*= 2;
+  tree->xc= (double *) realloc (tree->xc,tree->maxnode * sizeof(double) );
+  tree->yc= (double *) realloc (tree->yc,tree->maxnode * sizeof(double) );
+  tree->zc= (double *) realloc (tree->zc,tree->maxnode * sizeof(double) );
+  tree->hsize= (double *) realloc (tree->hsize,tree->maxnode * sizeof(double) );
+  tree->mass= (double *) realloc (tree->mass,tree->maxnode * sizeof(double) );
+  tree->xm= (double *) realloc (tree->xm,tree->maxnode * sizeof(double) );
+  tree->ym= (double *) realloc (tree->ym,tree->maxnode * sizeof(double) );
+  tree->zm= (double *) realloc (tree->zm,tree->maxnode * sizeof(double) );
+  tree->open2= (double *) realloc (tree->open2,tree->maxnode * sizeof(double) );
+  tree->child= (int *) realloc (tree->child,8 * tree->maxnode * sizeof(int) );
+  tree->first= (int *) realloc (tree->first,tree->maxnode * sizeof(int) );
+}
+static int bhtree_newnode(struct bhtree * tree,int parent,int oct){
+  //Create an empty leaf in octant oct of parent
+  int kk;
+  int node= tree->nnode++;
+  double hsize;
+  if ( node >= tree->maxnode ) bhtree_grow(tree);
+  hsize= 0.5 * *(tree->hsize+parent);
+  *(tree->hsize+node)= hsize;
+  *(tree->xc+node)= *(tree->xc+parent) + ( ( oct & 1 ) ? hsize : -hsize );
+  *(tree->yc+node)= *(tree->yc+parent) + ( ( oct & 2 ) ? hsize : -hsize );
+  *(tree->zc+node)= *(tree->zc+parent) + ( ( oct & 4 ) ? hsize : -hsize );
+  for (kk=0; kk < 8; kk++) *(tree->child+8*node+kk)= -1;
+  *(tree->first+node)= -1;
+  return node;
+}
+static inline int bhtree_octant(struct bhtree * tree,int node,
+				double x, double y, double z){
+  return ( x > *(tree->xc+node) )
+    + 2 * ( y > *(tree->yc+node) )
+    + 4 * ( z > *(tree->zc+node) );
+}
+void bhtree_build(struct bhtree * tree,
+		  int nobj,
+		  double *x,
+		  double *y,
+		  double *z,
+		  double *m,
+		  double opening_angle){
+  /*
+    (Re-)build the tree for the particles at x,y,z with masses m and compute
+    the mass, center of mass, and opening distance of each cell
+    A cell of size s is opened when a particle is closer than
+    s/opening_angle+delta to its center of mass, with delta the offset between
+    the center of mass and the geometric center (Barnes 1994); this ensures
+    that cells are always opened for the particles they contain for
+    opening_angle < 2/sqrt(3)
+  */
+  int ii, kk, node, depth, oct, c, q;
+  double xmin, xmax, ymin, ymax, zmin, zmax, hsize, mass, xm, ym, zm;
+  double dx, dy, dz, ropen;
+  //Bounding box
+  xmin= *x; xmax= *x;
+  ymin= *y; ymax= *y;
+  zmin= *z; zmax= *z;
+  for (ii=1; ii < nobj; ii++){
+    if ( *(x+ii) < xmin ) xmin= *(x+ii);
+    if ( *(x+ii) > xmax ) xmax= *(x+ii);
+    if ( *(y+ii) < ymin ) ymin= *(y+ii);
+    if ( *(y+ii) > ymax ) ymax= *(y+ii);
+    if ( *(z+ii) < zmin ) zmin= *(z+ii);
+    if ( *(z+ii) > zmax ) zmax= *(z+ii);
+  }
+  hsize= 0.5 * ( xmax - xmin );
+  if ( 0.5 * ( ymax - ymin ) > hsize ) hsize= 0.5 * ( ymax - ymin );
+  if ( 0.5 * ( zmax - zmin ) > hsize ) hsize= 0.5 * ( zmax - zmin );
+  if ( hsize <= 0. ) hsize= 1.;
+  //Root
+  tree->nnode= 1;
+  *(tree->xc)= 0.5 * ( xmax + xmin );
+  *(tree->yc)= 0.5 * ( ymax + ymin );
+  *(tree->zc)= 0.5 * ( zmax + zmin );
+  *(tree->hsize)= 1.0001 * hsize;
+  for (kk=0; kk < 8; kk++) *(tree->child+kk)= -1;
+  *(tree->first)= -1;
+  //Insert the particles one by one
+  for (ii=0; ii < nobj; ii++){
+    node= 0;
+    depth= 0;
+    while ( 1 ) {
+      if ( *(tree->first+node) == -2 ) { //internal node, descend
+	oct= bhtree_octant(tree,node,*(x+ii),*(y+ii),*(z+ii));
+	c= *(tree->child+8*node+oct);
+	if ( c < 0 ) {
+	  c= bhtree_newnode(tree,node,oct);
+	  *(tree->child+8*node+oct)= c;
+	  *(tree->first+c)= ii;
+	  *(tree->next+ii)= -1;
+	  break;
+	}
+	node= c;
+	depth++;
+      }
+      else if ( *(tree->first+node) == -1 ) { //empty leaf
+	*(tree->first+node)= ii;
+	*(tree->next+ii)= -1;
+	break;
+      }
+      else if ( depth >= BHTREE_MAXDEPTH ) { //add to the leaf's list
+	*(tree->next+ii)= *(tree->first+node);
+	*(tree->first+node)= ii;
+	break;
+      }
+      else { //split the leaf, which holds a single particle, and try again
+	q= *(tree->first+node);
+	*(tree->first+node)= -2;
+	oct= bhtree_octant(tree,node,*(x+q),*(y+q),*(z+q));
+	c= bhtree_newnode(tree,node,oct);
+	*(tree->child+8*node+oct)= c;
+	*(tree->first+c)= q;
+	*(tree->next+q)= -1;
+      }
+    }
+  }
+  //Compute the moments; children always have larger indices than parents
+  for (node=tree->nnode-1; node >= 0; node--){
+    mass= 0.;
+    xm= 0.;
+    ym= 0.;
+    zm= 0.;
+    if ( *(tree->first+node) == -2 )
+      for (kk=0; kk < 8; kk++) {
+	c= *(tree->child+8*node+kk);
+	if ( c < 0 ) continue;
+	mass+= *(tree->mass+c);
+	xm+= *(tree->mass+c) * *(tree->xm+c);
+	ym+= *(tree->mass+c) * *(tree->ym+c);
+	zm+= *(tree->mass+c) * *(tree->zm+c);
+      }
+    else
+      for (q=*(tree->first+node); q >= 0; q= *(tree->next+q)){
+	mass+= *(m+q);
+	xm+= *(m+q) * *(x+q);
+	ym+= *(m+q) * *(y+q);
+	zm+= *(m+q) * *(z+q);
+      }
+    *(tree->mass+node)= mass;
+    if ( mass > 0. ) {
+      xm/= mass;
+      ym/= mass;
+      zm/= mass;
+    }
+    else {
+      xm= *(tree->xc+node);
+      ym= *(tree->yc+node);
+      zm= *(tree->zc+node);
+    }
+    *(tree->xm+node)= xm;
+    *(tree->ym+node)= ym;
+    *(tree->zm+node)= zm;
+    if ( opening_angle > 0. ) {
+      dx= xm - *(tree->xc+node);
+      dy= ym - *(tree->yc+node);
+      dz= zm - *(tree->zc+node);
+      ropen= 2. * *(tree->hsize+node) / opening_angle + sqrt(dx*dx+dy*dy+dz*dz);
+      *(tree->open2+node)= ropen * ropen;
+    }
+    else
+      *(tree->open2+node)= HUGE_VAL;
+  }
+}
+void bhtree_nbody_force(int nobj,
+			double *x,
+			double *y,
+			double *z,
+			double *m,
+			double eps2,
+			double *ax,
+			double *ay,
+			double *az,
+			int nthreads,
+			void * forceArgs){
+  /*
+    Calculate the Plummer-softened mutual gravitational acceleration of
+    nobj particles using a Barnes-Hut tree (monopole approximation)
+    Input: positions x,y,z, masses m, the square of the softening length eps2,
+           forceArgs: struct bhtreeArg with the tree and the opening angle
+    Output: accelerations ax,ay,az
+  */
+  int ii, q, kk, c, node, nstack;
+  int stack[BHTREE_STACKSIZE];
+  double xi, yi, zi, axi, ayi, azi, dx, dy, dz, r2, fac;
+  struct bhtreeArg * args= (struct bhtreeArg *) forceArgs;
+  struct bhtree * tree= args->tree;
+  bhtree_build(tree,nobj,x,y,z,m,args->opening_angle);
+  int chunk= BHTREE_CHUNKSIZE;
+#pragma omp parallel for schedule(dynamic,chunk) num_threads(nthreads) \
+  private(ii,q,kk,c,node,nstack,stack,xi,yi,zi,axi,ayi,azi,dx,dy,dz,r2,fac) \
+  shared(nobj,x,y,z,m,eps2,ax,ay,az,tree)
+  for (ii=0; ii < nobj; ii++){
+    xi= *(x+ii);
+    yi= *(y+ii);
+    zi= *(z+ii);
+    axi= 0.;
+    ayi= 0.;
+    azi= 0.;
+    nstack= 0;
+    stack[nstack++]= 0;
+    while ( nstack > 0 ) {
+      node= stack[--nstack];
+      if ( *(tree->first+node) == -2 ) {
+	dx= *(tree->xm+node)-xi;
+	dy= *(tree->ym+node)-yi;
+	dz= *(tree->zm+node)-zi;
+	r2= dx*dx+dy*dy+dz*dz;
+	if ( r2 > *(tree->open2+node) ) { //use the monopole of the cell
+	  r2+= eps2;
+	  fac= *(tree->mass+node)/r2/sqrt(r2);
+	  axi+= fac*dx;
+	  ayi+= fac*dy;
+	  azi+= fac*dz;
+	}
+	else
+	  for (kk=0; kk < 8; kk++) {
+	    c= *(tree->child+8*node+kk);
+	    if ( c >= 0 ) stack[nstack++]= c;
+	  }
+      }
+      else
+	for (q=*(tree->first+node); q >= 0; q= *(tree->next+q)){
+	  if ( q == ii ) continue;
+	  dx= *(x+q)-xi;
+	  dy= *(y+q)-yi;
+	  dz= *(z+q)-zi;
+	  r2= dx*dx+dy*dy+dz*dz+eps2;
+	  fac= *(m+q)/r2/sqrt(r2);
+	  axi+= fac*dx;
+	  ayi+= fac*dy;
+	  azi+= fac*dz;
+	}
+    }
+    *(ax+ii)= axi;
+    *(ay+ii)= ayi;
+    *(az+ii)= azi;
+  }
+}
+void bhtree_nbody(int nobj,
+		  double *qo,
+		  double *po,
+		  double *m,
+		  int nt,
+		  double *t,
+		  int ndt,
+		  double softening_length,
+		  double opening_angle,
+		  int npot,
+		  int * pot_type,
+		  double * pot_args,
+		  double *result,
+		  int nthreads){
+  /*
+    Integrate nobj particles under their mutual (softened) gravity, computed
+    using a Barnes-Hut tree with opening angle opening_angle, and an
+    external potential; the tree's memory is re-used between steps
+  */
+  struct bhtreeArg args;
+  args.tree= bhtree_alloc(nobj);
+  args.opening_angle= opening_angle;
+  nbody_leapfrog(nobj,qo,po,m,nt,t,ndt,softening_length,
+		 npot,pot_type,pot_args,result,nthreads,
+		 &bhtree_nbody_force,&args);
+  bhtree_free(args.tree);
+}
@@ -0,0 +1,244 @@
+/*
+  C implementation of N-body codes: leapfrog stepping and direct summation
+*/
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+//Potentials
+#include <galpy_potentials.h>
+#include <integrateFullOrbit.h>
+#include <galpy_nbody.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+#define CHUNKSIZE 1
+//Number of particles in a block of the force calculation; a block of
+//positions (3 x NBODY_BLOCKSIZE doubles) should comfortably fit in L1 cache
+#define NBODY_BLOCKSIZE 128
+/*
+  Function Declarations
+*/
+void evalRectForce(double, double *, double *,
+		   int, struct potentialArg *);
+/*
+  Actual functions
+*/
+void direct_nbody_force(int nobj,
+			double *x,
+			double *y,
+			double *z,
+			double *m,
+			double eps2,
+			double *ax,
+			double *ay,
+			double *az,
+			int nthreads,
+			void * forceArgs){
+  /*
+    Calculate the Plummer-softened mutual gravitational acceleration of
+    nobj particles by direct summation, looping over blocks of sources
+    for each block of sinks such that the source positions stay in cache
+    Input: positions x,y,z, masses m, the square of the softening length eps2
+           (forceArgs is not used)
+    Output: accelerations ax,ay,az
+  */
+  int ib, jb, ii, jj, ie, je;
+  double xi, yi, zi, axi, ayi, azi, dx, dy, dz, r2, fac;
+  int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(dynamic,chunk) num_threads(nthreads) \
+  private(ib,jb,ii,jj,ie,je,xi,yi,zi,axi,ayi,azi,dx,dy,dz,r2,fac)	\
+  shared(nobj,x,y,z,m,eps2,ax,ay,az)
+  for (ib=0; ib < nobj; ib+= NBODY_BLOCKSIZE){
+    ie= ( ib + NBODY_BLOCKSIZE < nobj ) ? ib + NBODY_BLOCKSIZE : nobj;
+    for (ii=ib; ii < ie; ii++){
+      *(ax+ii)= 0.;
+      *(ay+ii)= 0.;
+      *(az+ii)= 0.;
+    }
+    for (jb=0; jb < nobj; jb+= NBODY_BLOCKSIZE){
+      je= ( jb + NBODY_BLOCKSIZE < nobj ) ? jb + NBODY_BLOCKSIZE : nobj;
+      for (ii=ib; ii < ie; ii++){
+	xi= *(x+ii);
+	yi= *(y+ii);
+	zi= *(z+ii);
+	axi= 0.;
+	ayi= 0.;
+	azi= 0.;
+	for (jj=jb; jj < je; jj++){
+	  dx= *(x+jj)-xi;
+	  dy= *(y+jj)-yi;
+	  dz= *(z+jj)-zi;
+	  r2= dx*dx+dy*dy+dz*dz+eps2;
+	  //the self-interaction is skipped (dx=dy=dz=0, but r2 may be zero)
+	  fac= ( jj == ii ) ? 0. : *(m+jj)/r2/sqrt(r2);
+	  axi+= fac*dx;
+	  ayi+= fac*dy;
+	  azi+= fac*dz;
+	}
+	*(ax+ii)+= axi;
+	*(ay+ii)+= ayi;
+	*(az+ii)+= azi;
+      }
+    }
+  }
+}
+void nbody_external_force(int nobj,
+			  double *q,
+			  double t,
+			  int npot,
+			  struct potentialArg * potentialArgs,
+			  double *a,
+			  int nthreads){
+  /*
+    Add the acceleration due to the external potential to a, using one
+    copy of the potential arguments per thread
+    Input: rectangular positions q [nobj,3]
+  */
+  int ii, tid;
+  double aext[3];
+  int chunk= 16;
+#pragma omp parallel for schedule(dynamic,chunk) num_threads(nthreads) \
+  private(ii,tid,aext)							\
+  shared(nobj,q,t,npot,potentialArgs,a)
+  for (ii=0; ii < nobj; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid= 0;
+#endif
+    evalRectForce(t,q+3*ii,aext,npot,potentialArgs+tid*npot);
+    *(a+3*ii)+= *aext;
+    *(a+3*ii+1)+= *(aext+1);
+    *(a+3*ii+2)+= *(aext+2);
+  }
+}
+void direct_nbody(int nobj,
+		  double *qo,
+		  double *po,
+		  double *m,
+		  int nt,
+		  double *t,
+		  int ndt,
+		  double softening_length,
+		  int npot,
+		  int * pot_type,
+		  double * pot_args,
+		  double *result,
+		  int nthreads){
+  /*
+    Integrate nobj particles under their mutual (softened) gravity, computed
+    by direct summation, and an external potential
+  */
+  nbody_leapfrog(nobj,qo,po,m,nt,t,ndt,softening_length,
+		 npot,pot_type,pot_args,result,nthreads,
+		 &direct_nbody_force,NULL);
+}
+void nbody_leapfrog(int nobj,
+		    double *qo,
+		    double *po,
+		    double *m,
+		    int nt,
+		    double *t,
+		    int ndt,
+		    double softening_length,
+		    int npot,
+		    int * pot_type,
+		    double * pot_args,
+		    double *result,
+		    int nthreads,
+		    void (*selfForce)(int,double *,double *,double *,double *,
+				      double,double *,double *,double *,int,
+				      void *),
+		    void * selfForceArgs){
+  /*
+    Integrate nobj particles under their mutual (softened) gravity and an
+    external potential using drift-kick-drift leapfrog steps
+    Input: rectangular positions qo [nobj,3] and momenta po [nobj,3],
+           masses m, output times t, number of steps per output interval ndt,
+	   function selfForce (and its arguments) that computes the mutual
+	   gravitational acceleration
+    Output: result [nt,nobj,6] with rectangular positions and momenta
+  */
+  int ii, jj, kk, tid;
+  double to, dt;
+  double eps2= softening_length*softening_length;
+#ifdef _OPENMP
+  if ( nthreads <= 0 ) nthreads= omp_get_max_threads();
+#else
+  nthreads= 1;
+#endif
+  if ( nthreads < 1 ) nthreads= 1;
+  //Set up the external forces, one copy for each thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( nthreads * npot * sizeof (struct potentialArg) );
+  for (tid=0; tid < nthreads; tid++)
+    parse_leapFuncArgs_Full(npot,potentialArgs+tid*npot,pot_type,pot_args);
+  //Work arrays; positions are also kept in x,y,z for the force calculation
+  double *q= (double *) malloc ( 3 * nobj * sizeof(double) );
+  double *p= (double *) malloc ( 3 * nobj * sizeof(double) );
+  double *a= (double *) malloc ( 3 * nobj * sizeof(double) );
+  double *x= (double *) malloc ( nobj * sizeof(double) );
+  double *y= (double *) malloc ( nobj * sizeof(double) );
+  double *z= (double *) malloc ( nobj * sizeof(double) );
+  double *ax= (double *) malloc ( nobj * sizeof(double) );
+  double *ay= (double *) malloc ( nobj * sizeof(double) );
+  double *az= (double *) malloc ( nobj * sizeof(double) );
+  for (jj=0; jj < 3*nobj; jj++){
+    *(q+jj)= *(qo+jj);
+    *(p+jj)= *(po+jj);
+  }
+  //Store the initial condition
+  for (jj=0; jj < nobj; jj++)
+    for (kk=0; kk < 3; kk++){
+      *(result+6*jj+kk)= *(q+3*jj+kk);
+      *(result+6*jj+kk+3)= *(p+3*jj+kk);
+    }
+  to= *t;
+  for (ii=1; ii < nt; ii++){
+    dt= (*(t+ii)-*(t+ii-1))/ndt;
+    for (kk=0; kk < ndt; kk++){
+      //drift
+      for (jj=0; jj < 3*nobj; jj++) *(q+jj)+= 0.5*dt* *(p+jj);
+      //kick
+      for (jj=0; jj < nobj; jj++){
+	*(x+jj)= *(q+3*jj);
+	*(y+jj)= *(q+3*jj+1);
+	*(z+jj)= *(q+3*jj+2);
+      }
+      selfForce(nobj,x,y,z,m,eps2,ax,ay,az,nthreads,selfForceArgs);
+      for (jj=0; jj < nobj; jj++){
+	*(a+3*jj)= *(ax+jj);
+	*(a+3*jj+1)= *(ay+jj);
+	*(a+3*jj+2)= *(az+jj);
+      }
+      if ( npot > 0 )
+	nbody_external_force(nobj,q,to+0.5*dt,npot,potentialArgs,a,nthreads);
+      for (jj=0; jj < 3*nobj; jj++) *(p+jj)+= dt* *(a+jj);
+      //drift
+      for (jj=0; jj < 3*nobj; jj++) *(q+jj)+= 0.5*dt* *(p+jj);
+      to+= dt;
+    }
+    //Store the output
+    for (jj=0; jj < nobj; jj++)
+      for (kk=0; kk < 3; kk++){
+	*(result+6*nobj*ii+6*jj+kk)= *(q+3*jj+kk);
+	*(result+6*nobj*ii+6*jj+kk+3)= *(p+3*jj+kk);
+      }
+  }
+  //Free allocated memory
+  free(q);
+  free(p);
+  free(a);
+  free(x);
+  free(y);
+  free(z);
+  free(ax);
+  free(ay);
+  free(az);
+  for (ii=0; ii < nthreads * npot; ii++) {
+    free(potentialArgs->args);
+    potentialArgs++;
+  }
+  potentialArgs-= nthreads * npot;
+  free(potentialArgs);
+  //Done!
+}
@@ -0,0 +1,57 @@
+/*
+  C implementations of N-body codes for galpy snapshots
+*/
+#ifndef __GALPY_NBODY_H__
+#define __GALPY_NBODY_H__
+#include <galpy_potentials.h>
+/*
+  Structure declarations
+*/
+//Barnes-Hut octree; the node arrays are allocated once and re-used (and
+//grown when necessary) every time the tree is rebuilt
+struct bhtree{
+  int nnode;
+  int maxnode;
+  double *xc; //geometric center and half-size of each cell
+  double *yc;
+  double *zc;
+  double *hsize;
+  double *mass; //total mass and center of mass of each cell
+  double *xm;
+  double *ym;
+  double *zm;
+  double *open2; //square of the distance within which the cell is opened
+  int *child; //8 children for each node, -1 if empty
+  int *first; //first particle in a leaf, -1 for empty leaves, -2 for
+              //internal nodes
+  int *next; //linked list of particles in a leaf, one per particle
+  int nobj;
+};
+struct bhtreeArg{
+  struct bhtree * tree;
+  double opening_angle;
+};
+/*
+  Function declarations
+*/
+void direct_nbody_force(int,double *,double *,double *,double *,double,
+			double *,double *,double *,int,void *);
+void bhtree_nbody_force(int,double *,double *,double *,double *,double,
+			double *,double *,double *,int,void *);
+void nbody_external_force(int,double *,double,int,struct potentialArg *,
+			  double *,int);
+void nbody_leapfrog(int,double *,double *,double *,int,double *,int,double,
+		    int,int *,double *,double *,int,
+		    void (*selfForce)(int,double *,double *,double *,double *,
+				      double,double *,double *,double *,int,
+				      void *),
+		    void *);
+void direct_nbody(int,double *,double *,double *,int,double *,int,double,
+		  int,int *,double *,double *,int);
+void bhtree_nbody(int,double *,double *,double *,int,double *,int,double,
+		  double,int,int *,double *,double *,int);
+struct bhtree * bhtree_alloc(int);
+void bhtree_build(struct bhtree *,int,double *,double *,double *,double *,
+		  double);
+void bhtree_free(struct bhtree *);
+#endif /* galpy_nbody.h */
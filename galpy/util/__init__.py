@@ -1,5 +1,6 @@
 import os
 import shutil
+import hashlib
 import warnings
 import tempfile
 import pickle
@@ -57,6 +58,132 @@ def save_pickles(savefilename,*args):
             if file_open:
                 savefile.close()
 
+def cache_dir(cachedir,*args):
+    """
+    NAME:
+       cache_dir
+    PURPOSE:
+       return (and create) the directory in an on-disk cache that holds the
+       data for the objects described by args
+    INPUT:
+       cachedir - top-level directory of the cache (None: no caching)
+       +objects that describe the cached data (potentials, arrays, numbers,
+        lists, ...; see cache_key)
+    OUTPUT:
+       directory name (None if cachedir is None)
+    HISTORY:
+       2026-10-18 - Written
+    """
+    if cachedir is None: return None
+    key= hashlib.sha1()
+    for arg in args:
+        key.update(cache_key(arg))
+    out= os.path.join(cachedir,key.hexdigest())
+    try:
+        os.makedirs(out)
+    except OSError:
+        if not os.path.isdir(out): raise
+    return out
+
+def cache_key(obj):
+    """
+    NAME:
+       cache_key
+    PURPOSE:
+       string that uniquely describes an object (e.g., a potential or list of
+       potentials) through its class and parameters; attributes that cannot
+       be described are represented by their id, such that the key never
+       matches a different object
+    INPUT:
+       obj - object
+    OUTPUT:
+       string
+    HISTORY:
+       2026-10-18 - Written
+    """
+    if isinstance(obj,(list,tuple)):
+        return '['+','.join([cache_key(o) for o in obj])+']'
+    elif isinstance(obj,numpy.ndarray):
+        return 'array(%s,%s,%s)' % (obj.dtype.str,obj.shape,
+                                    hashlib.sha1(numpy.ascontiguousarray(obj).tostring()).hexdigest())
+    elif isinstance(obj,dict):
+        return '{'+','.join(['%s:%s' % (k,cache_key(obj[k]))
+                             for k in sorted(obj.keys())])+'}'
+    elif obj is None or isinstance(obj,(bool,int,long,float,complex,str,
+                                        numpy.number,numpy.bool_)):
+        return repr(obj)
+    elif hasattr(obj,'__dict__') \
+            and obj.__class__.__module__.startswith('galpy'):
+        #Skip the cached C arguments, these are derived from the parameters
+        return obj.__class__.__module__+'.'+obj.__class__.__name__\
+            +cache_key(dict([(k,v) for k,v in obj.__dict__.items()
+                             if not k == '_c_parsed']))
+    else:
+        return '%s@%i' % (obj.__class__.__name__,id(obj))
+
+def save_npy(filename,array):
+    """
+    NAME:
+       save_npy
+    PURPOSE:
+       save an array to a .npy file such that other processes never read a
+       partially written file
+    INPUT:
+       filename - name of the file
+       array - array to save
+    OUTPUT:
+       none
+    HISTORY:
+       2026-10-18 - Written
+    """
+    #Write to a temporary file in the same directory first, then move it
+    tmpfd, tmpfilename= tempfile.mkstemp(suffix='.npy',
+                                         dir=os.path.dirname(os.path.abspath(filename)))
+    with os.fdopen(tmpfd,'wb') as tmpfile:
+        numpy.save(tmpfile,array)
+    os.rename(tmpfilename,filename)
+
+def load_npy_cache(key,names):
+    """
+    NAME:
+       load_npy_cache
+    PURPOSE:
+       load a set of arrays from a directory in the on-disk cache
+    INPUT:
+       key - directory in the cache (from cache_dir; None: no caching)
+       names - names of the arrays (stored as name.npy)
+    OUTPUT:
+       dictionary of the (memory-mapped) arrays, or None if not all of them
+       are in the cache
+    HISTORY:
+       2026-10-18 - Written
+    """
+    if key is None: return None
+    filenames= [os.path.join(key,name+'.npy') for name in names]
+    if not numpy.all([os.path.exists(f) for f in filenames]):
+        return None
+    return dict([(name,numpy.load(filename,mmap_mode='r'))
+                 for name, filename in zip(names,filenames)])
+
+def save_npy_cache(key,arrays):
+    """
+    NAME:
+       save_npy_cache
+    PURPOSE:
+       save a set of arrays to a directory in the on-disk cache
+    INPUT:
+       key - directory in the cache (from cache_dir; None: no caching)
+       arrays - dictionary of the arrays to save, keyed by their names
+    OUTPUT:
+       none
+    HISTORY:
+       2026-10-18 - Written
+    """
+    if key is None: return None
+    for name, array in arrays.items():
+        save_npy(os.path.join(key,name+'.npy'),array)
+    return None
+
 def logsumexp(arr,axis=0):
     """Faster logsumexp?"""
     minarr= numpy.amax(arr,axis=axis)
@@ -0,0 +1,165 @@
+#Persistent pool of processes that evaluates the methods of an object
+import os
+import pickle
+import tempfile
+import itertools
+import functools
+import multiprocessing
+_TOKENS= itertools.count() #identifies the state sent to the processes
+class StatePool:
+    """Persistent pool of processes that evaluates the methods of an object,
+    sending the state of the object to each process only once"""
+    def __init__(self,pool=None,workerattrs={}):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           initialize a StatePool
+        INPUT:
+           pool= (None) multiprocessing.Pool instance to use; if None, a pool
+                 is started the first time that it is needed and is kept
+                 until close() is called
+           workerattrs= ({}) attributes to set on the copies of the object in
+                        the processes (e.g., to turn off nested
+                        multi-processing)
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        self._pool= pool
+        self._ownPool= pool is None
+        self._workerattrs= workerattrs
+        self._state= None
+        return None
+
+    def processes(self):
+        """
+        NAME:
+           processes
+        PURPOSE:
+           return the number of processes in the pool
+        INPUT:
+           (none)
+        OUTPUT:
+           number of processes (None if the pool has not been started)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if self._pool is None: return None
+        return self._pool._processes
+
+    def reset_state(self):
+        """
+        NAME:
+           reset_state
+        PURPOSE:
+           forget the pickled state of the object, such that it is pickled
+           and sent to the processes again the next time that map is called;
+           call this whenever the object changes
+        INPUT:
+           (none)
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if not self._state is None:
+            try:
+                os.remove(self._state[1])
+            except OSError:
+                pass
+            self._state= None
+        return None
+
+    def close(self):
+        """
+        NAME:
+           close
+        PURPOSE:
+           shut down the pool of processes (if it was started by this
+           StatePool); a new pool is started when it is needed again
+        INPUT:
+           (none)
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-18 - Written
+        """
+        self.reset_state()
+        if not self._pool is None and self._ownPool:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool= None
+        return None
+
+    def map(self,obj,method,args,order=None,processes=None):
+        """
+        NAME:
+           map
+        PURPOSE:
+           evaluate a method of an object for a list of arguments on the pool
+           of processes; the tasks are handed out one at a time, such that
+           processes that finish early pick up the remaining tasks
+        INPUT:
+           obj - the object; its pickled state is cached until reset_state
+                 is called
+           method - name of the method
+           args - list of argument tuples, one for each task
+           order= (None) order in which to hand out the tasks (put the most
+                  expensive tasks first)
+           processes= (None) number of processes to use (default: the number
+                      of CPUs); a pool of a different size that was started
+                      by this StatePool is replaced
+        OUTPUT:
+           list of outputs, in the order of args
+        HISTORY:
+           2026-10-18 - Written
+        """
+        if order is None: order= range(len(args))
+        if processes is None: processes= multiprocessing.cpu_count()
+        if self._ownPool and not self._pool is None \
+                and self._pool._processes != processes:
+            self.close()
+        if self._pool is None:
+            self._pool= multiprocessing.Pool(processes=processes)
+        if self._state is None:
+            #The state is written to a file once; each process only reads it
+            #the first time that it sees its token
+            fd, filename= tempfile.mkstemp(prefix='galpy-pool-',
+                                           suffix='.pkl')
+            with os.fdopen(fd,'wb') as savefile:
+                pickle.dump(obj,savefile,pickle.HIGHEST_PROTOCOL)
+            self._state= ((os.getpid(),_TOKENS.next()),filename,
+                          self._workerattrs)
+        tasks= [(method,ii,args[ii]) for ii in order]
+        out= [None for ii in range(len(args))]
+        for ii, result in self._pool.imap_unordered(\
+            functools.partial(_pool_task,self._state),tasks,chunksize=1):
+            out[ii]= result
+        return out
+
+    def __getstate__(self):
+        #Neither the pool nor the pickled state can be pickled
+        return {'_workerattrs':self._workerattrs}
+
+    def __setstate__(self,state):
+        self.__init__(workerattrs=state['_workerattrs'])
+        return None
+
+    def __del__(self):
+        self.reset_state()
+
+def _pool_task(state,task):
+    """Internal function that evaluates a task on the pool of processes"""
+    global _POOLOBJ
+    token, filename, workerattrs= state
+    if _POOLOBJ is None or _POOLOBJ[0] != token:
+        with open(filename,'rb') as savefile:
+            obj= pickle.load(savefile)
+        for key, val in workerattrs.items():
+            setattr(obj,key,val)
+        _POOLOBJ= (token,obj)
+    method, ii, args= task
+    return (ii,getattr(_POOLOBJ[1],method)(*args))
+_POOLOBJ= None
@@ -36,6 +36,9 @@ POSSIBILITY OF SUCH DAMAGE.
 #define _MAX_STEPCHANGE_POWERTWO 3.
 #define _MIN_STEPCHANGE_POWERTWO -3.
 #define _MAX_STEPREDUCE 10000.
+#define _DOPR54_EVENTS_INITSTEPFRAC 1000.
+#define _DOPR54_EVENTS_MAXITER 100
+#define _DOPR54_EVENTS_TTOL 1e-13
 /*
 Runge-Kutta 4 integrator
 Usage:
@@ -668,3 +671,195 @@ double bovy_dopr54_actualstep(void (*func)(double t, double *y, double *a,int na
   dt_one= dt*pow(2.,powertwo);
   return dt_one;
 }
+/*
+Dense output for the Dormand-Prince 5/4 integrator, using the continuous 
+extension of Dormand & Prince (1986; see Hairer, Norsett, & Wanner 1993)
+Usage:
+   bovy_dopr54_dense_setup: set up the coefficients of the interpolant for 
+      the step yo --> yn1, using the k1-k7 of the step (k7 = dt * f(yn1))
+   bovy_dopr54_dense: evaluate the interpolant at fraction theta of the step
+  Arguments are:
+       int dim: dimension
+       double * rcont: coefficients of the interpolant (dimension 5 dim)
+*/
+void bovy_dopr54_dense_setup(int dim, double * yo, double * yn1,
+			     double * k1, double * k3, double * k4,
+			     double * k5, double * k6, double * k7,
+			     double * rcont){
+  //constants
+  static const double d1= -12715105075./11282082432.;
+  static const double d3= 87487479700./32700410799.;
+  static const double d4= -10690763975./1880347072.;
+  static const double d5= 701980252875./199316789632.;
+  static const double d6= -1453857185./822651844.;
+  static const double d7= 69997945./29380423.;
+  int ii;
+  double ydiff, bspl;
+  for (ii=0; ii < dim; ii++){
+    ydiff= *(yn1+ii) - *(yo+ii);
+    bspl= *(k1+ii) - ydiff;
+    *(rcont+ii)= *(yo+ii);
+    *(rcont+dim+ii)= ydiff;
+    *(rcont+2*dim+ii)= bspl;
+    *(rcont+3*dim+ii)= ydiff - *(k7+ii) - bspl;
+    *(rcont+4*dim+ii)= d1 * *(k1+ii) + d3 * *(k3+ii) + d4 * *(k4+ii)
+      + d5 * *(k5+ii) + d6 * *(k6+ii) + d7 * *(k7+ii);
+  }
+}
+void bovy_dopr54_dense(int dim, double theta, double * rcont, double * y){
+  int ii;
+  double theta1= 1.-theta;
+  for (ii=0; ii < dim; ii++)
+    *(y+ii)= *(rcont+ii) + theta * ( *(rcont+dim+ii) + theta1 * 
+				      ( *(rcont+2*dim+ii) + theta * 
+					( *(rcont+3*dim+ii) + theta1 
+					  * *(rcont+4*dim+ii))));
+}
+/*
+Runge-Kutta Dormand-Prince 5/4 integrator with event detection
+Usage:
+   Same func, dim, nargs, potentialArgs, rtol, atol as bovy_dopr54
+  Other arguments are:
+       double *yo: initial value, dimension: dim
+       double to: initial time
+       double tf: final time
+       int nevent: number of events
+       struct dopr54Event * events: events to detect; the event occurs when
+          eventFunc changes sign (in the direction given by direction); 
+	  the time and phase-space position of the event are found using 
+	  the dense output of the integrator, for at most maxevents
+	  occurrences
+  Output:
+       double *yf: phase-space position at tf (dimension: dim)
+       events: nevents, tevent, and yevent are set
+       int * err: if non-zero, something bad happened (1: maximum step reduction happened)
+*/
+void bovy_dopr54_events(void (*func)(double t, double *q, double *a,
+				     int nargs, struct potentialArg * potentialArgs),
+			int dim,
+			double * yo,
+			double to, double tf,
+			int nargs, struct potentialArg * potentialArgs,
+			double rtol, double atol,
+			int nevent, struct dopr54Event * events,
+			double * yf, int * err){
+  //Declare and initialize
+  double *a= (double *) malloc ( dim * sizeof(double) );
+  double *a1= (double *) malloc ( dim * sizeof(double) );
+  double *k1= (double *) malloc ( dim * sizeof(double) );
+  double *k2= (double *) malloc ( dim * sizeof(double) );
+  double *k3= (double *) malloc ( dim * sizeof(double) );
+  double *k4= (double *) malloc ( dim * sizeof(double) );
+  double *k5= (double *) malloc ( dim * sizeof(double) );
+  double *k6= (double *) malloc ( dim * sizeof(double) );
+  double *k7= (double *) malloc ( dim * sizeof(double) );
+  double *yn= (double *) malloc ( dim * sizeof(double) );
+  double *yold= (double *) malloc ( dim * sizeof(double) );
+  double *yn1= (double *) malloc ( dim * sizeof(double) );
+  double *yerr= (double *) malloc ( dim * sizeof(double) );
+  double *ynk= (double *) malloc ( dim * sizeof(double) );
+  double *rcont= (double *) malloc ( 5 * dim * sizeof(double) );
+  double *gold= (double *) malloc ( nevent * sizeof(double) );
+  int ii, jj;
+  double told, h, gnew, theta;
+  unsigned char accept;
+  *err= 0;
+  for (ii=0; ii < dim; ii++) *(yn+ii)= *(yo+ii);
+  double dt= (tf-to)/_DOPR54_EVENTS_INITSTEPFRAC;
+  double dt_one= rk4_estimate_step(*func,dim,yo,dt,&to,nargs,potentialArgs,
+				   rtol,atol);
+  double init_dt_one= dt_one;
+  //set up a1 and the initial value of the event functions
+  func(to,yn,a1,nargs,potentialArgs);
+  for (jj=0; jj < nevent; jj++){
+    (events+jj)->nevents= 0;
+    *(gold+jj)= (events+jj)->eventFunc(to,yn,events+jj);
+  }
+  //Integrate the system
+  while ( ( dt >= 0. && to < tf ) || ( dt < 0. && to > tf ) ) {
+    accept= 0;
+    if ( init_dt_one/dt_one > _MAX_STEPREDUCE) {
+      dt_one= init_dt_one/_MAX_STEPREDUCE;
+      accept= 1;
+      if ( *err % 2 ==  0) *err+= 1;
+    }
+    if ( dt >= 0. && dt_one > (tf - to) )
+      dt_one= tf - to;
+    if ( dt < 0. && dt_one < (tf - to) )
+      dt_one = tf - to;
+    for (ii=0; ii < dim; ii++) *(yold+ii)= *(yn+ii);
+    told= to;
+    h= dt_one;
+    dt_one= bovy_dopr54_actualstep(func,dim,yn,dt_one,&to,nargs,potentialArgs,
+				   rtol,atol,
+				   a1,a,k1,k2,k3,k4,k5,k6,yn1,yerr,ynk,
+				   accept);
+    if ( to == told ) continue; //step was rejected
+    //Step was accepted, check for events
+    if ( nevent == 0 ) continue;
+    for (ii=0; ii < dim; ii++) *(k7+ii)= h * *(a1+ii);
+    bovy_dopr54_dense_setup(dim,yold,yn,k1,k3,k4,k5,k6,k7,rcont);
+    for (jj=0; jj < nevent; jj++){
+      gnew= (events+jj)->eventFunc(to,yn,events+jj);
+      if ( ( ( *(gold+jj) < 0. && gnew >= 0. && (events+jj)->direction >= 0 )
+	     || ( *(gold+jj) > 0. && gnew <= 0. && (events+jj)->direction <= 0 ) )
+	   && (events+jj)->nevents < (events+jj)->maxevents ) {
+	theta= bovy_dopr54_findevent(dim,told,h,*(gold+jj),gnew,rcont,ynk,
+				     events+jj);
+	*((events+jj)->tevent+(events+jj)->nevents)= told+theta*h;
+	bovy_dopr54_dense(dim,theta,rcont,
+			  (events+jj)->yevent+dim*(events+jj)->nevents);
+	(events+jj)->nevents++;
+      }
+      *(gold+jj)= gnew;
+    }
+  }
+  for (ii=0; ii < dim; ii++) *(yf+ii)= *(yn+ii);
+  free(a);
+  free(a1);
+  free(k1);
+  free(k2);
+  free(k3);
+  free(k4);
+  free(k5);
+  free(k6);
+  free(k7);
+  free(yn);
+  free(yold);
+  free(yn1);
+  free(yerr);
+  free(ynk);
+  free(rcont);
+  free(gold);
+}
+//Find the root of the event function within a step using the dense output
+//(Illinois variant of regula falsi), returns the fraction of the step
+double bovy_dopr54_findevent(int dim, double told, double h,
+			     double glo, double ghi, double * rcont,
+			     double * y, struct dopr54Event * event){
+  int ii;
+  int side= 0;
+  double thetalo= 0., thetahi= 1., theta= 1., g;
+  if ( ghi == 0. ) return 1.;
+  for (ii=0; ii < _DOPR54_EVENTS_MAXITER; ii++){
+    theta= (thetalo * ghi - thetahi * glo) / (ghi - glo);
+    if ( fabs((thetahi-thetalo) * h) < _DOPR54_EVENTS_TTOL * fmax(1.,fabs(told)) ) 
+      break;
+    bovy_dopr54_dense(dim,theta,rcont,y);
+    g= event->eventFunc(told+theta*h,y,event);
+    if ( g == 0. ) break;
+    if ( ( g < 0. ) == ( glo < 0. ) ) {
+      thetalo= theta;
+      glo= g;
+      if ( side == -1 ) ghi/= 2.;
+      side= -1;
+    }
+    else {
+      thetahi= theta;
+      ghi= g;
+      if ( side == 1 ) glo/= 2.;
+      side= 1;
+    }
+  }
+  return theta;
+}
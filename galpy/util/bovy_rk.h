@@ -35,6 +35,21 @@ POSSIBILITY OF SUCH DAMAGE.
   include
 */
 #include <bovy_symplecticode.h>
+/*
+  Structure declarations
+*/
+//Event for bovy_dopr54_events: the event occurs when eventFunc changes sign
+struct dopr54Event{
+  double (*eventFunc)(double, double *, struct dopr54Event *);
+  int type; //type of event, interpreted by eventFunc
+  int index; //index of the event, passed to userFunc
+  double (*userFunc)(double, double *, int); //for user-defined events
+  int direction; //0: all crossings, 1: only increasing, -1: only decreasing
+  int maxevents;
+  int nevents;
+  double * tevent; //times of the events [maxevents]
+  double * yevent; //phase-space positions of the events [maxevents,dim]
+};
 /*
   Function declarations
 */
@@ -111,4 +126,21 @@ double bovy_dopr54_actualstep(void (*func)(double, double *, double *,int, struc
 			      double *, double *,
 			      double *, double *,
 			      double *,unsigned char);
+void bovy_dopr54_dense_setup(int, double *, double *,
+			     double *, double *, double *,
+			     double *, double *, double *,
+			     double *);
+void bovy_dopr54_dense(int, double, double *, double *);
+void bovy_dopr54_events(void (*func)(double, double *, double *,
+				     int, struct potentialArg *),
+			int,
+			double *,
+			double, double,
+			int, struct potentialArg *,
+			double, double,
+			int, struct dopr54Event *,
+			double *,int *);
+double bovy_dopr54_findevent(int, double, double,
+			     double, double, double *,
+			     double *, struct dopr54Event *);
 #endif /* bovy_rk.h */
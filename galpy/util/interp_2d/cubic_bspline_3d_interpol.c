@@ -0,0 +1,65 @@
+/*
+  Cubic B-spline interpolation in 3D, an extension of the 2D interpolation
+  in cubic_bspline_2d_interpol.c
+*/
+#include <math.h>
+#include "cubic_bspline_3d_interpol.h"
+/*
+  Weights and (mirrored) indices of the coefficients that contribute at x
+  along a dimension of size n; returns the number of contributing
+  coefficients (1 if n == 1)
+*/
+static int cubic_bspline_weights(long n,double x,long * index,double * weight){
+  long n2= 2L * n - 2L;
+  long i, k;
+  double w;
+  if ( n == 1L ) {
+    *index= 0L;
+    *weight= 1.;
+    return 1;
+  }
+  /* compute the interpolation indexes: floor(x) + {-1,0,1,2} */
+  i= (long) floor(x) - 1L;
+  for (k=0L; k < 4L; k++)
+    index[k]= i++;
+  /* compute the interpolation weights */
+  w= x - (double) index[1];
+  weight[3]= (1.0 / 6.0) * w * w * w;
+  weight[0]= (1.0 / 6.0) + (1.0 / 2.0) * w * (w - 1.0) - weight[3];
+  weight[2]= w + weight[0] - 2.0 * weight[3];
+  weight[1]= 1.0 - weight[0] - weight[2] - weight[3];
+  /* apply the mirror boundary conditions */
+  for (k=0L; k < 4L; k++) {
+    index[k]= (index[k] < 0L) ? (-index[k] - n2 * ((-index[k]) / n2))
+      : (index[k] - n2 * (index[k] / n2));
+    if ( n <= index[k] )
+      index[k]= n2 - index[k];
+  }
+  return 4;
+}
+double cubic_bspline_3d_interpol(double * coeffs, /* B-spline coefficients, C order [n1,n2,n3] */
+				 long n1,
+				 long n2,
+				 long n3,
+				 double x, /* coordinates in units of the grid spacing */
+				 double y,
+				 double z){
+  long x_index[4], y_index[4], z_index[4];
+  double x_weight[4], y_weight[4], z_weight[4];
+  int nx, ny, nz, i, j, k;
+  double interpolated, wy;
+  nx= cubic_bspline_weights(n1,x,x_index,x_weight);
+  ny= cubic_bspline_weights(n2,y,y_index,y_weight);
+  nz= cubic_bspline_weights(n3,z,z_index,z_weight);
+  /* perform interpolation */
+  interpolated= 0.0;
+  for (i=0; i < nx; i++) {
+    for (j=0; j < ny; j++) {
+      wy= x_weight[i] * y_weight[j];
+      for (k=0; k < nz; k++)
+	interpolated+= coeffs[(x_index[i] * n2 + y_index[j]) * n3 + z_index[k]]
+	  * wy * z_weight[k];
+    }
+  }
+  return interpolated;
+}
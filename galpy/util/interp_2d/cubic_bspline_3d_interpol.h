@@ -0,0 +1,13 @@
+/*
+  Cubic B-spline interpolation in 3D (also used for 1D and 2D arrays, by
+  setting the size of the trailing dimensions to 1); the coefficients
+  are those of a cubic B-spline with mirror-symmetric boundary conditions,
+  as calculated by scipy.ndimage.spline_filter, such that this
+  interpolation is the same as that of
+  scipy.ndimage.map_coordinates(order=3,prefilter=False)
+*/
+#ifndef __CUBIC_BSPLINE_3D_INTERPOL_H__
+#define __CUBIC_BSPLINE_3D_INTERPOL_H__
+double cubic_bspline_3d_interpol(double *,long,long,long,
+				 double,double,double);
+#endif /* cubic_bspline_3d_interpol.h */
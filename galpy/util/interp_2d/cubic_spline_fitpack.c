@@ -0,0 +1,64 @@
+/*
+  Evaluation of cubic splines given as FITPACK knots and coefficients
+*/
+#include "cubic_spline_fitpack.h"
+int cubic_bspline_fitpack_basis(double x,int n,double * t,double * h){
+  /*
+    Non-zero cubic B-spline basis functions h[4] at x for the n knots t
+    (following FITPACK's fpbspl); returns l such that t[l] <= x < t[l+1],
+    the basis functions are those of the coefficients l-3 to l; x outside
+    of the range of the spline uses the first or last interval
+  */
+  int lo, hi, mid, i, j;
+  double f, hh[3];
+  //Find the interval
+  lo= 3;
+  hi= n-5;
+  while ( lo < hi ) {
+    mid= (lo + hi + 1) / 2;
+    if ( x >= *(t+mid) ) lo= mid;
+    else hi= mid - 1;
+  }
+  h[0]= 1.;
+  for (j=1; j <= 3; j++) {
+    for (i=0; i < j; i++) hh[i]= h[i];
+    h[0]= 0.;
+    for (i=1; i <= j; i++) {
+      f= hh[i-1] / ( *(t+lo+i) - *(t+lo+i-j) );
+      h[i-1]+= f * ( *(t+lo+i) - x );
+      h[i]= f * ( x - *(t+lo+i-j) );
+    }
+  }
+  return lo;
+}
+double cubic_spline_fitpack_1d(double x,int n,double * t,double * c){
+  /*
+    Evaluate a cubic spline with n knots t and coefficients c; like
+    FITPACK's splev, the spline is extrapolated outside of its range
+  */
+  int l, i;
+  double h[4], out= 0.;
+  l= cubic_bspline_fitpack_basis(x,n,t,h);
+  for (i=0; i < 4; i++) out+= *(c+l-3+i) * h[i];
+  return out;
+}
+double cubic_spline_fitpack_2d(double x,double y,int nx,double * tx,
+			       int ny,double * ty,double * c){
+  /*
+    Evaluate a bicubic spline with knots tx, ty and coefficients c
+    [(nx-4)*(ny-4)]; like FITPACK's bispev, (x,y) is clamped to the range
+    of the spline
+  */
+  int lx, ly, i, j;
+  double hx[4], hy[4], out= 0.;
+  if ( x < *(tx+3) ) x= *(tx+3);
+  if ( x > *(tx+nx-4) ) x= *(tx+nx-4);
+  if ( y < *(ty+3) ) y= *(ty+3);
+  if ( y > *(ty+ny-4) ) y= *(ty+ny-4);
+  lx= cubic_bspline_fitpack_basis(x,nx,tx,hx);
+  ly= cubic_bspline_fitpack_basis(y,ny,ty,hy);
+  for (i=0; i < 4; i++)
+    for (j=0; j < 4; j++)
+      out+= *(c+(lx-3+i)*(ny-4)+ly-3+j) * hx[i] * hy[j];
+  return out;
+}
@@ -0,0 +1,13 @@
+/*
+  Evaluation of cubic splines given as FITPACK knots and coefficients (as
+  returned by scipy.interpolate.splrep or the get_knots/get_coeffs methods
+  of scipy's spline classes), such that the C evaluation is the same as
+  that of scipy
+*/
+#ifndef __CUBIC_SPLINE_FITPACK_H__
+#define __CUBIC_SPLINE_FITPACK_H__
+int cubic_bspline_fitpack_basis(double,int,double *,double *);
+double cubic_spline_fitpack_1d(double,int,double *,double *);
+double cubic_spline_fitpack_2d(double,double,int,double *,int,double *,
+			       double *);
+#endif /* cubic_spline_fitpack.h */
@@ -0,0 +1,120 @@
+############################TESTS OF THE ORBIT CLASS############################
+import numpy
+import warnings
+_TOL= 10.**-4. #tolerance for extrema from a finely sampled orbit
+
+def test_exact_extrema_coarse_output():
+    #The exact extrema should not depend on how finely the orbit is output
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    for vxvv in [[1.,0.1,1.1,0.1,0.2,0.],[1.,0.1,1.1,0.1,0.2],
+                 [1.,0.1,1.1,0.],[1.,0.1,1.1]]:
+        o= Orbit(vxvv)
+        o.integrate(numpy.linspace(0.,100.,3),lp,method='dopr54_c')
+        of= Orbit(vxvv)
+        of.integrate(numpy.linspace(0.,100.,100001),lp,method='dopr54_c')
+        if len(vxvv) > 4:
+            rf= numpy.sqrt(of.getOrbit()[:,0]**2.+of.getOrbit()[:,3]**2.)
+            assert numpy.fabs(o.zmax(exact=True)
+                              -numpy.amax(numpy.fabs(of.getOrbit()[:,3]))) < _TOL, \
+                'zmax(exact=True) of a coarsely output orbit is wrong'
+        else:
+            rf= of.getOrbit()[:,0]
+        assert numpy.fabs(o.rperi(exact=True)-numpy.amin(rf)) < _TOL, \
+            'rperi(exact=True) of a coarsely output orbit is wrong'
+        assert numpy.fabs(o.rap(exact=True)-numpy.amax(rf)) < _TOL, \
+            'rap(exact=True) of a coarsely output orbit is wrong'
+        assert numpy.fabs(o.e(exact=True)
+                          -(numpy.amax(rf)-numpy.amin(rf))\
+                              /(numpy.amax(rf)+numpy.amin(rf))) < _TOL, \
+            'e(exact=True) of a coarsely output orbit is wrong'
+    return None
+
+def test_integrate_events_maxevents_warning():
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    from galpy.util import galpyWarning
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    o= Orbit([1.,0.1,1.1,0.1,0.2,0.])
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always',galpyWarning)
+        tev, vxvv= o.integrate_events(100.,lp,events='z',maxevents=3)
+        assert len(tev) == 3
+        assert numpy.any([issubclass(ww.category,galpyWarning) for ww in w]), \
+            'integrate_events does not warn when maxevents is reached'
+    return None
+
+def test_integrate_events_user_exception():
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    o= Orbit([1.,0.1,1.1,0.1,0.2,0.])
+    def bad_event(t,vxvv):
+        raise ValueError('bad event')
+    try:
+        o.integrate_events(10.,lp,events=bad_event)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Exception in a user event function was not propagated')
+    return None
+
+def test_multiorbit_vs_single():
+    #Integrating multiple orbits at once should give the same results as
+    #integrating each orbit separately
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    ts= numpy.linspace(0.,50.,1001)
+    for vxvvs in [[[1.,0.1,1.1,0.1,0.2,0.],[1.1,0.,1.,0.05,0.1,1.],
+                   [0.9,-0.1,1.2,-0.1,0.,2.]],
+                  [[1.,0.1,1.1,0.],[1.1,0.,1.,1.],[0.9,-0.1,1.2,2.]]]:
+        os= Orbit(numpy.array(vxvvs))
+        os.integrate(ts,lp,method='dopr54_c')
+        singles= [Orbit(vxvv) for vxvv in vxvvs]
+        for o in singles: o.integrate(ts,lp,method='dopr54_c')
+        nd= len(vxvvs[0])
+        assert os.getOrbit().shape == (len(vxvvs),len(ts),nd), \
+            'getOrbit for multiple orbits does not have shape [N,nt,nd]'
+        for ii,o in enumerate(singles):
+            assert numpy.all(numpy.fabs(os.getOrbit()[ii]-o.getOrbit()) < 10.**-10.), \
+                'getOrbit for multiple orbits does not agree with that of the separately integrated orbits'
+        for func in ['R','vR','vT','E']:
+            assert numpy.all(numpy.fabs(getattr(os,func)(ts)
+                                        -numpy.array([getattr(o,func)(ts) for o in singles])) < 10.**-10.), \
+                '%s for multiple orbits does not agree with that of the separately integrated orbits' % func
+        for func in ['rap','rperi','e','zmax']:
+            if func == 'zmax' and nd == 4: continue
+            for kw in [{},{'exact':True},{'analytic':True}]:
+                if nd == 4 and kw.has_key('analytic'): continue
+                assert numpy.all(numpy.fabs(getattr(os,func)(**kw)
+                                            -numpy.array([getattr(o,func)(**kw) for o in singles])) < 10.**-10.), \
+                    '%s(%s) for multiple orbits does not agree with that of the separately integrated orbits' % (func,kw.keys())
+        if nd == 4:
+            assert numpy.all(os.zmax(exact=True) == 0.), \
+                'zmax for multiple planar orbits is not zero'
+    return None
+
+def test_integrate_events_multiorbit():
+    #integrate_events for multiple orbits should give the events of each
+    #orbit
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    for vxvvs in [[[1.,0.1,1.1,0.1,0.2,0.],[1.1,0.,1.,0.05,0.1,1.]],
+                  [[1.,0.1,1.1,0.1,0.2,0.],[1.1,0.,1.,0.05,0.1,1.],
+                   [0.9,-0.1,1.2,-0.1,0.,2.],[1.,0.1,1.1,0.1,0.2,0.],
+                   [1.2,0.,0.9,0.05,0.1,1.],[0.9,-0.1,1.2,0.1,0.,2.]],
+                  [[1.,0.1,1.1,0.],[1.1,0.,1.,1.]]]:
+        os= Orbit(numpy.array(vxvvs))
+        out= os.integrate_events(20.,lp,events=['vR','vr'])
+        assert len(out) == len(vxvvs), \
+            'integrate_events for multiple orbits does not return the events of each orbit'
+        for ii,vxvv in enumerate(vxvvs):
+            sout= Orbit(vxvv).integrate_events(20.,lp,events=['vR','vr'])
+            for jj in range(2):
+                assert numpy.all(numpy.fabs(out[ii][jj][0]-sout[jj][0]) < 10.**-10.) \
+                    and numpy.all(numpy.fabs(out[ii][jj][1]-sout[jj][1]) < 10.**-10.), \
+                    'integrate_events for multiple orbits does not agree with that for the separate orbits'
+    return None
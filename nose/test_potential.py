@@ -0,0 +1,29 @@
+############################TESTS OF THE POTENTIAL CLASSES############################
+import numpy
+_TOL= 10.**-10. #tolerance for evaluations
+
+def test_disk_array_input():
+    #The exponential-disk potentials should evaluate lists and arrays of R,z
+    #element by element and return scalars for scalar input
+    from galpy import potential
+    for pot in [potential.DoubleExponentialDiskPotential(),
+                potential.RazorThinExponentialDiskPotential()]:
+        Rs= [1.,1.5,2.]
+        zs= [0.,.1,.2]
+        if isinstance(pot,potential.RazorThinExponentialDiskPotential):
+            zs= [0.,0.,0.]
+        for func in [pot.__call__,pot.Rforce,pot.zforce]:
+            single= numpy.array([func(R,z) for R,z in zip(Rs,zs)])
+            assert numpy.ndim(func(Rs[0],zs[0])) == 0, \
+                'Scalar input does not give scalar output'
+            for R,z in [(Rs,zs),(numpy.array(Rs),numpy.array(zs)),
+                        (Rs,numpy.array(zs)),(numpy.array(Rs),zs)]:
+                out= func(R,z)
+                assert numpy.shape(out) == (3,), \
+                    'List or array input does not give an output for each point'
+                assert numpy.all(numpy.fabs(out-single) < _TOL), \
+                    'List or array input does not agree with scalar input'
+            out= func(numpy.array(Rs),zs[0])
+            assert numpy.shape(out) == (3,), \
+                'Array R with scalar z does not broadcast'
+    return None
@@ -0,0 +1,115 @@
+############TEST THE C IMPLEMENTATIONS OF POTENTIALS AGAINST PYTHON#############
+import numpy
+_TOL= 10.**-10. #relative tolerance for evaluations
+_ORBTOL= 10.**-6. #absolute tolerance for orbit integrations
+
+def _points():
+    numpy.random.seed(1)
+    R= 0.2+numpy.random.uniform(size=20)*2.
+    z= numpy.random.normal(size=20)*0.3
+    z[:3]= 0. #also test in the plane
+    phi= numpy.random.uniform(size=20)*2.*numpy.pi
+    t= numpy.random.uniform(size=20)*2.
+    return (R,z,phi,t)
+
+def _moving_object():
+    from galpy.potential import MWPotential, MovingObjectPotential
+    from galpy.orbit import Orbit
+    o= Orbit([1.,0.1,1.1,0.1,0.05,0.3])
+    o.integrate(numpy.linspace(-3.,3.,301),MWPotential)
+    return MovingObjectPotential(o,GM=0.1,softening_length=0.1)
+
+def _pots():
+    from galpy import potential
+    return [potential.BurkertPotential(normalize=1.,a=2.),
+            potential.PowerSphericalPotentialwCutoff(normalize=1.,alpha=1.5,
+                                                     rc=0.8),
+            potential.RazorThinExponentialDiskPotential(normalize=1.,hr=0.3),
+            potential.FlattenedPowerPotential(normalize=1.,alpha=0.5,q=0.8),
+            potential.FlattenedPowerPotential(normalize=1.,alpha=0.,q=0.8),
+            _moving_object()]
+
+def test_evaluate_c():
+    from galpy.potential import evaluatePotentials, evaluateRforces, \
+        evaluatezforces, evaluatephiforces
+    R,z,phi,t= _points()
+    for p in _pots():
+        assert p.hasC, '%s does not have a C implementation' \
+            % p.__class__.__name__
+        for func in [evaluatePotentials,evaluateRforces,evaluatezforces,
+                     evaluatephiforces]:
+            py= numpy.array([func(R[ii],z[ii],p,phi=phi[ii],t=t[ii])
+                             for ii in range(len(R))])
+            c= func(R,z,p,phi=phi,t=t,use_c=True)
+            assert numpy.all(numpy.fabs(c-py) < _TOL*(numpy.fabs(py)+10.**-8.)), \
+                '%s of %s in C does not agree with Python' \
+                % (func.__name__,p.__class__.__name__)
+    return None
+
+def test_evaluate_planar_c():
+    from galpy.potential import RZToplanarPotential, MovingObjectPotential
+    from galpy.potential_src.planarPotential import evaluateplanarRforces, \
+        evaluateplanarR2derivs
+    R,z,phi,t= _points()
+    for p in _pots():
+        if isinstance(p,MovingObjectPotential): continue #3D only
+        pp= RZToplanarPotential(p)
+        for func in [evaluateplanarRforces,evaluateplanarR2derivs]:
+            py= numpy.array([func(R[ii],pp,phi=phi[ii],t=t[ii])
+                             for ii in range(len(R))])
+            c= func(R,pp,phi=phi,t=t,use_c=True)
+            assert numpy.all(numpy.fabs(c-py) < _TOL*(numpy.fabs(py)+10.**-8.)), \
+                '%s of %s in C does not agree with Python' \
+                % (func.__name__,p.__class__.__name__)
+    return None
+
+def test_integrate_c():
+    from galpy.potential import MovingObjectPotential, \
+        LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    ts= numpy.linspace(0.,2.,101)
+    for p in _pots():
+        if isinstance(p,MovingObjectPotential):
+            p= [LogarithmicHaloPotential(normalize=1.),p]
+        os= [Orbit([0.9,0.1,1.05,0.05,0.1,0.2]) for ii in range(2)]
+        os[0].integrate(ts,p,method='odeint')
+        os[1].integrate(ts,p,method='dopr54_c')
+        assert numpy.all(numpy.fabs(os[0].getOrbit()-os[1].getOrbit()) < _ORBTOL), \
+            'Orbit integration in C does not agree with Python'
+        if isinstance(p,list): continue
+        os= [Orbit([0.9,0.1,1.05,0.2]) for ii in range(2)]
+        os[0].integrate(ts,p,method='odeint')
+        os[1].integrate(ts,p,method='dopr54_c')
+        assert numpy.all(numpy.fabs(os[0].getOrbit()-os[1].getOrbit()) < _ORBTOL), \
+            'Planar orbit integration in C does not agree with Python'
+    return None
+
+def test_integrate_linear_c():
+    from galpy.potential import KGPotential
+    from galpy.orbit import Orbit
+    ts= numpy.linspace(0.,2.,101)
+    kp= KGPotential()
+    assert kp.hasC, 'KGPotential does not have a C implementation'
+    os= [Orbit([0.5,0.3]) for ii in range(2)]
+    os[0].integrate(ts,kp,method='odeint')
+    os[1].integrate(ts,kp,method='dopr54_c')
+    assert numpy.all(numpy.fabs(os[0].getOrbit()-os[1].getOrbit()) < _ORBTOL), \
+        'Linear orbit integration in C does not agree with Python'
+    return None
+
+def test_integrate_c_changed_parameters():
+    #The arguments parsed for C must be updated when a parameter changes
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    ts= numpy.linspace(0.,2.,101)
+    lp= LogarithmicHaloPotential(normalize=1.)
+    o= Orbit([0.9,0.1,1.05,0.05,0.1,0.2])
+    o.integrate(ts,lp,method='dopr54_c')
+    lp._amp*= 2.
+    for vxvv in [[0.9,0.1,1.05,0.05,0.1,0.2],[0.9,0.1,1.05,0.2]]:
+        os= [Orbit(vxvv) for ii in range(2)]
+        os[0].integrate(ts,lp,method='odeint')
+        os[1].integrate(ts,lp,method='dopr54_c')
+        assert numpy.all(numpy.fabs(os[0].getOrbit()-os[1].getOrbit()) < _ORBTOL), \
+            'Orbit integration in C does not use the changed amplitude'
+    return None
@@ -0,0 +1,32 @@
+############################TESTS OF THE STREAMDF CLASS############################
+import numpy
+
+def test_callMarg_far_from_track():
+    #Points far from the stream track should have -inf log DF, not NaN
+    from galpy.df import streamdf
+    from galpy.orbit import Orbit
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.actionAngle import actionAngleIsochroneApprox
+    from galpy.util import bovy_conversion
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    aAI= actionAngleIsochroneApprox(pot=lp,b=0.8)
+    obs= Orbit([1.56148083,0.35081535,-1.15481504,
+                0.88719443,-0.47713334,0.12019596])
+    sdf= streamdf(0.365/220.,progenitor=obs,pot=lp,aA=aAI,leading=True,
+                  nTrackChunks=11,
+                  tdisrupt=4.5/bovy_conversion.time_in_Gyr(220.,8.))
+    xy= sdf._interpolatedObsTrackXY[30]
+    near= sdf.callMarg([xy[0],None,None,None,None,None])
+    assert numpy.isfinite(near), \
+        'callMarg for a point on the stream track is not finite'
+    far= sdf.callMarg([None,xy[1]+30.,None,None,None,None])
+    assert numpy.isinf(far) and far < 0., \
+        'callMarg for a point far from the stream track is not -inf'
+    out= sdf.callMarg(numpy.array([[xy[0],numpy.nan,numpy.nan,
+                                    numpy.nan,numpy.nan,numpy.nan],
+                                   [numpy.nan,xy[1]+30.,numpy.nan,
+                                    numpy.nan,numpy.nan,numpy.nan]]))
+    assert numpy.fabs(out[0]-near) < 10.**-8. and numpy.isinf(out[1]) \
+        and out[1] < 0., \
+        'callMarg for many points does not give -inf for the point far from the stream track'
+    return None
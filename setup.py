@@ -38,17 +38,23 @@ else:
 orbit_int_c_src= ['galpy/util/bovy_symplecticode.c','galpy/util/bovy_rk.c']
 orbit_int_c_src.extend(glob.glob('galpy/potential_src/potential_c_ext/*.c'))
 orbit_int_c_src.extend(glob.glob('galpy/orbit_src/orbit_c_ext/*.c'))
+orbit_int_c_src.extend(glob.glob('galpy/snapshot_src/snapshot_c_ext/*.c'))
 orbit_int_c_src.extend(glob.glob('galpy/util/interp_2d/*.c'))
 
 orbit_libraries=['m']
 if float(gsl_version[0]) >= 1.:
     orbit_libraries.extend(['gsl','gslcblas'])
+if 'gomp' in pot_libraries:
+    orbit_libraries.append('gomp')
 orbit_int_c= Extension('galpy_integrate_c',
                        sources=orbit_int_c_src,
                        libraries=orbit_libraries,
                        include_dirs=['galpy/util',
                                      'galpy/util/interp_2d',
-                                     'galpy/potential_src/potential_c_ext'])
+                                     'galpy/potential_src/potential_c_ext',
+                                     'galpy/orbit_src/orbit_c_ext',
+                                     'galpy/snapshot_src/snapshot_c_ext'],
+                       extra_compile_args=extra_compile_args)
 ext_modules=[]
 if float(gsl_version[0]) >= 1.:
     ext_modules.append(orbit_int_c)
@@ -78,6 +84,7 @@ interppotential_c_src.extend(glob.glob('galpy/potential_src/interppotential_c_ex
 interppotential_c_src.extend(['galpy/util/bovy_symplecticode.c','galpy/util/bovy_rk.c'])
 interppotential_c_src.append('galpy/actionAngle_src/actionAngle_c_ext/actionAngle.c')
 interppotential_c_src.append('galpy/orbit_src/orbit_c_ext/integrateFullOrbit.c')
+interppotential_c_src.append('galpy/orbit_src/orbit_c_ext/integratePlanarOrbit.c')
 interppotential_c_src.extend(glob.glob('galpy/util/interp_2d/*.c'))
 
 interppotential_c= Extension('galpy_interppotential_c',